@@ -19,6 +19,7 @@ from dtfabric import reader
 from dtfabric import registry
 
 from yaldevtools import configuration
+from yaldevtools import profiler
 from yaldevtools import source_formatter
 from yaldevtools import template_string
 
@@ -1223,8 +1224,6 @@ class SourceGenerator(object):
         else:
           file_object.write(line)
 
-    lines = formatter.FormatSource(lines)
-
   def _VerticalAlignAssignmentStatements(self, output_filename):
     """Vertically aligns assignment statements.
 
@@ -1357,6 +1356,8 @@ def Main():
       'configuration_file', action='store', metavar='PATH',
       default='libyal.ini', help='path of the configuration file.')
 
+  profiler.AddArguments(argument_parser)
+
   options = argument_parser.parse_args()
 
   if not options.configuration_file:
@@ -1394,7 +1395,17 @@ def Main():
         '{1!s}').format(options.definitions_file, exception))
     return False
 
-  return source_generator.Generate(project_configuration)
+  generation_profiler = profiler.CreateProfiler(options)
+  if generation_profiler:
+    generation_profiler.InstrumentClass(SourceGenerator)
+    generation_profiler.Start()
+
+  try:
+    return source_generator.Generate(project_configuration)
+
+  finally:
+    if generation_profiler:
+      generation_profiler.Stop()
 
 
 if __name__ == '__main__':
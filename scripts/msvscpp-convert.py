@@ -31,6 +31,8 @@ import os
 import sys
 import uuid
 
+from yaldevtools import profiler
+
 
 class VSConfiguration(object):
   """Visual Studio configuration."""
@@ -4219,6 +4221,8 @@ def Main():
       action='store', metavar='FORMAT', default='2010',
       help='The format to convert to.')
 
+  profiler.AddArguments(argument_parser)
+
   options = argument_parser.parse_args()
 
   if not options.solution_file:
@@ -4241,7 +4245,25 @@ def Main():
   else:
     input_solution = VSSolution()
 
-  if not input_solution.Convert(options.solution_file, options.output_format):
+  generation_profiler = profiler.CreateProfiler(options)
+  if generation_profiler:
+    # The conversion has no templates, the reading, configuring and writing
+    # of the projects and solution are timed instead.
+    generation_profiler.InstrumentClass(
+        type(input_solution), generate_method_names=['Convert'],
+        method_prefixes=['_Configure', '_Convert', '_Read', '_Write'],
+        template_method_names=[])
+    generation_profiler.Start()
+
+  try:
+    result = input_solution.Convert(
+        options.solution_file, options.output_format)
+
+  finally:
+    if generation_profiler:
+      generation_profiler.Stop()
+
+  if not result:
     print('Unable to convert Visual Studio solution file.')
     return False
 
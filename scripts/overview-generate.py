@@ -9,115 +9,13 @@ import abc
 import argparse
 import glob
 import io
-import json
 import logging
 import os
-import string
 import sys
 
-try:
-  import ConfigParser as configparser
-except ImportError:
-  import configparser  # pylint: disable=import-error
-
-
-class Project(object):
-  """Project definition.
-
-  Attributes:
-    appveyor_identifier (str): AppVeyor identifier.
-    category (str): category.
-    coverity_badge (int): Coverity badge identifier.
-    description (str): description.
-    display_name (str): display name.
-    documentation_only (bool): True if the project only contains documentation.
-    group (int): group.
-    name (str): name.
-  """
-
-  def __init__(self, name):
-    """Initializes a project.
-
-    Args:
-      name (str): name.
-    """
-    super(Project, self).__init__()
-    self.appveyor_identifier = None
-    self.category = None
-    self.coverity_badge = None
-    self.description = None
-    self.display_name = name
-    self.documentation_only = False
-    self.group = None
-    self.name = name
-
-
-class ProjectsReader(object):
-  """Project definition reader."""
-
-  def __init__(self):
-    """Initializes a projects definition reader."""
-    super(ProjectsReader, self).__init__()
-    # TODO: replace by:
-    # self._config_parser = configparser. ConfigParser(interpolation=None)
-    self._config_parser = configparser.RawConfigParser()
-
-  def _GetConfigValue(self, section_name, value_name):
-    """Retrieves a value from the config parser.
-
-    Args:
-      section_name (str): name of the section that contains the value.
-      value_name (str): name of the value.
-
-    Returns:
-      object: value or None if the value is not available.
-    """
-    try:
-      value = self._config_parser.get(section_name, value_name)
-    except configparser.NoOptionError:
-      value = None
-
-    if value:
-      return json.loads(value)
-
-    return None
-
-  def ReadFromFile(self, filename):
-    """Reads the projects from file.
-
-    Args:
-      filename (str): path of the projects file.
-
-    Returns:
-      list[Project]: project.
-    """
-    self._config_parser.read([filename])
-
-    projects = []
-    for project_name in self._config_parser.sections():
-      project = Project(project_name)
-
-      project.appveyor_identifier = self._GetConfigValue(
-          project_name, 'appveyor_identifier')
-
-      project.category = self._GetConfigValue(project_name, 'category')
-
-      project.coverity_badge = self._GetConfigValue(
-          project_name, 'coverity_badge')
-
-      project.description = self._GetConfigValue(project_name, 'description')
-
-      project.display_name = self._GetConfigValue(
-          project_name, 'display_name')
-
-      project.documentation_only = self._GetConfigValue(
-          project_name, 'documentation_only')
-
-      project.group = self._GetConfigValue(project_name, 'group')
-
-      projects.append(project)
-
-    return projects
+from yaldevtools import profiler
+from yaldevtools import projects_reader
+from yaldevtools import template_cache
 
 
 class ConfigureAcFile(object):
@@ -375,10 +273,8 @@ class WikiPageGenerator(object):
     """
     path = os.path.join(self._template_directory, filename)
 
-    with io.open(path, 'r', encoding='utf8') as file_object:
-      file_data = file_object.read()
-
-    return string.Template(file_data)
+    return template_cache.TEMPLATE_CACHE.GetTemplate(
+        path, universal_newlines=True)
 
   @abc.abstractmethod
   def Generate(self, projects, output_writer):
@@ -1157,6 +1053,8 @@ def Main():
       metavar='OUTPUT_DIRECTORY', default=None,
       help='path of the output files to write to.')
 
+  profiler.AddArguments(argument_parser)
+
   options = argument_parser.parse_args()
 
   if not options.configuration_file:
@@ -1184,9 +1082,9 @@ def Main():
   libyal_directory = os.path.dirname(libyal_directory)
   libyal_directory = os.path.dirname(libyal_directory)
 
-  projects_reader = ProjectsReader()
+  reader = projects_reader.ProjectsReader()
 
-  projects = projects_reader.ReadFromFile(options.configuration_file)
+  projects = reader.ReadFromFile(options.configuration_file)
   if not projects:
     print('Unable to read projects from configuration file: {0:s}.'.format(
         options.configuration_file))
@@ -1198,26 +1096,38 @@ def Main():
       ('Status', StatusWikiPageGenerator),
   ]
 
-  for page_name, page_generator_class in wiki_pages:
-    data_directory = os.path.join(libyal_directory, 'data')
-    template_directory = os.path.join(data_directory, 'wiki', page_name)
-    wiki_page = page_generator_class(data_directory, template_directory)
+  generation_profiler = profiler.CreateProfiler(options)
+  if generation_profiler:
+    for _, page_generator_class in wiki_pages:
+      generation_profiler.InstrumentClass(page_generator_class)
+
+    generation_profiler.Start()
+
+  try:
+    for page_name, page_generator_class in wiki_pages:
+      data_directory = os.path.join(libyal_directory, 'data')
+      template_directory = os.path.join(data_directory, 'wiki', page_name)
+      wiki_page = page_generator_class(data_directory, template_directory)
+
+      if options.output_directory:
+        filename = '{0:s}.md'.format(page_name)
+        output_file = os.path.join(options.output_directory, filename)
+        output_writer = FileWriter(output_file)
+      else:
+        output_writer = StdoutWriter()
 
-    if options.output_directory:
-      filename = '{0:s}.md'.format(page_name)
-      output_file = os.path.join(options.output_directory, filename)
-      output_writer = FileWriter(output_file)
-    else:
-      output_writer = StdoutWriter()
+      if not output_writer.Open():
+        print('Unable to open output writer.')
+        print('')
+        return False
 
-    if not output_writer.Open():
-      print('Unable to open output writer.')
-      print('')
-      return False
+      wiki_page.Generate(projects, output_writer)
 
-    wiki_page.Generate(projects, output_writer)
+      output_writer.Close()
 
-    output_writer.Close()
+  finally:
+    if generation_profiler:
+      generation_profiler.Stop()
 
   # TODO: add support for Unicode templates.
 
@@ -0,0 +1,45 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to run a source formatter server for editor integration."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import sys
+
+from yaldevtools import format_server
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Runs a source formatter server that reads JSON-RPC requests from stdin '
+      'and writes the responses to stdout, one JSON object per line.'))
+
+  argument_parser.parse_args()
+
+  input_file = io.open(
+      sys.stdin.fileno(), 'r', encoding='utf8', closefd=False)
+  output_file = io.open(
+      sys.stdout.fileno(), 'w', encoding='utf8', closefd=False)
+
+  server = format_server.FormatServer()
+  try:
+    server.Serve(input_file, output_file)
+  except KeyboardInterrupt:
+    pass
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -1,15 +1,24 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
-"""Script to format a source file."""
+"""Script to format source files."""
 
 from __future__ import print_function
 from __future__ import unicode_literals
 
 import argparse
 import io
+import os
+import logging
 import sys
+import time
 
-from yaldevtools import source_formatter
+from yaldevtools import format_cache
+from yaldevtools import job_scheduler
+from yaldevtools import source_formatting
+
+
+# Number of source files that are formatted per job.
+NUMBER_OF_FILES_PER_JOB = 32
 
 
 class SourceFileParser(object):
@@ -61,18 +70,56 @@ def Main():
       'Formats source files of the libyal libraries.'))
 
   argument_parser.add_argument(
-      'source_file', action='store', metavar='PATH',
-      default='libyal.ini', help='path of the source file.')
+      '--check', dest='check', action='store_true', default=False, help=(
+          'only check if the source files are formatted, without changing '
+          'them, and fail if a source file would be changed.'))
+
+  argument_parser.add_argument(
+      '--diff', dest='diff_path', action='store', metavar='PATH',
+      default=None, help=(
+          'path of a unified diff without context lines, such as created by '
+          '"git diff -U0", or - to read it from stdin. Only the functions and '
+          'the lines outside functions that overlap with changed lines of '
+          'the source files in the diff are formatted.'))
+
+  argument_parser.add_argument(
+      '--format-cache', dest='format_cache_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of the cache of formatted source files, which are skipped '
+          'as long as their content and the formatter did not change, where '
+          '{0:s} is the default.').format(format_cache.GetDefaultPath()))
+
+  argument_parser.add_argument(
+      '-j', '--jobs', dest='jobs', action='store', type=int, default=1,
+      metavar='NUMBER', help='number of jobs to format source files with.')
+
+  argument_parser.add_argument(
+      '--no-format-cache', dest='no_format_cache', action='store_true',
+      default=False, help='do not use the cache of formatted source files.')
+
+  argument_parser.add_argument(
+      'source_paths', action='store', metavar='PATH', nargs='*', default=[],
+      help=(
+          'path of a source file, a directory, which is searched recursively '
+          'for .c and .h files, or a glob pattern.'))
 
   options = argument_parser.parse_args()
 
-  if not options.source_file:
+  if not options.source_paths and not options.diff_path:
     print('Source file missing.')
     print('')
     argument_parser.print_help()
     print('')
     return False
 
+  if options.jobs < 1:
+    print('Unsupported number of jobs: {0:d}.'.format(options.jobs))
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.INFO, format='[%(levelname)s] %(message)s')
+
   # TODO: remove trailing whitespace
 
   # parser = SourceFileParser()
@@ -80,17 +127,115 @@ def Main():
 
   # return
 
-  with io.open(options.source_file, 'r', encoding='utf8') as file_object:
-    file_content = file_object.read()
+  start_time = time.time()
 
-  lines = file_content.split('\n')
+  line_ranges_per_path = None
+  if options.diff_path:
+    if options.diff_path == '-':
+      diff_lines = sys.stdin.readlines()
+    else:
+      with io.open(options.diff_path, 'r', encoding='utf8') as file_object:
+        diff_lines = file_object.readlines()
 
-  formatter = source_formatter.SourceFormatter()
-  formatted_lines = formatter.FormatSource(lines)
-  formatted_file_content = '\n'.join(formatted_lines)
+    line_ranges_per_path = source_formatting.GetChangedLineRanges(diff_lines)
 
-  with io.open(options.source_file, 'w', encoding='utf8') as file_object:
-    file_object.write(formatted_file_content)
+  if options.source_paths:
+    source_files = source_formatting.FindSourceFiles(options.source_paths)
+  else:
+    source_files = []
+    for path in sorted(line_ranges_per_path.keys()):
+      _, extension = os.path.splitext(path)
+      if (extension in source_formatting.SOURCE_FILE_EXTENSIONS and
+          os.path.isfile(path)):
+        source_files.append(path)
+
+  if line_ranges_per_path is not None:
+    source_files = [
+        path for path in source_files
+        if os.path.normpath(path) in line_ranges_per_path]
+
+  formatted_files_cache = format_cache.FormatCache()
+  if not options.no_format_cache:
+    formatted_files_cache = format_cache.FormatCache(
+        path=options.format_cache_path or format_cache.GetDefaultPath())
+    formatted_files_cache.ReadFromFile()
+
+  # Source files known to be formatted are skipped without being parsed.
+  file_hashes = {}
+  for path in source_files:
+    file_hash = formatted_files_cache.GetFileHash(path)
+    if not formatted_files_cache.IsFormatted(path, file_hash):
+      file_hashes[path] = file_hash
+
+  unformatted_files = [path for path in source_files if path in file_hashes]
+
+  scheduler = job_scheduler.JobScheduler(number_of_jobs=options.jobs)
+
+  for index in range(0, len(unformatted_files), NUMBER_OF_FILES_PER_JOB):
+    scheduler.AddJob(
+        'files{0:d}'.format(index), source_formatting.FormatSourceFiles, (
+            unformatted_files[index:index + NUMBER_OF_FILES_PER_JOB],
+            options.check, line_ranges_per_path))
+
+  try:
+    results = scheduler.Run()
+  except RuntimeError as exception:
+    logging.error('{0!s}'.format(exception))
+    return False
+
+  changed_files = set()
+  failed_files = set()
+  for job_changed_files, job_failed_files in results.values():
+    changed_files.update(job_changed_files)
+    failed_files.update(job_failed_files)
+
+  for path in unformatted_files:
+    # Only formatting all lines of a source file determines that it is
+    # formatted.
+    if line_ranges_per_path is not None or path in failed_files:
+      continue
+
+    file_hash = file_hashes[path]
+    if path in changed_files:
+      if options.check:
+        continue
+
+      file_hash = formatted_files_cache.GetFileHash(path)
+
+    formatted_files_cache.SetFormatted(path, file_hash)
+
+  formatted_files_cache.WriteToFile()
+
+  if options.check:
+    for path in sorted(changed_files):
+      print('Would change: {0:s}'.format(path))
+
+  for path in sorted(failed_files):
+    print('Unable to format: {0:s}'.format(path))
+
+  if options.check:
+    print((
+        'Scanned: {0:d} files, would change: {1:d} files, failed: {2:d} '
+        'files, skipped: {3:d} cached files in {4:.2f} seconds.').format(
+            len(source_files), len(changed_files), len(failed_files),
+            len(source_files) - len(unformatted_files),
+            time.time() - start_time))
+
+    if changed_files:
+      return False
+
+  else:
+    print((
+        'Scanned: {0:d} files, changed: {1:d} files, failed: {2:d} files, '
+        'skipped: {3:d} cached files in {4:.2f} seconds.').format(
+            len(source_files), len(changed_files), len(failed_files),
+            len(source_files) - len(unformatted_files),
+            time.time() - start_time))
+
+  # Source files that could not be formatted are neither formatted nor
+  # checked.
+  if failed_files:
+    return False
 
   return True
 
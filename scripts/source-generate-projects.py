@@ -0,0 +1,273 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to automate generation of source of multiple libyal libraries."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import logging
+import os
+import sys
+
+from yaldevtools import job_scheduler
+from yaldevtools import parse_cache
+from yaldevtools import projects_reader
+from yaldevtools import source_generation
+from yaldevtools import symbol_database
+from yaldevtools import template_bundle
+from yaldevtools import template_index
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  libyal_directory = os.path.abspath(__file__)
+  libyal_directory = os.path.dirname(libyal_directory)
+  libyal_directory = os.path.dirname(libyal_directory)
+
+  argument_parser = argparse.ArgumentParser(description=(
+      'Generates source files of multiple libyal libraries.'))
+
+  argument_parser.add_argument(
+      '-c', '--only-changed', dest='only_changed', action='store_true',
+      default=False, help=(
+          'only write output files of which the content changed, which '
+          'preserves the modification time of unchanged files.'))
+
+  argument_parser.add_argument(
+      '-e', '--experimental', dest='experimental', action='store_true',
+      default=False, help='enable experimental functionality.')
+
+  argument_parser.add_argument(
+      '-g', '--generators', dest='generators', action='store', default='all',
+      help='names of the generators to run.')
+
+  argument_parser.add_argument(
+      '-j', '--jobs', dest='jobs', action='store', type=int, default=1,
+      metavar='NUMBER', help='number of projects to generate in parallel.')
+
+  argument_parser.add_argument(
+      '-n', '--names', dest='project_names', action='store', default=None,
+      help='names of the projects to generate, where all projects are the '
+           'default.')
+
+  argument_parser.add_argument(
+      '--parse-cache', dest='parse_cache_directory', action='store',
+      metavar='DIRECTORY', default=None, help=(
+          'path of the directory of the cache of parsed header and source '
+          'files, where {0:s} is the default. Cache files of other versions '
+          'of the parser and cache files that were not used for 30 days are '
+          'removed from the directory. To move the cache pass another '
+          'directory and to clear it remove the directory.').format(
+              parse_cache.GetDefaultDirectory()))
+
+  argument_parser.add_argument(
+      '-p', '--projects', dest='projects_directory', action='store',
+      metavar='PROJECTS_DIRECTORY', default=None,
+      help='path of the projects.')
+
+  argument_parser.add_argument(
+      '--symbol-database', dest='symbol_database_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of the symbol database file, which stores the analysis of '
+          'the library header files between runs so that unchanged include '
+          'headers are not parsed again, such as {0:s}. By default '
+          'no symbol database is used.').format(
+              symbol_database.GetDefaultPath()))
+
+  argument_parser.add_argument(
+      '--template-bundle', dest='template_bundle_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of a template bundle, built with template-bundle.py, to read '
+          'the templates from instead of data/source, such as {0:s}. By '
+          'default no template bundle is used.').format(
+              template_bundle.GetDefaultPath(libyal_directory)))
+
+  argument_parser.add_argument(
+      '--template-report', dest='template_report', action='store_true',
+      default=False, help=(
+          'report the templates in data/source that were not rendered, '
+          'where unused templates were looked up but not rendered and '
+          'unreachable templates were neither looked up nor rendered.'))
+
+  argument_parser.add_argument(
+      'configuration_file', action='store', metavar='PATH', nargs='?',
+      default=None, help=(
+          'path of the projects configuration file, where data/projects.ini '
+          'is the default.'))
+
+  options = argument_parser.parse_args()
+
+  configuration_file = options.configuration_file
+  if not configuration_file:
+    configuration_file = os.path.join(
+        libyal_directory, 'data', 'projects.ini')
+
+  if not os.path.exists(configuration_file):
+    print('No such configuration file: {0:s}.'.format(configuration_file))
+    print('')
+    return False
+
+  if options.jobs < 1:
+    print('Unsupported number of jobs: {0:d}.'.format(options.jobs))
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.INFO, format='[%(levelname)s] %(message)s')
+
+  parse_cache.PARSE_CACHE.SetDirectory(
+      options.parse_cache_directory or parse_cache.GetDefaultDirectory())
+
+  if options.symbol_database_path:
+    symbol_database.SYMBOL_DATABASE.SetPath(options.symbol_database_path)
+
+  projects_directory = options.projects_directory
+  if not projects_directory:
+    projects_directory = os.path.dirname(libyal_directory)
+
+  projects_directory = os.path.abspath(projects_directory)
+
+  if options.template_bundle_path:
+    source_generation.OpenTemplateBundle(
+        libyal_directory, options.template_bundle_path)
+
+  if options.generators == 'all':
+    generators = None
+  else:
+    generators = options.generators.split(',')
+
+  project_names = None
+  if options.project_names:
+    project_names = options.project_names.split(',')
+
+  reader = projects_reader.ProjectsReader()
+  projects = reader.ReadFromFile(configuration_file)
+
+  scheduler = job_scheduler.JobScheduler(number_of_jobs=options.jobs)
+
+  for project in projects:
+    if project_names and project.name not in project_names:
+      continue
+
+    if project.documentation_only:
+      continue
+
+    project_directory = os.path.join(projects_directory, project.name)
+    project_configuration_file = os.path.join(
+        project_directory, '{0:s}.ini'.format(project.name))
+
+    if not os.path.exists(project_configuration_file):
+      logging.warning(
+          'Missing: {0:s} skipping generation of project: {1:s}.'.format(
+              project_configuration_file, project.name))
+      continue
+
+    scheduler.AddJob(
+        project.name, source_generation.GenerateProjectSources, (
+            project.name, project_directory, project_configuration_file,
+            projects_directory, libyal_directory, generators,
+            options.experimental, options.only_changed))
+
+  try:
+    summaries = scheduler.Run()
+  except RuntimeError as exception:
+    logging.error('{0!s}'.format(exception))
+    return False
+
+  if not summaries:
+    print('No projects to generate.')
+    return True
+
+  total_duration = 0.0
+  total_number_of_changed_files = 0
+  cache_statistics = {'evictions': 0, 'hits': 0, 'misses': 0}
+  parse_cache_statistics = {'hits': 0, 'misses': 0}
+  output_files_statistics = {'changed': 0, 'new': 0, 'unchanged': 0}
+
+  print('')
+  print('{0:<32s} {1:>10s} {2:>14s}'.format(
+      'Project', 'Time (s)', 'Changed files'))
+
+  for project in projects:
+    summary = summaries.get(project.name, None)
+    if not summary:
+      continue
+
+    number_of_changed_files = len(summary['changed_files'])
+
+    print('{0:<32s} {1:>10.2f} {2:>14d}'.format(
+        summary['name'], summary['duration'], number_of_changed_files))
+
+    total_duration += summary['duration']
+    total_number_of_changed_files += number_of_changed_files
+
+    for key in cache_statistics:
+      cache_statistics[key] += summary['template_cache'][key]
+
+    for key in parse_cache_statistics:
+      parse_cache_statistics[key] += summary['parse_cache'][key]
+
+    for key in output_files_statistics:
+      output_files_statistics[key] += summary['output_files'][key]
+
+  print('{0:<32s} {1:>10.2f} {2:>14d}'.format(
+      'Total', total_duration, total_number_of_changed_files))
+  print('')
+
+  logging.info((
+      'Output files: {0:d} unchanged, {1:d} changed, {2:d} new.').format(
+          output_files_statistics['unchanged'],
+          output_files_statistics['changed'], output_files_statistics['new']))
+
+  logging.info('Parse cache: {0:d} hits, {1:d} misses.'.format(
+      parse_cache_statistics['hits'], parse_cache_statistics['misses']))
+
+  logging.info((
+      'Template cache: {0:d} hits, {1:d} misses, {2:d} evictions.').format(
+          cache_statistics['hits'], cache_statistics['misses'],
+          cache_statistics['evictions']))
+
+  if options.template_report:
+    looked_up_templates = set()
+    rendered_templates = set()
+    for summary in summaries.values():
+      looked_up_templates.update(summary['looked_up_templates'])
+      rendered_templates.update(summary['rendered_templates'])
+
+    unreachable_templates = []
+    unused_templates = []
+
+    sources_directory = os.path.join(libyal_directory, 'data', 'source')
+    for template_path in template_index.TEMPLATE_INDEX.GetTemplatePaths(
+        sources_directory):
+      if template_path in rendered_templates:
+        continue
+
+      if template_path in looked_up_templates:
+        unused_templates.append(template_path)
+      else:
+        unreachable_templates.append(template_path)
+
+    print('')
+    for description, template_paths in (
+        ('Unused templates', unused_templates),
+        ('Unreachable templates', unreachable_templates)):
+      print('{0:s} ({1:d}):'.format(description, len(template_paths)))
+      for template_path in template_paths:
+        print('\t{0:s}'.format(
+            os.path.relpath(template_path, sources_directory)))
+      print('')
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
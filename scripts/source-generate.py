@@ -11,17 +11,17 @@ import os
 import sys
 
 from yaldevtools import configuration
-from yaldevtools import output_writers
-from yaldevtools.source_generators import common
-from yaldevtools.source_generators import config
-from yaldevtools.source_generators import documents
-from yaldevtools.source_generators import include
-from yaldevtools.source_generators import library
-from yaldevtools.source_generators import manpage
-from yaldevtools.source_generators import python_module
-from yaldevtools.source_generators import scripts
-from yaldevtools.source_generators import tests
-from yaldevtools.source_generators import tools
+from yaldevtools import dependency_manifest
+from yaldevtools import job_scheduler
+from yaldevtools import parse_cache
+from yaldevtools import profiler
+from yaldevtools import source_generation
+from yaldevtools import symbol_database
+from yaldevtools import template_bundle
+
+
+# Name of the dependency manifest file, in the output directory.
+MANIFEST_FILENAME = '.source-generate.manifest'
 
 
 def Main():
@@ -30,9 +30,19 @@ def Main():
   Returns:
     bool: True if successful or False if not.
   """
+  libyal_directory = os.path.abspath(__file__)
+  libyal_directory = os.path.dirname(libyal_directory)
+  libyal_directory = os.path.dirname(libyal_directory)
+
   argument_parser = argparse.ArgumentParser(description=(
       'Generates source files of the libyal libraries.'))
 
+  argument_parser.add_argument(
+      '-c', '--only-changed', dest='only_changed', action='store_true',
+      default=False, help=(
+          'only write output files of which the content changed, which '
+          'preserves the modification time of unchanged files.'))
+
   argument_parser.add_argument(
       '-e', '--experimental', dest='experimental', action='store_true',
       default=False, help='enable experimental functionality.')
@@ -41,22 +51,76 @@ def Main():
       '-g', '--generators', dest='generators', action='store', default='all',
       help='names of the generators to run.')
 
+  argument_parser.add_argument(
+      '-i', '--incremental', dest='incremental', action='store_true',
+      default=False, help=(
+          'only run the generators of which the templates, configuration or '
+          'input files changed since the previous run, as recorded in a '
+          'dependency manifest in the output directory.'))
+
+  argument_parser.add_argument(
+      '-j', '--jobs', dest='jobs', action='store', type=int, default=1,
+      metavar='NUMBER', help=(
+          'number of generator categories to run in parallel, categories that '
+          'depend on the output of another category are run after it.'))
+
+  argument_parser.add_argument(
+      '--list-generators', dest='list_generators', action='store_true',
+      default=False, help=(
+          'list the names of the generators, which can be passed to -g, and '
+          'exit.'))
+
   argument_parser.add_argument(
       '-o', '--output', dest='output_directory', action='store',
       metavar='OUTPUT_DIRECTORY', default=None,
       help='path of the output files to write to.')
 
+  argument_parser.add_argument(
+      '--parse-cache', dest='parse_cache_directory', action='store',
+      metavar='DIRECTORY', default=None, help=(
+          'path of the directory of the cache of parsed header and source '
+          'files, where {0:s} is the default. Cache files of other versions '
+          'of the parser and cache files that were not used for 30 days are '
+          'removed from the directory. To move the cache pass another '
+          'directory and to clear it remove the directory.').format(
+              parse_cache.GetDefaultDirectory()))
+
   argument_parser.add_argument(
       '-p', '--projects', dest='projects_directory', action='store',
       metavar='PROJECTS_DIRECTORY', default=None,
       help='path of the projects.')
 
+  profiler.AddArguments(argument_parser)
+
   argument_parser.add_argument(
-      'configuration_file', action='store', metavar='PATH',
+      '--symbol-database', dest='symbol_database_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of the symbol database file, which stores the analysis of '
+          'the library header files between runs so that unchanged include '
+          'headers are not parsed again, such as {0:s}. By default '
+          'no symbol database is used.').format(
+              symbol_database.GetDefaultPath()))
+
+  argument_parser.add_argument(
+      '--template-bundle', dest='template_bundle_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of a template bundle, built with template-bundle.py, to read '
+          'the templates from instead of data/source, such as {0:s}. By '
+          'default no template bundle is used.').format(
+              template_bundle.GetDefaultPath(libyal_directory)))
+
+  argument_parser.add_argument(
+      'configuration_file', action='store', metavar='PATH', nargs='?',
       default='libyal.ini', help='path of the configuration file.')
 
   options = argument_parser.parse_args()
 
+  if options.list_generators:
+    for source_category in source_generation.GetSourceGeneratorNames():
+      print(source_category)
+
+    return True
+
   if not options.configuration_file:
     print('Configuration file missing.')
     print('')
@@ -75,20 +139,36 @@ def Main():
     print('')
     return False
 
+  if options.incremental and not options.output_directory:
+    print('Incremental generation requires an output directory.')
+    print('')
+    return False
+
+  if options.jobs < 1:
+    print('Unsupported number of jobs: {0:d}.'.format(options.jobs))
+    print('')
+    return False
+
   logging.basicConfig(
       level=logging.INFO, format='[%(levelname)s] %(message)s')
 
+  parse_cache.PARSE_CACHE.SetDirectory(
+      options.parse_cache_directory or parse_cache.GetDefaultDirectory())
+
+  if options.symbol_database_path:
+    symbol_database.SYMBOL_DATABASE.SetPath(options.symbol_database_path)
+
   project_configuration = configuration.ProjectConfiguration()
   project_configuration.ReadFromFile(options.configuration_file)
 
-  libyal_directory = os.path.abspath(__file__)
-  libyal_directory = os.path.dirname(libyal_directory)
-  libyal_directory = os.path.dirname(libyal_directory)
-
   projects_directory = options.projects_directory
   if not projects_directory:
     projects_directory = os.path.dirname(libyal_directory)
 
+  if options.template_bundle_path:
+    source_generation.OpenTemplateBundle(
+        libyal_directory, options.template_bundle_path)
+
   # TODO: generate more source files.
   # include headers
   # yal.net files
@@ -98,65 +178,116 @@ def Main():
   else:
     generators = options.generators.split(',')
 
-  SOURCE_GENERATORS = [
-      ('common', common.CommonSourceFileGenerator),
-      ('config', config.ConfigurationFileGenerator),
-      ('documents', documents.DocumentFileGenerator),
-      ('include', include.IncludeSourceFileGenerator),
-      ('libyal', library.LibrarySourceFileGenerator),
-      ('pyyal', python_module.PythonModuleSourceFileGenerator),
-      ('scripts', scripts.ScriptFileGenerator),
-      ('tests', tests.TestSourceFileGenerator),
-      ('yaltools', tools.ToolSourceFileGenerator),
-  ]
-
-  sources_directory = os.path.join(
-      libyal_directory, 'data', 'source')
-  for source_category, source_generator_class in SOURCE_GENERATORS:
-    if generators and source_category not in generators:
+  number_of_jobs = options.jobs
+  if number_of_jobs > 1 and not options.output_directory:
+    logging.info('Output to stdout, running generators sequentially.')
+    number_of_jobs = 1
+
+  generation_profiler = profiler.CreateProfiler(options)
+  if number_of_jobs > 1 and generation_profiler:
+    logging.info('Profiling, running generators sequentially.')
+    number_of_jobs = 1
+
+  scheduler = job_scheduler.JobScheduler(number_of_jobs=number_of_jobs)
+
+  source_generators = source_generation.GetSourceGenerators(
+      libyal_directory, generators=generators)
+
+  manifest = None
+  if options.incremental:
+    manifest_path = os.path.join(options.output_directory, MANIFEST_FILENAME)
+    templates_directory = os.path.join(libyal_directory, 'data', 'source')
+
+    manifest = dependency_manifest.DependencyManifest(
+        manifest_path, options.output_directory, templates_directory)
+    manifest.ReadFromFile()
+
+    code_hash = dependency_manifest.GetCodeHash(
+        os.path.join(libyal_directory, 'yaldevtools'))
+    configuration_hash = dependency_manifest.GetConfigurationHash(
+        project_configuration)
+
+  template_directories = {}
+  for (source_category, source_generator_class, template_directory,
+       dependencies) in source_generators:
+    # A category is also generated when a category it depends on is.
+    generated_dependencies = set(dependencies).intersection(
+        template_directories.keys())
+
+    if (manifest and not generated_dependencies and manifest.IsUpToDate(
+        source_category, template_directory, code_hash, configuration_hash)):
+      logging.info('Skipping up to date generator: {0:s}'.format(
+          source_category))
       continue
 
-    template_directory = os.path.join(sources_directory, source_category)
-    source_generator_object = source_generator_class(
-        projects_directory, template_directory,
-        experimental=options.experimental)
+    template_directories[source_category] = template_directory
 
-    if options.output_directory:
-      output_writer = output_writers.FileWriter(options.output_directory)
-    else:
-      output_writer = output_writers.StdoutWriter()
-
-    source_generator_object.Generate(project_configuration, output_writer)
+    scheduler.AddJob(
+        source_category, source_generation.GenerateSourceCategory, (
+            source_generator_class, projects_directory, template_directory,
+            project_configuration, options.output_directory,
+            options.experimental, options.only_changed),
+        dependencies=dependencies)
 
   # TODO: dpkg handle dependencies
 
   # TODO: add support for Unicode templates.
 
-  # TODO: generate manuals/Makefile.am
-
-  SOURCE_GENERATORS = [
-      ('libyal.3', manpage.LibraryManPageGenerator),
-  ]
+  if generation_profiler:
+    for _, source_generator_class, _, _ in source_generators:
+      generation_profiler.InstrumentClass(source_generator_class)
 
-  manuals_directory = os.path.join(
-      libyal_directory, 'data', 'source', 'manuals')
-  for source_category, source_generator_class in SOURCE_GENERATORS:
-    if generators and source_category not in generators:
-      continue
-
-    template_directory = os.path.join(manuals_directory, source_category)
-    source_generator_object = source_generator_class(
-        projects_directory, template_directory,
-        experimental=options.experimental)
-
-    if options.output_directory:
-      output_writer = output_writers.FileWriter(options.output_directory)
-    else:
-      output_writer = output_writers.StdoutWriter()
+    generation_profiler.Start()
 
-    source_generator_object.Generate(project_configuration, output_writer)
+  try:
+    results_per_category = scheduler.Run()
+  except RuntimeError as exception:
+    logging.error('{0!s}'.format(exception))
+    return False
 
-  # TODO: add support for Unicode templates.
+  finally:
+    if generation_profiler:
+      generation_profiler.Stop()
+
+  cache_statistics = {'evictions': 0, 'hits': 0, 'misses': 0}
+  parse_cache_statistics = {'hits': 0, 'misses': 0}
+  output_files_statistics = {'changed': 0, 'new': 0, 'unchanged': 0}
+  for result in results_per_category.values():
+    for key in cache_statistics:
+      cache_statistics[key] += result['template_cache'][key]
+
+    for key in parse_cache_statistics:
+      parse_cache_statistics[key] += result['parse_cache'][key]
+
+    if result['output_files']:
+      for key in output_files_statistics:
+        output_files_statistics[key] += result['output_files'][key]
+
+  if manifest:
+    for source_category, result in results_per_category.items():
+      manifest.SetCategory(
+          source_category, template_directories[source_category], code_hash,
+          configuration_hash, result['input_files'],
+          result['output_templates'],
+          input_directories=result['input_directories'])
+
+    manifest.WriteToFile()
+
+  # Output file statistics are only tracked when only changed files are
+  # written, to prevent reading all output files otherwise.
+  if options.output_directory and options.only_changed:
+    logging.info((
+        'Output files: {0:d} unchanged, {1:d} changed, {2:d} new.').format(
+            output_files_statistics['unchanged'],
+            output_files_statistics['changed'], output_files_statistics['new']))
+
+  logging.info('Parse cache: {0:d} hits, {1:d} misses.'.format(
+      parse_cache_statistics['hits'], parse_cache_statistics['misses']))
+
+  logging.info((
+      'Template cache: {0:d} hits, {1:d} misses, {2:d} evictions.').format(
+          cache_statistics['hits'], cache_statistics['misses'],
+          cache_statistics['evictions']))
 
   return True
 
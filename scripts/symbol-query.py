@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to query the symbols of multiple libyal libraries."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from yaldevtools import projects_reader
+from yaldevtools import symbol_database
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Queries the functions and enumeration types of multiple libyal '
+      'libraries. The libraries are indexed in a symbol database first, '
+      'where only libraries of which the header files changed are indexed '
+      'again.'))
+
+  argument_parser.add_argument(
+      '-d', '--database', dest='database_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of the symbol database file, where {0:s} is the '
+          'default.').format(symbol_database.GetDefaultPath()))
+
+  argument_parser.add_argument(
+      '-e', '--enums', dest='enums_pattern', action='store',
+      metavar='PATTERN', default=None, help=(
+          'glob pattern of the names of the enumeration types to list, such '
+          'as "*_ACCESS_FLAGS".'))
+
+  argument_parser.add_argument(
+      '-f', '--functions', dest='functions_pattern', action='store',
+      metavar='PATTERN', default=None, help=(
+          'glob pattern of the names of the functions to list, such as '
+          '"*_get_*_by_index".'))
+
+  argument_parser.add_argument(
+      '-n', '--names', dest='project_names', action='store', default=None,
+      help='names of the projects to query, where all projects are the '
+           'default.')
+
+  argument_parser.add_argument(
+      '-p', '--projects', dest='projects_directory', action='store',
+      metavar='PROJECTS_DIRECTORY', default=None,
+      help='path of the projects.')
+
+  argument_parser.add_argument(
+      'configuration_file', action='store', metavar='PATH', nargs='?',
+      default=None, help=(
+          'path of the projects configuration file, where data/projects.ini '
+          'is the default.'))
+
+  options = argument_parser.parse_args()
+
+  libyal_directory = os.path.abspath(__file__)
+  libyal_directory = os.path.dirname(libyal_directory)
+  libyal_directory = os.path.dirname(libyal_directory)
+
+  configuration_file = options.configuration_file
+  if not configuration_file:
+    configuration_file = os.path.join(
+        libyal_directory, 'data', 'projects.ini')
+
+  if not os.path.exists(configuration_file):
+    print('No such configuration file: {0:s}.'.format(configuration_file))
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.INFO, format='[%(levelname)s] %(message)s')
+
+  projects_directory = options.projects_directory
+  if not projects_directory:
+    projects_directory = os.path.dirname(libyal_directory)
+
+  projects_directory = os.path.abspath(projects_directory)
+
+  project_names = None
+  if options.project_names:
+    project_names = options.project_names.split(',')
+
+  database = symbol_database.SymbolDatabase(
+      path=options.database_path or symbol_database.GetDefaultPath())
+
+  reader = projects_reader.ProjectsReader()
+  projects = reader.ReadFromFile(configuration_file)
+
+  start_time = time.time()
+  number_of_indexed_projects = 0
+  number_of_projects = 0
+
+  for project in projects:
+    if project_names and project.name not in project_names:
+      continue
+
+    if project.documentation_only:
+      continue
+
+    if database.UpdateProject(project.name, projects_directory):
+      number_of_indexed_projects += 1
+
+    number_of_projects += 1
+
+  logging.info((
+      'Indexed {0:d} of {1:d} projects in {2:.2f} seconds.').format(
+          number_of_indexed_projects, number_of_projects,
+          time.time() - start_time))
+
+  start_time = time.time()
+
+  if options.functions_pattern:
+    for project_name, function_prototype in database.GetFunctionPrototypes(
+        name_pattern=options.functions_pattern):
+      if project_names and project_name not in project_names:
+        continue
+
+      print('{0:s}: {1:s} {2:s}( {3:s} );'.format(
+          project_name, function_prototype.return_type,
+          function_prototype.name, function_prototype.CopyToString()))
+
+  if options.enums_pattern:
+    for project_name, enum_declaration in database.GetEnumDeclarations(
+        name_pattern=options.enums_pattern):
+      if project_names and project_name not in project_names:
+        continue
+
+      print('{0:s}: enum {1:s}'.format(project_name, enum_declaration.name))
+      for name, value in enum_declaration.constants.items():
+        if value:
+          print('\t{0:s} = {1:s}'.format(name, value))
+        else:
+          print('\t{0:s}'.format(name))
+
+  logging.info('Queried symbols in {0:.3f} seconds.'.format(
+      time.time() - start_time))
+
+  database.Close()
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
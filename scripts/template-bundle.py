@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to pack the source templates into a template bundle."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import sys
+
+from yaldevtools import template_bundle
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  libyal_directory = os.path.abspath(__file__)
+  libyal_directory = os.path.dirname(libyal_directory)
+  libyal_directory = os.path.dirname(libyal_directory)
+
+  argument_parser = argparse.ArgumentParser(description=(
+      'Packs the templates in data/source into a single template bundle, '
+      'which the source generators read instead of the individual '
+      'templates when passed with --template-bundle.'))
+
+  argument_parser.add_argument(
+      '-o', '--output', dest='output_path', action='store', metavar='PATH',
+      default=None, help=(
+          'path of the template bundle, where {0:s} is the default.').format(
+              template_bundle.GetDefaultPath(libyal_directory)))
+
+  argument_parser.add_argument(
+      '--verify', dest='verify', action='store_true', default=False, help=(
+          'verify that the template bundle contains the current templates '
+          'instead of writing it.'))
+
+  options = argument_parser.parse_args()
+
+  output_path = options.output_path or template_bundle.GetDefaultPath(
+      libyal_directory)
+  sources_directory = os.path.join(libyal_directory, 'data', 'source')
+
+  if options.verify:
+    bundle = template_bundle.TemplateBundle()
+    try:
+      bundle.Open(output_path, sources_directory)
+    except (IOError, OSError) as exception:
+      print('Unable to open template bundle: {0:s} with error: {1!s}'.format(
+          output_path, exception))
+      print('')
+      return False
+
+    bundle_content_hash = bundle.content_hash
+    bundle.Close()
+
+    content_hash = template_bundle.GetContentHash(sources_directory)
+    if bundle_content_hash != content_hash:
+      print('Template bundle: {0:s} is out of date.'.format(output_path))
+      print('')
+      return False
+
+    print('Template bundle: {0:s} is up to date ({1:s}).'.format(
+        output_path, content_hash))
+    return True
+
+  content_hash = template_bundle.WriteTemplateBundle(
+      output_path, sources_directory)
+
+  print('Wrote template bundle: {0:s} ({1:s}).'.format(
+      output_path, content_hash))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -10,10 +10,11 @@ import argparse
 import io
 import os
 import re
-import string
 import sys
 
 from yaldevtools import configuration
+from yaldevtools import profiler
+from yaldevtools import template_cache
 
 
 class WikiPageGenerator(object):
@@ -863,10 +864,8 @@ class WikiPageGenerator(object):
     """
     path = os.path.join(self._template_directory, filename)
 
-    with io.open(path, 'r', encoding='utf8') as file_object:
-      file_data = file_object.read()
-
-    return string.Template(file_data)
+    return template_cache.TEMPLATE_CACHE.GetTemplate(
+        path, universal_newlines=True)
 
   @abc.abstractmethod
   def Generate(self, project_configuration, output_writer):
@@ -1364,6 +1363,8 @@ def Main():
       metavar='OUTPUT_DIRECTORY', default=None,
       help='path of the output files to write to.')
 
+  profiler.AddArguments(argument_parser)
+
   options = argument_parser.parse_args()
 
   if not options.configuration_file:
@@ -1433,29 +1434,41 @@ def Main():
       ('Troubleshooting', TroubleshootingPageGenerator),
   ]
 
-  for page_name, page_generator_class in wiki_pages:
-    template_directory = os.path.join(
-        libyal_directory, 'data', 'wiki', page_name)
-    wiki_page = page_generator_class(template_directory)
+  generation_profiler = profiler.CreateProfiler(options)
+  if generation_profiler:
+    for _, page_generator_class in wiki_pages:
+      generation_profiler.InstrumentClass(page_generator_class)
 
-    if not wiki_page.HasContent(project_configuration):
-      continue
+    generation_profiler.Start()
 
-    if options.output_directory:
-      filename = '{0:s}.md'.format(page_name)
-      output_file = os.path.join(options.output_directory, filename)
-      output_writer = FileWriter(output_file)
-    else:
-      output_writer = StdoutWriter()
+  try:
+    for page_name, page_generator_class in wiki_pages:
+      template_directory = os.path.join(
+          libyal_directory, 'data', 'wiki', page_name)
+      wiki_page = page_generator_class(template_directory)
+
+      if not wiki_page.HasContent(project_configuration):
+        continue
+
+      if options.output_directory:
+        filename = '{0:s}.md'.format(page_name)
+        output_file = os.path.join(options.output_directory, filename)
+        output_writer = FileWriter(output_file)
+      else:
+        output_writer = StdoutWriter()
+
+      if not output_writer.Open():
+        print('Unable to open output writer.')
+        print('')
+        return False
 
-    if not output_writer.Open():
-      print('Unable to open output writer.')
-      print('')
-      return False
+      wiki_page.Generate(project_configuration, output_writer)
 
-    wiki_page.Generate(project_configuration, output_writer)
+      output_writer.Close()
 
-    output_writer.Close()
+  finally:
+    if generation_profiler:
+      generation_profiler.Stop()
 
   # TODO: add support for Unicode templates.
 
@@ -0,0 +1,74 @@
+/*
+ * Error functions
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBXYZ_INTERNAL_ERROR_H )
+#define _LIBXYZ_INTERNAL_ERROR_H
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#if !defined( HAVE_LOCAL_LIBXYZ )
+#include <libxyz/error.h>
+#endif
+
+#include "libxyz_extern.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+#if !defined( HAVE_LOCAL_LIBXYZ )
+
+LIBXYZ_EXTERN \
+void libxyz_error_free(
+      libxyz_error_t **error );
+
+LIBXYZ_EXTERN \
+int libxyz_error_fprint(
+     libxyz_error_t *error,
+     FILE *stream );
+
+LIBXYZ_EXTERN \
+int libxyz_error_sprint(
+     libxyz_error_t *error,
+     char *string,
+     size_t size );
+
+LIBXYZ_EXTERN \
+int libxyz_error_backtrace_fprint(
+     libxyz_error_t *error,
+     FILE *stream );
+
+LIBXYZ_EXTERN \
+int libxyz_error_backtrace_sprint(
+     libxyz_error_t *error,
+     char *string,
+     size_t size );
+
+#endif /* !defined( HAVE_LOCAL_LIBXYZ ) */
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBXYZ_INTERNAL_ERROR_H ) */
+
@@ -0,0 +1,124 @@
+/*
+ * Python object wrapper of libxyz_file_t
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYXYZ_FILE_H )
+#define _PYXYZ_FILE_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyxyz_libbfio.h"
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyxyz_file pyxyz_file_t;
+
+struct pyxyz_file
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+
+	/* The libxyz file
+	 */
+	libxyz_file_t *file;
+
+	/* The libbfio file IO handle
+	 */
+	libbfio_handle_t *file_io_handle;
+};
+
+extern PyMethodDef pyxyz_file_object_methods[];
+extern PyTypeObject pyxyz_file_type_object;
+
+int pyxyz_file_init(
+     pyxyz_file_t *pyxyz_file );
+
+void pyxyz_file_free(
+      pyxyz_file_t *pyxyz_file );
+
+PyObject *pyxyz_file_signal_abort(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments );
+
+PyObject *pyxyz_file_open(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyxyz_file_open_file_object(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyxyz_file_close(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments );
+
+PyObject *pyxyz_file_get_size(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments );
+
+PyObject *pyxyz_file_get_ascii_codepage(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments );
+
+int pyxyz_file_set_ascii_codepage_from_string(
+     pyxyz_file_t *pyxyz_file,
+     const char *codepage_string );
+
+PyObject *pyxyz_file_set_ascii_codepage(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments,
+           PyObject *keywords );
+
+int pyxyz_file_set_ascii_codepage_setter(
+     pyxyz_file_t *pyxyz_file,
+     PyObject *string_object,
+     void *closure );
+
+PyObject *pyxyz_file_get_number_of_items(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments );
+
+PyObject *pyxyz_file_get_item_by_index(
+           PyObject *pyxyz_file,
+           int item_index );
+
+PyObject *pyxyz_file_get_item(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyxyz_file_get_items(
+           pyxyz_file_t *pyxyz_file,
+           PyObject *arguments );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYXYZ_FILE_H ) */
+
@@ -0,0 +1,35 @@
+import argparse
+import os
+import sys
+import unittest
+
+import pyxyz
+
+
+
+  def test_open(self):
+    """Tests the open function."""
+    if not unittest.source:
+      raise unittest.SkipTest("missing source")
+
+    with open(unittest.source, "rb") as file_object:
+
+  def test_open_close(self):
+    """Tests the open and close functions."""
+    if not unittest.source:
+      return
+
+
+if __name__ == "__main__":
+  argument_parser = argparse.ArgumentParser()
+
+  argument_parser.add_argument(
+      "source", nargs="?", action="store", metavar="PATH",
+      default=None, help="path of the source file.")
+
+  options, unknown_options = argument_parser.parse_known_args()
+  unknown_options.insert(0, sys.argv[0])
+
+  setattr(unittest, "source", options.source)
+
+  unittest.main(argv=unknown_options, verbosity=2)
@@ -0,0 +1,20 @@
+import argparse
+import os
+import sys
+import unittest
+
+import pyxyz
+
+
+
+
+if __name__ == "__main__":
+  argument_parser = argparse.ArgumentParser()
+
+
+  options, unknown_options = argument_parser.parse_known_args()
+  unknown_options.insert(0, sys.argv[0])
+
+
+
+  unittest.main(argv=unknown_options, verbosity=2)
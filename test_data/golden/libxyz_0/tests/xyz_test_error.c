@@ -0,0 +1,151 @@
+/*
+ * Library error functions test program
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "xyz_test_libcerror.h"
+#include "xyz_test_libxyz.h"
+#include "xyz_test_macros.h"
+#include "xyz_test_unused.h"
+
+/* Tests the libxyz_error_free function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_error_free(
+     void )
+{
+	/* Test invocation of function only
+	 */
+	libxyz_error_free(
+	 NULL );
+
+	return( 1 );
+}
+
+/* Tests the libxyz_error_fprint function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_error_fprint(
+     void )
+{
+	/* Test invocation of function only
+	 */
+	libxyz_error_fprint(
+	 NULL,
+	 NULL );
+
+	return( 1 );
+}
+
+/* Tests the libxyz_error_sprint function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_error_sprint(
+     void )
+{
+	/* Test invocation of function only
+	 */
+	libxyz_error_sprint(
+	 NULL,
+	 NULL,
+	 0 );
+
+	return( 1 );
+}
+
+/* Tests the libxyz_error_backtrace_fprint function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_error_backtrace_fprint(
+     void )
+{
+	/* Test invocation of function only
+	 */
+	libxyz_error_backtrace_fprint(
+	 NULL,
+	 NULL );
+
+	return( 1 );
+}
+
+/* Tests the libxyz_error_backtrace_sprint function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_error_backtrace_sprint(
+     void )
+{
+	/* Test invocation of function only
+	 */
+	libxyz_error_backtrace_sprint(
+	 NULL,
+	 NULL,
+	 0 );
+
+	return( 1 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc XYZ_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] XYZ_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc XYZ_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] XYZ_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	XYZ_TEST_UNREFERENCED_PARAMETER( argc )
+	XYZ_TEST_UNREFERENCED_PARAMETER( argv )
+
+	XYZ_TEST_RUN(
+	 "libxyz_error_free",
+	 xyz_test_error_free );
+
+	XYZ_TEST_RUN(
+	 "libxyz_error_fprint",
+	 xyz_test_error_fprint );
+
+	XYZ_TEST_RUN(
+	 "libxyz_error_sprint",
+	 xyz_test_error_sprint );
+
+	XYZ_TEST_RUN(
+	 "libxyz_error_backtrace_fprint",
+	 xyz_test_error_backtrace_fprint );
+
+	XYZ_TEST_RUN(
+	 "libxyz_error_backtrace_sprint",
+	 xyz_test_error_backtrace_sprint );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,88 @@
+/*
+ * Info handle
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _INFO_HANDLE_H )
+#define _INFO_HANDLE_H
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#include "xyztools_libcerror.h"
+#include "xyztools_libxyz.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct info_handle info_handle_t;
+
+struct info_handle
+{
+	/* The file
+	 */
+	libxyz_file_t *file;
+
+	/* The ascii codepage
+	 */
+	int ascii_codepage;
+
+	/* The notification output stream
+	 */
+	FILE *notify_stream;
+
+	/* Value to indicate if abort was signalled
+	 */
+	int abort;
+};
+
+int info_handle_initialize(
+     info_handle_t **info_handle,
+     libcerror_error_t **error );
+
+int info_handle_free(
+     info_handle_t **info_handle,
+     libcerror_error_t **error );
+
+int info_handle_signal_abort(
+     info_handle_t *info_handle,
+     libcerror_error_t **error );
+
+int info_handle_set_ascii_codepage(
+     info_handle_t *info_handle,
+     const system_character_t *string,
+     libcerror_error_t **error );
+
+int info_handle_open(
+     info_handle_t *info_handle,
+     const system_character_t *filename,
+     libcerror_error_t **error );
+
+int info_handle_close(
+     info_handle_t *info_handle,
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _INFO_HANDLE_H ) */
+
@@ -0,0 +1,612 @@
+/*
+ * Mounts None
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <system_string.h>
+#include <types.h>
+
+#include <stdio.h>
+
+#if defined( HAVE_IO_H ) || defined( WINAPI )
+#include <io.h>
+#endif
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#if defined( HAVE_UNISTD_H )
+#include <unistd.h>
+#endif
+
+#include "mount_dokan.h"
+#include "mount_fuse.h"
+#include "mount_handle.h"
+#include "xyztools_getopt.h"
+#include "xyztools_i18n.h"
+#include "xyztools_libcerror.h"
+#include "xyztools_libclocale.h"
+#include "xyztools_libcnotify.h"
+#include "xyztools_libxyz.h"
+#include "xyztools_output.h"
+#include "xyztools_signal.h"
+#include "xyztools_unused.h"
+
+mount_handle_t *xyzmount_mount_handle = NULL;
+int xyzmount_abort                    = 0;
+
+/* Prints usage information
+ */
+void usage_fprint(
+      FILE *stream )
+{
+	if( stream == NULL )
+	{
+		return;
+	}
+	fprintf( stream, "Use xyzmount to mount None\n\n" );
+
+	fprintf( stream, "Usage: xyzmount [ -c codepage ] [ -X extended_options ] [ -hvV ] file\n"
+	                 "                mount_point\n\n" );
+
+	fprintf( stream, "\tfile:        None\n\n" );
+	fprintf( stream, "\tmount_point: the directory to serve as mount point\n\n" );
+
+	fprintf( stream, "\t-c:          codepage of ASCII strings, options: ascii, windows-874, windows-932,\n"
+	                 "\t             windows-936, windows-949, windows-950, windows-1250, windows-1251,\n"
+	                 "\t             windows-1252 (default), windows-1253, windows-1254, windows-1255,\n"
+	                 "\t             windows-1256, windows-1257 or windows-1258\n" );
+	fprintf( stream, "\t-h:          shows this help\n" );
+	fprintf( stream, "\t-v:          verbose output to stderr, while xyzmount will remain running in the\n"
+	                 "\t             foreground\n" );
+	fprintf( stream, "\t-V:          print version\n" );
+	fprintf( stream, "\t-X:          extended options to pass to sub system\n" );
+}
+
+/* Signal handler for xyzmount
+ */
+void xyzmount_signal_handler(
+      xyztools_signal_t signal XYZTOOLS_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "xyzmount_signal_handler";
+
+	XYZTOOLS_UNREFERENCED_PARAMETER( signal )
+
+	xyzmount_abort = 1;
+
+	if( xyzmount_mount_handle != NULL )
+	{
+		if( mount_handle_signal_abort(
+		     xyzmount_mount_handle,
+		     &error ) != 1 )
+		{
+			libcnotify_printf(
+			 "%s: unable to signal mount handle to abort.\n",
+			 function );
+
+			libcnotify_print_error_backtrace(
+			 error );
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	/* Force stdin to close otherwise any function reading it will remain blocked
+	 */
+#if defined( WINAPI ) && !defined( __CYGWIN__ )
+	if( _close(
+	     0 ) != 0 )
+#else
+	if( close(
+	     0 ) != 0 )
+#endif
+	{
+		libcnotify_printf(
+		 "%s: unable to close stdin.\n",
+		 function );
+	}
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain( int argc, wchar_t * const argv[] )
+#else
+int main( int argc, char * const argv[] )
+#endif
+{
+	libxyz_error_t *error                       = NULL;
+	system_character_t *mount_point             = NULL;
+	system_character_t *option_codepage         = NULL;
+	system_character_t *option_extended_options = NULL;
+	system_character_t *source                  = NULL;
+	char *program                               = "xyzmount";
+	system_integer_t option                     = 0;
+	int result                                  = 0;
+	int verbose                                 = 0;
+
+#if defined( HAVE_LIBFUSE ) || defined( HAVE_LIBOSXFUSE )
+	struct fuse_operations xyzmount_fuse_operations;
+
+	struct fuse_args xyzmount_fuse_arguments = FUSE_ARGS_INIT(0, NULL);
+	struct fuse_chan *xyzmount_fuse_channel  = NULL;
+	struct fuse *xyzmount_fuse_handle        = NULL;
+
+#elif defined( HAVE_LIBDOKAN )
+	DOKAN_OPERATIONS xyzmount_dokan_operations;
+	DOKAN_OPTIONS xyzmount_dokan_options;
+#endif
+
+	libcnotify_stream_set(
+	 stderr,
+	 NULL );
+	libcnotify_verbose_set(
+	 1 );
+
+	if( libclocale_initialize(
+	     "xyztools",
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to initialize locale values.\n" );
+
+		goto on_error;
+	}
+	if( xyztools_output_initialize(
+	     _IONBF,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to initialize output settings.\n" );
+
+		goto on_error;
+	}
+	xyztools_output_version_fprint(
+	 stdout,
+	 program );
+
+	while( ( option = xyztools_getopt(
+	                   argc,
+	                   argv,
+	                   _SYSTEM_STRING( "c:hvVX:" ) ) ) != (system_integer_t) -1 )
+	{
+		switch( option )
+		{
+			case (system_integer_t) '?':
+			default:
+				fprintf(
+				 stderr,
+				 "Invalid argument: %" PRIs_SYSTEM "\n",
+				 argv[ optind - 1 ] );
+
+				usage_fprint(
+				 stdout );
+
+				return( EXIT_FAILURE );
+
+			case (system_integer_t) 'c':
+				option_codepage = optarg;
+
+				break;
+
+			case (system_integer_t) 'h':
+				usage_fprint(
+				 stdout );
+
+				return( EXIT_SUCCESS );
+
+			case (system_integer_t) 'v':
+				verbose = 1;
+
+				break;
+
+			case (system_integer_t) 'V':
+				xyztools_output_copyright_fprint(
+				 stdout );
+
+				return( EXIT_SUCCESS );
+
+			case (system_integer_t) 'X':
+				option_extended_options = optarg;
+
+				break;
+		}
+	}
+	if( optind == argc )
+	{
+		fprintf(
+		 stderr,
+		 "Missing source file.\n" );
+
+		usage_fprint(
+		 stdout );
+
+		return( EXIT_FAILURE );
+	}
+	source = argv[ optind++ ];
+
+	if( optind == argc )
+	{
+		fprintf(
+		 stderr,
+		 "Missing mount point.\n" );
+
+		usage_fprint(
+		 stdout );
+
+		return( EXIT_FAILURE );
+	}
+	mount_point = argv[ optind ];
+
+	libcnotify_verbose_set(
+	 verbose );
+	libxyz_notify_set_stream(
+	 stderr,
+	 NULL );
+	libxyz_notify_set_verbose(
+	 verbose );
+
+	if( mount_handle_initialize(
+	     &xyzmount_mount_handle,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to initialize mount handle.\n" );
+
+		goto on_error;
+	}
+	if( option_codepage != NULL )
+	{
+		result = mount_handle_set_ascii_codepage(
+		          xyzmount_mount_handle,
+		          option_codepage,
+		          &error );
+
+		if( result == -1 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable to set ASCII codepage in mount handle.\n" );
+
+			goto on_error;
+		}
+		else if( result == 0 )
+		{
+			fprintf(
+			 stderr,
+			 "Unsupported ASCII codepage defaulting to: windows-1252.\n" );
+		}
+	}
+	if( mount_handle_open(
+	     xyzmount_mount_handle,
+	     source,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to open source file\n" );
+
+		goto on_error;
+	}
+#if defined( HAVE_LIBFUSE ) || defined( HAVE_LIBOSXFUSE )
+	if( option_extended_options != NULL )
+	{
+		/* This argument is required but ignored
+		 */
+		if( fuse_opt_add_arg(
+		     &xyzmount_fuse_arguments,
+		     "" ) != 0 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable add fuse arguments.\n" );
+
+			goto on_error;
+		}
+		if( fuse_opt_add_arg(
+		     &xyzmount_fuse_arguments,
+		     "-o" ) != 0 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable add fuse arguments.\n" );
+
+			goto on_error;
+		}
+		if( fuse_opt_add_arg(
+		     &xyzmount_fuse_arguments,
+		     option_extended_options ) != 0 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable add fuse arguments.\n" );
+
+			goto on_error;
+		}
+	}
+	if( memory_set(
+	     &xyzmount_fuse_operations,
+	     0,
+	     sizeof( struct fuse_operations ) ) == NULL )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to clear fuse operations.\n" );
+
+		goto on_error;
+	}
+	xyzmount_fuse_operations.open       = &mount_fuse_open;
+	xyzmount_fuse_operations.read       = &mount_fuse_read;
+	xyzmount_fuse_operations.release    = &mount_fuse_release;
+	xyzmount_fuse_operations.opendir    = &mount_fuse_opendir;
+	xyzmount_fuse_operations.readdir    = &mount_fuse_readdir;
+	xyzmount_fuse_operations.releasedir = &mount_fuse_releasedir;
+	xyzmount_fuse_operations.getattr    = &mount_fuse_getattr;
+	xyzmount_fuse_operations.destroy    = &mount_fuse_destroy;
+
+	xyzmount_fuse_channel = fuse_mount(
+	                         mount_point,
+	                         &xyzmount_fuse_arguments );
+
+	if( xyzmount_fuse_channel == NULL )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to create fuse channel.\n" );
+
+		goto on_error;
+	}
+	xyzmount_fuse_handle = fuse_new(
+	                        xyzmount_fuse_channel,
+	                        &xyzmount_fuse_arguments,
+	                        &xyzmount_fuse_operations,
+	                        sizeof( struct fuse_operations ),
+	                        xyzmount_mount_handle );
+
+	if( xyzmount_fuse_handle == NULL )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to create fuse handle.\n" );
+
+		goto on_error;
+	}
+	if( verbose == 0 )
+	{
+		if( fuse_daemonize(
+		     0 ) != 0 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable to daemonize fuse.\n" );
+
+			goto on_error;
+		}
+	}
+	result = fuse_loop(
+	          xyzmount_fuse_handle );
+
+	if( result != 0 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to run fuse loop.\n" );
+
+		goto on_error;
+	}
+	fuse_destroy(
+	 xyzmount_fuse_handle );
+
+	fuse_opt_free_args(
+	 &xyzmount_fuse_arguments );
+
+	return( EXIT_SUCCESS );
+
+#elif defined( HAVE_LIBDOKAN )
+	if( memory_set(
+	     &xyzmount_dokan_operations,
+	     0,
+	     sizeof( DOKAN_OPERATIONS ) ) == NULL )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to clear dokan operations.\n" );
+
+		goto on_error;
+	}
+	if( memory_set(
+	     &xyzmount_dokan_options,
+	     0,
+	     sizeof( DOKAN_OPTIONS ) ) == NULL )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to clear dokan options.\n" );
+
+		goto on_error;
+	}
+	xyzmount_dokan_options.Version     = DOKAN_VERSION;
+	xyzmount_dokan_options.ThreadCount = 0;
+	xyzmount_dokan_options.MountPoint  = mount_point;
+
+	if( verbose != 0 )
+	{
+		xyzmount_dokan_options.Options |= DOKAN_OPTION_STDERR;
+#if defined( HAVE_DEBUG_OUTPUT )
+		xyzmount_dokan_options.Options |= DOKAN_OPTION_DEBUG;
+#endif
+	}
+/* This will only affect the drive properties
+	xyzmount_dokan_options.Options |= DOKAN_OPTION_REMOVABLE;
+*/
+
+#if ( DOKAN_VERSION >= 600 ) && ( DOKAN_VERSION < 800 )
+	xyzmount_dokan_options.Options |= DOKAN_OPTION_KEEP_ALIVE;
+
+	xyzmount_dokan_operations.CreateFile           = &mount_dokan_CreateFile;
+	xyzmount_dokan_operations.OpenDirectory        = &mount_dokan_OpenDirectory;
+	xyzmount_dokan_operations.CreateDirectory      = NULL;
+	xyzmount_dokan_operations.Cleanup              = NULL;
+	xyzmount_dokan_operations.CloseFile            = &mount_dokan_CloseFile;
+	xyzmount_dokan_operations.ReadFile             = &mount_dokan_ReadFile;
+	xyzmount_dokan_operations.WriteFile            = NULL;
+	xyzmount_dokan_operations.FlushFileBuffers     = NULL;
+	xyzmount_dokan_operations.GetFileInformation   = &mount_dokan_GetFileInformation;
+	xyzmount_dokan_operations.FindFiles            = &mount_dokan_FindFiles;
+	xyzmount_dokan_operations.FindFilesWithPattern = NULL;
+	xyzmount_dokan_operations.SetFileAttributes    = NULL;
+	xyzmount_dokan_operations.SetFileTime          = NULL;
+	xyzmount_dokan_operations.DeleteFile           = NULL;
+	xyzmount_dokan_operations.DeleteDirectory      = NULL;
+	xyzmount_dokan_operations.MoveFile             = NULL;
+	xyzmount_dokan_operations.SetEndOfFile         = NULL;
+	xyzmount_dokan_operations.SetAllocationSize    = NULL;
+	xyzmount_dokan_operations.LockFile             = NULL;
+	xyzmount_dokan_operations.UnlockFile           = NULL;
+	xyzmount_dokan_operations.GetFileSecurity      = NULL;
+	xyzmount_dokan_operations.SetFileSecurity      = NULL;
+	xyzmount_dokan_operations.GetDiskFreeSpace     = NULL;
+	xyzmount_dokan_operations.GetVolumeInformation = &mount_dokan_GetVolumeInformation;
+	xyzmount_dokan_operations.Unmount              = &mount_dokan_Unmount;
+
+#else
+	xyzmount_dokan_operations.ZwCreateFile         = &mount_dokan_ZwCreateFile;
+	xyzmount_dokan_operations.Cleanup              = NULL;
+	xyzmount_dokan_operations.CloseFile            = &mount_dokan_CloseFile;
+	xyzmount_dokan_operations.ReadFile             = &mount_dokan_ReadFile;
+	xyzmount_dokan_operations.WriteFile            = NULL;
+	xyzmount_dokan_operations.FlushFileBuffers     = NULL;
+	xyzmount_dokan_operations.GetFileInformation   = &mount_dokan_GetFileInformation;
+	xyzmount_dokan_operations.FindFiles            = &mount_dokan_FindFiles;
+	xyzmount_dokan_operations.FindFilesWithPattern = NULL;
+	xyzmount_dokan_operations.SetFileAttributes    = NULL;
+	xyzmount_dokan_operations.SetFileTime          = NULL;
+	xyzmount_dokan_operations.DeleteFile           = NULL;
+	xyzmount_dokan_operations.DeleteDirectory      = NULL;
+	xyzmount_dokan_operations.MoveFile             = NULL;
+	xyzmount_dokan_operations.SetEndOfFile         = NULL;
+	xyzmount_dokan_operations.SetAllocationSize    = NULL;
+	xyzmount_dokan_operations.LockFile             = NULL;
+	xyzmount_dokan_operations.UnlockFile           = NULL;
+	xyzmount_dokan_operations.GetFileSecurity      = NULL;
+	xyzmount_dokan_operations.SetFileSecurity      = NULL;
+	xyzmount_dokan_operations.GetDiskFreeSpace     = NULL;
+	xyzmount_dokan_operations.GetVolumeInformation = &mount_dokan_GetVolumeInformation;
+	xyzmount_dokan_operations.Unmounted            = NULL;
+	xyzmount_dokan_operations.FindStreams          = NULL;
+	xyzmount_dokan_operations.Mounted              = NULL;
+
+#endif /* ( DOKAN_VERSION >= 600 ) && ( DOKAN_VERSION < 800 ) */
+
+	result = DokanMain(
+	          &xyzmount_dokan_options,
+	          &xyzmount_dokan_operations );
+
+	switch( result )
+	{
+		case DOKAN_SUCCESS:
+			break;
+
+		case DOKAN_ERROR:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: generic error\n" );
+			break;
+
+		case DOKAN_DRIVE_LETTER_ERROR:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: bad drive letter\n" );
+			break;
+
+		case DOKAN_DRIVER_INSTALL_ERROR:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: unable to load driver\n" );
+			break;
+
+		case DOKAN_START_ERROR:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: driver error\n" );
+			break;
+
+		case DOKAN_MOUNT_ERROR:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: unable to assign drive letter\n" );
+			break;
+
+		case DOKAN_MOUNT_POINT_ERROR:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: mount point error\n" );
+			break;
+
+		default:
+			fprintf(
+			 stderr,
+			 "Unable to run dokan main: unknown error: %d\n",
+			 result );
+			break;
+	}
+	return( EXIT_SUCCESS );
+
+#else
+	fprintf(
+	 stderr,
+	 "No sub system to mount XYZ format.\n" );
+
+	return( EXIT_FAILURE );
+
+#endif /* defined( HAVE_LIBFUSE ) || defined( HAVE_LIBOSXFUSE ) */
+
+on_error:
+	if( error != NULL )
+	{
+		libcnotify_print_error_backtrace(
+		 error );
+		libcerror_error_free(
+		 &error );
+	}
+#if defined( HAVE_LIBFUSE ) || defined( HAVE_LIBOSXFUSE )
+	if( xyzmount_fuse_handle != NULL )
+	{
+		fuse_destroy(
+		 xyzmount_fuse_handle );
+	}
+	fuse_opt_free_args(
+	 &xyzmount_fuse_arguments );
+#endif
+	if( xyzmount_mount_handle != NULL )
+	{
+		mount_handle_free(
+		 &xyzmount_mount_handle,
+		 NULL );
+	}
+	return( EXIT_FAILURE );
+}
+
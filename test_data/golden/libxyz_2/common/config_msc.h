@@ -0,0 +1,34 @@
+/*
+ * Configuration for the Microsoft Visual Studio C++ compiler
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _CONFIG_MSC_H )
+#define _CONFIG_MSC_H
+
+/* Disable warning C4127: conditional expression is constant
+ */
+#pragma warning( disable : 4127 )
+
+/* Disable warning C4201: nonstandard extension used : nameless struct/union
+ */
+#pragma warning( disable : 4201 )
+
+#endif /* !defined( _CONFIG_MSC_H ) */
+
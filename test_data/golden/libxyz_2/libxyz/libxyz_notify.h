@@ -0,0 +1,63 @@
+/*
+ * Notification functions
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBXYZ_NOTIFY_H )
+#define _LIBXYZ_NOTIFY_H
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#include "libxyz_extern.h"
+#include "libxyz_libcerror.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+#if !defined( HAVE_LOCAL_LIBXYZ )
+
+LIBXYZ_EXTERN \
+void libxyz_notify_set_verbose(
+      int verbose );
+
+LIBXYZ_EXTERN \
+int libxyz_notify_set_stream(
+     FILE *stream,
+     libcerror_error_t **error );
+
+LIBXYZ_EXTERN \
+int libxyz_notify_stream_open(
+     const char *filename,
+     libcerror_error_t **error );
+
+LIBXYZ_EXTERN \
+int libxyz_notify_stream_close(
+     libcerror_error_t **error );
+
+#endif /* !defined( HAVE_LOCAL_LIBXYZ ) */
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBXYZ_NOTIFY_H ) */
+
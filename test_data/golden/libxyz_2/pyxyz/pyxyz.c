@@ -0,0 +1,729 @@
+/*
+ * Python bindings module for libxyz (pyxyz)
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <narrow_string.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( HAVE_WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "pyxyz.h"
+#include "pyxyz_error.h"
+#include "pyxyz_file.h"
+#include "pyxyz_file_attribute_flags.h"
+#include "pyxyz_file_object_io_handle.h"
+#include "pyxyz_item.h"
+#include "pyxyz_item_types.h"
+#include "pyxyz_items.h"
+#include "pyxyz_libbfio.h"
+#include "pyxyz_libcerror.h"
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+#include "pyxyz_unused.h"
+#include "pyxyz_value0.h"
+#include "pyxyz_value0s.h"
+#include "pyxyz_value1.h"
+#include "pyxyz_value1s.h"
+
+#if !defined( LIBXYZ_HAVE_BFIO )
+
+LIBXYZ_EXTERN \
+int libxyz_check_file_signature_file_io_handle(
+     libbfio_handle_t *file_io_handle,
+     libxyz_error_t **error );
+
+#endif /* !defined( LIBXYZ_HAVE_BFIO ) */
+
+/* The pyxyz module methods
+ */
+PyMethodDef pyxyz_module_methods[] = {
+	{ "get_version",
+	  (PyCFunction) pyxyz_get_version,
+	  METH_NOARGS,
+	  "get_version() -> String\n"
+	  "\n"
+	  "Retrieves the version." },
+
+	{ "check_file_signature",
+	  (PyCFunction) pyxyz_check_file_signature,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "check_file_signature(filename) -> Boolean\n"
+	  "\n"
+	  "Checks if a file has a Example (XYZ) file signature." },
+
+	{ "check_file_signature_file_object",
+	  (PyCFunction) pyxyz_check_file_signature_file_object,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "check_file_signature_file_object(file_object) -> Boolean\n"
+	  "\n"
+	  "Checks if a file has a Example (XYZ) file signature using a file-like object." },
+
+	{ "open",
+	  (PyCFunction) pyxyz_open_new_file,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "open(filename, mode='r') -> Object\n"
+	  "\n"
+	  "Opens a file." },
+
+	{ "open_file_object",
+	  (PyCFunction) pyxyz_open_new_file_with_file_object,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "open_file_object(file_object, mode='r') -> Object\n"
+	  "\n"
+	  "Opens a file using a file-like object." },
+
+	/* Sentinel */
+	{ NULL, NULL, 0, NULL }
+};
+
+/* Retrieves the pyxyz/libxyz version
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_get_version(
+           PyObject *self PYXYZ_ATTRIBUTE_UNUSED,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	const char *errors           = NULL;
+	const char *version_string   = NULL;
+	size_t version_string_length = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( self )
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	Py_BEGIN_ALLOW_THREADS
+
+	version_string = libxyz_get_version();
+
+	Py_END_ALLOW_THREADS
+
+	version_string_length = narrow_string_length(
+	                         version_string );
+
+	/* Pass the string length to PyUnicode_DecodeUTF8
+	 * otherwise it makes the end of string character is part
+	 * of the string
+	 */
+	return( PyUnicode_DecodeUTF8(
+	         version_string,
+	         (Py_ssize_t) version_string_length,
+	         errors ) );
+}
+
+/* Checks if a file has a Example (XYZ) file signature
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_check_file_signature(
+           PyObject *self PYXYZ_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *string_object      = NULL;
+	libcerror_error_t *error     = NULL;
+	static char *function        = "pyxyz_check_file_signature";
+	static char *keyword_list[]  = { "filename", NULL };
+	const char *filename_narrow  = NULL;
+	int result                   = 0;
+
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+	const wchar_t *filename_wide = NULL;
+#else
+	PyObject *utf8_string_object = NULL;
+#endif
+
+	PYXYZ_UNREFERENCED_PARAMETER( self )
+
+	/* Note that PyArg_ParseTupleAndKeywords with "s" will force Unicode strings to be converted to narrow character string.
+	 * On Windows the narrow character strings contains an extended ASCII string with a codepage. Hence we get a conversion
+	 * exception. This will also fail if the default encoding is not set correctly. We cannot use "u" here either since that
+	 * does not allow us to pass non Unicode string objects and Python (at least 2.7) does not seems to automatically upcast them.
+	 */
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O|",
+	     keyword_list,
+	     &string_object ) == 0 )
+	{
+		return( NULL );
+	}
+	PyErr_Clear();
+
+	result = PyObject_IsInstance(
+	          string_object,
+	          (PyObject *) &PyUnicode_Type );
+
+	if( result == -1 )
+	{
+		pyxyz_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type Unicode.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result != 0 )
+	{
+		PyErr_Clear();
+
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+		filename_wide = (wchar_t *) PyUnicode_AsUnicode(
+		                             string_object );
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libxyz_check_file_signature_wide(
+		          filename_wide,
+		          &error );
+
+		Py_END_ALLOW_THREADS
+#else
+		utf8_string_object = PyUnicode_AsUTF8String(
+		                      string_object );
+
+		if( utf8_string_object == NULL )
+		{
+			pyxyz_error_fetch_and_raise(
+			 PyExc_RuntimeError,
+			 "%s: unable to convert Unicode string to UTF-8.",
+			 function );
+
+			return( NULL );
+		}
+#if PY_MAJOR_VERSION >= 3
+		filename_narrow = PyBytes_AsString(
+				   utf8_string_object );
+#else
+		filename_narrow = PyString_AsString(
+				   utf8_string_object );
+#endif
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libxyz_check_file_signature(
+		          filename_narrow,
+		          &error );
+
+		Py_END_ALLOW_THREADS
+
+		Py_DecRef(
+		 utf8_string_object );
+
+#endif /* defined( HAVE_WIDE_SYSTEM_CHARACTER ) */
+
+		if( result == -1 )
+		{
+			pyxyz_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: unable to check file signature.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+
+			return( NULL );
+		}
+		if( result != 0 )
+		{
+			Py_IncRef(
+			 (PyObject *) Py_True );
+
+			return( Py_True );
+		}
+		Py_IncRef(
+		 (PyObject *) Py_False );
+
+		return( Py_False );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyxyz_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result != 0 )
+	{
+		PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+		filename_narrow = PyBytes_AsString(
+				   string_object );
+#else
+		filename_narrow = PyString_AsString(
+				   string_object );
+#endif
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libxyz_check_file_signature(
+		          filename_narrow,
+		          &error );
+
+		Py_END_ALLOW_THREADS
+
+		if( result == -1 )
+		{
+			pyxyz_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: unable to check file signature.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+
+			return( NULL );
+		}
+		if( result != 0 )
+		{
+			Py_IncRef(
+			 (PyObject *) Py_True );
+
+			return( Py_True );
+		}
+		Py_IncRef(
+		 (PyObject *) Py_False );
+
+		return( Py_False );
+	}
+	PyErr_Format(
+	 PyExc_TypeError,
+	 "%s: unsupported string object type.",
+	 function );
+
+	return( NULL );
+}
+
+/* Checks if a file has a Example (XYZ) file signature using a file-like object
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_check_file_signature_file_object(
+           PyObject *self PYXYZ_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error         = NULL;
+	libbfio_handle_t *file_io_handle = NULL;
+	PyObject *file_object            = NULL;
+	static char *function            = "pyxyz_check_file_signature_file_object";
+	static char *keyword_list[]      = { "file_object", NULL };
+	int result                       = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "|O",
+	     keyword_list,
+	     &file_object ) == 0 )
+	{
+		return( NULL );
+	}
+	if( pyxyz_file_object_initialize(
+	     &file_io_handle,
+	     file_object,
+	     &error ) != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to initialize file IO handle.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_check_file_signature_file_io_handle(
+	          file_io_handle,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to check file signature.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	if( libbfio_handle_free(
+	     &file_io_handle,
+	     &error ) != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to free file IO handle.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	if( result != 0 )
+	{
+		Py_IncRef(
+		 (PyObject *) Py_True );
+
+		return( Py_True );
+	}
+	Py_IncRef(
+	 (PyObject *) Py_False );
+
+	return( Py_False );
+
+on_error:
+	if( file_io_handle != NULL )
+	{
+		libbfio_handle_free(
+		 &file_io_handle,
+		 NULL );
+	}
+	return( NULL );
+}
+
+/* Creates a new file object and opens it
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_open_new_file(
+           PyObject *self PYXYZ_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *pyxyz_file = NULL;
+
+	PYXYZ_UNREFERENCED_PARAMETER( self )
+
+	pyxyz_file_init(
+	 (pyxyz_file_t *) pyxyz_file );
+
+	pyxyz_file_open(
+	 (pyxyz_file_t *) pyxyz_file,
+	 arguments,
+	 keywords );
+
+	return( pyxyz_file );
+}
+
+/* Creates a new file object and opens it using a file-like object
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_open_new_file_with_file_object(
+           PyObject *self PYXYZ_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *pyxyz_file = NULL;
+
+	PYXYZ_UNREFERENCED_PARAMETER( self )
+
+	pyxyz_file_init(
+	 (pyxyz_file_t *) pyxyz_file );
+
+	pyxyz_file_open_file_object(
+	 (pyxyz_file_t *) pyxyz_file,
+	 arguments,
+	 keywords );
+
+	return( pyxyz_file );
+}
+
+#if PY_MAJOR_VERSION >= 3
+
+/* The pyxyz module definition
+ */
+PyModuleDef pyxyz_module_definition = {
+	PyModuleDef_HEAD_INIT,
+
+	/* m_name */
+	"pyxyz",
+	/* m_doc */
+	"Python libxyz module (pyxyz).",
+	/* m_size */
+	-1,
+	/* m_methods */
+	pyxyz_module_methods,
+	/* m_reload */
+	NULL,
+	/* m_traverse */
+	NULL,
+	/* m_clear */
+	NULL,
+	/* m_free */
+	NULL,
+};
+
+#endif /* PY_MAJOR_VERSION >= 3 */
+
+/* Initializes the pyxyz module
+ */
+#if PY_MAJOR_VERSION >= 3
+PyMODINIT_FUNC PyInit_pyxyz(
+                void )
+#else
+PyMODINIT_FUNC initpyxyz(
+                void )
+#endif
+{
+	PyObject *module           = NULL;
+	PyGILState_STATE gil_state = 0;
+
+#if defined( HAVE_DEBUG_OUTPUT )
+	libxyz_notify_set_stream(
+	 stderr,
+	 NULL );
+	libxyz_notify_set_verbose(
+	 1 );
+#endif
+
+	/* Create the module
+	 * This function must be called before grabbing the GIL
+	 * otherwise the module will segfault on a version mismatch
+	 */
+#if PY_MAJOR_VERSION >= 3
+	module = PyModule_Create(
+	          &pyxyz_module_definition );
+#else
+	module = Py_InitModule3(
+	          "pyxyz",
+	          pyxyz_module_methods,
+	          "Python libxyz module (pyxyz)." );
+#endif
+	if( module == NULL )
+	{
+#if PY_MAJOR_VERSION >= 3
+		return( NULL );
+#else
+		return;
+#endif
+	}
+	PyEval_InitThreads();
+
+	gil_state = PyGILState_Ensure();
+
+	/* Setup the file type object
+	 */
+	pyxyz_file_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_file_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_file_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "file",
+	 (PyObject *) &pyxyz_file_type_object );
+
+	/* Setup the file_attribute_flags type object
+	 */
+	pyxyz_file_attribute_flags_type_object.tp_new = PyType_GenericNew;
+
+	if( pyxyz_file_attribute_flags_init_type(
+	     &pyxyz_file_attribute_flags_type_object ) != 1 )
+	{
+		goto on_error;
+	}
+	if( PyType_Ready(
+	     &pyxyz_file_attribute_flags_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_file_attribute_flags_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "file_attribute_flags",
+	 (PyObject *) &pyxyz_file_attribute_flags_type_object );
+
+	/* Setup the item type object
+	 */
+	pyxyz_item_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_item_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_item_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "item",
+	 (PyObject *) &pyxyz_item_type_object );
+
+	/* Setup the item_types type object
+	 */
+	pyxyz_item_types_type_object.tp_new = PyType_GenericNew;
+
+	if( pyxyz_item_types_init_type(
+	     &pyxyz_item_types_type_object ) != 1 )
+	{
+		goto on_error;
+	}
+	if( PyType_Ready(
+	     &pyxyz_item_types_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_item_types_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "item_types",
+	 (PyObject *) &pyxyz_item_types_type_object );
+
+	/* Setup the items type object
+	 */
+	pyxyz_items_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_items_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_items_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "items",
+	 (PyObject *) &pyxyz_items_type_object );
+
+	/* Setup the value0 type object
+	 */
+	pyxyz_value0_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_value0_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_value0_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "value0",
+	 (PyObject *) &pyxyz_value0_type_object );
+
+	/* Setup the value0s type object
+	 */
+	pyxyz_value0s_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_value0s_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_value0s_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "value0s",
+	 (PyObject *) &pyxyz_value0s_type_object );
+
+	/* Setup the value1 type object
+	 */
+	pyxyz_value1_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_value1_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_value1_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "value1",
+	 (PyObject *) &pyxyz_value1_type_object );
+
+	/* Setup the value1s type object
+	 */
+	pyxyz_value1s_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyxyz_value1s_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyxyz_value1s_type_object );
+
+	PyModule_AddObject(
+	 module,
+	 "value1s",
+	 (PyObject *) &pyxyz_value1s_type_object );
+
+	PyGILState_Release(
+	 gil_state );
+
+#if PY_MAJOR_VERSION >= 3
+	return( module );
+#else
+	return;
+#endif
+
+on_error:
+	PyGILState_Release(
+	 gil_state );
+
+#if PY_MAJOR_VERSION >= 3
+	return( NULL );
+#else
+	return;
+#endif
+}
+
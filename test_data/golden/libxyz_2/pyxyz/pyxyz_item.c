@@ -0,0 +1,926 @@
+/*
+ * Python object wrapper of libxyz_item_t
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( HAVE_WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "pyxyz_datetime.h"
+#include "pyxyz_error.h"
+#include "pyxyz_integer.h"
+#include "pyxyz_item.h"
+#include "pyxyz_libcerror.h"
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+#include "pyxyz_unused.h"
+#include "pyxyz_value0.h"
+#include "pyxyz_value0s.h"
+
+PyMethodDef pyxyz_item_object_methods[] = {
+
+	{ "get_size",
+	  (PyCFunction) pyxyz_item_get_size,
+	  METH_NOARGS,
+	  "get_size() -> Integer or None\n"
+	  "\n"
+	  "Retrieves the size." },
+
+	{ "get_identifier",
+	  (PyCFunction) pyxyz_item_get_identifier,
+	  METH_NOARGS,
+	  "get_identifier() -> Integer\n"
+	  "\n"
+	  "Retrieves the identifier." },
+
+	{ "get_creation_time",
+	  (PyCFunction) pyxyz_item_get_creation_time,
+	  METH_NOARGS,
+	  "get_creation_time() -> Datetime\n"
+	  "\n"
+	  "Retrieves the creation time." },
+
+	{ "get_creation_time_as_integer",
+	  (PyCFunction) pyxyz_item_get_creation_time_as_integer,
+	  METH_NOARGS,
+	  "get_creation_time_as_integer() -> Integer or None\n"
+	  "\n"
+	  "Retrieves the creation time as a 64-bit integer containing a FILETIME value." },
+
+	{ "get_name",
+	  (PyCFunction) pyxyz_item_get_name,
+	  METH_NOARGS,
+	  "get_name() -> Unicode string or None\n"
+	  "\n"
+	  "Retrieves the encoded name." },
+
+	{ "get_data",
+	  (PyCFunction) pyxyz_item_get_data,
+	  METH_NOARGS,
+	  "get_data() -> Binary string\n"
+	  "\n"
+	  "Retrieves the data." },
+
+	{ "is_allocated",
+	  (PyCFunction) pyxyz_item_is_allocated,
+	  METH_NOARGS,
+	  "is_allocated() -> Boolean or None\n"
+	  "\n"
+	  "Determines if the item is allocated." },
+
+	{ "get_number_of_value0s",
+	  (PyCFunction) pyxyz_item_get_number_of_value0s,
+	  METH_NOARGS,
+	  "get_number_of_value0s() -> Integer\n"
+	  "\n"
+	  "Retrieves the number of value0s." },
+
+	{ "get_value0",
+	  (PyCFunction) pyxyz_item_get_value0,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "get_value0(value0_index) -> Object\n"
+	  "\n"
+	  "Retrieves the value0 specified by the index." },
+
+	/* Sentinel */
+	{ NULL, NULL, 0, NULL }
+};
+
+PyGetSetDef pyxyz_item_object_get_set_definitions[] = {
+
+	{ "size",
+	  (getter) pyxyz_item_get_size,
+	  (setter) 0,
+	  "The size.",
+	  NULL },
+
+	{ "identifier",
+	  (getter) pyxyz_item_get_identifier,
+	  (setter) 0,
+	  "The identifier.",
+	  NULL },
+
+	{ "creation_time",
+	  (getter) pyxyz_item_get_creation_time,
+	  (setter) 0,
+	  "The creation time.",
+	  NULL },
+
+	{ "name",
+	  (getter) pyxyz_item_get_name,
+	  (setter) 0,
+	  "The encoded name.",
+	  NULL },
+
+	{ "data",
+	  (getter) pyxyz_item_get_data,
+	  (setter) 0,
+	  "The data.",
+	  NULL },
+
+	{ "number_of_value0s",
+	  (getter) pyxyz_item_get_number_of_value0s,
+	  (setter) 0,
+	  "The number of value0s.",
+	  NULL },
+
+	{ "value0s",
+	  (getter) pyxyz_item_get_value0s,
+	  (setter) 0,
+	  "The value0s.",
+	  NULL },
+
+	/* Sentinel */
+	{ NULL, NULL, NULL, NULL, NULL }
+};
+
+PyTypeObject pyxyz_item_type_object = {
+	PyVarObject_HEAD_INIT( NULL, 0 )
+
+	/* tp_name */
+	"pyxyz.item",
+	/* tp_basicsize */
+	sizeof( pyxyz_item_t ),
+	/* tp_itemsize */
+	0,
+	/* tp_dealloc */
+	(destructor) pyxyz_item_free,
+	/* tp_print */
+	0,
+	/* tp_getattr */
+	0,
+	/* tp_setattr */
+	0,
+	/* tp_compare */
+	0,
+	/* tp_repr */
+	0,
+	/* tp_as_number */
+	0,
+	/* tp_as_sequence */
+	0,
+	/* tp_as_mapping */
+	0,
+	/* tp_hash */
+	0,
+	/* tp_call */
+	0,
+	/* tp_str */
+	0,
+	/* tp_getattro */
+	0,
+	/* tp_setattro */
+	0,
+	/* tp_as_buffer */
+	0,
+	/* tp_flags */
+	Py_TPFLAGS_DEFAULT,
+	/* tp_doc */
+	"pyxyz item object (wraps libxyz_item_t)",
+	/* tp_traverse */
+	0,
+	/* tp_clear */
+	0,
+	/* tp_richcompare */
+	0,
+	/* tp_weaklistoffset */
+	0,
+	/* tp_iter */
+	0,
+	/* tp_iternext */
+	0,
+	/* tp_methods */
+	pyxyz_item_object_methods,
+	/* tp_members */
+	0,
+	/* tp_getset */
+	pyxyz_item_object_get_set_definitions,
+	/* tp_base */
+	0,
+	/* tp_dict */
+	0,
+	/* tp_descr_get */
+	0,
+	/* tp_descr_set */
+	0,
+	/* tp_dictoffset */
+	0,
+	/* tp_init */
+	(initproc) pyxyz_item_init,
+	/* tp_alloc */
+	0,
+	/* tp_new */
+	0,
+	/* tp_free */
+	0,
+	/* tp_is_gc */
+	0,
+	/* tp_bases */
+	NULL,
+	/* tp_mro */
+	NULL,
+	/* tp_cache */
+	NULL,
+	/* tp_subclasses */
+	NULL,
+	/* tp_weaklist */
+	NULL,
+	/* tp_del */
+	0
+};
+
+/* Intializes an item object
+ * Returns 0 if successful or -1 on error
+ */
+int pyxyz_item_init(
+     pyxyz_item_t *pyxyz_item )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_item_init";
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( -1 );
+	}
+	/* Make sure libxyz item is set to NULL
+	 */
+	pyxyz_item->item = NULL;
+
+	if( libxyz_item_initialize(
+	     &( pyxyz_item->item ),
+	     &error ) != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to initialize item.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( -1 );
+	}
+	return( 0 );
+}
+
+/* Frees an item object
+ */
+void pyxyz_item_free(
+      pyxyz_item_t *pyxyz_item )
+{
+	struct _typeobject *ob_type = NULL;
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyxyz_item_free";
+	int result                  = 0;
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return;
+	}
+	ob_type = Py_TYPE(
+	           pyxyz_item );
+
+	if( ob_type == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: missing ob_type.",
+		 function );
+
+		return;
+	}
+	if( ob_type->tp_free == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid ob_type - missing tp_free.",
+		 function );
+
+		return;
+	}
+	if( pyxyz_item->item != NULL )
+	{
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libxyz_item_free(
+		          &( pyxyz_item->item ),
+		          &error );
+
+		Py_END_ALLOW_THREADS
+
+		if( result != 1 )
+		{
+			pyxyz_error_raise(
+			 error,
+			 PyExc_MemoryError,
+			 "%s: unable to free libxyz item.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	ob_type->tp_free(
+	 (PyObject*) pyxyz_item );
+}
+
+/* Retrieves the identifier
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_identifier(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *integer_object = NULL;
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_item_get_identifier";
+	uint32_t value_32bit     = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_identifier(
+	          pyxyz_item->item,
+	          &value_32bit,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve identifier.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	integer_object = PyLong_FromUnsignedLong(
+	                  (unsigned long) value_32bit );
+
+	return( integer_object );
+}
+
+/* Retrieves the creation time
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_creation_time(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *datetime_object = NULL;
+	libcerror_error_t *error  = NULL;
+	static char *function     = "pyxyz_item_get_creation_time";
+	uint64_t filetime         = 0;
+	int result                = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_creation_time(
+	          pyxyz_item->item,
+	          &filetime,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve creation time.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	datetime_object = pyxyz_datetime_new_from_filetime(
+	                   filetime );
+
+	return( datetime_object );
+}
+
+/* Retrieves the creation time as an integer
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_creation_time_as_integer(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *integer_object = NULL;
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_item_get_creation_time_as_integer";
+	uint64_t filetime        = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_creation_time(
+	          pyxyz_item->item,
+	          &filetime,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve creation time.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	integer_object = pyxyz_integer_unsigned_new_from_64bit(
+	                  (uint64_t) filetime );
+
+	return( integer_object );
+}
+
+/* Retrieves the data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_data(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *bytes_object   = NULL;
+	libcerror_error_t *error = NULL;
+	char *data               = NULL;
+	static char *function    = "pyxyz_item_get_data";
+	size_t data_size         = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_data_size(
+	          pyxyz_item->item,
+	          &data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve data size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	else if( ( result == 0 )
+	      || ( data_size == 0 ) )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	data = (char *) PyMem_Malloc(
+	                 sizeof( char ) * data_size );
+
+	if( data == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create data.",
+		 function );
+
+		goto on_error;
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_data(
+	          pyxyz_item->item,
+	          (uint8_t *) data,
+	          data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	/* This is a binary string so include the full size
+	 */
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                data,
+	                (Py_ssize_t) data_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                data,
+	                (Py_ssize_t) data_size );
+#endif
+	if( bytes_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_IOError,
+		 "%s: unable to convert data into Bytes object.",
+		 function );
+
+		goto on_error;
+	}
+	PyMem_Free(
+	 data );
+
+	return( bytes_object );
+
+on_error:
+	if( data != NULL )
+	{
+		PyMem_Free(
+		 data );
+	}
+	return( NULL );
+}
+
+/* Determines if the item is 
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_is_allocated(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_item_is_allocated";
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_is_allocated(
+	          pyxyz_item->item,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to determine if item is .",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	if( result != 0 )
+	{
+		Py_IncRef(
+		 (PyObject *) Py_True );
+
+		return( Py_True );
+	}
+	Py_IncRef(
+	 (PyObject *) Py_False );
+
+	return( Py_False );
+}
+
+/* Retrieves the number of value0s
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_number_of_value0s(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *integer_object = NULL;
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_item_get_number_of_value0s";
+	int number_of_value0s    = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_number_of_value0s(
+	          pyxyz_item->item,
+	          &number_of_value0s,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve number of value0s.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	integer_object = PyLong_FromLong(
+	                  (long) number_of_value0s );
+#else
+	integer_object = PyInt_FromLong(
+	                  (long) number_of_value0s );
+#endif
+	return( integer_object );
+}
+
+/* Retrieves a specific value0 by index
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_value0_by_index(
+           PyObject *pyxyz_item,
+           int value0_index )
+{
+	PyObject *value0_object  = NULL;
+	libcerror_error_t *error = NULL;
+	libxyz_value0_t *value0  = NULL;
+	static char *function    = "pyxyz_item_get_value0_by_index";
+	int result               = 0;
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_value0_by_index(
+	          ( (pyxyz_item_t *) pyxyz_item )->item,
+	          value0_index,
+	          &value0,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve value0: %d.",
+		 function,
+		 value0_index );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	value0_object = pyxyz_value0_new(
+	                 value0,
+	                 pyxyz_item );
+
+	if( value0_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create value0 object.",
+		 function );
+
+		goto on_error;
+	}
+	return( value0_object );
+
+on_error:
+	if( value0 != NULL )
+	{
+		libxyz_value0_free(
+		 &value0,
+		 NULL );
+	}
+	return( NULL );
+}
+
+/* Retrieves a specific value0
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_value0(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *value0_object     = NULL;
+	static char *keyword_list[] = { "value0_index", NULL };
+	int value0_index            = 0;
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "i",
+	     keyword_list,
+	     &value0_index ) == 0 )
+	{
+		return( NULL );
+	}
+	value0_object = pyxyz_item_get_value0_by_index(
+	                 (PyObject *) pyxyz_item,
+	                 value0_index );
+
+	return( value0_object );
+}
+
+/* Retrieves a sequence and iterator object for the value0s
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_item_get_value0s(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *sequence_object = NULL;
+	libcerror_error_t *error  = NULL;
+	static char *function     = "pyxyz_item_get_value0s";
+	int number_of_value0s     = 0;
+	int result                = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_item == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid item.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_item_get_number_of_value0s(
+	          pyxyz_item->item,
+	          &number_of_value0s,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve number of value0s.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	sequence_object = pyxyz_value0s_new(
+	                   (PyObject *) pyxyz_item,
+	                   &pyxyz_item_get_value0_by_index,
+	                   number_of_value0s );
+
+	if( sequence_object == NULL )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to create sequence object.",
+		 function );
+
+		return( NULL );
+	}
+	return( sequence_object );
+}
+
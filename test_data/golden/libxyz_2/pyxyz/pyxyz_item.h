@@ -0,0 +1,107 @@
+/*
+ * Python object wrapper of libxyz_item_t
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYXYZ_ITEM_H )
+#define _PYXYZ_ITEM_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyxyz_item pyxyz_item_t;
+
+struct pyxyz_item
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+
+	/* The libxyz item
+	 */
+	libxyz_item_t *item;
+};
+
+extern PyMethodDef pyxyz_item_object_methods[];
+extern PyTypeObject pyxyz_item_type_object;
+
+int pyxyz_item_init(
+     pyxyz_item_t *pyxyz_item );
+
+void pyxyz_item_free(
+      pyxyz_item_t *pyxyz_item );
+
+PyObject *pyxyz_item_get_size(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_identifier(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_creation_time(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_creation_time_as_integer(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_name(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_data(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_is_allocated(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_number_of_value0s(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+PyObject *pyxyz_item_get_value0_by_index(
+           PyObject *pyxyz_item,
+           int value0_index );
+
+PyObject *pyxyz_item_get_value0(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyxyz_item_get_value0s(
+           pyxyz_item_t *pyxyz_item,
+           PyObject *arguments );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYXYZ_ITEM_H ) */
+
@@ -0,0 +1,63 @@
+/*
+ * Python object definition of the libxyz item types
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYXYZ_ITEM_TYPES_H )
+#define _PYXYZ_ITEM_TYPES_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyxyz_item_types pyxyz_item_types_t;
+
+struct pyxyz_item_types
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+};
+
+extern PyTypeObject pyxyz_item_types_type_object;
+
+int pyxyz_item_types_init_type(
+     PyTypeObject *type_object );
+
+PyObject *pyxyz_item_types_new(
+           void );
+
+int pyxyz_item_types_init(
+     pyxyz_item_types_t *definitions_object );
+
+void pyxyz_item_types_free(
+      pyxyz_item_types_t *definitions_object );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYXYZ_ITEM_TYPES_H ) */
+
@@ -0,0 +1,107 @@
+/*
+ * Python object wrapper of libxyz_value0_t
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYXYZ_VALUE0_H )
+#define _PYXYZ_VALUE0_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyxyz_value0 pyxyz_value0_t;
+
+struct pyxyz_value0
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+
+	/* The libxyz value0
+	 */
+	libxyz_value0_t *value0;
+};
+
+extern PyMethodDef pyxyz_value0_object_methods[];
+extern PyTypeObject pyxyz_value0_type_object;
+
+int pyxyz_value0_init(
+     pyxyz_value0_t *pyxyz_value0 );
+
+void pyxyz_value0_free(
+      pyxyz_value0_t *pyxyz_value0 );
+
+PyObject *pyxyz_value0_get_size(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_identifier(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_creation_time(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_creation_time_as_integer(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_name(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_data(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_is_allocated(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_number_of_value1s(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+PyObject *pyxyz_value0_get_value1_by_index(
+           PyObject *pyxyz_value0,
+           int value1_index );
+
+PyObject *pyxyz_value0_get_value1(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyxyz_value0_get_value1s(
+           pyxyz_value0_t *pyxyz_value0,
+           PyObject *arguments );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYXYZ_VALUE0_H ) */
+
@@ -0,0 +1,679 @@
+/*
+ * Python object wrapper of libxyz_value1_t
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( HAVE_WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "pyxyz_datetime.h"
+#include "pyxyz_error.h"
+#include "pyxyz_integer.h"
+#include "pyxyz_libcerror.h"
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+#include "pyxyz_unused.h"
+#include "pyxyz_value1.h"
+
+PyMethodDef pyxyz_value1_object_methods[] = {
+
+	{ "get_size",
+	  (PyCFunction) pyxyz_value1_get_size,
+	  METH_NOARGS,
+	  "get_size() -> Integer or None\n"
+	  "\n"
+	  "Retrieves the size." },
+
+	{ "get_identifier",
+	  (PyCFunction) pyxyz_value1_get_identifier,
+	  METH_NOARGS,
+	  "get_identifier() -> Integer\n"
+	  "\n"
+	  "Retrieves the identifier." },
+
+	{ "get_creation_time",
+	  (PyCFunction) pyxyz_value1_get_creation_time,
+	  METH_NOARGS,
+	  "get_creation_time() -> Datetime\n"
+	  "\n"
+	  "Retrieves the creation time." },
+
+	{ "get_creation_time_as_integer",
+	  (PyCFunction) pyxyz_value1_get_creation_time_as_integer,
+	  METH_NOARGS,
+	  "get_creation_time_as_integer() -> Integer or None\n"
+	  "\n"
+	  "Retrieves the creation time as a 64-bit integer containing a FILETIME value." },
+
+	{ "get_name",
+	  (PyCFunction) pyxyz_value1_get_name,
+	  METH_NOARGS,
+	  "get_name() -> Unicode string or None\n"
+	  "\n"
+	  "Retrieves the encoded name." },
+
+	{ "get_data",
+	  (PyCFunction) pyxyz_value1_get_data,
+	  METH_NOARGS,
+	  "get_data() -> Binary string\n"
+	  "\n"
+	  "Retrieves the data." },
+
+	{ "is_allocated",
+	  (PyCFunction) pyxyz_value1_is_allocated,
+	  METH_NOARGS,
+	  "is_allocated() -> Boolean or None\n"
+	  "\n"
+	  "Determines if the value1 is allocated." },
+
+	/* Sentinel */
+	{ NULL, NULL, 0, NULL }
+};
+
+PyGetSetDef pyxyz_value1_object_get_set_definitions[] = {
+
+	{ "size",
+	  (getter) pyxyz_value1_get_size,
+	  (setter) 0,
+	  "The size.",
+	  NULL },
+
+	{ "identifier",
+	  (getter) pyxyz_value1_get_identifier,
+	  (setter) 0,
+	  "The identifier.",
+	  NULL },
+
+	{ "creation_time",
+	  (getter) pyxyz_value1_get_creation_time,
+	  (setter) 0,
+	  "The creation time.",
+	  NULL },
+
+	{ "name",
+	  (getter) pyxyz_value1_get_name,
+	  (setter) 0,
+	  "The encoded name.",
+	  NULL },
+
+	{ "data",
+	  (getter) pyxyz_value1_get_data,
+	  (setter) 0,
+	  "The data.",
+	  NULL },
+
+	/* Sentinel */
+	{ NULL, NULL, NULL, NULL, NULL }
+};
+
+PyTypeObject pyxyz_value1_type_object = {
+	PyVarObject_HEAD_INIT( NULL, 0 )
+
+	/* tp_name */
+	"pyxyz.value1",
+	/* tp_basicsize */
+	sizeof( pyxyz_value1_t ),
+	/* tp_itemsize */
+	0,
+	/* tp_dealloc */
+	(destructor) pyxyz_value1_free,
+	/* tp_print */
+	0,
+	/* tp_getattr */
+	0,
+	/* tp_setattr */
+	0,
+	/* tp_compare */
+	0,
+	/* tp_repr */
+	0,
+	/* tp_as_number */
+	0,
+	/* tp_as_sequence */
+	0,
+	/* tp_as_mapping */
+	0,
+	/* tp_hash */
+	0,
+	/* tp_call */
+	0,
+	/* tp_str */
+	0,
+	/* tp_getattro */
+	0,
+	/* tp_setattro */
+	0,
+	/* tp_as_buffer */
+	0,
+	/* tp_flags */
+	Py_TPFLAGS_DEFAULT,
+	/* tp_doc */
+	"pyxyz value1 object (wraps libxyz_value1_t)",
+	/* tp_traverse */
+	0,
+	/* tp_clear */
+	0,
+	/* tp_richcompare */
+	0,
+	/* tp_weaklistoffset */
+	0,
+	/* tp_iter */
+	0,
+	/* tp_iternext */
+	0,
+	/* tp_methods */
+	pyxyz_value1_object_methods,
+	/* tp_members */
+	0,
+	/* tp_getset */
+	pyxyz_value1_object_get_set_definitions,
+	/* tp_base */
+	0,
+	/* tp_dict */
+	0,
+	/* tp_descr_get */
+	0,
+	/* tp_descr_set */
+	0,
+	/* tp_dictoffset */
+	0,
+	/* tp_init */
+	(initproc) pyxyz_value1_init,
+	/* tp_alloc */
+	0,
+	/* tp_new */
+	0,
+	/* tp_free */
+	0,
+	/* tp_is_gc */
+	0,
+	/* tp_bases */
+	NULL,
+	/* tp_mro */
+	NULL,
+	/* tp_cache */
+	NULL,
+	/* tp_subclasses */
+	NULL,
+	/* tp_weaklist */
+	NULL,
+	/* tp_del */
+	0
+};
+
+/* Intializes a value1 object
+ * Returns 0 if successful or -1 on error
+ */
+int pyxyz_value1_init(
+     pyxyz_value1_t *pyxyz_value1 )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_value1_init";
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return( -1 );
+	}
+	/* Make sure libxyz value1 is set to NULL
+	 */
+	pyxyz_value1->value1 = NULL;
+
+	if( libxyz_value1_initialize(
+	     &( pyxyz_value1->value1 ),
+	     &error ) != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to initialize value1.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( -1 );
+	}
+	return( 0 );
+}
+
+/* Frees a value1 object
+ */
+void pyxyz_value1_free(
+      pyxyz_value1_t *pyxyz_value1 )
+{
+	struct _typeobject *ob_type = NULL;
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyxyz_value1_free";
+	int result                  = 0;
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return;
+	}
+	ob_type = Py_TYPE(
+	           pyxyz_value1 );
+
+	if( ob_type == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: missing ob_type.",
+		 function );
+
+		return;
+	}
+	if( ob_type->tp_free == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid ob_type - missing tp_free.",
+		 function );
+
+		return;
+	}
+	if( pyxyz_value1->value1 != NULL )
+	{
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libxyz_value1_free(
+		          &( pyxyz_value1->value1 ),
+		          &error );
+
+		Py_END_ALLOW_THREADS
+
+		if( result != 1 )
+		{
+			pyxyz_error_raise(
+			 error,
+			 PyExc_MemoryError,
+			 "%s: unable to free libxyz value1.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	ob_type->tp_free(
+	 (PyObject*) pyxyz_value1 );
+}
+
+/* Retrieves the identifier
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_value1_get_identifier(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *integer_object = NULL;
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_value1_get_identifier";
+	uint32_t value_32bit     = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_value1_get_identifier(
+	          pyxyz_value1->value1,
+	          &value_32bit,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve identifier.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	integer_object = PyLong_FromUnsignedLong(
+	                  (unsigned long) value_32bit );
+
+	return( integer_object );
+}
+
+/* Retrieves the creation time
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_value1_get_creation_time(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *datetime_object = NULL;
+	libcerror_error_t *error  = NULL;
+	static char *function     = "pyxyz_value1_get_creation_time";
+	uint64_t filetime         = 0;
+	int result                = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_value1_get_creation_time(
+	          pyxyz_value1->value1,
+	          &filetime,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve creation time.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	datetime_object = pyxyz_datetime_new_from_filetime(
+	                   filetime );
+
+	return( datetime_object );
+}
+
+/* Retrieves the creation time as an integer
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_value1_get_creation_time_as_integer(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *integer_object = NULL;
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_value1_get_creation_time_as_integer";
+	uint64_t filetime        = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_value1_get_creation_time(
+	          pyxyz_value1->value1,
+	          &filetime,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve creation time.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	integer_object = pyxyz_integer_unsigned_new_from_64bit(
+	                  (uint64_t) filetime );
+
+	return( integer_object );
+}
+
+/* Retrieves the data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_value1_get_data(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	PyObject *bytes_object   = NULL;
+	libcerror_error_t *error = NULL;
+	char *data               = NULL;
+	static char *function    = "pyxyz_value1_get_data";
+	size_t data_size         = 0;
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_value1_get_data_size(
+	          pyxyz_value1->value1,
+	          &data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve data size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	else if( ( result == 0 )
+	      || ( data_size == 0 ) )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	data = (char *) PyMem_Malloc(
+	                 sizeof( char ) * data_size );
+
+	if( data == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create data.",
+		 function );
+
+		goto on_error;
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_value1_get_data(
+	          pyxyz_value1->value1,
+	          (uint8_t *) data,
+	          data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	/* This is a binary string so include the full size
+	 */
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                data,
+	                (Py_ssize_t) data_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                data,
+	                (Py_ssize_t) data_size );
+#endif
+	if( bytes_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_IOError,
+		 "%s: unable to convert data into Bytes object.",
+		 function );
+
+		goto on_error;
+	}
+	PyMem_Free(
+	 data );
+
+	return( bytes_object );
+
+on_error:
+	if( data != NULL )
+	{
+		PyMem_Free(
+		 data );
+	}
+	return( NULL );
+}
+
+/* Determines if the value1 is 
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyxyz_value1_is_allocated(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments PYXYZ_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyxyz_value1_is_allocated";
+	int result               = 0;
+
+	PYXYZ_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyxyz_value1 == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid value1.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libxyz_value1_is_allocated(
+	          pyxyz_value1->value1,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyxyz_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to determine if value1 is .",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	if( result != 0 )
+	{
+		Py_IncRef(
+		 (PyObject *) Py_True );
+
+		return( Py_True );
+	}
+	Py_IncRef(
+	 (PyObject *) Py_False );
+
+	return( Py_False );
+}
+
@@ -0,0 +1,90 @@
+/*
+ * Python object wrapper of libxyz_value1_t
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYXYZ_VALUE1_H )
+#define _PYXYZ_VALUE1_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyxyz_value1 pyxyz_value1_t;
+
+struct pyxyz_value1
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+
+	/* The libxyz value1
+	 */
+	libxyz_value1_t *value1;
+};
+
+extern PyMethodDef pyxyz_value1_object_methods[];
+extern PyTypeObject pyxyz_value1_type_object;
+
+int pyxyz_value1_init(
+     pyxyz_value1_t *pyxyz_value1 );
+
+void pyxyz_value1_free(
+      pyxyz_value1_t *pyxyz_value1 );
+
+PyObject *pyxyz_value1_get_size(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+PyObject *pyxyz_value1_get_identifier(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+PyObject *pyxyz_value1_get_creation_time(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+PyObject *pyxyz_value1_get_creation_time_as_integer(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+PyObject *pyxyz_value1_get_name(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+PyObject *pyxyz_value1_get_data(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+PyObject *pyxyz_value1_is_allocated(
+           pyxyz_value1_t *pyxyz_value1,
+           PyObject *arguments );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYXYZ_VALUE1_H ) */
+
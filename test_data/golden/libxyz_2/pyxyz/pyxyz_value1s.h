@@ -0,0 +1,95 @@
+/*
+ * Python object definition of the sequence and iterator object of value1s
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYXYZ_VALUE1S_H )
+#define _PYXYZ_VALUE1S_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyxyz_libxyz.h"
+#include "pyxyz_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyxyz_value1s pyxyz_value1s_t;
+
+struct pyxyz_value1s
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+
+	/* The parent object
+	 */
+	PyObject *parent_object;
+
+	/* The get item by index callback function
+	 */
+	PyObject* (*get_item_by_index)(
+	             PyObject *parent_object,
+	             int index );
+
+	/* The current index
+	 */
+	int current_index;
+
+	/* The number of items
+	 */
+	int number_of_items;
+};
+
+extern PyTypeObject pyxyz_value1s_type_object;
+
+PyObject *pyxyz_value1s_new(
+           PyObject *parent_object,
+           PyObject* (*get_item_by_index)(
+                        PyObject *parent_object,
+                        int index ),
+           int number_of_items );
+
+int pyxyz_value1s_init(
+     pyxyz_value1s_t *sequence_object );
+
+void pyxyz_value1s_free(
+      pyxyz_value1s_t *sequence_object );
+
+Py_ssize_t pyxyz_value1s_len(
+            pyxyz_value1s_t *sequence_object );
+
+PyObject *pyxyz_value1s_getitem(
+           pyxyz_value1s_t *sequence_object,
+           Py_ssize_t item_index );
+
+PyObject *pyxyz_value1s_iter(
+           pyxyz_value1s_t *sequence_object );
+
+PyObject *pyxyz_value1s_iternext(
+           pyxyz_value1s_t *sequence_object );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYXYZ_VALUE1S_H ) */
+
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+#
+# Python-bindings value0 type test script
+#
+# Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import os
+import sys
+import unittest
+
+import pyxyz
+
+
+class Value0TypeTests(unittest.TestCase):
+  """Tests the value0 type."""
+
+  def test_get_size(self):
+    """Tests the get_size function and size property."""
+    if not unittest.source:
+      raise unittest.SkipTest("missing source")
+
+    xyz_value0 = pyxyz.value0()
+
+    xyz_value0.open(unittest.source)
+
+    size = xyz_value0.get_size()
+    self.assertIsNotNone(size)
+
+    self.assertIsNotNone(xyz_value0.size)
+
+    xyz_value0.close()
+
+  def test_get_identifier(self):
+    """Tests the get_identifier function and identifier property."""
+    if not unittest.source:
+      raise unittest.SkipTest("missing source")
+
+    xyz_value0 = pyxyz.value0()
+
+    xyz_value0.open(unittest.source)
+
+    identifier = xyz_value0.get_identifier()
+    self.assertIsNotNone(identifier)
+
+    self.assertIsNotNone(xyz_value0.identifier)
+
+    xyz_value0.close()
+
+  def test_get_creation_time(self):
+    """Tests the get_creation_time function and creation_time property."""
+    if not unittest.source:
+      raise unittest.SkipTest("missing source")
+
+    xyz_value0 = pyxyz.value0()
+
+    xyz_value0.open(unittest.source)
+
+    creation_time = xyz_value0.get_creation_time()
+    self.assertIsNotNone(creation_time)
+
+    self.assertIsNotNone(xyz_value0.creation_time)
+
+    xyz_value0.close()
+
+  def test_get_name(self):
+    """Tests the get_name function and name property."""
+    if not unittest.source:
+      raise unittest.SkipTest("missing source")
+
+    xyz_value0 = pyxyz.value0()
+
+    xyz_value0.open(unittest.source)
+
+    name = xyz_value0.get_name()
+    self.assertIsNotNone(name)
+
+    self.assertIsNotNone(xyz_value0.name)
+
+    xyz_value0.close()
+
+  def test_get_number_of_value1s(self):
+    """Tests the get_number_of_value1s function and number_of_value1s property."""
+    if not unittest.source:
+      raise unittest.SkipTest("missing source")
+
+    xyz_value0 = pyxyz.value0()
+
+    xyz_value0.open(unittest.source)
+
+    number_of_value1s = xyz_value0.get_number_of_value1s()
+    self.assertIsNotNone(number_of_value1s)
+
+    self.assertIsNotNone(xyz_value0.number_of_value1s)
+
+    xyz_value0.close()
+
+
+if __name__ == "__main__":
+  argument_parser = argparse.ArgumentParser()
+
+
+  options, unknown_options = argument_parser.parse_known_args()
+  unknown_options.insert(0, sys.argv[0])
+
+
+
+  unittest.main(argv=unknown_options, verbosity=2)
@@ -0,0 +1,788 @@
+/*
+ * Library value1 type test program
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "xyz_test_libcerror.h"
+#include "xyz_test_libxyz.h"
+#include "xyz_test_macros.h"
+#include "xyz_test_memory.h"
+#include "xyz_test_unused.h"
+
+#include "../libxyz/libxyz_value1.h"
+
+/* Tests the libxyz_value1_initialize function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_value1_initialize(
+     void )
+{
+	libcerror_error_t *error        = NULL;
+	libxyz_value1_t *value1         = NULL;
+	int result                      = 0;
+
+#if defined( HAVE_XYZ_TEST_MEMORY )
+	int number_of_malloc_fail_tests = 1;
+	int number_of_memset_fail_tests = 1;
+	int test_number                 = 0;
+#endif
+
+	/* Test regular cases
+	 */
+	result = libxyz_value1_initialize(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libxyz_value1_free(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libxyz_value1_initialize(
+	          NULL,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	value1 = (libxyz_value1_t *) 0x12345678UL;
+
+	result = libxyz_value1_initialize(
+	          &value1,
+	          &error );
+
+	value1 = NULL;
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+#if defined( HAVE_XYZ_TEST_MEMORY )
+
+	for( test_number = 0;
+	     test_number < number_of_malloc_fail_tests;
+	     test_number++ )
+	{
+		/* Test libxyz_value1_initialize with malloc failing
+		 */
+		xyz_test_malloc_attempts_before_fail = test_number;
+
+		result = libxyz_value1_initialize(
+		          &value1,
+		          &error );
+
+		if( xyz_test_malloc_attempts_before_fail != -1 )
+		{
+			xyz_test_malloc_attempts_before_fail = -1;
+
+			if( value1 != NULL )
+			{
+				libxyz_value1_free(
+				 &value1,
+				 NULL );
+			}
+		}
+		else
+		{
+			XYZ_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			XYZ_TEST_ASSERT_IS_NULL(
+			 "value1",
+			 value1 );
+
+			XYZ_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	for( test_number = 0;
+	     test_number < number_of_memset_fail_tests;
+	     test_number++ )
+	{
+		/* Test libxyz_value1_initialize with memset failing
+		 */
+		xyz_test_memset_attempts_before_fail = test_number;
+
+		result = libxyz_value1_initialize(
+		          &value1,
+		          &error );
+
+		if( xyz_test_memset_attempts_before_fail != -1 )
+		{
+			xyz_test_memset_attempts_before_fail = -1;
+
+			if( value1 != NULL )
+			{
+				libxyz_value1_free(
+				 &value1,
+				 NULL );
+			}
+		}
+		else
+		{
+			XYZ_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			XYZ_TEST_ASSERT_IS_NULL(
+			 "value1",
+			 value1 );
+
+			XYZ_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+#endif /* defined( HAVE_XYZ_TEST_MEMORY ) */
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( value1 != NULL )
+	{
+		libxyz_value1_free(
+		 &value1,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libxyz_value1_free function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_value1_free(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	int result               = 0;
+
+	/* Test error cases
+	 */
+	result = libxyz_value1_free(
+	          NULL,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libxyz_value1_get_size function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_value1_get_size(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	libxyz_value1_t *value1  = NULL;
+	size64_t size            = 0;
+	int result               = 0;
+	int size_is_set          = 0;
+
+	/* Initialize test
+	 */
+	result = libxyz_value1_initialize(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libxyz_value1_get_size(
+	          value1,
+	          &size,
+	          &error );
+
+	XYZ_TEST_ASSERT_NOT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	size_is_set = result;
+
+	/* Test error cases
+	 */
+	result = libxyz_value1_get_size(
+	          NULL,
+	          &size,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	if( size_is_set != 0 )
+	{
+		result = libxyz_value1_get_size(
+		          value1,
+		          NULL,
+		          &error );
+
+		XYZ_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		XYZ_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+	}
+	/* Clean up
+	 */
+	result = libxyz_value1_free(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( value1 != NULL )
+	{
+		libxyz_value1_free(
+		 &value1,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libxyz_value1_get_identifier function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_value1_get_identifier(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	libxyz_value1_t *value1  = NULL;
+	uint32_t identifier      = 0;
+	int result               = 0;
+
+	/* Initialize test
+	 */
+	result = libxyz_value1_initialize(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libxyz_value1_get_identifier(
+	          value1,
+	          &identifier,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libxyz_value1_get_identifier(
+	          NULL,
+	          &identifier,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libxyz_value1_get_identifier(
+	          value1,
+	          NULL,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libxyz_value1_free(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( value1 != NULL )
+	{
+		libxyz_value1_free(
+		 &value1,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libxyz_value1_get_creation_time function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_value1_get_creation_time(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	libxyz_value1_t *value1  = NULL;
+	uint64_t creation_time   = 0;
+	int result               = 0;
+
+	/* Initialize test
+	 */
+	result = libxyz_value1_initialize(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libxyz_value1_get_creation_time(
+	          value1,
+	          &creation_time,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libxyz_value1_get_creation_time(
+	          NULL,
+	          &creation_time,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libxyz_value1_get_creation_time(
+	          value1,
+	          NULL,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libxyz_value1_free(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( value1 != NULL )
+	{
+		libxyz_value1_free(
+		 &value1,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libxyz_value1_is_allocated function
+ * Returns 1 if successful or 0 if not
+ */
+int xyz_test_value1_is_allocated(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	libxyz_value1_t *value1  = NULL;
+	int result               = 0;
+
+	/* Initialize test
+	 */
+	result = libxyz_value1_initialize(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libxyz_value1_is_allocated(
+	          NULL,
+	          &error );
+
+	XYZ_TEST_ASSERT_NOT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libxyz_value1_is_allocated(
+	          NULL,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	XYZ_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libxyz_value1_free(
+	          &value1,
+	          &error );
+
+	XYZ_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "value1",
+	 value1 );
+
+	XYZ_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( value1 != NULL )
+	{
+		libxyz_value1_free(
+		 &value1,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc XYZ_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] XYZ_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc XYZ_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] XYZ_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	XYZ_TEST_UNREFERENCED_PARAMETER( argc )
+	XYZ_TEST_UNREFERENCED_PARAMETER( argv )
+
+	XYZ_TEST_RUN(
+	 "libxyz_value1_initialize",
+	 xyz_test_value1_initialize );
+
+	XYZ_TEST_RUN(
+	 "libxyz_value1_free",
+	 xyz_test_value1_free );
+
+#if defined( __GNUC__ ) && !defined( LIBXYZ_DLL_IMPORT )
+
+	/* TODO: add tests for libxyz_internal_value1_read_data */
+
+#endif /* defined( __GNUC__ ) && !defined( LIBXYZ_DLL_IMPORT ) */
+
+	XYZ_TEST_RUN(
+	 "libxyz_value1_get_size",
+	 xyz_test_value1_get_size );
+
+	XYZ_TEST_RUN(
+	 "libxyz_value1_get_identifier",
+	 xyz_test_value1_get_identifier );
+
+	XYZ_TEST_RUN(
+	 "libxyz_value1_get_creation_time",
+	 xyz_test_value1_get_creation_time );
+
+	/* TODO: add tests for libxyz_value1_get_utf8_name_size */
+
+	/* TODO: add tests for libxyz_value1_get_utf8_name */
+
+	/* TODO: add tests for libxyz_value1_get_utf16_name_size */
+
+	/* TODO: add tests for libxyz_value1_get_utf16_name */
+
+	/* TODO: add tests for libxyz_value1_get_data */
+
+	XYZ_TEST_RUN(
+	 "libxyz_value1_is_allocated",
+	 xyz_test_value1_is_allocated );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,361 @@
+/*
+ * Info handle
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#include "info_handle.h"
+#include "xyztools_libcerror.h"
+#include "xyztools_libxyz.h"
+
+#define INFO_HANDLE_NOTIFY_STREAM	stdout
+
+/* Creates an info handle
+ * Make sure the value info_handle is referencing, is set to NULL
+ * Returns 1 if successful or -1 on error
+ */
+int info_handle_initialize(
+     info_handle_t **info_handle,
+     libcerror_error_t **error )
+{
+	static char *function = "info_handle_initialize";
+
+	if( info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid info handle.",
+		 function );
+
+		return( -1 );
+	}
+	if( *info_handle != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid info handle value already set.",
+		 function );
+
+		return( -1 );
+	}
+	*info_handle = memory_allocate_structure(
+	                info_handle_t );
+
+	if( *info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create info handle.",
+		 function );
+
+		goto on_error;
+	}
+	if( memory_set(
+	     *info_handle,
+	     0,
+	     sizeof( info_handle_t ) ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear info handle.",
+		 function );
+
+		goto on_error;
+	}
+	if( libxyz_file_initialize(
+	     &( ( *info_handle )->file ),
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+		 "%s: unable to initialize file.",
+		 function );
+
+		goto on_error;
+	}
+	( *info_handle )->ascii_codepage = LIBXYZ_CODEPAGE_WINDOWS_1252;
+	( *info_handle )->notify_stream  = INFO_HANDLE_NOTIFY_STREAM;
+
+	return( 1 );
+
+on_error:
+	if( *info_handle != NULL )
+	{
+		memory_free(
+		 *info_handle );
+
+		*info_handle = NULL;
+	}
+	return( -1 );
+}
+
+/* Frees an info handle
+ * Returns 1 if successful or -1 on error
+ */
+int info_handle_free(
+     info_handle_t **info_handle,
+     libcerror_error_t **error )
+{
+	static char *function = "info_handle_free";
+	int result            = 1;
+
+	if( info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid info handle.",
+		 function );
+
+		return( -1 );
+	}
+	if( *info_handle != NULL )
+	{
+		if( libxyz_file_free(
+		     &( ( *info_handle )->file ),
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free file.",
+			 function );
+
+			result = -1;
+		}
+		memory_free(
+		 *info_handle );
+
+		*info_handle = NULL;
+	}
+	return( result );
+}
+
+/* Signals the info handle to abort
+ * Returns 1 if successful or -1 on error
+ */
+int info_handle_signal_abort(
+     info_handle_t *info_handle,
+     libcerror_error_t **error )
+{
+	static char *function = "info_handle_signal_abort";
+
+	if( info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid info handle.",
+		 function );
+
+		return( -1 );
+	}
+	info_handle->abort = 1;
+
+	if( info_handle->file != NULL )
+	{
+		if( libxyz_file_signal_abort(
+		     info_handle->file,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+			 "%s: unable to signal file to abort.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	return( 1 );
+}
+
+/* Sets the ascii codepage
+ * Returns 1 if successful or -1 on error
+ */
+int info_handle_set_ascii_codepage(
+     info_handle_t *info_handle,
+     const system_character_t *string,
+     libcerror_error_t **error )
+{
+	static char *function  = "info_handle_set_ascii_codepage";
+	size_t string_length   = 0;
+	uint32_t feature_flags = 0;
+	int result             = 0;
+
+	if( info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid info handle.",
+		 function );
+
+		return( -1 );
+	}
+	feature_flags = LIBCLOCALE_CODEPAGE_FEATURE_FLAG_HAVE_WINDOWS;
+
+	string_length = system_string_length(
+	                 string );
+
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+	result = libclocale_codepage_copy_from_string_wide(
+	          &( info_handle->ascii_codepage ),
+	          string,
+	          string_length,
+	          feature_flags,
+	          error );
+#else
+	result = libclocale_codepage_copy_from_string(
+	          &( info_handle->ascii_codepage ),
+	          string,
+	          string_length,
+	          feature_flags,
+	          error );
+#endif
+	if( result == -1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to determine ASCII codepage.",
+		 function );
+
+		return( -1 );
+	}
+	return( result );
+}
+
+/* Opens the info handle
+ * Returns 1 if successful or -1 on error
+ */
+int info_handle_open(
+     info_handle_t *info_handle,
+     const system_character_t *filename,
+     libcerror_error_t **error )
+{
+	static char *function = "info_handle_open";
+
+	if( info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid info handle.",
+		 function );
+
+		return( -1 );
+	}
+	if( libxyz_file_set_ascii_codepage(
+	     info_handle->file,
+	     info_handle->ascii_codepage,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set ASCII codepage in file.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+	if( libxyz_file_open_wide(
+	     info_handle->file,
+	     filename,
+	     LIBXYZ_OPEN_READ,
+	     error ) != 1 )
+#else
+	if( libxyz_file_open(
+	     info_handle->file,
+	     filename,
+	     LIBXYZ_OPEN_READ,
+	     error ) != 1 )
+#endif
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_OPEN_FAILED,
+		 "%s: unable to open file.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Closes the info handle
+ * Returns the 0 if succesful or -1 on error
+ */
+int info_handle_close(
+     info_handle_t *info_handle,
+     libcerror_error_t **error )
+{
+	static char *function = "info_handle_close";
+
+	if( info_handle == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid info handle.",
+		 function );
+
+		return( -1 );
+	}
+	if( libxyz_file_close(
+	     info_handle->file,
+	     error ) != 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_CLOSE_FAILED,
+		 "%s: unable to close file.",
+		 function );
+
+		return( -1 );
+	}
+	return( 0 );
+}
+
@@ -0,0 +1,324 @@
+/*
+ * Shows information obtained from an XYZ file
+ *
+ * Copyright (C) 2010-@current_year@, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <system_string.h>
+#include <types.h>
+
+#include <stdio.h>
+
+#if defined( HAVE_IO_H ) || defined( WINAPI )
+#include <io.h>
+#endif
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#if defined( HAVE_UNISTD_H )
+#include <unistd.h>
+#endif
+
+#include "info_handle.h"
+#include "xyztools_getopt.h"
+#include "xyztools_libcerror.h"
+#include "xyztools_libclocale.h"
+#include "xyztools_libcnotify.h"
+#include "xyztools_libxyz.h"
+#include "xyztools_output.h"
+#include "xyztools_signal.h"
+#include "xyztools_unused.h"
+
+info_handle_t *xyzinfo_info_handle = NULL;
+int xyzinfo_abort                  = 0;
+
+/* Prints usage information
+ */
+void usage_fprint(
+      FILE *stream )
+{
+	if( stream == NULL )
+	{
+		return;
+	}
+	fprintf( stream, "Use xyzinfo to determine information about an XYZ file.\n\n" );
+
+	fprintf( stream, "Usage: xyzinfo [ -c codepage ] [ -hvV ] file\n\n" );
+
+	fprintf( stream, "\tsource: the source file\n\n" );
+
+	fprintf( stream, "\t-c:          codepage of ASCII strings, options: ascii, windows-874, windows-932,\n"
+	                 "\t             windows-936, windows-949, windows-950, windows-1250, windows-1251,\n"
+	                 "\t             windows-1252 (default), windows-1253, windows-1254, windows-1255,\n"
+	                 "\t             windows-1256, windows-1257 or windows-1258\n" );
+	fprintf( stream, "\t-h:          shows this help\n" );
+	fprintf( stream, "\t-v:          verbose output to stderr\n" );
+	fprintf( stream, "\t-V:          print version\n" );
+}
+
+/* Signal handler for xyzinfo
+ */
+void xyzinfo_signal_handler(
+      xyztools_signal_t signal XYZTOOLS_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "xyzinfo_signal_handler";
+
+	XYZTOOLS_UNREFERENCED_PARAMETER( signal )
+
+	xyzinfo_abort = 1;
+
+	if( xyzinfo_info_handle != NULL )
+	{
+		if( info_handle_signal_abort(
+		     xyzinfo_info_handle,
+		     &error ) != 1 )
+		{
+			libcnotify_printf(
+			 "%s: unable to signal info handle to abort.\n",
+			 function );
+
+			libcnotify_print_error_backtrace(
+			 error );
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	/* Force stdin to close otherwise any function reading it will remain blocked
+	 */
+#if defined( WINAPI ) && !defined( __CYGWIN__ )
+	if( _close(
+	     0 ) != 0 )
+#else
+	if( close(
+	     0 ) != 0 )
+#endif
+	{
+		libcnotify_printf(
+		 "%s: unable to close stdin.\n",
+		 function );
+	}
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain( int argc, wchar_t * const argv[] )
+#else
+int main( int argc, char * const argv[] )
+#endif
+{
+	libxyz_error_t *error               = NULL;
+	system_character_t *option_codepage = NULL;
+	system_character_t *source          = NULL;
+	char *program                       = "xyzinfo";
+	system_integer_t option             = 0;
+	int result                          = 0;
+	int verbose                         = 0;
+
+	libcnotify_stream_set(
+	 stderr,
+	 NULL );
+	libcnotify_verbose_set(
+	 1 );
+
+	if( libclocale_initialize(
+	     "xyztools",
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to initialize locale values.\n" );
+
+		goto on_error;
+	}
+	if( xyztools_output_initialize(
+	     _IONBF,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to initialize output settings.\n" );
+
+		goto on_error;
+	}
+	xyzoutput_version_fprint(
+	 stdout,
+	 program );
+
+	while( ( option = xyztools_getopt(
+	                   argc,
+	                   argv,
+	                   _SYSTEM_STRING( "c:hvV" ) ) ) != (system_integer_t) -1 )
+	{
+		switch( option )
+		{
+			case (system_integer_t) '?':
+			default:
+				fprintf(
+				 stderr,
+				 "Invalid argument: %" PRIs_SYSTEM "\n",
+				 argv[ optind - 1 ] );
+
+				usage_fprint(
+				 stdout );
+
+				return( EXIT_FAILURE );
+
+			case (system_integer_t) 'c':
+				option_codepage = optarg;
+
+				break;
+
+			case (system_integer_t) 'h':
+				usage_fprint(
+				 stdout );
+
+				return( EXIT_SUCCESS );
+
+			case (system_integer_t) 'v':
+				verbose = 1;
+
+				break;
+
+			case (system_integer_t) 'V':
+				xyztools_output_copyright_fprint(
+				 stdout );
+
+				return( EXIT_SUCCESS );
+		}
+	}
+	if( optind == argc )
+	{
+		fprintf(
+		 stderr,
+		 "Missing source file.\n" );
+
+		usage_fprint(
+		 stdout );
+
+		return( EXIT_FAILURE );
+	}
+	source = argv[ optind ];
+
+	libcnotify_verbose_set(
+	 verbose );
+	libxyz_notify_set_stream(
+	 stderr,
+	 NULL );
+	libxyz_notify_set_verbose(
+	 verbose );
+
+	if( info_handle_initialize(
+	     &xyzinfo_info_handle,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to initialize info handle.\n" );
+
+		goto on_error;
+	}
+	if( option_ascii_codepage != NULL )
+	{
+		result = info_handle_set_ascii_codepage(
+		          xyzinfo_info_handle,
+		          option_ascii_codepage,
+		          &error );
+
+		if( result == -1 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable to set ASCII codepage in info handle.\n" );
+
+			goto on_error;
+		}
+		else if( result == 0 )
+		{
+			fprintf(
+			 stderr,
+			 "Unsupported ASCII codepage defaulting to: windows-1252.\n" );
+		}
+	}
+	if( info_handle_open_input(
+	     xyzinfo_info_handle,
+	     source,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to open: %" PRIs_SYSTEM ".\n",
+		 source );
+
+		goto on_error;
+	}
+	if( info_handle_file_fprint(
+	     xyzinfo_info_handle,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to print file information.\n" );
+
+		goto on_error;
+	}
+	if( info_handle_close_input(
+	     xyzinfo_info_handle,
+	     &error ) != 0 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to close info handle.\n" );
+
+		goto on_error;
+	}
+	if( info_handle_free(
+	     &xyzinfo_info_handle,
+	     &error ) != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to free info handle.\n" );
+
+		goto on_error;
+	}
+	return( EXIT_SUCCESS );
+
+on_error:
+	if( error != NULL )
+	{
+		libcnotify_print_error_backtrace(
+		 error );
+		libcerror_error_free(
+		 &error );
+	}
+	if( xyzinfo_info_handle != NULL )
+	{
+		info_handle_free(
+		 &xyzinfo_info_handle,
+		 NULL );
+	}
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of rendering compiled template strings.
+
+To compare rendering templates with string.Template run:
+
+  python -m tests.benchmarks.compiled_template -n 10000
+
+Where the templates default to large templates in data/source.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import os
+import string
+import sys
+import time
+
+from yaldevtools import compiled_template
+
+
+_TEMPLATES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'data', 'source')
+
+_DEFAULT_TEMPLATE_PATHS = [
+    os.path.join(_TEMPLATES_PATH, 'pyyal', 'pyyal_file_object_io_handle.c'),
+    os.path.join(_TEMPLATES_PATH, 'tests', 'yal_test_deflate.c')]
+
+
+def ReadTemplateFile(path):
+  """Reads a template file into memory.
+
+  Args:
+    path (str): path of the template file.
+
+  Returns:
+    tuple[str, dict[str, str]]: template string and template mappings of
+        all its template variables.
+  """
+  with io.open(path, 'r', encoding='utf8') as file_object:
+    template = file_object.read()
+
+  template_string = compiled_template.CompiledTemplate(template)
+  template_mappings = {
+      identifier: 'value_{0:d}'.format(index)
+      for index, identifier in enumerate(template_string.identifiers)}
+
+  return template, template_mappings
+
+
+def MeasureRendering(template_class, template, template_mappings,
+                     number_of_iterations):
+  """Measures rendering a template string.
+
+  Args:
+    template_class (type): template string class, such as string.Template.
+    template (str): template string.
+    template_mappings (dict[str, str]): template mappings.
+    number_of_iterations (int): number of times the template is rendered.
+
+  Returns:
+    tuple[str, float]: rendered template and elapsed time in seconds.
+  """
+  template_string = template_class(template)
+
+  output_data = None
+  start_time = time.time()
+
+  for _ in range(number_of_iterations):
+    output_data = template_string.substitute(template_mappings)
+
+  return output_data, time.time() - start_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Compares rendering templates with string.Template and compiled '
+      'templates.'))
+
+  argument_parser.add_argument(
+      '-n', '--iterations', dest='number_of_iterations', type=int,
+      action='store', default=10000, metavar='NUMBER', help=(
+          'number of times every template is rendered.'))
+
+  argument_parser.add_argument(
+      'paths', nargs='*', action='store', metavar='PATH', default=None,
+      help='path of a template file.')
+
+  options = argument_parser.parse_args()
+
+  for path in options.paths or _DEFAULT_TEMPLATE_PATHS:
+    template, template_mappings = ReadTemplateFile(path)
+
+    expected_output_data, expected_elapsed_time = MeasureRendering(
+        string.Template, template, template_mappings,
+        options.number_of_iterations)
+    output_data, elapsed_time = MeasureRendering(
+        compiled_template.CompiledTemplate, template, template_mappings,
+        options.number_of_iterations)
+
+    if output_data != expected_output_data:
+      print('Rendering of {0:s} differs.'.format(path))
+      print('')
+      return False
+
+    print((
+        '{0:s}: rendered {1:d} times: string.Template {2:.3f} seconds, '
+        'compiled {3:.3f} seconds, {4:.1f}x.').format(
+            os.path.basename(path), options.number_of_iterations,
+            expected_elapsed_time, elapsed_time,
+            expected_elapsed_time / max(elapsed_time, 0.000001)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the startup time of the source generation.
+
+To measure the time spent importing modules run:
+
+  python -m tests.benchmarks.import_time
+
+Which requires Python 3.7 or later, for "python -X importtime".
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import subprocess
+import sys
+import unittest
+
+from tests import test_lib
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+_SOURCE_GENERATORS_MODULE_PREFIX = 'yaldevtools.source_generators.'
+
+# Python code that retrieves the source generators of specific categories.
+_GET_SOURCE_GENERATORS_CODE = (
+    'from yaldevtools import source_generation; '
+    'source_generation.GetSourceGenerators({0!r}, generators={1!r})')
+
+
+def MeasureImportTime(arguments):
+  """Measures the time spent importing modules by a Python process.
+
+  Args:
+    arguments (list[str]): arguments of the Python interpreter, such as the
+        path of a script and its arguments.
+
+  Returns:
+    dict[str, int]: import time in microseconds per name of an imported
+        module, excluding the time spent importing its nested imports.
+
+  Raises:
+    RuntimeError: if the Python process fails.
+  """
+  environment = dict(os.environ)
+  environment['PYTHONPATH'] = _LIBYAL_DIRECTORY
+
+  command = [sys.executable, '-X', 'importtime'] + arguments
+  process = subprocess.Popen(
+      command, cwd=_LIBYAL_DIRECTORY, env=environment,
+      stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  _, error_output = process.communicate()
+
+  if process.returncode != 0:
+    raise RuntimeError('Unable to run: {0:s} with error: {1:s}'.format(
+        ' '.join(command), error_output.decode('utf8', 'replace')))
+
+  import_times = {}
+  for line in error_output.decode('utf8', 'replace').split('\n'):
+    if not line.startswith('import time:'):
+      continue
+
+    _, _, values = line.partition(':')
+    values = [value.strip() for value in values.split('|')]
+    if len(values) != 3 or not values[0].isdigit():
+      continue
+
+    import_times[values[2]] = int(values[0], 10)
+
+  return import_times
+
+
+def MeasureStartupScenarios():
+  """Measures the import time of the source generation startup scenarios.
+
+  Returns:
+    list[tuple[str, int, list[str]]]: description of the scenario, import
+        time of the yaldevtools modules in microseconds and names of the
+        source generator modules imported.
+  """
+  source_generate_script = os.path.join('scripts', 'source-generate.py')
+
+  scenarios = [
+      ('source-generate.py --list-generators', [
+          source_generate_script, '--list-generators']),
+      ('GetSourceGenerators(generators=["include"])', [
+          '-c', _GET_SOURCE_GENERATORS_CODE.format(
+              _LIBYAL_DIRECTORY, ['include'])]),
+      ('GetSourceGenerators(generators=None)', [
+          '-c', _GET_SOURCE_GENERATORS_CODE.format(_LIBYAL_DIRECTORY, None)])]
+
+  results = []
+  for description, arguments in scenarios:
+    import_times = MeasureImportTime(arguments)
+
+    source_generator_modules = sorted([
+        module_name[len(_SOURCE_GENERATORS_MODULE_PREFIX):]
+        for module_name in import_times
+        if module_name.startswith(_SOURCE_GENERATORS_MODULE_PREFIX)])
+
+    import_time = sum([
+        module_import_time for module_name, module_import_time in (
+            import_times.items())
+        if module_name.startswith('yaldevtools')])
+
+    results.append((description, import_time, source_generator_modules))
+
+  return results
+
+
+@unittest.skipIf(
+    sys.version_info[0:2] < (3, 7), 'missing python -X importtime support')
+class ImportTimeBenchmarkTest(test_lib.BaseTestCase):
+  """Import time benchmark tests."""
+
+  def testMeasureStartupScenarios(self):
+    """Tests the MeasureStartupScenarios function."""
+    results = MeasureStartupScenarios()
+    self.assertEqual(len(results), 3)
+
+    _, _, source_generator_modules = results[0]
+    self.assertEqual(source_generator_modules, [])
+
+    _, _, source_generator_modules = results[1]
+    self.assertEqual(source_generator_modules, ['include', 'interface'])
+
+    _, _, source_generator_modules = results[2]
+    self.assertIn('python_module', source_generator_modules)
+    self.assertIn('tests', source_generator_modules)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Measures the time spent importing modules when starting the source '
+      'generation.'))
+
+  argument_parser.parse_args()
+
+  if sys.version_info[0:2] < (3, 7):
+    print('Measuring import time requires Python 3.7 or later.')
+    print('')
+    return False
+
+  for description, import_time, source_generator_modules in (
+      MeasureStartupScenarios()):
+    print('{0:s}: {1:.1f} ms, source generator modules: {2:s}'.format(
+        description, float(import_time) / 1000.0,
+        ', '.join(source_generator_modules) or 'none'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
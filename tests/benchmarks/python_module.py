@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the Python type object function prototypes.
+
+To measure determining the prototypes of a libyal project run:
+
+  python -m tests.benchmarks.python_module -p .. libpff
+
+Without a projects directory the library header files of a synthetic
+library with 64 types are used.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import glob
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from yaldevtools import configuration
+from yaldevtools.source_generators import python_module
+
+
+_TYPE_FUNCTIONS = """\
+{LIB}_EXTERN \\
+int {lib}_{type}_get_identifier(
+     {lib}_{type}_t *{type},
+     uint32_t *identifier,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_get_size(
+     {lib}_{type}_t *{type},
+     size64_t *size,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_get_creation_time(
+     {lib}_{type}_t *{type},
+     uint64_t *filetime,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_get_utf8_name_size(
+     {lib}_{type}_t *{type},
+     size_t *utf8_string_size,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_get_utf8_name(
+     {lib}_{type}_t *{type},
+     uint8_t *utf8_string,
+     size_t utf8_string_size,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_get_number_of_sub_items(
+     {lib}_{type}_t *{type},
+     int *number_of_sub_items,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_get_sub_item_by_index(
+     {lib}_{type}_t *{type},
+     int sub_item_index,
+     {lib}_item_t **sub_item,
+     libcerror_error_t **error );
+
+{LIB}_EXTERN \\
+int {lib}_{type}_is_allocated(
+     {lib}_{type}_t *{type},
+     libcerror_error_t **error );
+"""
+
+
+def GetLibraryTypeNames(projects_directory, library_name):
+  """Determines the type names of the library header files of a project.
+
+  Args:
+    projects_directory (str): path of the projects directory.
+    library_name (str): name of the library.
+
+  Returns:
+    list[str]: type names.
+  """
+  path = os.path.join(
+      projects_directory, library_name, library_name,
+      '{0:s}_*.h'.format(library_name))
+
+  type_names = []
+  for header_file_path in sorted(glob.glob(path)):
+    filename = os.path.basename(header_file_path)
+    type_names.append(filename[len(library_name) + 1:-2])
+
+  return type_names
+
+
+def WriteLibraryHeaderFiles(projects_directory, library_name, type_names):
+  """Writes the library header files of a synthetic library.
+
+  Args:
+    projects_directory (str): path of the projects directory.
+    library_name (str): name of the library.
+    type_names (list[str]): type names.
+  """
+  library_path = os.path.join(projects_directory, library_name, library_name)
+  os.makedirs(library_path)
+
+  for type_name in type_names:
+    header_file_path = os.path.join(library_path, '{0:s}_{1:s}.h'.format(
+        library_name, type_name))
+
+    with io.open(header_file_path, 'w', encoding='utf8') as file_object:
+      file_object.write(_TYPE_FUNCTIONS.format(
+          LIB=library_name.upper(), lib=library_name, type=type_name))
+
+
+def MeasurePrototypes(
+    projects_directory, library_name, type_names, number_of_iterations):
+  """Measures determining the Python type object function prototypes.
+
+  Every iteration determines the prototypes of every type and retrieves the
+  derived values of every prototype as often as the source generator does.
+
+  Args:
+    projects_directory (str): path of the projects directory.
+    library_name (str): name of the library.
+    type_names (list[str]): type names.
+    number_of_iterations (int): number of times the prototypes of every type
+        are determined.
+
+  Returns:
+    tuple[int, float]: number of prototypes and elapsed time in seconds.
+  """
+  project_configuration = configuration.ProjectConfiguration()
+  project_configuration.library_name = library_name
+  project_configuration.python_module_name = 'py{0:s}'.format(
+      library_name[3:])
+
+  generator = python_module.PythonModuleSourceFileGenerator(
+      projects_directory, projects_directory)
+
+  # Read the library header files beforehand so that only determining the
+  # prototypes is measured.
+  for type_name in type_names:
+    generator._GetTypeLibraryHeaderFile(  # pylint: disable=protected-access
+        project_configuration, type_name)
+
+  number_of_prototypes = 0
+  start_time = time.time()
+
+  for _ in range(number_of_iterations):
+    for type_name in type_names:
+      python_function_prototypes = (
+          generator._GetPythonTypeObjectFunctionPrototypes(  # pylint: disable=protected-access
+              project_configuration, type_name))
+
+      for python_function_prototype in (
+          python_function_prototypes or {}).values():
+        for _ in range(4):
+          _ = python_function_prototype.name
+          _ = python_function_prototype.type_function
+          _ = python_function_prototype.value_name
+          python_function_prototype.GetAttributeDescription()
+          python_function_prototype.GetDataTypeDescription()
+          python_function_prototype.GetDescription()
+          python_function_prototype.GetValueNameAndPrefix()
+
+        number_of_prototypes += 1
+
+  return number_of_prototypes, time.time() - start_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Measures determining the Python type object function prototypes.'))
+
+  argument_parser.add_argument(
+      '-n', '--iterations', dest='number_of_iterations', type=int,
+      action='store', default=10, metavar='NUMBER', help=(
+          'number of times the prototypes of every type are determined.'))
+
+  argument_parser.add_argument(
+      '-p', '--projects', dest='projects_directory', action='store',
+      metavar='PROJECTS_DIRECTORY', default=None, help=(
+          'path of the projects, where a synthetic library is used if not '
+          'set.'))
+
+  argument_parser.add_argument(
+      'library_name', nargs='?', action='store', metavar='NAME',
+      default='libyal', help='name of the library.')
+
+  options = argument_parser.parse_args()
+
+  # Unsupported functions are expected and should not be reported.
+  logging.disable(logging.WARNING)
+
+  temporary_directory = None
+  projects_directory = options.projects_directory
+  if not projects_directory:
+    temporary_directory = tempfile.mkdtemp()
+    projects_directory = temporary_directory
+
+    WriteLibraryHeaderFiles(
+        projects_directory, options.library_name,
+        ['type{0:d}'.format(index) for index in range(64)])
+
+  try:
+    type_names = GetLibraryTypeNames(projects_directory, options.library_name)
+    if not type_names:
+      print('No library header files found.')
+      print('')
+      return False
+
+    number_of_prototypes, elapsed_time = MeasurePrototypes(
+        projects_directory, options.library_name, type_names,
+        options.number_of_iterations)
+
+  finally:
+    if temporary_directory:
+      shutil.rmtree(temporary_directory, True)
+
+  print((
+      'Determined {0:d} prototypes of {1:d} types in {2:.3f} seconds, '
+      '{3:.1f} microseconds per prototype.').format(
+          number_of_prototypes, len(type_names), elapsed_time,
+          elapsed_time * 1000000.0 / max(number_of_prototypes, 1)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
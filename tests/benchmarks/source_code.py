@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the memory used by the source code objects.
+
+To measure the memory used by indexing libyal projects run:
+
+  python -m tests.benchmarks.source_code ../libyal ../libewf
+
+Where every argument is a project directory or a header file. Without
+arguments the header templates in data/source are used.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import gc
+import io
+import sys
+
+try:
+  import tracemalloc
+except ImportError:
+  tracemalloc = None
+
+from yaldevtools import source_formatter
+from yaldevtools import source_parser
+
+from tests.benchmarks import source_parser as source_parser_benchmark
+
+
+def MeasureMemoryUsage(header_files, number_of_copies):
+  """Measures the memory used by the objects of parsed header files.
+
+  Args:
+    header_files (list[tuple[str, str]]): library name and data of the header
+        files.
+    number_of_copies (int): number of times every header file is parsed,
+        where the objects of every copy are kept.
+
+  Returns:
+    tuple[int, int]: number of objects and number of bytes allocated for
+        them.
+  """
+  gc.collect()
+  tracemalloc.start()
+  try:
+    start_size, _ = tracemalloc.get_traced_memory()
+
+    objects = []
+    for _ in range(number_of_copies):
+      for library_name, data in header_files:
+        parser = source_parser.DeclarationParser(library_name)
+        parser.Parse(io.StringIO(data))
+
+        for function_declaration in parser.function_declarations:
+          function_prototype = function_declaration.function_prototype
+          objects.append(function_declaration)
+          objects.append(function_prototype)
+          objects.extend(function_prototype.arguments)
+
+          for function_argument in function_prototype.arguments:
+            objects.append(source_formatter.Variable(
+                function_argument.CopyToString()))
+
+        objects.extend(parser.enum_declarations)
+
+    gc.collect()
+    end_size, _ = tracemalloc.get_traced_memory()
+
+  finally:
+    tracemalloc.stop()
+
+  return len(objects), end_size - start_size
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Measures the memory used by the objects of parsed header files.'))
+
+  argument_parser.add_argument(
+      '-n', '--copies', dest='number_of_copies', type=int, action='store',
+      default=1, metavar='NUMBER', help=(
+          'number of times every header file is parsed, where the objects of '
+          'every copy are kept.'))
+
+  argument_parser.add_argument(
+      'paths', nargs='*', action='store', metavar='PATH', default=None,
+      help='path of a project directory or header file.')
+
+  options = argument_parser.parse_args()
+
+  if tracemalloc is None:
+    print('Measuring memory usage requires tracemalloc.')
+    print('')
+    return False
+
+  if options.paths:
+    header_files = source_parser_benchmark.ReadHeaderFiles(options.paths)
+  else:
+    header_files = source_parser_benchmark.ReadHeaderTemplates()
+
+  if not header_files:
+    print('No header files found.')
+    print('')
+    return False
+
+  number_of_objects, number_of_bytes = MeasureMemoryUsage(
+      header_files, options.number_of_copies)
+
+  print((
+      'Parsed {0:d} header files {1:d} times: {2:d} objects use {3:.1f} MiB, '
+      '{4:.0f} bytes per object.').format(
+          len(header_files), options.number_of_copies, number_of_objects,
+          float(number_of_bytes) / (1024 * 1024),
+          float(number_of_bytes) / max(number_of_objects, 1)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
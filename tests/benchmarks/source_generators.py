@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the source generators on a synthetic libyal project.
+
+To measure the source generators with 10, 100 and 1000 types run:
+
+  python -m tests.benchmarks.source_generators -o results.json
+
+Every source generator is run, in order of generation, on a synthetic
+project per number of types, once to measure its throughput and once to
+measure its peak memory usage. Peak memory usage is measured with the
+tracemalloc module, which requires Python 3.4 or later.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+  import tracemalloc
+except ImportError:
+  tracemalloc = None
+
+from yaldevtools import configuration
+from yaldevtools import output_writers
+from yaldevtools import parse_cache
+from yaldevtools import source_generation
+from yaldevtools import template_cache
+
+from tests import synthetic_project
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+def _RunSourceGenerator(
+    source_generator_class, template_directory, projects_directory,
+    project_directory, project_configuration):
+  """Runs a source generator on a project.
+
+  Args:
+    source_generator_class (type): source generator class.
+    template_directory (str): path of the template directory.
+    projects_directory (str): path of the projects directory.
+    project_directory (str): path of the project directory.
+    project_configuration (ProjectConfiguration): project configuration.
+
+  Returns:
+    tuple[int, int]: number of output files and number of bytes written.
+  """
+  output_writer = output_writers.FileWriter(project_directory)
+
+  working_directory = os.getcwd()
+  os.chdir(project_directory)
+
+  try:
+    source_generator_object = source_generator_class(
+        projects_directory, template_directory)
+    source_generator_object.Generate(project_configuration, output_writer)
+    output_writer.Close()
+
+    written_files = output_writer.GetWrittenFiles()
+    number_of_bytes = sum([
+        os.path.getsize(path) for path in written_files
+        if os.path.isfile(path)])
+
+  finally:
+    os.chdir(working_directory)
+
+  return len(written_files), number_of_bytes
+
+
+def MeasureSourceGenerators(projects_directory, number_of_types):
+  """Measures the source generators on a synthetic project.
+
+  The caches are emptied before every measurement so that every measurement
+  starts with cold caches.
+
+  Args:
+    projects_directory (str): path of the projects directory, in which
+        the synthetic projects are written.
+    number_of_types (int): number of value types of the synthetic project.
+
+  Returns:
+    dict[str, dict[str, object]]: duration in seconds, number of output
+        files, number of bytes written, throughput in output files and in
+        bytes per second and peak memory usage in bytes, which is None if
+        not supported, per source generator category.
+  """
+  results = {}
+  for measure_memory in (False, True):
+    if measure_memory and not tracemalloc:
+      break
+
+    project_writer = synthetic_project.SyntheticProjectWriter(
+        number_of_types=number_of_types)
+
+    measurement_directory = os.path.join(
+        projects_directory, '{0:d}-{1:s}'.format(
+            number_of_types, 'memory' if measure_memory else 'time'))
+    project_directory = project_writer.Write(measurement_directory)
+
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.ReadFromFile(os.path.join(
+        project_directory, 'libxyz.ini'))
+
+    parse_cache.PARSE_CACHE.Empty()
+    template_cache.TEMPLATE_CACHE.Empty()
+
+    for source_category, source_generator_class, template_directory, _ in (
+        source_generation.GetSourceGenerators(_LIBYAL_DIRECTORY)):
+      if measure_memory:
+        tracemalloc.start()
+
+      start_time = time.time()
+
+      number_of_files, number_of_bytes = _RunSourceGenerator(
+          source_generator_class, template_directory, measurement_directory,
+          project_directory, project_configuration)
+
+      duration = time.time() - start_time
+
+      if measure_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[source_category]['peak_memory'] = peak_memory
+        continue
+
+      duration = max(duration, 0.000001)
+      results[source_category] = {
+          'bytes_per_second': number_of_bytes / duration,
+          'duration': duration,
+          'files_per_second': number_of_files / duration,
+          'number_of_bytes': number_of_bytes,
+          'number_of_files': number_of_files,
+          'peak_memory': None}
+
+  return results
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Measures the source generators on a synthetic libyal project.'))
+
+  argument_parser.add_argument(
+      '-o', '--output', dest='output_path', action='store', metavar='PATH',
+      default=None, help='path of the JSON file to write the results to.')
+
+  argument_parser.add_argument(
+      '-t', '--types', dest='number_of_types', action='store',
+      metavar='NUMBERS', default='10,100,1000', help=(
+          'comma separated numbers of types of the synthetic projects.'))
+
+  options = argument_parser.parse_args()
+
+  try:
+    numbers_of_types = [
+        int(value, 10) for value in options.number_of_types.split(',')]
+  except ValueError:
+    print('Unsupported numbers of types: {0:s}.'.format(
+        options.number_of_types))
+    print('')
+    return False
+
+  # Unsupported functions are expected and should not be reported.
+  logging.disable(logging.ERROR)
+
+  results = []
+  projects_directory = tempfile.mkdtemp()
+  try:
+    for number_of_types in numbers_of_types:
+      results_per_category = MeasureSourceGenerators(
+          projects_directory, number_of_types)
+
+      results.append({
+          'generators': results_per_category,
+          'number_of_types': number_of_types})
+
+      for source_category, result in sorted(results_per_category.items()):
+        peak_memory = result['peak_memory']
+        if peak_memory is None:
+          peak_memory = 'N/A'
+        else:
+          peak_memory = '{0:.1f} MiB'.format(peak_memory / (1024.0 * 1024.0))
+
+        print((
+            '{0:d} types: {1:s}: {2:.3f} seconds, {3:d} files, {4:.1f} '
+            'files/second, {5:.1f} KiB/second, peak memory: {6:s}').format(
+                number_of_types, source_category, result['duration'],
+                result['number_of_files'], result['files_per_second'],
+                result['bytes_per_second'] / 1024.0, peak_memory))
+
+  finally:
+    shutil.rmtree(projects_directory, True)
+
+  if options.output_path:
+    report = {
+        'python_version': platform.python_version(),
+        'results': results}
+
+    with io.open(options.output_path, 'w', encoding='utf8') as file_object:
+      file_object.write('{0:s}\n'.format(
+          json.dumps(report, indent=2, sort_keys=True)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the C declaration parser.
+
+To measure the throughput on libyal projects run:
+
+  python -m tests.benchmarks.source_parser ../libyal ../libewf
+
+Where every argument is a project directory or a header file. Without
+arguments the header templates in data/source are used.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import os
+import string
+import sys
+import time
+
+from yaldevtools import source_parser
+
+
+_TEMPLATES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'data', 'source')
+
+
+def _IsHeaderPath(path):
+  """Determines if a path is, or is part of, a header file.
+
+  Args:
+    path (str): path.
+
+  Returns:
+    bool: True if the path is a header file or a fragment of a header file
+        template.
+  """
+  for path_segment in path.split(os.sep):
+    if path_segment.endswith('.h') or path_segment.endswith('.h.in'):
+      return True
+  return False
+
+
+def GetLibraryName(path):
+  """Determines the library name from the path of a header file.
+
+  Args:
+    path (str): path of the header file, such as "libyal/libyal_file.h".
+
+  Returns:
+    str: library name, such as "libyal".
+  """
+  filename = os.path.basename(path)
+  library_name, _, _ = filename.partition('.')
+  library_name, _, _ = library_name.partition('_')
+  return library_name
+
+
+def ReadHeaderFiles(paths):
+  """Reads header files into memory.
+
+  Args:
+    paths (list[str]): paths of project directories or header files.
+
+  Returns:
+    list[tuple[str, str]]: library name and data of the header files.
+  """
+  header_files = []
+  for path in paths:
+    if os.path.isdir(path):
+      header_file_paths = []
+      for directory, _, filenames in os.walk(path):
+        for filename in filenames:
+          header_file_path = os.path.join(directory, filename)
+          if _IsHeaderPath(header_file_path):
+            header_file_paths.append(header_file_path)
+
+    else:
+      header_file_paths = [path]
+
+    for header_file_path in sorted(header_file_paths):
+      with io.open(header_file_path, 'r', encoding='utf8') as file_object:
+        data = file_object.read()
+
+      header_files.append((GetLibraryName(header_file_path), data))
+
+  return header_files
+
+
+def ReadHeaderTemplates():
+  """Reads the header templates into memory.
+
+  Returns:
+    list[tuple[str, str]]: library name and data of the header templates
+        with the library name substituted.
+  """
+  template_mappings = {
+      'library_name': 'libyal',
+      'library_name_suffix': 'yal',
+      'library_name_suffix_upper_case': 'YAL',
+      'library_name_upper_case': 'LIBYAL'}
+
+  header_files = []
+  for _, data in ReadHeaderFiles([_TEMPLATES_PATH]):
+    data = string.Template(data).safe_substitute(template_mappings)
+    header_files.append(('libyal', data))
+
+  return header_files
+
+
+def MeasureThroughput(header_files, number_of_iterations):
+  """Measures the throughput of parsing header files.
+
+  Args:
+    header_files (list[tuple[str, str]]): library name and data of the header
+        files.
+    number_of_iterations (int): number of times every header file is parsed.
+
+  Returns:
+    tuple[int, float]: number of bytes parsed and elapsed time in seconds.
+  """
+  parsers = {}
+  for library_name, _ in header_files:
+    if library_name not in parsers:
+      parsers[library_name] = source_parser.DeclarationParser(library_name)
+
+  number_of_bytes = 0
+  start_time = time.time()
+
+  for _ in range(number_of_iterations):
+    for library_name, data in header_files:
+      parsers[library_name].Parse(io.StringIO(data))
+      number_of_bytes += len(data.encode('utf8'))
+
+  return number_of_bytes, time.time() - start_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Measures the throughput of the C declaration parser.'))
+
+  argument_parser.add_argument(
+      '-n', '--iterations', dest='number_of_iterations', type=int,
+      action='store', default=10, metavar='NUMBER', help=(
+          'number of times every header file is parsed.'))
+
+  argument_parser.add_argument(
+      'paths', nargs='*', action='store', metavar='PATH', default=None,
+      help='path of a project directory or header file.')
+
+  options = argument_parser.parse_args()
+
+  if options.paths:
+    header_files = ReadHeaderFiles(options.paths)
+  else:
+    header_files = ReadHeaderTemplates()
+
+  if not header_files:
+    print('No header files found.')
+    print('')
+    return False
+
+  number_of_bytes, elapsed_time = MeasureThroughput(
+      header_files, options.number_of_iterations)
+
+  megabytes = float(number_of_bytes) / (1024 * 1024)
+  throughput = megabytes / max(elapsed_time, 0.000001)
+
+  print((
+      'Parsed {0:d} header files {1:d} times: {2:.1f} MiB in {3:.3f} seconds, '
+      '{4:.1f} MiB/s.').format(
+          len(header_files), options.number_of_iterations, megabytes,
+          elapsed_time, throughput))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Tests for the compiled template string."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import string
+import unittest
+
+from yaldevtools import compiled_template
+
+from tests import test_lib
+
+
+_TEMPLATES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'source')
+
+
+class CompiledTemplateTest(test_lib.BaseTestCase):
+  """Compiled template string tests."""
+
+  _TEMPLATE = (
+      'int ${library_name}_${type_name}_free(\n'
+      '     ${library_name}_${type_name}_t **$type_name );\n'
+      '/* $$ */\n')
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    template_string = compiled_template.CompiledTemplate(self._TEMPLATE)
+    self.assertEqual(template_string.template, self._TEMPLATE)
+    self.assertEqual(
+        template_string.identifiers, ['library_name', 'type_name'])
+
+  def testGetMissingIdentifiers(self):
+    """Tests the GetMissingIdentifiers function."""
+    template_string = compiled_template.CompiledTemplate(self._TEMPLATE)
+
+    missing_identifiers = template_string.GetMissingIdentifiers({})
+    self.assertEqual(missing_identifiers, ['library_name', 'type_name'])
+
+    missing_identifiers = template_string.GetMissingIdentifiers(
+        {'library_name': 'libyal', 'type_name': 'file'})
+    self.assertEqual(missing_identifiers, [])
+
+  def testSubstitute(self):
+    """Tests the substitute function."""
+    template_mappings = {'library_name': 'libyal', 'type_name': 'file'}
+
+    template_string = compiled_template.CompiledTemplate(self._TEMPLATE)
+    output_data = template_string.substitute(template_mappings)
+
+    expected_output_data = string.Template(self._TEMPLATE).substitute(
+        template_mappings)
+    self.assertEqual(output_data, expected_output_data)
+
+    output_data = template_string.substitute(
+        template_mappings, type_name='volume')
+    self.assertEqual(output_data, (
+        'int libyal_volume_free(\n'
+        '     libyal_volume_t **volume );\n'
+        '/* $ */\n'))
+
+    template_string = compiled_template.CompiledTemplate('${value}')
+    self.assertEqual(template_string.substitute({'value': 5}), '5')
+
+    template_string = compiled_template.CompiledTemplate('')
+    self.assertEqual(template_string.substitute({}), '')
+
+  def testSubstituteWithTemplateFiles(self):
+    """Tests the substitute function with large template files."""
+    for path_segments in (
+        ['pyyal', 'pyyal_file_object_io_handle.c'],
+        ['tests', 'yal_test_deflate.c']):
+      path = os.path.join(_TEMPLATES_PATH, *path_segments)
+      with io.open(path, 'r', encoding='utf8') as file_object:
+        template = file_object.read()
+
+      template_string = compiled_template.CompiledTemplate(template)
+      template_mappings = {
+          identifier: 'value_{0:d}'.format(index)
+          for index, identifier in enumerate(template_string.identifiers)}
+
+      output_data = template_string.substitute(template_mappings)
+
+      expected_output_data = string.Template(template).substitute(
+          template_mappings)
+      self.assertEqual(output_data, expected_output_data)
+
+  def testSubstituteWithMissingMappings(self):
+    """Tests the substitute function with missing template mappings."""
+    template_string = compiled_template.CompiledTemplate(self._TEMPLATE)
+
+    with self.assertRaises(KeyError) as context_manager:
+      template_string.substitute({})
+
+    self.assertEqual(
+        context_manager.exception.args, ('library_name, type_name', ))
+
+  def testSubstituteWithInvalidPlaceholder(self):
+    """Tests the substitute function with an invalid placeholder."""
+    template_string = compiled_template.CompiledTemplate('value\n $ value')
+
+    with self.assertRaises(ValueError) as context_manager:
+      template_string.substitute({})
+
+    with self.assertRaises(ValueError) as expected_context_manager:
+      string.Template('value\n $ value').substitute({})
+
+    self.assertEqual(
+        '{0!s}'.format(context_manager.exception),
+        '{0!s}'.format(expected_context_manager.exception))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Tests for the dependency manifest."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import dependency_manifest
+
+from tests import test_lib
+
+
+class DependencyManifestTest(test_lib.BaseTestCase):
+  """Dependency manifest tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    self._project_directory = os.path.join(
+        self._temporary_directory, 'project')
+    self._templates_directory = os.path.join(
+        self._temporary_directory, 'templates')
+    self._template_directory = os.path.join(
+        self._templates_directory, 'category')
+
+    os.mkdir(self._project_directory)
+    os.mkdir(self._templates_directory)
+    os.mkdir(self._template_directory)
+
+    self._input_path = self._WriteFile(
+        self._project_directory, 'input.h', 'input')
+    self._output_path = self._WriteFile(
+        self._project_directory, 'output.c', 'output')
+    self._template_path = self._WriteFile(
+        self._template_directory, 'template.c', 'template')
+
+    self._manifest_path = os.path.join(self._project_directory, '.manifest')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _CreateManifest(self):
+    """Creates a dependency manifest with a generated category.
+
+    Returns:
+      DependencyManifest: dependency manifest.
+    """
+    manifest = dependency_manifest.DependencyManifest(
+        self._manifest_path, self._project_directory, self._templates_directory)
+
+    manifest.SetCategory(
+        'category', self._template_directory, 'code', 'configuration',
+        [self._input_path], {self._output_path: [self._template_path]})
+
+    return manifest
+
+  def _WriteFile(self, directory, filename, data):
+    """Writes a file.
+
+    Args:
+      directory (str): path of the directory.
+      filename (str): name of the file.
+      data (str): data of the file.
+
+    Returns:
+      str: path of the file.
+    """
+    path = os.path.join(directory, filename)
+    with io.open(path, 'w', encoding='utf8') as file_object:
+      file_object.write(data)
+
+    return path
+
+  def testIsUpToDate(self):
+    """Tests the IsUpToDate function."""
+    manifest = self._CreateManifest()
+
+    self.assertTrue(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+    self.assertFalse(manifest.IsUpToDate(
+        'other', self._template_directory, 'code', 'configuration'))
+    self.assertFalse(manifest.IsUpToDate(
+        'category', self._template_directory, 'changed', 'configuration'))
+    self.assertFalse(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'changed'))
+
+    for path in (self._input_path, self._output_path, self._template_path):
+      manifest = self._CreateManifest()
+      manifest.WriteToFile()
+
+      with io.open(path, 'a', encoding='utf8') as file_object:
+        file_object.write('changed')
+
+      manifest = dependency_manifest.DependencyManifest(
+          self._manifest_path, self._project_directory,
+          self._templates_directory)
+      manifest.ReadFromFile()
+
+      self.assertFalse(manifest.IsUpToDate(
+          'category', self._template_directory, 'code', 'configuration'))
+
+  def testIsUpToDateWithInputDirectory(self):
+    """Tests the IsUpToDate function with an input directory."""
+    input_directory = os.path.join(self._project_directory, 'data')
+    os.mkdir(input_directory)
+
+    self._WriteFile(input_directory, 'input.1', 'input')
+
+    manifest = dependency_manifest.DependencyManifest(
+        self._manifest_path, self._project_directory, self._templates_directory)
+    manifest.SetCategory(
+        'category', self._template_directory, 'code', 'configuration',
+        [], {self._output_path: [self._template_path]},
+        input_directories={input_directory: ['input.1']})
+
+    self.assertTrue(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+
+    self._WriteFile(input_directory, 'input.2', 'input')
+
+    self.assertFalse(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+
+    # The names of the entries are recorded as they were listed.
+    manifest.SetCategory(
+        'category', self._template_directory, 'code', 'configuration',
+        [], {self._output_path: [self._template_path]},
+        input_directories={input_directory: ['input.1']})
+
+    self.assertFalse(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+
+  def testIsUpToDateWithRenamedTemplate(self):
+    """Tests the IsUpToDate function with a renamed template."""
+    manifest = self._CreateManifest()
+
+    os.rename(
+        self._template_path,
+        os.path.join(self._template_directory, 'renamed.c'))
+
+    self.assertFalse(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+
+  def testReadFromFileAndWriteToFile(self):
+    """Tests the ReadFromFile and WriteToFile functions."""
+    manifest = self._CreateManifest()
+    manifest.WriteToFile()
+
+    manifest = dependency_manifest.DependencyManifest(
+        self._manifest_path, self._project_directory, self._templates_directory)
+
+    self.assertFalse(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+
+    manifest.ReadFromFile()
+
+    self.assertTrue(manifest.IsUpToDate(
+        'category', self._template_directory, 'code', 'configuration'))
+
+
+if __name__ == '__main__':
+  unittest.main()
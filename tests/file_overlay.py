@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests for the file overlay."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import file_overlay
+
+from tests import test_lib
+
+
+class FileOverlayTest(test_lib.BaseTestCase):
+  """File overlay tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    self._path = os.path.join(self._temporary_directory, 'libyal.h')
+    with io.open(self._path, 'wb') as file_object:
+      file_object.write(b'int disk;\n')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testExists(self):
+    """Tests the Exists function."""
+    overlay = file_overlay.FileOverlay()
+
+    path = os.path.join(self._temporary_directory, 'libyal.c')
+    self.assertTrue(overlay.Exists(self._path))
+    self.assertFalse(overlay.Exists(path))
+
+    overlay.SetFileData(path, '')
+    self.assertTrue(overlay.Exists(path))
+
+    overlay.Empty()
+    self.assertFalse(overlay.Exists(path))
+
+  def testOpen(self):
+    """Tests the Open function."""
+    overlay = file_overlay.FileOverlay()
+
+    with overlay.Open(self._path) as file_object:
+      self.assertEqual(file_object.read(), 'int disk;\n')
+
+    overlay.SetFileData(self._path, 'int overlay;\r\n')
+    self.assertEqual(overlay.GetFileData(self._path), 'int overlay;\r\n')
+
+    # Lines are read with universal newlines, the same way as from disk.
+    with overlay.Open(self._path) as file_object:
+      self.assertEqual(file_object.read(), 'int overlay;\n')
+
+    path = os.path.join(self._temporary_directory, 'libyal.c')
+    self.assertIsNone(overlay.GetFileData(path))
+
+    with self.assertRaises(IOError):
+      overlay.Open(path)
+
+
+if __name__ == '__main__':
+  unittest.main()
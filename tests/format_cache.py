@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cache of formatted source files."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import format_cache
+
+from tests import test_lib
+
+
+class FormatCacheTest(test_lib.BaseTestCase):
+  """Tests for the cache of formatted source files."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    self._source_path = os.path.join(self._temporary_directory, 'source.c')
+    with io.open(self._source_path, 'w', encoding='utf8') as file_object:
+      file_object.write('int a;\n')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetFileHash(self):
+    """Tests the GetFileHash function."""
+    test_cache = format_cache.FormatCache()
+
+    file_hash = test_cache.GetFileHash(self._source_path)
+    self.assertEqual(file_hash, '56f54d1636dfec63c3e1586e5e4bdc9a455bb9f6')
+
+    file_hash = test_cache.GetFileHash(os.path.join(
+        self._temporary_directory, 'missing.c'))
+    self.assertIsNone(file_hash)
+
+  def testIsFormatted(self):
+    """Tests the IsFormatted function."""
+    test_cache = format_cache.FormatCache()
+
+    file_hash = test_cache.GetFileHash(self._source_path)
+    self.assertFalse(test_cache.IsFormatted(self._source_path, file_hash))
+
+    test_cache.SetFormatted(self._source_path, file_hash)
+    self.assertTrue(test_cache.IsFormatted(self._source_path, file_hash))
+    self.assertFalse(test_cache.IsFormatted(self._source_path, 'other'))
+    self.assertFalse(test_cache.IsFormatted(self._source_path, None))
+
+  def testReadFromFile(self):
+    """Tests the ReadFromFile and WriteToFile functions."""
+    cache_path = os.path.join(
+        self._temporary_directory, 'cache', 'format.json')
+
+    test_cache = format_cache.FormatCache(path=cache_path)
+    file_hash = test_cache.GetFileHash(self._source_path)
+    test_cache.SetFormatted(self._source_path, file_hash)
+    test_cache.WriteToFile()
+
+    test_cache = format_cache.FormatCache(path=cache_path)
+    test_cache.ReadFromFile()
+    self.assertTrue(test_cache.IsFormatted(self._source_path, file_hash))
+
+    with io.open(cache_path, 'w', encoding='utf8') as file_object:
+      file_object.write('{')
+
+    test_cache.ReadFromFile()
+    self.assertFalse(test_cache.IsFormatted(self._source_path, file_hash))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source formatter server."""
+
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from yaldevtools import format_server
+
+from tests import test_lib
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__)))
+
+_UNFORMATTED_SOURCE = """\
+int myfunction(
+     int *argument )
+{
+	int second = 0;
+	int first = 0;
+
+	return( first );
+}
+"""
+
+_FORMATTED_SOURCE = """\
+int myfunction(
+     int *argument )
+{
+	int first  = 0;
+	int second = 0;
+
+	return( first );
+}
+"""
+
+
+class StubClient(object):
+  """Stub client of the source formatter server script."""
+
+  def __init__(self):
+    """Initializes a stub client."""
+    super(StubClient, self).__init__()
+    self._last_identifier = 0
+    self._process = None
+
+  def Call(self, method, params=None):
+    """Calls a method of the server.
+
+    Args:
+      method (str): name of the method.
+      params (Optional[dict[str, object]]): parameters of the method.
+
+    Returns:
+      dict[str, object]: response.
+    """
+    self._last_identifier += 1
+    request = {
+        'id': self._last_identifier, 'jsonrpc': '2.0', 'method': method,
+        'params': params or {}}
+
+    request_data = '{0:s}\n'.format(json.dumps(request))
+    self._process.stdin.write(request_data.encode('utf8'))
+    self._process.stdin.flush()
+
+    response_data = self._process.stdout.readline()
+    return json.loads(response_data.decode('utf8'))
+
+  def Start(self):
+    """Starts the server."""
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = _LIBYAL_DIRECTORY
+
+    script_path = os.path.join(
+        _LIBYAL_DIRECTORY, 'scripts', 'source-format-server.py')
+
+    self._process = subprocess.Popen(
+        [sys.executable, script_path], env=environment,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+  def Stop(self):
+    """Stops the server.
+
+    Returns:
+      int: exit code of the server.
+    """
+    self._process.stdin.close()
+    exit_code = self._process.wait()
+    self._process.stdout.close()
+    return exit_code
+
+
+class FormatServerTest(test_lib.BaseTestCase):
+  """Tests for the source formatter server."""
+
+  def testHandleRequest(self):
+    """Tests the HandleRequest function."""
+    server = format_server.FormatServer()
+
+    response = server.HandleRequest({
+        'id': 1, 'jsonrpc': '2.0', 'method': 'format',
+        'params': {'text': _UNFORMATTED_SOURCE}})
+    self.assertEqual(response, {
+        'id': 1, 'jsonrpc': '2.0', 'result': {'text': _FORMATTED_SOURCE}})
+
+    response = server.HandleRequest({
+        'id': 2, 'jsonrpc': '2.0', 'method': 'format',
+        'params': {'edits': True, 'text': _UNFORMATTED_SOURCE}})
+    self.assertEqual(response['result'], {'edits': [
+        {'end': 3, 'lines': ['\tint first  = 0;'], 'start': 3},
+        {'end': 5, 'lines': [], 'start': 4}]})
+
+    response = server.HandleRequest({
+        'id': 3, 'jsonrpc': '2.0', 'method': 'format',
+        'params': {'line_ranges': [[1, 2]], 'text': _UNFORMATTED_SOURCE}})
+    self.assertEqual(response['result'], {'text': _UNFORMATTED_SOURCE})
+
+    response = server.HandleRequest({
+        'id': 4, 'jsonrpc': '2.0', 'method': 'format', 'params': {}})
+    self.assertEqual(response['error']['code'], -32602)
+
+    response = server.HandleRequest({
+        'id': 5, 'jsonrpc': '2.0', 'method': 'bogus'})
+    self.assertEqual(response['error']['code'], -32601)
+
+    # A notification has no response.
+    response = server.HandleRequest({
+        'jsonrpc': '2.0', 'method': 'format',
+        'params': {'text': _UNFORMATTED_SOURCE}})
+    self.assertIsNone(response)
+
+  def testHandleRequestWithCRLF(self):
+    """Tests the HandleRequest function with CRLF line endings."""
+    server = format_server.FormatServer()
+
+    response = server.HandleRequest({
+        'id': 1, 'jsonrpc': '2.0', 'method': 'format',
+        'params': {'text': _UNFORMATTED_SOURCE.replace('\n', '\r\n')}})
+    self.assertEqual(response['result'], {'text': _FORMATTED_SOURCE})
+
+  def testHandleRequestWithOnlyDeclarations(self):
+    """Tests the HandleRequest function with a function of declarations."""
+    server = format_server.FormatServer()
+
+    text = 'int f(void)\n{\n\tint yy = 1;\n\tint x = 0;\n}\n'
+    response = server.HandleRequest({
+        'id': 1, 'jsonrpc': '2.0', 'method': 'format',
+        'params': {'text': text}})
+    self.assertEqual(response['result'], {
+        'text': 'int f(void)\n{\n\tint x  = 0;\n\tint yy = 1;\n}\n'})
+
+  def testServe(self):
+    """Tests the Serve function."""
+    requests = [
+        {'id': 1, 'jsonrpc': '2.0', 'method': 'format',
+         'params': {'text': _UNFORMATTED_SOURCE}},
+        {'id': 2, 'jsonrpc': '2.0', 'method': 'shutdown'},
+        {'id': 3, 'jsonrpc': '2.0', 'method': 'format',
+         'params': {'text': _UNFORMATTED_SOURCE}}]
+
+    input_data = '\n'.join([json.dumps(request) for request in requests])
+    input_file = io.StringIO('{{\n{0:s}\n'.format(input_data))
+    output_file = io.StringIO()
+
+    server = format_server.FormatServer()
+    server.Serve(input_file, output_file)
+
+    responses = [
+        json.loads(line) for line in output_file.getvalue().splitlines()]
+
+    # The request after the shutdown request is not handled.
+    self.assertEqual(len(responses), 3)
+    self.assertEqual(responses[0]['error']['code'], -32700)
+    self.assertEqual(responses[1]['result'], {'text': _FORMATTED_SOURCE})
+    self.assertEqual(responses[2], {'id': 2, 'jsonrpc': '2.0', 'result': None})
+
+  def testServeWithStubClient(self):
+    """Tests the source formatter server script with a stub client."""
+    client = StubClient()
+    client.Start()
+
+    try:
+      for identifier in range(1, 4):
+        response = client.Call('format', {'text': _UNFORMATTED_SOURCE})
+        self.assertEqual(response, {
+            'id': identifier, 'jsonrpc': '2.0',
+            'result': {'text': _FORMATTED_SOURCE}})
+
+      response = client.Call('shutdown')
+      self.assertIsNone(response['result'])
+
+    finally:
+      exit_code = client.Stop()
+
+    self.assertEqual(exit_code, 0)
+
+
+class GetEditsTest(test_lib.BaseTestCase):
+  """Tests for the GetEdits function."""
+
+  def testGetEdits(self):
+    """Tests the GetEdits function."""
+    lines = ['a', 'b', 'c', 'd']
+    formatted_lines = ['a', 'B', 'c', 'd', 'e']
+
+    edits = format_server.GetEdits(lines, formatted_lines)
+    self.assertEqual(edits, [
+        {'end': 2, 'lines': ['B'], 'start': 1},
+        {'end': 4, 'lines': ['e'], 'start': 4}])
+
+    for edit in reversed(edits):
+      lines[edit['start']:edit['end']] = edit['lines']
+
+    self.assertEqual(lines, formatted_lines)
+
+    edits = format_server.GetEdits(formatted_lines, formatted_lines)
+    self.assertEqual(edits, [])
+
+
+if __name__ == '__main__':
+  unittest.main()
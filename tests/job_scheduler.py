@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Tests for the job scheduler."""
+
+from __future__ import unicode_literals
+
+import logging
+import time
+import unittest
+
+from yaldevtools import job_scheduler
+
+from tests import test_lib
+
+
+def _TestJob(name, sleep_time):
+  """Job function for testing.
+
+  Args:
+    name (str): name of the job.
+    sleep_time (float): number of seconds to sleep.
+
+  Returns:
+    str: name of the job.
+  """
+  time.sleep(sleep_time)
+  logging.info('Job: {0:s}'.format(name))
+  return name
+
+
+def _FailingTestJob():
+  """Job function for testing that fails.
+
+  Raises:
+    ValueError: always.
+  """
+  raise ValueError('failure')
+
+
+def _UnpicklableResultTestJob():
+  """Job function for testing that returns a result that cannot be pickled.
+
+  Returns:
+    function: function that cannot be pickled.
+  """
+  return lambda: None
+
+
+class JobSchedulerTest(test_lib.BaseTestCase):
+  """Job scheduler tests."""
+
+  def _CreateScheduler(self, number_of_jobs):
+    """Creates a job scheduler with test jobs.
+
+    Args:
+      number_of_jobs (int): maximum number of jobs to run in parallel.
+
+    Returns:
+      JobScheduler: job scheduler.
+    """
+    scheduler = job_scheduler.JobScheduler(number_of_jobs=number_of_jobs)
+    scheduler.AddJob('first', _TestJob, ('first', 0.2))
+    scheduler.AddJob('second', _TestJob, ('second', 0.0))
+    scheduler.AddJob(
+        'third', _TestJob, ('third', 0.0), dependencies=['first', 'missing'])
+    return scheduler
+
+  def testAddJob(self):
+    """Tests the AddJob function."""
+    scheduler = job_scheduler.JobScheduler()
+    scheduler.AddJob('first', _TestJob, ('first', 0.0))
+
+    with self.assertRaises(KeyError):
+      scheduler.AddJob('first', _TestJob, ('first', 0.0))
+
+  def testRun(self):
+    """Tests the Run function."""
+    expected_results = {'first': 'first', 'second': 'second', 'third': 'third'}
+    expected_log_output = [
+        'INFO:root:Job: first', 'INFO:root:Job: second',
+        'INFO:root:Job: third']
+
+    scheduler = self._CreateScheduler(1)
+
+    with self.assertLogs(level=logging.INFO) as log_context:
+      results = scheduler.Run()
+
+    self.assertEqual(results, expected_results)
+    self.assertEqual(log_context.output, expected_log_output)
+
+    scheduler = self._CreateScheduler(3)
+
+    with self.assertLogs(level=logging.INFO) as log_context:
+      results = scheduler.Run()
+
+    self.assertEqual(results, expected_results)
+    self.assertEqual(log_context.output, expected_log_output)
+
+    scheduler = job_scheduler.JobScheduler(number_of_jobs=2)
+    scheduler.AddJob('first', _TestJob, ('first', 0.0), dependencies=['second'])
+    scheduler.AddJob('second', _TestJob, ('second', 0.0))
+
+    with self.assertRaises(ValueError):
+      scheduler.Run()
+
+    scheduler = job_scheduler.JobScheduler(number_of_jobs=2)
+    scheduler.AddJob('first', _FailingTestJob, ())
+    scheduler.AddJob('second', _TestJob, ('second', 0.0))
+
+    with self.assertRaises(RuntimeError):
+      scheduler.Run()
+
+    scheduler = job_scheduler.JobScheduler(number_of_jobs=2)
+    scheduler.AddJob('first', _UnpicklableResultTestJob, ())
+    scheduler.AddJob('second', _TestJob, ('second', 0.0))
+
+    with self.assertRaises(RuntimeError):
+      scheduler.Run()
+
+    scheduler = job_scheduler.JobScheduler(number_of_jobs=2)
+    scheduler.AddJob('first', _TestJob, (lambda: None, 0.0))
+    scheduler.AddJob('second', _TestJob, ('second', 0.0))
+
+    with self.assertRaises(RuntimeError):
+      scheduler.Run()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""Tests for the output writers."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from yaldevtools import output_writers
+
+from tests import test_lib
+
+
+class FileWriterTest(test_lib.BaseTestCase):
+  """File output writer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetChangedFiles(self):
+    """Tests the GetChangedFiles function."""
+    changed_path = os.path.join(self._temporary_directory, 'changed.txt')
+    new_path = os.path.join(self._temporary_directory, 'new.txt')
+    unchanged_path = os.path.join(self._temporary_directory, 'unchanged.txt')
+
+    for path in (changed_path, unchanged_path):
+      with io.open(path, 'w', encoding='utf8') as file_object:
+        file_object.write('data\n')
+
+    output_writer = output_writers.FileWriter(
+        self._temporary_directory, track_changes=True)
+    output_writer.WriteFile(unchanged_path, 'da')
+    output_writer.WriteFile(unchanged_path, 'ta\n', access_mode='a')
+    output_writer.WriteFile(changed_path, 'other data\n')
+    output_writer.WriteFile(new_path, 'data\n')
+    output_writer.WriteFile(new_path, 'more data\n', access_mode='a')
+
+    # Changes are determined without reading back the written files.
+    for path in (changed_path, new_path, unchanged_path):
+      os.remove(path)
+
+    changed_files = output_writer.GetChangedFiles()
+    self.assertEqual(changed_files, [changed_path, new_path])
+
+    output_writer = output_writers.FileWriter(self._temporary_directory)
+    output_writer.WriteFile(changed_path, 'data\n')
+
+    changed_files = output_writer.GetChangedFiles()
+    self.assertIsNone(changed_files)
+
+  def testGetStatistics(self):
+    """Tests the GetStatistics function."""
+    changed_path = os.path.join(self._temporary_directory, 'changed.txt')
+    new_path = os.path.join(self._temporary_directory, 'new.txt')
+    unchanged_path = os.path.join(self._temporary_directory, 'unchanged.txt')
+
+    for path in (changed_path, unchanged_path):
+      with io.open(path, 'w', encoding='utf8') as file_object:
+        file_object.write('data\n')
+
+    output_writer = output_writers.FileWriter(
+        self._temporary_directory, track_changes=True)
+    output_writer.WriteFile(unchanged_path, 'data\n')
+    output_writer.WriteFile(changed_path, 'other data\n')
+    output_writer.WriteFile(new_path, 'data\n')
+
+    statistics = output_writer.GetStatistics()
+    self.assertEqual(statistics, {'changed': 1, 'new': 1, 'unchanged': 1})
+
+    output_writer = output_writers.FileWriter(self._temporary_directory)
+    output_writer.WriteFile(changed_path, 'data\n')
+
+    statistics = output_writer.GetStatistics()
+    self.assertIsNone(statistics)
+
+
+class ChangedFileWriterTest(test_lib.BaseTestCase):
+  """File output writer that only replaces changed files tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testSetExecutable(self):
+    """Tests the SetExecutable function."""
+    path = os.path.join(self._temporary_directory, 'script.sh')
+
+    output_writer = output_writers.ChangedFileWriter(self._temporary_directory)
+    output_writer.WriteFile(path, '#!/bin/sh\n')
+    output_writer.SetExecutable(path)
+
+    stat_info = os.stat(path)
+    self.assertTrue(stat_info.st_mode & stat.S_IEXEC)
+
+  def testWriteFile(self):
+    """Tests the WriteFile function."""
+    changed_path = os.path.join(self._temporary_directory, 'changed.txt')
+    new_path = os.path.join(self._temporary_directory, 'new.txt')
+    unchanged_path = os.path.join(self._temporary_directory, 'unchanged.txt')
+
+    for path in (changed_path, unchanged_path):
+      with io.open(path, 'w', encoding='utf8') as file_object:
+        file_object.write('data\n')
+
+      os.utime(path, (0, 0))
+
+    output_writer = output_writers.ChangedFileWriter(self._temporary_directory)
+    output_writer.WriteFile(unchanged_path, 'da')
+    output_writer.WriteFile(unchanged_path, 'ta\n', access_mode='a')
+    output_writer.WriteFile(changed_path, 'other data\n')
+    output_writer.WriteFile(changed_path, 'more data\n', access_mode='a')
+    output_writer.WriteFile(new_path, 'data\n')
+    output_writer.WriteFile(unchanged_path, 'data\n')
+    output_writer.WriteFile(new_path, 'more data\n', access_mode='a')
+    output_writer.Close()
+
+    self.assertEqual(os.stat(unchanged_path).st_mtime, 0)
+    self.assertNotEqual(os.stat(changed_path).st_mtime, 0)
+
+    with io.open(changed_path, 'r', encoding='utf8') as file_object:
+      self.assertEqual(file_object.read(), 'other data\nmore data\n')
+
+    with io.open(new_path, 'r', encoding='utf8') as file_object:
+      self.assertEqual(file_object.read(), 'data\nmore data\n')
+
+    self.assertEqual(
+        sorted(os.listdir(self._temporary_directory)),
+        ['changed.txt', 'new.txt', 'unchanged.txt'])
+
+    changed_files = output_writer.GetChangedFiles()
+    self.assertEqual(changed_files, [changed_path, new_path])
+
+    statistics = output_writer.GetStatistics()
+    self.assertEqual(statistics, {'changed': 1, 'new': 1, 'unchanged': 1})
+
+
+class RecordWriterTest(test_lib.BaseTestCase):
+  """Record output writer tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetRecords(self):
+    """Tests the GetRecords function."""
+    existing_path = os.path.join(self._temporary_directory, 'existing.txt')
+    new_path = os.path.join(self._temporary_directory, 'new.txt')
+    script_path = os.path.join(self._temporary_directory, 'script.sh')
+
+    with io.open(existing_path, 'w', encoding='utf8') as file_object:
+      file_object.write('data\n')
+
+    output_writer = output_writers.RecordWriter()
+    output_writer.WriteFile(new_path, 'da')
+    output_writer.WriteFile(existing_path, 'more data\n', access_mode='a')
+    output_writer.WriteFile(new_path, 'ta\n', access_mode='a')
+    output_writer.WriteFile(script_path, '#!/bin/sh\n')
+    output_writer.SetExecutable(script_path)
+    output_writer.Close()
+
+    output_records = output_writer.GetRecords()
+    self.assertEqual(
+        [output_record.path for output_record in output_records],
+        [new_path, existing_path, script_path])
+
+    self.assertEqual(output_records[0].data, 'data\n')
+    self.assertFalse(output_records[0].executable)
+    self.assertEqual(output_records[1].data, 'data\nmore data\n')
+    self.assertEqual(output_records[2].data, '#!/bin/sh\n')
+    self.assertTrue(output_records[2].executable)
+
+    # No files are written.
+    self.assertEqual(
+        sorted(os.listdir(self._temporary_directory)), ['existing.txt'])
+
+    with io.open(existing_path, 'r', encoding='utf8') as file_object:
+      self.assertEqual(file_object.read(), 'data\n')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Tests for the parse cache."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from yaldevtools import parse_cache
+
+from tests import test_lib
+
+
+class ParseCacheTest(test_lib.BaseTestCase):
+  """Parse cache tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+    self._cache_directory = os.path.join(self._temporary_directory, 'cache')
+
+    self._path = os.path.join(self._temporary_directory, 'header.h')
+    with io.open(self._path, 'w', encoding='utf8') as file_object:
+      file_object.write('int function( void );\n')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetKey(self):
+    """Tests the GetKey function."""
+    cache = parse_cache.ParseCache()
+
+    missing_path = os.path.join(self._temporary_directory, 'missing.h')
+
+    key = cache.GetKey('parser', ['libyal'], [self._path, missing_path])
+    self.assertEqual(
+        key, cache.GetKey('parser', ['libyal'], [self._path, missing_path]))
+
+    self.assertNotEqual(
+        key, cache.GetKey('other', ['libyal'], [self._path, missing_path]))
+    self.assertNotEqual(
+        key, cache.GetKey('parser', ['libother'], [self._path, missing_path]))
+
+    with io.open(self._path, 'a', encoding='utf8') as file_object:
+      file_object.write('int other_function( void );\n')
+
+    self.assertNotEqual(
+        key, cache.GetKey('parser', ['libyal'], [self._path, missing_path]))
+
+  def testGetValuesAndSetValues(self):
+    """Tests the GetValues and SetValues functions."""
+    cache = parse_cache.ParseCache(directory=self._cache_directory)
+
+    key = cache.GetKey('parser', ['libyal'], [self._path])
+
+    values = cache.GetValues(key)
+    self.assertIsNone(values)
+    self.assertEqual(cache.misses, 1)
+
+    cache.SetValues(key, {'types': ['file']})
+
+    values = cache.GetValues(key)
+    self.assertEqual(values, {'types': ['file']})
+    self.assertEqual(cache.hits, 1)
+
+    # Modifying retrieved values does not affect the cached values.
+    values['types'].append('item')
+
+    values = cache.GetValues(key)
+    self.assertEqual(values, {'types': ['file']})
+
+    # The cached values are shared with another cache using the same
+    # directory.
+    cache = parse_cache.ParseCache(directory=self._cache_directory)
+
+    values = cache.GetValues(key)
+    self.assertEqual(values, {'types': ['file']})
+
+    self.assertEqual(os.listdir(self._cache_directory), [
+        '1-{0:s}-{1:s}.pickle'.format(parse_cache.PARSER_CODE_HASH, key)])
+
+  def testRemoveObsoleteFiles(self):
+    """Tests the _RemoveObsoleteFiles function."""
+    cache = parse_cache.ParseCache(directory=self._cache_directory)
+
+    key = cache.GetKey('parser', ['libyal'], [self._path])
+    cache.SetValues(key, {'types': ['file']})
+
+    unused_key = cache.GetKey('parser', ['libother'], [self._path])
+    cache.SetValues(unused_key, {'types': ['item']})
+
+    # Cache file of another version of the parser code.
+    path = os.path.join(
+        self._cache_directory, '1-{0:s}-{1:s}.pickle'.format('0' * 40, key))
+    with io.open(path, 'wb') as file_object:
+      file_object.write(b'')
+
+    # Cache file without a prefix written by an earlier version.
+    path = os.path.join(self._cache_directory, '{0:s}.pickle'.format(key))
+    with io.open(path, 'wb') as file_object:
+      file_object.write(b'')
+
+    # Files that are not cache files are kept.
+    path = os.path.join(self._cache_directory, 'README')
+    with io.open(path, 'wb') as file_object:
+      file_object.write(b'')
+
+    modification_time = time.time() - (31 * 24 * 60 * 60)
+    os.utime(path, (modification_time, modification_time))
+
+    for cache_key in (key, unused_key):
+      path = os.path.join(
+          self._cache_directory, '1-{0:s}-{1:s}.pickle'.format(
+              parse_cache.PARSER_CODE_HASH, cache_key))
+      os.utime(path, (modification_time, modification_time))
+
+    # Reading a cache file updates its modification time.
+    cache.Empty()
+    self.assertEqual(cache.GetValues(key), {'types': ['file']})
+
+    cache.SetDirectory(self._cache_directory)
+
+    self.assertEqual(sorted(os.listdir(self._cache_directory)), [
+        '1-{0:s}-{1:s}.pickle'.format(parse_cache.PARSER_CODE_HASH, key),
+        'README'])
+
+if __name__ == '__main__':
+  unittest.main()
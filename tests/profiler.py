@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Tests for the generation profiler."""
+
+from __future__ import unicode_literals
+
+import argparse
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import profiler
+
+from tests import test_lib
+
+
+class TestGenerator(object):
+  """Generator for testing."""
+
+  def _GenerateSection(self, template_filename, output_filename):
+    """Generates a section from template filename.
+
+    Args:
+      template_filename (str): path of the template file.
+      output_filename (str): path of the output file.
+    """
+    with io.open(template_filename, 'r', encoding='utf8') as file_object:
+      output_data = file_object.read()
+
+    with io.open(output_filename, 'a', encoding='utf8') as file_object:
+      file_object.write(output_data)
+
+  def _GenerateSourceFile(self, template_filename, output_filename):
+    """Generates a source file.
+
+    Args:
+      template_filename (str): path of the template file.
+      output_filename (str): path of the output file.
+    """
+    self._GenerateSection(template_filename, output_filename)
+    self._GenerateSection(template_filename, output_filename)
+
+  def Generate(self, template_filename, output_filename):
+    """Generates the output.
+
+    Args:
+      template_filename (str): path of the template file.
+      output_filename (str): path of the output file.
+    """
+    self._GenerateSourceFile(template_filename, output_filename)
+
+
+class CreateProfilerTest(test_lib.BaseTestCase):
+  """Tests for the CreateProfiler function."""
+
+  def testCreateProfiler(self):
+    """Tests the CreateProfiler function."""
+    argument_parser = argparse.ArgumentParser()
+    profiler.AddArguments(argument_parser)
+
+    options = argument_parser.parse_args([])
+    self.assertIsNone(profiler.CreateProfiler(options))
+
+    options = argument_parser.parse_args(['--profile', 'report.json'])
+    generation_profiler = profiler.CreateProfiler(options)
+    self.assertIsNotNone(generation_profiler)
+
+
+class GenerationProfilerTest(test_lib.BaseTestCase):
+  """Generation profiler tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    self._template_filename = os.path.join(
+        self._temporary_directory, 'template.c')
+    with io.open(self._template_filename, 'w', encoding='utf8') as file_object:
+      file_object.write('int é;\n')
+
+    self._output_filename = os.path.join(self._temporary_directory, 'output.c')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetReport(self):
+    """Tests the GetReport function."""
+    generation_profiler = profiler.GenerationProfiler()
+    generation_profiler.InstrumentClass(TestGenerator)
+    generation_profiler.Start()
+
+    test_generator = TestGenerator()
+    test_generator.Generate(self._template_filename, self._output_filename)
+
+    generation_profiler.Stop()
+
+    report = generation_profiler.GetReport()
+
+    self.assertEqual(list(report['generators'].keys()), ['TestGenerator'])
+    self.assertEqual(report['generators']['TestGenerator']['calls'], 1)
+
+    self.assertEqual(sorted(report['methods'].keys()), [
+        'TestGenerator._GenerateSection', 'TestGenerator._GenerateSourceFile'])
+
+    method_timing = report['methods']['TestGenerator._GenerateSection']
+    self.assertEqual(method_timing['calls'], 2)
+
+    method_timing = report['methods']['TestGenerator._GenerateSourceFile']
+    self.assertEqual(method_timing['calls'], 1)
+    self.assertLessEqual(
+        method_timing['self_time'], method_timing['total_time'])
+
+    template_timing = report['templates'][self._template_filename]
+    self.assertEqual(template_timing['calls'], 2)
+
+    # "int é;\n" is 8 bytes in UTF-8.
+    self.assertEqual(report['files'], {
+        'bytes_read': 16, 'bytes_written': 16, 'opens': 4})
+
+    self.assertIn('hit_rate', report['caches']['template_cache'])
+    self.assertIsNotNone(report['wall_time'])
+
+  def testStop(self):
+    """Tests the Stop function."""
+    generate_method = TestGenerator.__dict__['Generate']
+    open_function = io.open
+
+    report_path = os.path.join(self._temporary_directory, 'report.json')
+    generation_profiler = profiler.GenerationProfiler(report_path=report_path)
+    generation_profiler.InstrumentClass(TestGenerator)
+    generation_profiler.Start()
+
+    self.assertIsNot(TestGenerator.__dict__['Generate'], generate_method)
+    self.assertIsNot(io.open, open_function)
+
+    generation_profiler.Stop()
+
+    self.assertIs(TestGenerator.__dict__['Generate'], generate_method)
+    self.assertIs(io.open, open_function)
+
+    with io.open(report_path, 'r', encoding='utf8') as file_object:
+      report = json.load(file_object)
+
+    self.assertEqual(report['files']['opens'], 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source code objects."""
+
+from __future__ import unicode_literals
+
+import pickle
+import unittest
+
+from yaldevtools import definitions
+from yaldevtools import source_code
+
+from tests import test_lib
+
+
+class FunctionPrototypeTest(test_lib.BaseTestCase):
+  """Function prototype tests."""
+
+  def testPickle(self):
+    """Tests pickling a function prototype."""
+    function_prototype = source_code.FunctionPrototype(
+        'libyal_file_free', 'int')
+    function_prototype.AddArgument(source_code.FunctionArgument(
+        'libyal_file_t **file'))
+
+    # The objects have no __dict__ since they define __slots__.
+    self.assertFalse(hasattr(function_prototype, '__dict__'))
+    self.assertFalse(hasattr(function_prototype.arguments[0], '__dict__'))
+
+    function_prototype = pickle.loads(pickle.dumps(function_prototype))
+    self.assertEqual(function_prototype.name, 'libyal_file_free')
+    self.assertEqual(function_prototype.return_type, 'int')
+    self.assertEqual(
+        function_prototype.arguments[0].CopyToString(),
+        'libyal_file_t **file')
+
+
+class PythonTypeObjectFunctionPrototypeTest(test_lib.BaseTestCase):
+  """Python type object function prototype tests."""
+
+  def testGetDescription(self):
+    """Tests the GetDescription function."""
+    python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+        'pyyal', 'file', 'get_utf8_name')
+    python_function_prototype.function_type = definitions.FUNCTION_TYPE_GET
+
+    self.assertEqual(python_function_prototype.name, 'pyyal_file_get_name')
+    self.assertEqual(python_function_prototype.value_name, 'name')
+    self.assertEqual(
+        python_function_prototype.GetDescription(), ['Retrieves the name.'])
+
+    python_function_prototype.value_description = 'UTF-8 name'
+
+    self.assertEqual(
+        python_function_prototype.GetDescription(),
+        ['Retrieves the UTF-8 name.'])
+
+  def testGetDataTypeDescription(self):
+    """Tests the GetDataTypeDescription function."""
+    python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+        'pyyal', 'file', 'get_size')
+    python_function_prototype.data_type = definitions.DATA_TYPE_SIZE64
+
+    self.assertEqual(
+        python_function_prototype.GetDataTypeDescription(), 'Integer')
+
+    python_function_prototype.return_values = set(['None'])
+
+    self.assertEqual(
+        python_function_prototype.GetDataTypeDescription(), 'Integer or None')
+
+  def testGetValueNameAndPrefix(self):
+    """Tests the GetValueNameAndPrefix function."""
+    python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+        'pyyal', 'item', 'get_sub_item_by_index')
+
+    self.assertEqual(
+        python_function_prototype.GetValueNameAndPrefix(), (None, None))
+
+    python_function_prototype.function_type = (
+        definitions.FUNCTION_TYPE_GET_BY_INDEX)
+
+    self.assertEqual(
+        python_function_prototype.GetValueNameAndPrefix(), ('item', 'sub'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source file classes."""
+
+from __future__ import unicode_literals
+
+import io
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import source_file
+
+from tests import test_lib
+
+
+class LibraryHeaderFileTest(test_lib.BaseTestCase):
+  """Library header file tests."""
+
+  _HEADER_FILE_DATA = """\
+LIBYAL_EXTERN \\
+int libyal_file_get_size(
+     libyal_file_t *file,
+     size64_t *size,
+     libcerror_error_t **error );
+
+LIBYAL_EXTERN \\
+int libyal_file_get_utf8_name(
+     libyal_file_t *file,
+     uint8_t *utf8_string,
+     size_t utf8_string_size,
+     libcerror_error_t **error );
+"""
+
+  # The functions are defined in a different order than in the header.
+  _SOURCE_FILE_DATA = """\
+/* Retrieves the UTF-8 encoded name
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libyal_file_get_utf8_name(
+     libyal_file_t *file,
+     uint8_t *utf8_string,
+     size_t utf8_string_size,
+     libcerror_error_t **error )
+{
+	return( libyal_internal_file_get_name(
+	         file,
+	         error ) );
+}
+
+/* Retrieves the size
+ * Returns 1 if successful or -1 on error
+ */
+int libyal_file_get_size(
+     libyal_file_t *file,
+     size64_t *size,
+     libcerror_error_t **error )
+{
+	return( 1 );
+}
+"""
+
+  def testReadFileObject(self):
+    """Tests the _ReadFileObject function."""
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.library_name = 'libyal'
+
+    header_file = source_file.LibraryHeaderFile('libyal_file.h')
+
+    header_file_object = io.StringIO(self._HEADER_FILE_DATA)
+    source_file_object = io.StringIO(self._SOURCE_FILE_DATA)
+
+    # pylint: disable=protected-access
+    header_file._ReadFileObject(
+        project_configuration, header_file_object, source_file_object)
+
+    self.assertEqual(
+        list(header_file.functions_per_name.keys()),
+        ['libyal_file_get_size', 'libyal_file_get_utf8_name'])
+
+    function_prototype = header_file.GetTypeFunction('file', 'get_size')
+    self.assertIsNotNone(function_prototype)
+    self.assertEqual(function_prototype.return_values, set(['-1', '1']))
+    self.assertEqual(function_prototype.value_description, 'size')
+
+    function_prototype = header_file.GetTypeFunction('file', 'get_utf8_name')
+    self.assertIsNotNone(function_prototype)
+    self.assertEqual(function_prototype.return_values, set(['-1', '0', '1']))
+    self.assertEqual(function_prototype.value_description, 'encoded name')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -60,6 +60,83 @@ int myfunction(
 
     self.assertEqual(lines, expected_lines)
 
+  def testFormatSourceWithOnlyDeclarations(self):
+    """Tests the FormatSource function with a function of declarations."""
+    test_formatter = source_formatter.SourceFormatter()
+
+    lines = test_formatter.FormatSource([
+        'int f(void)', '{', '\tint yy = 1;', '\tint x = 0;', '}'])
+
+    self.assertEqual(lines, [
+        'int f(void)', '{', '\tint x  = 0;', '\tint yy = 1;', '}'])
+
+  def testFormatSourceWithLineRanges(self):
+    """Tests the FormatSource function with line ranges."""
+    test_formatter = source_formatter.SourceFormatter()
+
+    lines = [
+        'int first(',
+        '     void )',
+        '{',
+        '\tint bb = 0;',
+        '\tint a = 0;',
+        '',
+        '\treturn( 0 );',
+        '}',
+        'int second(',
+        '     void )',
+        '{',
+        '\tint bb = 0;',
+        '\tint a = 0;',
+        '',
+        '\treturn( 0 );',
+        '}',
+        '']
+
+    expected_lines = list(lines)
+    expected_lines[11:13] = ['\tint a  = 0;', '\tint bb = 0;']
+
+    formatted_lines = test_formatter.FormatSource(lines, line_ranges=[(15, 15)])
+    self.assertEqual(formatted_lines, expected_lines)
+
+    formatted_lines = test_formatter.FormatSource(lines, line_ranges=[])
+    self.assertEqual(formatted_lines, lines)
+
+    formatted_lines = test_formatter.FormatSource(
+        lines, line_ranges=[(1, len(lines))])
+    self.assertEqual(formatted_lines, test_formatter.FormatSource(lines))
+
+  def testSortVariableDeclarations(self):
+    """Tests the SortVariableDeclarations function."""
+    test_formatter = source_formatter.SourceFormatter()
+
+    lines = [
+        '\tuint8_t *data = NULL;',
+        '\tlibcerror_error_t *error = NULL;',
+        '\tsize_t data_size = 0;',
+        '\tint result = 0;',
+        '\tint8_t value = 0;',
+        '',
+        '#if defined( HAVE_DEBUG_OUTPUT )',
+        '\tuint32_t value_32bit = 0;',
+        '\tchar *value_string = NULL;',
+        '#endif']
+
+    expected_lines = [
+        '\tlibcerror_error_t *error = NULL;',
+        '\tuint8_t *data            = NULL;',
+        '\tsize_t data_size         = 0;',
+        '\tint8_t value             = 0;',
+        '\tint result               = 0;',
+        '',
+        '#if defined( HAVE_DEBUG_OUTPUT )',
+        '\tchar *value_string       = NULL;',
+        '\tuint32_t value_32bit     = 0;',
+        '#endif']
+
+    lines = test_formatter.SortVariableDeclarations(lines)
+    self.assertEqual(lines, expected_lines)
+
   def testVerticalAlignEqualSigns(self):
     """Tests the VerticalAlignEqualSigns function."""
     test_formatter = source_formatter.SourceFormatter()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Tests for the functions to format source files."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import source_formatting
+
+from tests import test_lib
+
+
+_UNFORMATTED_SOURCE = """\
+int myfunction(
+     int *argument )
+{
+	int second = 0;
+	int first = 0;
+
+	return( first );
+}
+"""
+
+_FORMATTED_SOURCE = """\
+int myfunction(
+     int *argument )
+{
+	int first  = 0;
+	int second = 0;
+
+	return( first );
+}
+"""
+
+
+class SourceFormattingTest(test_lib.BaseTestCase):
+  """Tests for the functions to format source files."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _WriteFile(self, path, data):
+    """Writes a file in the temporary directory.
+
+    Args:
+      path (list[str]): path segments of the file relative to the temporary
+          directory.
+      data (str): data of the file.
+
+    Returns:
+      str: path of the file.
+    """
+    path = os.path.join(self._temporary_directory, *path)
+
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+      os.makedirs(directory)
+
+    with io.open(path, 'w', encoding='utf8') as file_object:
+      file_object.write(data)
+
+    return path
+
+  def testFindSourceFiles(self):
+    """Tests the FindSourceFiles function."""
+    source_path = self._WriteFile(['lib', 'source.c'], '')
+    header_path = self._WriteFile(['lib', 'header.h'], '')
+    self._WriteFile(['lib', 'Makefile.am'], '')
+    self._WriteFile(['lib', '.git', 'hidden.c'], '')
+    test_path = self._WriteFile(['tests', 'test.c'], '')
+    script_path = self._WriteFile(['tests', 'test.sh'], '')
+
+    source_files = source_formatting.FindSourceFiles([
+        os.path.join(self._temporary_directory, 'lib'),
+        os.path.join(self._temporary_directory, 'tests', 'test.*'),
+        source_path])
+
+    self.assertEqual(source_files, sorted([
+        header_path, script_path, source_path, test_path]))
+
+  def testFormatSourceFiles(self):
+    """Tests the FormatSourceFiles function."""
+    formatted_path = self._WriteFile(['formatted.c'], _FORMATTED_SOURCE)
+    unformatted_path = self._WriteFile(['unformatted.c'], _UNFORMATTED_SOURCE)
+    missing_path = os.path.join(self._temporary_directory, 'missing.c')
+
+    os.utime(formatted_path, (0, 0))
+
+    changed_files, failed_files = source_formatting.FormatSourceFiles(
+        [formatted_path, missing_path, unformatted_path], check=True)
+    self.assertEqual(changed_files, [unformatted_path])
+    self.assertEqual(failed_files, [missing_path])
+
+    with io.open(unformatted_path, 'r', encoding='utf8') as file_object:
+      self.assertEqual(file_object.read(), _UNFORMATTED_SOURCE)
+
+    changed_files, failed_files = source_formatting.FormatSourceFiles([
+        formatted_path, missing_path, unformatted_path])
+    self.assertEqual(changed_files, [unformatted_path])
+    self.assertEqual(failed_files, [missing_path])
+
+    self.assertEqual(os.stat(formatted_path).st_mtime, 0)
+
+    with io.open(unformatted_path, 'r', encoding='utf8') as file_object:
+      self.assertEqual(file_object.read(), _FORMATTED_SOURCE)
+
+  def testGetChangedLineRanges(self):
+    """Tests the GetChangedLineRanges function."""
+    diff_lines = [
+        'diff --git a/lib/source.c b/lib/source.c',
+        'index 0123456..789abcd 100644',
+        '--- a/lib/source.c',
+        '+++ b/lib/source.c',
+        '@@ -14 +14 @@ int function( void )',
+        '-\treturn( 0 );',
+        '+\treturn( 1 );',
+        '@@ -20,2 +20,0 @@',
+        '-\tint a;',
+        '-\tint b;',
+        '@@ -30,0 +29,3 @@',
+        '+\tint a;',
+        '+\tint b;',
+        '+\tint c;',
+        'diff --git a/removed.c b/removed.c',
+        'deleted file mode 100644',
+        '--- a/removed.c',
+        '+++ /dev/null',
+        '@@ -1 +0,0 @@',
+        '-int a;']
+
+    line_ranges_per_path = source_formatting.GetChangedLineRanges(diff_lines)
+    self.assertEqual(line_ranges_per_path, {
+        os.path.join('lib', 'source.c'): [(14, 14), (20, 21), (29, 31)]})
+
+
+if __name__ == '__main__':
+  unittest.main()
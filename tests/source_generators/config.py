@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source file generator for configuration files."""
+
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import dependency_manifest
+from yaldevtools import source_generation
+
+from tests import synthetic_project
+from tests import test_lib
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+class ConfigurationFileGeneratorTest(test_lib.BaseTestCase):
+  """Configuration files generator tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._projects_directory = tempfile.mkdtemp()
+    self._working_directory = os.getcwd()
+
+    project_writer = synthetic_project.SyntheticProjectWriter(
+        number_of_types=0)
+    self._project_directory = project_writer.Write(self._projects_directory)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    os.chdir(self._working_directory)
+    shutil.rmtree(self._projects_directory, True)
+
+  def testGenerateDependencies(self):
+    """Tests the dependencies recorded by the Generate function."""
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.ReadFromFile(os.path.join(
+        self._project_directory, 'libxyz.ini'))
+
+    _, source_generator_class, template_directory, _ = (
+        source_generation.GetSourceGenerators(
+            _LIBYAL_DIRECTORY, generators=['config'])[0])
+
+    manifest_path = os.path.join(self._project_directory, '.manifest')
+    templates_directory = os.path.join(_LIBYAL_DIRECTORY, 'data', 'source')
+
+    os.chdir(self._project_directory)
+
+    # Unsupported functions are expected and should not be reported.
+    logging.disable(logging.ERROR)
+    try:
+      result = source_generation.GenerateSourceCategory(
+          source_generator_class, self._projects_directory,
+          template_directory, project_configuration, self._project_directory,
+          False)
+    finally:
+      logging.disable(logging.NOTSET)
+
+    manifest = dependency_manifest.DependencyManifest(
+        manifest_path, self._project_directory, templates_directory)
+    manifest.SetCategory(
+        'config', template_directory, 'code', 'configuration',
+        result['input_files'], result['output_templates'],
+        input_directories=result['input_directories'])
+    manifest.WriteToFile()
+
+    self.assertTrue(manifest.IsUpToDate(
+        'config', template_directory, 'code', 'configuration'))
+
+    # The test source files are listed to generate .gitignore.
+    with io.open(os.path.join('tests', 'xyz_test_newthing.c'), 'wb'):
+      pass
+
+    manifest = dependency_manifest.DependencyManifest(
+        manifest_path, self._project_directory, templates_directory)
+    manifest.ReadFromFile()
+
+    self.assertFalse(manifest.IsUpToDate(
+        'config', template_directory, 'code', 'configuration'))
+
+
+if __name__ == '__main__':
+  unittest.main()
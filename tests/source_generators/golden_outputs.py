@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+"""Golden output tests of the source generators.
+
+Every source generator is run, in order of generation, on synthetic libyal
+projects and the output is compared byte-for-byte, including the executable
+bit, with the golden output in test_data/golden. The current date and year,
+which the source generators write, are normalized before the comparison.
+
+To update the golden output after an intended change of the output run:
+
+  python -m tests.source_generators.golden_outputs --update
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import datetime
+import difflib
+import io
+import logging
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+import time
+
+from yaldevtools import configuration
+from yaldevtools import output_writers
+from yaldevtools import parse_cache
+from yaldevtools import source_generation
+from yaldevtools import symbol_database
+from yaldevtools import template_cache
+
+from tests import synthetic_project
+from tests import test_lib
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+_GOLDEN_DIRECTORY = os.path.join(_LIBYAL_DIRECTORY, 'test_data', 'golden')
+
+# The fixture projects, as the name of the golden output directory and the
+# number of value types of the synthetic project.
+_FIXTURES = [
+    ('libxyz_0', 0),
+    ('libxyz_2', 2)]
+
+# Maximum number of lines of the diff reported per differing file.
+_MAXIMUM_NUMBER_OF_DIFF_LINES = 40
+
+
+def _GetDateNormalizations():
+  """Retrieves the normalizations of the current date and year.
+
+  Returns:
+    list[tuple[re.RegexObject, bytes]]: expression of a date value and its
+        replacement, in order of application.
+  """
+  current_time = time.gmtime()
+  current_date = time.strftime('%B %d, %Y', current_time).replace(' 0', '  ')
+  current_day = time.strftime('%Y%m%d', current_time)
+  current_year = '{0:d}'.format(datetime.date.today().year)
+
+  return [
+      (re.compile(re.escape(current_date.encode('utf8'))), b'@current_date@'),
+      (re.compile(re.escape(current_day.encode('utf8'))), b'@current_day@'),
+      (re.compile(br'\b' + current_year.encode('utf8') + br'\b'),
+       b'@current_year@')]
+
+
+def _ReadFiles(directory):
+  """Reads the files in a directory tree.
+
+  Args:
+    directory (str): path of the directory.
+
+  Returns:
+    dict[str, tuple[bytes, bool]]: data of the file and True if the file is
+        executable per path relative to the directory, with "/" as path
+        segment separator.
+  """
+  files = {}
+  for path, _, filenames in os.walk(directory):
+    for filename in filenames:
+      file_path = os.path.join(path, filename)
+      with io.open(file_path, 'rb') as file_object:
+        file_data = file_object.read()
+
+      is_executable = bool(os.stat(file_path).st_mode & stat.S_IEXEC)
+
+      relative_path = os.path.relpath(file_path, directory)
+      files[relative_path.replace(os.sep, '/')] = (file_data, is_executable)
+
+  return files
+
+
+def CompareOutputs(outputs, golden_outputs, output_categories=None):
+  """Compares output with golden output.
+
+  Args:
+    outputs (dict[str, tuple[bytes, bool]]): data of the file and True if
+        the file is executable per relative path of an output file.
+    golden_outputs (dict[str, tuple[bytes, bool]]): data of the file and True
+        if the file is executable per relative path of a golden output file.
+    output_categories (Optional[dict[str, str]]): name of the source generator
+        category that wrote the output file per relative path.
+
+  Returns:
+    list[str]: descriptions of the differences, sorted by path, where the
+        description of differing data contains a unified diff.
+  """
+  output_categories = output_categories or {}
+
+  differences = []
+  for path in sorted(set(outputs.keys()).union(golden_outputs.keys())):
+    category = output_categories.get(path, None)
+    if category:
+      description = '{0:s} ({1:s})'.format(path, category)
+    else:
+      description = path
+
+    if path not in golden_outputs:
+      differences.append('Unexpected output file: {0:s}'.format(description))
+      continue
+
+    if path not in outputs:
+      differences.append('Missing output file: {0:s}'.format(description))
+      continue
+
+    file_data, is_executable = outputs[path]
+    golden_file_data, golden_is_executable = golden_outputs[path]
+
+    if is_executable != golden_is_executable:
+      differences.append('Executable bit differs: {0:s}'.format(description))
+
+    if file_data != golden_file_data:
+      diff_lines = list(difflib.unified_diff(
+          golden_file_data.decode('utf8', 'replace').splitlines(),
+          file_data.decode('utf8', 'replace').splitlines(),
+          fromfile='golden/{0:s}'.format(path),
+          tofile='output/{0:s}'.format(path), lineterm=''))
+
+      if not diff_lines:
+        # The data differs in end of line characters only.
+        diff_lines = ['(end of line characters differ)']
+
+      elif len(diff_lines) > _MAXIMUM_NUMBER_OF_DIFF_LINES:
+        number_of_lines = len(diff_lines) - _MAXIMUM_NUMBER_OF_DIFF_LINES
+        diff_lines = diff_lines[:_MAXIMUM_NUMBER_OF_DIFF_LINES]
+        diff_lines.append('(and {0:d} more lines)'.format(number_of_lines))
+
+      differences.append('Output file differs: {0:s}\n{1:s}'.format(
+          description, '\n'.join(diff_lines)))
+
+  return differences
+
+
+def GenerateOutputs(projects_directory, number_of_types):
+  """Runs the source generators on a synthetic project.
+
+  Args:
+    projects_directory (str): path of the projects directory, in which the
+        synthetic project is written.
+    number_of_types (int): number of value types of the synthetic project.
+
+  Returns:
+    tuple[dict[str, tuple[bytes, bool]], dict[str, str], dict[str, float]]:
+        normalized data of the file and True if the file is executable per
+        relative path of an output file, name of the source generator
+        category that last wrote an output file per relative path and
+        duration in seconds per source generator category.
+  """
+  project_writer = synthetic_project.SyntheticProjectWriter(
+      number_of_types=number_of_types)
+  project_directory = project_writer.Write(projects_directory)
+
+  input_files = _ReadFiles(project_directory)
+
+  project_configuration = configuration.ProjectConfiguration()
+  project_configuration.ReadFromFile(os.path.join(
+      project_directory, 'libxyz.ini'))
+
+  # Start with empty caches so that the output does not depend on earlier
+  # generation.
+  parse_cache.PARSE_CACHE.Empty()
+  template_cache.TEMPLATE_CACHE.Empty()
+
+  durations = {}
+  output_categories = {}
+
+  working_directory = os.getcwd()
+  os.chdir(project_directory)
+
+  try:
+    for source_category, source_generator_class, template_directory, _ in (
+        source_generation.GetSourceGenerators(_LIBYAL_DIRECTORY)):
+      start_time = time.time()
+
+      output_writer = output_writers.FileWriter(project_directory)
+      source_generator_object = source_generator_class(
+          projects_directory, template_directory)
+      source_generator_object.Generate(project_configuration, output_writer)
+      output_writer.Close()
+
+      durations[source_category] = time.time() - start_time
+
+      for path in output_writer.GetWrittenFiles():
+        relative_path = os.path.relpath(path, project_directory)
+        output_categories[relative_path.replace(os.sep, '/')] = (
+            source_category)
+
+  finally:
+    os.chdir(working_directory)
+
+  date_normalizations = _GetDateNormalizations()
+
+  # Input files that were not written or changed are not part of the output.
+  outputs = {}
+  for path, (file_data, is_executable) in _ReadFiles(
+      project_directory).items():
+    if path not in output_categories and input_files.get(path, None) == (
+        file_data, is_executable):
+      continue
+
+    for expression, replacement in date_normalizations:
+      file_data = expression.sub(replacement, file_data)
+
+    outputs[path] = (file_data, is_executable)
+
+  return outputs, output_categories, durations
+
+
+def ReadGoldenOutputs(golden_directory):
+  """Reads golden output.
+
+  Args:
+    golden_directory (str): path of the golden output directory.
+
+  Returns:
+    dict[str, tuple[bytes, bool]]: data of the file and True if the file is
+        executable per relative path of a golden output file.
+  """
+  return _ReadFiles(golden_directory)
+
+
+def WriteGoldenOutputs(golden_directory, outputs):
+  """Writes golden output.
+
+  Existing golden output is replaced.
+
+  Args:
+    golden_directory (str): path of the golden output directory.
+    outputs (dict[str, tuple[bytes, bool]]): data of the file and True if
+        the file is executable per relative path of an output file.
+  """
+  if os.path.exists(golden_directory):
+    shutil.rmtree(golden_directory)
+
+  for path, (file_data, is_executable) in outputs.items():
+    file_path = os.path.join(golden_directory, *path.split('/'))
+
+    directory = os.path.dirname(file_path)
+    if not os.path.exists(directory):
+      os.makedirs(directory)
+
+    with io.open(file_path, 'wb') as file_object:
+      file_object.write(file_data)
+
+    if is_executable:
+      stat_info = os.stat(file_path)
+      os.chmod(file_path, stat_info.st_mode | stat.S_IEXEC)
+
+
+class GoldenOutputsTest(test_lib.BaseTestCase):
+  """Golden output tests of the source generators."""
+
+  def _CheckGeneratedRecords(self, fixture_name, number_of_types):
+    """Checks the output records of the source generators with golden output.
+
+    Args:
+      fixture_name (str): name of the fixture project.
+      number_of_types (int): number of value types of the synthetic project.
+    """
+    # Unsupported functions are expected and should not be reported.
+    logging.disable(logging.ERROR)
+
+    projects_directory = tempfile.mkdtemp()
+    try:
+      project_writer = synthetic_project.SyntheticProjectWriter(
+          number_of_types=number_of_types)
+      project_directory = project_writer.Write(projects_directory)
+
+      input_files = _ReadFiles(project_directory)
+
+      parse_cache.PARSE_CACHE.Empty()
+      template_cache.TEMPLATE_CACHE.Empty()
+
+      output_records = list(source_generation.GenerateProjectRecords(
+          project_directory, os.path.join(project_directory, 'libxyz.ini'),
+          projects_directory, _LIBYAL_DIRECTORY, None, False))
+
+      # No files are written.
+      self.assertEqual(_ReadFiles(project_directory), input_files)
+
+    finally:
+      logging.disable(logging.NOTSET)
+      shutil.rmtree(projects_directory, True)
+
+    date_normalizations = _GetDateNormalizations()
+
+    outputs = {}
+    for output_record in output_records:
+      file_data = output_record.data.encode('utf8')
+      for expression, replacement in date_normalizations:
+        file_data = expression.sub(replacement, file_data)
+
+      path = output_record.path.replace(os.sep, '/')
+      outputs[path] = (file_data, output_record.executable)
+
+    golden_outputs = ReadGoldenOutputs(
+        self._GetTestFilePath(['golden', fixture_name]))
+
+    differences = CompareOutputs(outputs, golden_outputs)
+    self.assertEqual(differences, [])
+
+  def _CheckGoldenOutputs(self, fixture_name, number_of_types):
+    """Checks the output of the source generators with golden output.
+
+    Args:
+      fixture_name (str): name of the fixture project.
+      number_of_types (int): number of value types of the synthetic project.
+    """
+    # Unsupported functions are expected and should not be reported.
+    logging.disable(logging.ERROR)
+
+    projects_directory = tempfile.mkdtemp()
+    try:
+      outputs, output_categories, _ = GenerateOutputs(
+          projects_directory, number_of_types)
+
+    finally:
+      logging.disable(logging.NOTSET)
+      shutil.rmtree(projects_directory, True)
+
+    golden_outputs = ReadGoldenOutputs(
+        self._GetTestFilePath(['golden', fixture_name]))
+
+    differences = CompareOutputs(outputs, golden_outputs, output_categories)
+    self.assertEqual(differences, [])
+
+  def testCompareOutputs(self):
+    """Tests the CompareOutputs function."""
+    golden_outputs = {
+        'changed.c': (b'int a;\nint b;\n', False),
+        'missing.c': (b'', False),
+        'runtests.sh': (b'#!/bin/sh\n', True),
+        'unchanged.c': (b'int c;\n', False)}
+
+    outputs = {
+        'changed.c': (b'int a;\nint d;\n', False),
+        'runtests.sh': (b'#!/bin/sh\n', False),
+        'unchanged.c': (b'int c;\n', False),
+        'unexpected.c': (b'', False)}
+
+    differences = CompareOutputs(
+        outputs, golden_outputs, output_categories={'changed.c': 'libyal'})
+
+    expected_differences = [
+        '\n'.join([
+            'Output file differs: changed.c (libyal)',
+            '--- golden/changed.c',
+            '+++ output/changed.c',
+            '@@ -1,2 +1,2 @@',
+            ' int a;',
+            '-int b;',
+            '+int d;']),
+        'Missing output file: missing.c',
+        'Executable bit differs: runtests.sh',
+        'Unexpected output file: unexpected.c']
+    self.assertEqual(differences, expected_differences)
+
+  @test_lib.skipUnlessHasTestFile(['golden', 'libxyz_0'])
+  def testGenerateProjectRecordsLibxyz0(self):
+    """Tests the output records of a project without value types."""
+    self._CheckGeneratedRecords('libxyz_0', 0)
+
+  @test_lib.skipUnlessHasTestFile(['golden', 'libxyz_2'])
+  def testGenerateProjectRecordsLibxyz2(self):
+    """Tests the output records of a project with value types."""
+    self._CheckGeneratedRecords('libxyz_2', 2)
+
+  @test_lib.skipUnlessHasTestFile(['golden', 'libxyz_0'])
+  def testGoldenOutputsLibxyz0(self):
+    """Tests the output of a project without value types."""
+    self._CheckGoldenOutputs('libxyz_0', 0)
+
+  @test_lib.skipUnlessHasTestFile(['golden', 'libxyz_2'])
+  def testGoldenOutputsLibxyz2(self):
+    """Tests the output of a project with value types."""
+    self._CheckGoldenOutputs('libxyz_2', 2)
+
+  @test_lib.skipUnlessHasTestFile(['golden', 'libxyz_2'])
+  def testGoldenOutputsLibxyz2WithSymbolDatabase(self):
+    """Tests the output of a project with value types and symbol database."""
+    temporary_directory = tempfile.mkdtemp()
+    symbol_database.SYMBOL_DATABASE.SetPath(
+        os.path.join(temporary_directory, 'symbols.db'))
+
+    try:
+      self._CheckGoldenOutputs('libxyz_2', 2)
+
+    finally:
+      symbol_database.SYMBOL_DATABASE.SetPath(None)
+      shutil.rmtree(temporary_directory, True)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Compares the output of the source generators on synthetic libyal '
+      'projects with golden output.'))
+
+  argument_parser.add_argument(
+      '--update', dest='update', action='store_true', default=False, help=(
+          'replace the golden output with the output of the source '
+          'generators.'))
+
+  options = argument_parser.parse_args()
+
+  # Unsupported functions are expected and should not be reported.
+  logging.disable(logging.ERROR)
+
+  result = True
+  for fixture_name, number_of_types in _FIXTURES:
+    golden_directory = os.path.join(_GOLDEN_DIRECTORY, fixture_name)
+
+    projects_directory = tempfile.mkdtemp()
+    try:
+      outputs, output_categories, durations = GenerateOutputs(
+          projects_directory, number_of_types)
+
+    finally:
+      shutil.rmtree(projects_directory, True)
+
+    for source_category, duration in sorted(durations.items()):
+      print('{0:s}: {1:s}: {2:.3f} seconds'.format(
+          fixture_name, source_category, duration))
+
+    if options.update:
+      WriteGoldenOutputs(golden_directory, outputs)
+      print('{0:s}: updated {1:d} golden output files.'.format(
+          fixture_name, len(outputs)))
+      continue
+
+    differences = CompareOutputs(
+        outputs, ReadGoldenOutputs(golden_directory), output_categories)
+
+    for difference in differences:
+      print(difference)
+
+    print('{0:s}: {1:d} output files, {2:d} differences.'.format(
+        fixture_name, len(outputs), len(differences)))
+
+    if differences:
+      result = False
+
+  return result
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
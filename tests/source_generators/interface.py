@@ -6,16 +6,45 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+from yaldevtools import output_writers
 from yaldevtools.source_generators import interface
 
 from tests import test_lib
 
 
+class TestOutputWriter(output_writers.OutputWriter):
+  """Output writer for testing.
+
+  Attributes:
+    writes (list[tuple[str, str, str]]): file path, file data and access mode
+        of every write.
+  """
+
+  def __init__(self):
+    """Initializes a test output writer."""
+    super(TestOutputWriter, self).__init__()
+    self.writes = []
+
+  def WriteFile(self, file_path, file_data, access_mode='w'):
+    """Writes the data to file.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): to write.
+      access_mode (Optional[str]): output file access mode.
+    """
+    self.writes.append((file_path, file_data, access_mode))
+
+
 class SourceFileGeneratorTest(test_lib.BaseTestCase):
   """Source files generator tests."""
 
-  def testInitialize(self):
-    """Tests the __init__ function."""
+  def _CreateGenerator(self):
+    """Creates a source file generator.
+
+    Returns:
+      SourceFileGenerator: source file generator.
+    """
     source_directory = os.path.abspath(__file__)
     source_directory = os.path.dirname(source_directory)
     source_directory = os.path.dirname(source_directory)
@@ -25,11 +54,57 @@ class SourceFileGeneratorTest(test_lib.BaseTestCase):
     template_directory = os.path.join(
         source_directory, 'data', 'source', 'common')
 
-    generator = interface.SourceFileGenerator(
+    return interface.SourceFileGenerator(
         projects_directory, template_directory)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    generator = self._CreateGenerator()
     self.assertIsNotNone(generator)
 
-  # TODO: add tests for _CorrectDescriptionSpelling function.
+  # pylint: disable=protected-access
+
+  def testCorrectDescriptionSpelling(self):
+    """Tests the _CorrectDescriptionSpelling function."""
+    generator = self._CreateGenerator()
+    output_writer = TestOutputWriter()
+
+    generator._StartOutputBuffer('test.c')
+    generator._WriteOutputData(
+        output_writer, 'test.c', '/* Retrieves a item value\n */\n')
+    generator._CorrectDescriptionSpelling('item_value', 'test.c')
+    generator._FlushOutputBuffer(output_writer, 'test.c')
+
+    expected_writes = [('test.c', '/* Retrieves an item value\n */\n', 'w')]
+    self.assertEqual(output_writer.writes, expected_writes)
+
+    with self.assertRaises(RuntimeError):
+      generator._CorrectDescriptionSpelling('item_value', 'test.c')
+
+  def testFlushOutputBuffer(self):
+    """Tests the _FlushOutputBuffer function."""
+    generator = self._CreateGenerator()
+    output_writer = TestOutputWriter()
+
+    generator._StartOutputBuffer('test.h')
+    generator._WriteOutputData(output_writer, 'test.h', 'first\n')
+    generator._WriteOutputData(output_writer, 'test.h', 'a\tb\n')
+    generator._WriteOutputData(
+        output_writer, 'test.h', 'aaaaaaaaaaaa\tc\n', access_mode='a')
+    generator._VerticalAlignTabs('test.h')
+
+    self.assertEqual(output_writer.writes, [])
+
+    generator._FlushOutputBuffer(output_writer, 'test.h')
+
+    expected_writes = [('test.h', 'a\t\tb\naaaaaaaaaaaa\tc\n', 'w')]
+    self.assertEqual(output_writer.writes, expected_writes)
+
+    generator._WriteOutputData(output_writer, 'test.h', 'data')
+
+    expected_writes.append(('test.h', 'data', 'w'))
+    self.assertEqual(output_writer.writes, expected_writes)
+
   # TODO: add tests for _GenerateSection function.
   # TODO: add tests for _GenerateSections function.
   # TODO: add tests for _GetDefinitionsIncludeHeaderFile function.
@@ -50,6 +125,20 @@ class SourceFileGeneratorTest(test_lib.BaseTestCase):
   # TODO: add tests for _SetValueTypeInTemplateMappings function.
   # TODO: add tests for _SortIncludeHeaders function.
   # TODO: add tests for _SortVariableDeclarations function.
+
+  def testSplitLines(self):
+    """Tests the _SplitLines function."""
+    generator = self._CreateGenerator()
+
+    lines = generator._SplitLines('a\r\nb\rc\n\nd')
+    self.assertEqual(lines, ['a\n', 'b\n', 'c\n', '\n', 'd'])
+
+    lines = generator._SplitLines('a\n')
+    self.assertEqual(lines, ['a\n'])
+
+    lines = generator._SplitLines('')
+    self.assertEqual(lines, [])
+
   # TODO: add tests for _VerticalAlignAssignmentStatements function.
   # TODO: add tests for _VerticalAlignFunctionArguments function.
   # TODO: add tests for _VerticalAlignTabs function.
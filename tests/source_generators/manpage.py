@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source file generator for man pages."""
+
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import output_writers
+from yaldevtools import source_generation
+
+from tests import synthetic_project
+from tests import test_lib
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+class LibraryManPageGeneratorTest(test_lib.BaseTestCase):
+  """Library man page generator tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._projects_directory = tempfile.mkdtemp()
+    self._working_directory = os.getcwd()
+
+    project_writer = synthetic_project.SyntheticProjectWriter(
+        number_of_types=0)
+    self._project_directory = project_writer.Write(self._projects_directory)
+    self._man_page_path = os.path.join(
+        self._project_directory, 'manuals', 'libxyz.3')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    os.chdir(self._working_directory)
+    shutil.rmtree(self._projects_directory, True)
+
+  def _GenerateManPage(self):
+    """Generates the man page of the synthetic project.
+
+    Returns:
+      str: data of the man page.
+    """
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.ReadFromFile(os.path.join(
+        self._project_directory, 'libxyz.ini'))
+
+    _, source_generator_class, template_directory, _ = (
+        source_generation.GetSourceGenerators(
+            _LIBYAL_DIRECTORY, generators=['libyal.3'])[0])
+
+    os.chdir(self._project_directory)
+
+    # Unsupported functions are expected and should not be reported.
+    logging.disable(logging.ERROR)
+    try:
+      output_writer = output_writers.FileWriter(self._project_directory)
+      source_generator_object = source_generator_class(
+          self._projects_directory, template_directory)
+      source_generator_object.Generate(project_configuration, output_writer)
+      output_writer.Close()
+
+    finally:
+      logging.disable(logging.NOTSET)
+      os.chdir(self._working_directory)
+
+    with io.open(self._man_page_path, 'r', encoding='utf8') as file_object:
+      return file_object.read()
+
+  def testGenerate(self):
+    """Tests the Generate function."""
+    man_page_data = self._GenerateManPage()
+    self.assertNotIn('Outdated library description', man_page_data)
+    self.assertIn('.Sh SYNOPSIS', man_page_data)
+
+    # A man page of which only the date changed is not changed.
+    man_page_lines = man_page_data.split('\n')
+    man_page_lines[0] = '.Dd January  1, 2018'
+
+    with io.open(self._man_page_path, 'w', encoding='utf8') as file_object:
+      file_object.write('\n'.join(man_page_lines))
+
+    man_page_data = self._GenerateManPage()
+    self.assertEqual(man_page_data.split('\n'), man_page_lines)
+
+    # An empty man page is not changed.
+    with io.open(self._man_page_path, 'w', encoding='utf8') as file_object:
+      file_object.write('')
+
+    man_page_data = self._GenerateManPage()
+    self.assertEqual(man_page_data, '')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Tests for the source file generator for test source files."""
+
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import dependency_manifest
+from yaldevtools import source_generation
+
+from tests import synthetic_project
+from tests import test_lib
+
+
+_LIBYAL_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+class TestSourceFileGeneratorTest(test_lib.BaseTestCase):
+  """Test source files generator tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._projects_directory = tempfile.mkdtemp()
+    self._working_directory = os.getcwd()
+
+    project_writer = synthetic_project.SyntheticProjectWriter(
+        number_of_types=0)
+    self._project_directory = project_writer.Write(self._projects_directory)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    os.chdir(self._working_directory)
+    shutil.rmtree(self._projects_directory, True)
+
+  def _CreateManifest(self, template_directory, result):
+    """Creates a dependency manifest with the tests category.
+
+    Args:
+      template_directory (str): path of the template directory of the tests
+          category.
+      result (dict[str, object]): result of the generation of the tests
+          category.
+    """
+    manifest = dependency_manifest.DependencyManifest(
+        os.path.join(self._project_directory, '.manifest'),
+        self._project_directory,
+        os.path.join(_LIBYAL_DIRECTORY, 'data', 'source'))
+    manifest.SetCategory(
+        'tests', template_directory, 'code', 'configuration',
+        result['input_files'], result['output_templates'],
+        input_directories=result['input_directories'])
+    manifest.WriteToFile()
+
+  def _IsUpToDate(self, template_directory):
+    """Determines if the tests category is up to date.
+
+    Args:
+      template_directory (str): path of the template directory of the tests
+          category.
+
+    Returns:
+      bool: True if the tests category is up to date.
+    """
+    manifest = dependency_manifest.DependencyManifest(
+        os.path.join(self._project_directory, '.manifest'),
+        self._project_directory,
+        os.path.join(_LIBYAL_DIRECTORY, 'data', 'source'))
+    manifest.ReadFromFile()
+
+    return manifest.IsUpToDate(
+        'tests', template_directory, 'code', 'configuration')
+
+  def testGenerateDependencies(self):
+    """Tests the dependencies recorded by the Generate function."""
+    test_data_directory = os.path.join(
+        self._project_directory, 'tests', 'data')
+    os.mkdir(test_data_directory)
+
+    test_data_path = os.path.join(test_data_directory, 'item.1')
+    with io.open(test_data_path, 'wb') as file_object:
+      file_object.write(b'\x01\x02\x03\x04')
+
+    # The test source file of a type is only generated when it does not exist.
+    os.remove(os.path.join(self._project_directory, 'tests', 'xyz_test_item.c'))
+
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.ReadFromFile(os.path.join(
+        self._project_directory, 'libxyz.ini'))
+
+    os.chdir(self._project_directory)
+
+    # Unsupported functions are expected and should not be reported.
+    logging.disable(logging.ERROR)
+    try:
+      for source_category, source_generator_class, template_directory, _ in (
+          source_generation.GetSourceGenerators(
+              _LIBYAL_DIRECTORY, generators=['include', 'libyal', 'tests'])):
+        result = source_generation.GenerateSourceCategory(
+            source_generator_class, self._projects_directory,
+            template_directory, project_configuration,
+            self._project_directory, False)
+    finally:
+      logging.disable(logging.NOTSET)
+
+    self.assertEqual(source_category, 'tests')
+
+    self._CreateManifest(template_directory, result)
+    self.assertTrue(self._IsUpToDate(template_directory))
+
+    # The test data files are read to generate the type tests.
+    with io.open(test_data_path, 'wb') as file_object:
+      file_object.write(b'\x05\x06\x07\x08')
+
+    self.assertFalse(self._IsUpToDate(template_directory))
+
+    self._CreateManifest(template_directory, result)
+    self.assertTrue(self._IsUpToDate(template_directory))
+
+    # The test data directory is listed to find the test data files.
+    with io.open(os.path.join(test_data_directory, 'item.2'), 'wb'):
+      pass
+
+    self.assertFalse(self._IsUpToDate(template_directory))
+
+
+if __name__ == '__main__':
+  unittest.main()
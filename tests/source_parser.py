@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Tests for the C declaration parser."""
+
+from __future__ import unicode_literals
+
+import io
+import unittest
+
+from yaldevtools import source_parser
+
+from tests import test_lib
+
+
+class TokenizerTest(test_lib.BaseTestCase):
+  """Tokenizer tests."""
+
+  def testTokenize(self):
+    """Tests the Tokenize function."""
+    tokenizer = source_parser.Tokenizer('libyal')
+
+    file_object = io.StringIO(
+        '\n'
+        '#if defined( HAVE_DEBUG_OUTPUT )\n'
+        '#endif\n'
+        '#include <common.h>\n'
+        '/* Retrieves the size\n'
+        ' */\n'
+        'LIBYAL_DEPRECATED \\\n'
+        'LIBYAL_EXTERN \\\n'
+        'int libyal_file_get_size(\n'
+        'typedef struct libyal_file libyal_file_t;\n'
+        'enum LIBYAL_FILE_TYPES\n'
+        'size64_t size;\n'
+        '{\n')
+
+    expected_tokens = [
+        (source_parser.TOKEN_TYPE_BLANK, ''),
+        (source_parser.TOKEN_TYPE_IF_DEFINED,
+         '#if defined( HAVE_DEBUG_OUTPUT )'),
+        (source_parser.TOKEN_TYPE_ENDIF, '#endif'),
+        (source_parser.TOKEN_TYPE_PREPROCESSOR, '#include <common.h>'),
+        (source_parser.TOKEN_TYPE_COMMENT, '/* Retrieves the size'),
+        (source_parser.TOKEN_TYPE_COMMENT, '*/'),
+        (source_parser.TOKEN_TYPE_DEPRECATED, 'LIBYAL_DEPRECATED \\'),
+        (source_parser.TOKEN_TYPE_EXTERN, 'LIBYAL_EXTERN \\'),
+        (source_parser.TOKEN_TYPE_OPEN_PARENTHESIS,
+         'int libyal_file_get_size('),
+        (source_parser.TOKEN_TYPE_TYPEDEF,
+         'typedef struct libyal_file libyal_file_t;'),
+        (source_parser.TOKEN_TYPE_ENUM, 'enum LIBYAL_FILE_TYPES'),
+        (source_parser.TOKEN_TYPE_STATEMENT, 'size64_t size;'),
+        (source_parser.TOKEN_TYPE_OTHER, '{')]
+
+    tokens = list(tokenizer.Tokenize(file_object))
+    self.assertEqual(tokens, expected_tokens)
+
+
+class DeclarationParserTest(test_lib.BaseTestCase):
+  """Declaration parser tests."""
+
+  _HEADER_FILE_DATA = """\
+typedef intptr_t libyal_file_t;
+
+enum LIBYAL_ACCESS_FLAGS
+{
+	LIBYAL_ACCESS_FLAG_READ = 0x01,
+	LIBYAL_ACCESS_FLAG_WRITE = 0x02
+};
+
+typedef struct libyal_internal_file libyal_internal_file_t;
+
+struct libyal_internal_file
+{
+	libcthreads_read_write_lock_t *read_write_lock;
+};
+
+/* -------------------------------------------------------------------------
+ * File functions
+ * ------------------------------------------------------------------------- */
+
+LIBYAL_EXTERN \\
+int libyal_file_set_callback(
+     libyal_file_t *file,
+     int (*callback)(
+            void *data,
+            size_t data_size ),
+     libcerror_error_t **error );
+
+#if defined( LIBYAL_HAVE_BFIO )
+
+LIBYAL_EXTERN \\
+int libyal_file_open_file_io_handle(
+     libyal_file_t *file,
+     libbfio_handle_t *file_io_handle,
+     libcerror_error_t **error );
+
+#endif /* defined( LIBYAL_HAVE_BFIO ) */
+
+LIBYAL_DEPRECATED \\
+LIBYAL_EXTERN \\
+int libyal_file_get_ascii_codepage(
+     libyal_file_t *file,
+     int *ascii_codepage,
+     libcerror_error_t **error );
+
+int libyal_internal_file_close(
+     libyal_internal_file_t *internal_file,
+     libcerror_error_t **error );
+"""
+
+  def testParse(self):
+    """Tests the Parse function."""
+    parser = source_parser.DeclarationParser('libyal')
+
+    file_object = io.StringIO(self._HEADER_FILE_DATA)
+    parser.Parse(file_object)
+
+    self.assertTrue(parser.has_read_write_lock)
+    self.assertEqual(parser.intptr_types, ['file'])
+    self.assertEqual(parser.section_names, ['File functions'])
+    self.assertEqual(parser.struct_types, ['libyal_internal_file'])
+
+    self.assertEqual(len(parser.enum_declarations), 1)
+
+    enum_declaration = parser.enum_declarations[0]
+    self.assertEqual(enum_declaration.name, 'LIBYAL_ACCESS_FLAGS')
+    self.assertEqual(list(enum_declaration.constants.items()), [
+        ('LIBYAL_ACCESS_FLAG_READ', '0x01'),
+        ('LIBYAL_ACCESS_FLAG_WRITE', '0x02')])
+
+    self.assertEqual(len(parser.function_declarations), 4)
+
+    function_declaration = parser.function_declarations[0]
+    self.assertEqual(
+        function_declaration.function_line, 'int libyal_file_set_callback(')
+    self.assertEqual(function_declaration.conditions, set())
+    self.assertFalse(function_declaration.is_deprecated)
+    self.assertEqual(function_declaration.section_name, 'File functions')
+
+    function_prototype = function_declaration.function_prototype
+    self.assertEqual(function_prototype.name, 'libyal_file_set_callback')
+    self.assertEqual(function_prototype.return_type, 'int')
+    self.assertTrue(function_prototype.have_extern)
+
+    arguments = [
+        argument.CopyToString() for argument in function_prototype.arguments]
+    self.assertEqual(arguments, [
+        'libyal_file_t *file',
+        'int (*callback)( void *data, size_t data_size )',
+        'libcerror_error_t **error'])
+
+    function_declaration = parser.function_declarations[1]
+    self.assertEqual(function_declaration.conditions, set(['LIBYAL_HAVE_BFIO']))
+
+    function_declaration = parser.function_declarations[2]
+    self.assertEqual(function_declaration.conditions, set())
+    self.assertTrue(function_declaration.is_deprecated)
+
+    function_declaration = parser.function_declarations[3]
+    self.assertFalse(function_declaration.is_deprecated)
+
+    function_prototype = function_declaration.function_prototype
+    self.assertEqual(function_prototype.name, 'libyal_internal_file_close')
+    self.assertFalse(function_prototype.have_extern)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Tests for the symbol database."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import source_file
+from yaldevtools import symbol_database
+
+from tests import test_lib
+
+
+class SymbolDatabaseTest(test_lib.BaseTestCase):
+  """Symbol database tests."""
+
+  _DEFINITIONS_INCLUDE_HEADER_FILE_DATA = """\
+enum LIBYAL_ACCESS_FLAGS
+{
+	LIBYAL_ACCESS_FLAG_READ = 0x01,
+	LIBYAL_ACCESS_FLAG_WRITE = 0x02
+};
+"""
+
+  _INCLUDE_HEADER_FILE_DATA = """\
+/* -------------------------------------------------------------------------
+ * Support functions
+ * ------------------------------------------------------------------------- */
+
+LIBYAL_EXTERN \\
+int libyal_check_file_signature(
+     const char *filename,
+     libyal_error_t **error );
+
+/* -------------------------------------------------------------------------
+ * File functions
+ * ------------------------------------------------------------------------- */
+
+LIBYAL_EXTERN \\
+int libyal_file_initialize(
+     libyal_file_t **file,
+     libyal_error_t **error );
+
+LIBYAL_EXTERN \\
+int libyal_file_free(
+     libyal_file_t **file,
+     libyal_error_t **error );
+
+LIBYAL_EXTERN \\
+int libyal_file_open(
+     libyal_file_t *file,
+     const char *filename,
+     int access_flags,
+     libyal_error_t **error );
+
+LIBYAL_EXTERN \\
+int libyal_file_get_item_by_index(
+     libyal_file_t *file,
+     int item_index,
+     libyal_item_t **item,
+     libyal_error_t **error );
+"""
+
+  _LIBRARY_HEADER_FILE_DATA = """\
+int libyal_internal_file_read_header(
+     libyal_internal_file_t *internal_file,
+     libcerror_error_t **error );
+"""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    project_directory = os.path.join(self._temporary_directory, 'libyal')
+    os.makedirs(os.path.join(project_directory, 'include', 'libyal'))
+    os.makedirs(os.path.join(project_directory, 'libyal'))
+
+    self._include_header_path = os.path.join(
+        project_directory, 'include', 'libyal.h.in')
+
+    self._WriteFile(
+        self._include_header_path, self._INCLUDE_HEADER_FILE_DATA)
+    self._WriteFile(
+        os.path.join(
+            project_directory, 'include', 'libyal', 'definitions.h.in'),
+        self._DEFINITIONS_INCLUDE_HEADER_FILE_DATA)
+    self._WriteFile(
+        os.path.join(project_directory, 'libyal', 'libyal_file.h'),
+        self._LIBRARY_HEADER_FILE_DATA)
+
+    self._database = symbol_database.SymbolDatabase(path=os.path.join(
+        self._temporary_directory, 'symbols.db'))
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._database.Close()
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _WriteFile(self, path, data):
+    """Writes a file.
+
+    Args:
+      path (str): path of the file.
+      data (str): data of the file.
+    """
+    with io.open(path, 'w', encoding='utf8') as file_object:
+      file_object.write(data)
+
+  def testGetAPITestGroups(self):
+    """Tests the GetAPITestGroups function."""
+    self._database.UpdateProject('libyal', self._temporary_directory)
+
+    api_test_groups = self._database.GetAPITestGroups('libyal')
+    self.assertEqual(api_test_groups, ([], ['support'], [], ['file'], []))
+
+    self.assertEqual(self._database.GetCheckSignatureType('libyal'), 'file')
+
+  def testGetEnumDeclarations(self):
+    """Tests the GetEnumDeclarations function."""
+    self._database.UpdateProject('libyal', self._temporary_directory)
+
+    enum_declarations = self._database.GetEnumDeclarations(
+        name_pattern='*_ACCESS_FLAGS')
+    self.assertEqual(len(enum_declarations), 1)
+
+    project_name, enum_declaration = enum_declarations[0]
+    self.assertEqual(project_name, 'libyal')
+    self.assertEqual(enum_declaration.name, 'LIBYAL_ACCESS_FLAGS')
+    self.assertEqual(list(enum_declaration.constants.items()), [
+        ('LIBYAL_ACCESS_FLAG_READ', '0x01'),
+        ('LIBYAL_ACCESS_FLAG_WRITE', '0x02')])
+
+  def testGetFunctionPrototypes(self):
+    """Tests the GetFunctionPrototypes function."""
+    self._database.UpdateProject('libyal', self._temporary_directory)
+
+    function_prototypes = self._database.GetFunctionPrototypes(
+        name_pattern='*_get_*_by_index')
+    self.assertEqual(len(function_prototypes), 1)
+
+    project_name, function_prototype = function_prototypes[0]
+    self.assertEqual(project_name, 'libyal')
+    self.assertEqual(function_prototype.name, 'libyal_file_get_item_by_index')
+    self.assertEqual(function_prototype.return_type, 'int')
+    self.assertTrue(function_prototype.have_extern)
+    self.assertEqual(function_prototype.CopyToString(), (
+        'libyal_file_t *file, int item_index, libyal_item_t **item, '
+        'libyal_error_t **error'))
+
+    function_prototypes = self._database.GetFunctionPrototypes(
+        project_name='libyal', name_pattern='*_internal_*')
+    self.assertEqual(len(function_prototypes), 1)
+
+    _, function_prototype = function_prototypes[0]
+    self.assertEqual(
+        function_prototype.name, 'libyal_internal_file_read_header')
+    self.assertFalse(function_prototype.have_extern)
+
+    function_prototypes = self._database.GetFunctionPrototypes(
+        project_name='libother')
+    self.assertEqual(function_prototypes, [])
+
+  def testGetLibraryIncludeHeaderFile(self):
+    """Tests the GetLibraryIncludeHeaderFile function."""
+    self._database.UpdateProject('libyal', self._temporary_directory)
+
+    include_header_file = self._database.GetLibraryIncludeHeaderFile(
+        'libyal', self._include_header_path)
+    self.assertIsNotNone(include_header_file)
+
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.library_name = 'libyal'
+
+    expected_include_header_file = source_file.LibraryIncludeHeaderFile(
+        self._include_header_path)
+    expected_include_header_file.Read(project_configuration)
+
+    self.assertEqual(
+        include_header_file.section_names,
+        expected_include_header_file.section_names)
+    self.assertEqual(
+        list(include_header_file.functions_per_name.keys()),
+        list(expected_include_header_file.functions_per_name.keys()))
+
+    for section_name, functions in (
+        expected_include_header_file.functions_per_section.items()):
+      self.assertEqual(
+          [function_prototype.CopyToString() for function_prototype in (
+              include_header_file.functions_per_section[section_name])],
+          [function_prototype.CopyToString()
+           for function_prototype in functions])
+
+    self.assertFalse(include_header_file.have_bfio)
+    self.assertFalse(include_header_file.have_wide_character_type)
+    self.assertTrue(include_header_file.HasTypeFunction('file', 'open'))
+    self.assertEqual(include_header_file.GetCheckSignatureType(), 'file')
+
+    self.assertEqual(
+        list(include_header_file.GetAPIFunctionTestGroups()[1]), ['support'])
+    self.assertEqual(
+        include_header_file.GetAPITypeTestGroups(), ([], ['file']))
+    self.assertEqual(
+        [function_prototype.name for function_prototype in (
+            include_header_file.GetFunctionGroup('file'))],
+        ['libyal_file_initialize', 'libyal_file_free', 'libyal_file_open',
+         'libyal_file_get_item_by_index'])
+    self.assertTrue(include_header_file.HasErrorArgument('file'))
+
+    self.assertIsNone(self._database.GetLibraryIncludeHeaderFile(
+        'libother', self._include_header_path))
+
+  def testUpdateProject(self):
+    """Tests the UpdateProject function."""
+    self.assertTrue(self._database.UpdateProject(
+        'libyal', self._temporary_directory))
+    self.assertFalse(self._database.UpdateProject(
+        'libyal', self._temporary_directory))
+    self.assertFalse(self._database.UpdateProject(
+        'libother', self._temporary_directory))
+
+    self.assertEqual(self._database.GetProjectNames(), ['libyal'])
+
+    self._WriteFile(self._include_header_path, (
+        self._INCLUDE_HEADER_FILE_DATA.replace('_by_index', '_by_name')))
+
+    self.assertTrue(self._database.UpdateProject(
+        'libyal', self._temporary_directory))
+
+    function_prototypes = self._database.GetFunctionPrototypes(
+        name_pattern='*_get_*')
+    self.assertEqual(len(function_prototypes), 1)
+
+    _, function_prototype = function_prototypes[0]
+    self.assertEqual(function_prototype.name, 'libyal_file_get_item_by_name')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,871 @@
+# -*- coding: utf-8 -*-
+"""Synthetic libyal project for testing and benchmarking the generators."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+
+
+class SyntheticProjectWriter(object):
+  """Synthetic libyal project writer.
+
+  The synthetic project, libxyz, consists of the files the source generators
+  read: the project configuration file, the include headers, the library
+  header and source files, Makefile.am and configure.ac, an outdated man page
+  and the (empty) files in tests, pyxyz and xyztools of which the presence
+  enables the generation of the corresponding output files.
+
+  The library has a file type, an item type and a configurable number of
+  value types, where the item type and the first value types have a sub
+  value type.
+  """
+
+  _LIBRARY_NAME = 'libxyz'
+
+  # Number of value types that have a sub value type.
+  _NUMBER_OF_TYPES_WITH_SUB_TYPE = 3
+
+  _SECTION_START = (
+      '/* -------------------------------------------------------------------'
+      '------')
+  _SECTION_END = (
+      ' * -------------------------------------------------------------------'
+      '------ */')
+
+  # Names of the library source files, that are written empty if not written
+  # otherwise.
+  _LIBRARY_SOURCE_FILES = [
+      '{library_name:s}.c',
+      '{library_name:s}_debug.c',
+      '{library_name:s}_debug.h',
+      '{library_name:s}_definitions.h',
+      '{library_name:s}_error.c',
+      '{library_name:s}_error.h',
+      '{library_name:s}_extern.h',
+      '{library_name:s}_io_handle.c',
+      '{library_name:s}_io_handle.h',
+      '{library_name:s}_libcerror.h',
+      '{library_name:s}_notify.c',
+      '{library_name:s}_notify.h',
+      '{library_name:s}_support.c',
+      '{library_name:s}_support.h',
+      '{library_name:s}_unused.h']
+
+  # Paths of the files of which the presence enables the generation of the
+  # corresponding output files.
+  _PLACEHOLDER_FILES = [
+      'py{suffix:s}/py{suffix:s}.c',
+      'py{suffix:s}/py{suffix:s}.h',
+      'py{suffix:s}/py{suffix:s}_codepage.c',
+      'py{suffix:s}/py{suffix:s}_datetime.c',
+      'py{suffix:s}/py{suffix:s}_error.c',
+      'py{suffix:s}/py{suffix:s}_error.h',
+      'py{suffix:s}/py{suffix:s}_file_object_io_handle.c',
+      'py{suffix:s}/py{suffix:s}_file_object_io_handle.h',
+      'py{suffix:s}/py{suffix:s}_integer.c',
+      'py{suffix:s}/py{suffix:s}_libcerror.h',
+      'py{suffix:s}/py{suffix:s}_python.h',
+      'py{suffix:s}/py{suffix:s}_unused.h',
+      'tests/py{suffix:s}_test_file.py',
+      'tests/py{suffix:s}_test_item.py',
+      'tests/py{suffix:s}_test_support.py',
+      'tests/runtests.sh',
+      'tests/test_library.sh',
+      'tests/test_python_module.sh',
+      'tests/test_runner.sh',
+      'tests/test_tools.sh',
+      'tests/test_{suffix:s}info.sh',
+      'tests/{suffix:s}_test_error.c',
+      'tests/{suffix:s}_test_file.c',
+      'tests/{suffix:s}_test_functions.c',
+      'tests/{suffix:s}_test_functions.h',
+      'tests/{suffix:s}_test_getopt.c',
+      'tests/{suffix:s}_test_io_handle.c',
+      'tests/{suffix:s}_test_item.c',
+      'tests/{suffix:s}_test_libcerror.h',
+      'tests/{suffix:s}_test_macros.h',
+      'tests/{suffix:s}_test_memory.c',
+      'tests/{suffix:s}_test_memory.h',
+      'tests/{suffix:s}_test_notify.c',
+      'tests/{suffix:s}_test_support.c',
+      'tests/{suffix:s}_test_tools_info_handle.c',
+      'tests/{suffix:s}_test_unused.h',
+      '{suffix:s}tools/Makefile.am',
+      '{suffix:s}tools/info_handle.c',
+      '{suffix:s}tools/info_handle.h',
+      '{suffix:s}tools/mount_dokan.c',
+      '{suffix:s}tools/mount_file_entry.c',
+      '{suffix:s}tools/mount_file_system.c',
+      '{suffix:s}tools/mount_fuse.c',
+      '{suffix:s}tools/mount_handle.c',
+      '{suffix:s}tools/mount_handle.h',
+      '{suffix:s}tools/{suffix:s}info.c',
+      '{suffix:s}tools/{suffix:s}mount.c',
+      '{suffix:s}tools/{suffix:s}tools_getopt.c',
+      '{suffix:s}tools/{suffix:s}tools_libcerror.h',
+      '{suffix:s}tools/{suffix:s}tools_output.c',
+      '{suffix:s}tools/{suffix:s}tools_signal.c',
+      '{suffix:s}tools/{suffix:s}tools_unused.h']
+
+  # Paths of the directories that are expected to exist.
+  _DIRECTORIES = [
+      '.travis', 'common', 'documentation', 'dpkg/source', 'm4', 'msvscpp',
+      'ossfuzz', 'po', 'synctestdata']
+
+  def __init__(self, number_of_types=3):
+    """Initializes a synthetic libyal project writer.
+
+    Args:
+      number_of_types (Optional[int]): number of value types.
+    """
+    super(SyntheticProjectWriter, self).__init__()
+    self._library_name = self._LIBRARY_NAME
+    self._library_name_upper_case = self._LIBRARY_NAME.upper()
+    self._library_name_suffix = self._LIBRARY_NAME[3:]
+    self._number_of_types = number_of_types
+    self._project_directory = None
+
+  def _FormatFunctionPrototype(
+      self, return_type, function_name, arguments, extern=True):
+    """Formats a function prototype.
+
+    Args:
+      return_type (str): return type.
+      function_name (str): name of the function.
+      arguments (list[str]): arguments, where None represents void.
+      extern (Optional[bool]): True if the function is exported.
+
+    Returns:
+      list[str]: lines of the function prototype.
+    """
+    lines = []
+    if extern:
+      lines.append('{0:s}_EXTERN \\'.format(self._library_name_upper_case))
+
+    lines.append('{0:s} {1:s}('.format(return_type, function_name))
+
+    if arguments is None:
+      lines.append('             void );')
+    else:
+      arguments = arguments + ['libcerror_error_t **error']
+      for argument in arguments[:-1]:
+        lines.append('     {0:s},'.format(argument))
+      lines.append('     {0:s} );'.format(arguments[-1]))
+
+    return lines
+
+  def _GetFileFunctions(self):
+    """Retrieves the functions of the file type.
+
+    Returns:
+      list[tuple[str, str, str, str, list[str]]]: description, description
+          of the return value, return type, name without type prefix and
+          arguments of every function.
+    """
+    file_type = '{0:s}_file_t'.format(self._library_name)
+    item_type = '{0:s}_item_t'.format(self._library_name)
+
+    return [
+        ('Creates a file', '1 if successful or -1 on error', 'int',
+         'initialize', ['{0:s} **file'.format(file_type)]),
+        ('Frees a file', '1 if successful or -1 on error', 'int',
+         'free', ['{0:s} **file'.format(file_type)]),
+        ('Signals the file to abort its current activity',
+         '1 if successful or -1 on error', 'int',
+         'signal_abort', ['{0:s} *file'.format(file_type)]),
+        ('Opens a file', '1 if successful or -1 on error', 'int',
+         'open', ['{0:s} *file'.format(file_type), 'const char *filename',
+                  'int access_flags']),
+        ('Opens a file', '1 if successful or -1 on error', 'int',
+         'open_wide', ['{0:s} *file'.format(file_type),
+                       'const wchar_t *filename', 'int access_flags']),
+        ('Opens a file using a Basic File IO (bfio) handle',
+         '1 if successful or -1 on error', 'int',
+         'open_file_io_handle', ['{0:s} *file'.format(file_type),
+                                 'libbfio_handle_t *file_io_handle',
+                                 'int access_flags']),
+        ('Closes a file', '0 if successful or -1 on error', 'int',
+         'close', ['{0:s} *file'.format(file_type)]),
+        ('Retrieves the file size', '1 if successful or -1 on error', 'int',
+         'get_size', ['{0:s} *file'.format(file_type), 'size64_t *size']),
+        ('Retrieves the ASCII codepage', '1 if successful or -1 on error',
+         'int', 'get_ascii_codepage', ['{0:s} *file'.format(file_type),
+                                       'int *ascii_codepage']),
+        ('Sets the ASCII codepage', '1 if successful or -1 on error', 'int',
+         'set_ascii_codepage', ['{0:s} *file'.format(file_type),
+                                'int ascii_codepage']),
+        ('Retrieves the number of items', '1 if successful or -1 on error',
+         'int', 'get_number_of_items', ['{0:s} *file'.format(file_type),
+                                        'int *number_of_items']),
+        ('Retrieves a specific item', '1 if successful or -1 on error', 'int',
+         'get_item_by_index', ['{0:s} *file'.format(file_type),
+                               'int item_index',
+                               '{0:s} **item'.format(item_type)])]
+
+  def _GetTypeFunctions(self, type_name, sub_type_name):
+    """Retrieves the functions of an item or value type.
+
+    Args:
+      type_name (str): name of the type.
+      sub_type_name (str): name of the sub type or None if the type has no
+          sub type.
+
+    Returns:
+      list[tuple[str, str, str, str, list[str]]]: description, description
+          of the return value, return type, name without type prefix and
+          arguments of every function.
+    """
+    description = type_name.replace('_', ' ')
+    type_argument = '{0:s}_{1:s}_t *{1:s}'.format(self._library_name, type_name)
+
+    functions = [
+        ('Creates a {0:s}'.format(description),
+         '1 if successful or -1 on error', 'int',
+         'initialize', ['{0:s}_{1:s}_t **{1:s}'.format(
+             self._library_name, type_name)]),
+        ('Frees a {0:s}'.format(description),
+         '1 if successful or -1 on error', 'int',
+         'free', ['{0:s}_{1:s}_t **{1:s}'.format(
+             self._library_name, type_name)]),
+        ('Retrieves the size',
+         '1 if successful, 0 if not available or -1 on error', 'int',
+         'get_size', [type_argument, 'size64_t *size']),
+        ('Retrieves the identifier', '1 if successful or -1 on error', 'int',
+         'get_identifier', [type_argument, 'uint32_t *identifier']),
+        ('Retrieves the creation time', '1 if successful or -1 on error',
+         'int', 'get_creation_time', [type_argument, 'uint64_t *filetime']),
+        ('Retrieves the size of the UTF-8 encoded name',
+         '1 if successful, 0 if not available or -1 on error', 'int',
+         'get_utf8_name_size', [type_argument, 'size_t *utf8_string_size']),
+        ('Retrieves the UTF-8 encoded name',
+         '1 if successful, 0 if not available or -1 on error', 'int',
+         'get_utf8_name', [type_argument, 'uint8_t *utf8_string',
+                           'size_t utf8_string_size']),
+        ('Retrieves the size of the UTF-16 encoded name',
+         '1 if successful, 0 if not available or -1 on error', 'int',
+         'get_utf16_name_size', [type_argument, 'size_t *utf16_string_size']),
+        ('Retrieves the UTF-16 encoded name',
+         '1 if successful, 0 if not available or -1 on error', 'int',
+         'get_utf16_name', [type_argument, 'uint16_t *utf16_string',
+                            'size_t utf16_string_size']),
+        ('Retrieves the data', '1 if successful or -1 on error', 'int',
+         'get_data', [type_argument, 'uint8_t *data', 'size_t data_size']),
+        ('Determines if the {0:s} is allocated'.format(type_name),
+         '1 if allocated, 0 if not or -1 on error', 'int',
+         'is_allocated', [type_argument])]
+
+    if sub_type_name:
+      sub_type_description = sub_type_name.replace('_', ' ')
+      functions.extend([
+          ('Retrieves the number of {0:s}s'.format(sub_type_description),
+           '1 if successful or -1 on error', 'int',
+           'get_number_of_{0:s}s'.format(sub_type_name), [
+               type_argument, 'int *number_of_{0:s}s'.format(sub_type_name)]),
+          ('Retrieves a specific {0:s}'.format(sub_type_description),
+           '1 if successful or -1 on error', 'int',
+           'get_{0:s}_by_index'.format(sub_type_name), [
+               type_argument, 'int {0:s}_index'.format(sub_type_name),
+               '{0:s}_{1:s}_t **{1:s}'.format(
+                   self._library_name, sub_type_name)])])
+
+    return functions
+
+  def _GetTypeNames(self):
+    """Retrieves the names of the item and value types.
+
+    Returns:
+      list[tuple[str, str]]: name of the type and name of its sub type, or
+          None if the type has no sub type.
+    """
+    value_type_names = [
+        'value{0:d}'.format(index) for index in range(self._number_of_types)]
+    type_names = ['item'] + value_type_names
+
+    type_names_with_sub_type = []
+    for index, type_name in enumerate(type_names):
+      sub_type_name = None
+      if (index < self._NUMBER_OF_TYPES_WITH_SUB_TYPE and
+          index + 1 < len(type_names)):
+        sub_type_name = type_names[index + 1]
+
+      type_names_with_sub_type.append((type_name, sub_type_name))
+
+    return type_names_with_sub_type
+
+  def _WriteConfigurationFile(self):
+    """Writes the project configuration file."""
+    lines = [
+        '[project]',
+        'name: "{0:s}"'.format(self._library_name),
+        'status: "experimental"',
+        'year_of_creation: "2010"',
+        'data_format: "Example (XYZ)"',
+        ('documentation_url: "https://github.com/libyal/{0:s}/tree/master/'
+         'documentation"').format(self._library_name),
+        'features: ["debug_output"]',
+        '',
+        '[library]',
+        'description: "Library to access the Example (XYZ) format"',
+        'public_types: ["file", "item"]',
+        'build_dependencies: ["zlib"]',
+        '',
+        '[development]',
+        'main_object: "file"',
+        'main_object_filename: "example.xyz"',
+        '',
+        '[tools]',
+        'description: "Several tools for reading XYZ files"',
+        'names: ["{0:s}info", "{0:s}mount"]'.format(self._library_name_suffix),
+        '',
+        '[info_tool]',
+        'source_description: "an XYZ file"',
+        'source_type: "file"',
+        '',
+        '[mount_tool]',
+        'features: ["codepage"]',
+        'base_type: "file"',
+        'file_entry_type: "item"',
+        'file_system_type: "file"',
+        ('mounted_description: "a device file that provides the RAW data '
+         'contained in the XYZ file"'),
+        'source: "image.xyz"',
+        'source_description: "an XYZ file"',
+        'source_type: "file"',
+        '',
+        '[troubleshooting]',
+        'example: "{0:s}info image.xyz"'.format(self._library_name_suffix),
+        '',
+        '[tests]',
+        'profiles: ["{0:s}", "py{1:s}", "{1:s}info"]'.format(
+            self._library_name, self._library_name_suffix),
+        'example_filename1: "image1.xyz"',
+        'example_filename2: "image2.xyz"',
+        '',
+        '[cygwin]',
+        'build_dependencies: ["zlib-devel"]',
+        '',
+        '[dpkg]',
+        'build_dependencies: ["zlib1g-dev"]',
+        '',
+        '[rpm]',
+        'build_dependencies: ["zlib-devel"]',
+        '',
+        '[pypi]',
+        'appveyor_token: "x"',
+        'travis_token: "y"',
+        '',
+        '[coverity]',
+        'scan_token: "z"',
+        '']
+
+    self._WriteFile('{0:s}.ini'.format(self._library_name), lines)
+
+  def _WriteFile(self, path, lines):
+    """Writes a file of the project.
+
+    Args:
+      path (str): path of the file relative to the project directory, with
+          "/" as path segment separator.
+      lines (list[str]): lines of the file.
+    """
+    path = os.path.join(self._project_directory, *path.split('/'))
+
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+      os.makedirs(directory)
+
+    with io.open(path, 'w', encoding='utf8') as file_object:
+      file_object.write('\n'.join(lines))
+
+  def _WriteIncludeHeaders(self):
+    """Writes the include header and the headers in include/libxyz."""
+    lines = [
+        '/*',
+        ' * Library to access the Example (XYZ) format',
+        ' */',
+        '',
+        '#if !defined( _{0:s}_H )'.format(self._library_name_upper_case),
+        '#define _{0:s}_H'.format(self._library_name_upper_case),
+        '']
+
+    for header_name in (
+        'codepage', 'definitions', 'error', 'extern', 'features', 'types'):
+      lines.append('#include <{0:s}/{1:s}.h>'.format(
+          self._library_name, header_name))
+
+    lines.extend([
+        '',
+        '#include <stdio.h>',
+        '',
+        '#if defined( {0:s}_HAVE_BFIO )'.format(self._library_name_upper_case),
+        '#include <libbfio.h>',
+        '#endif',
+        '',
+        '#if defined( __cplusplus )',
+        'extern "C" {',
+        '#endif',
+        ''])
+
+    self._WriteIncludeHeaderSection(lines, 'Support functions', [
+        ('Returns the library version', 'const char *', 'get_version', None),
+        ('Returns the access flags for reading', 'int',
+         'get_access_flags_read', None),
+        ('Retrieves the narrow system string codepage', 'int',
+         'get_codepage', ['int *codepage']),
+        ('Sets the narrow system string codepage', 'int',
+         'set_codepage', ['int codepage']),
+        ('Determines if a file contains a XYZ file signature', 'int',
+         'check_file_signature', ['const char *filename']),
+        ('Determines if a file contains a XYZ file signature', 'int',
+         'check_file_signature_wide', ['const wchar_t *filename']),
+        (('Determines if a file contains a XYZ file signature using a Basic '
+          'File IO (bfio) handle'), 'int',
+         'check_file_signature_file_io_handle', [
+             'libbfio_handle_t *file_io_handle'])])
+
+    self._WriteIncludeHeaderSection(lines, 'Notify functions', [
+        ('Sets the verbose notification', 'void', 'notify_set_verbose', [])])
+
+    self._WriteIncludeHeaderSection(lines, 'Error functions', [
+        ('Frees an error', 'void', 'error_free', [])])
+
+    self._WriteIncludeHeaderSection(lines, 'File functions', [
+        (description, return_type, 'file_{0:s}'.format(name), arguments)
+        for description, _, return_type, name, arguments in (
+            self._GetFileFunctions())])
+
+    for type_name, sub_type_name in self._GetTypeNames():
+      section_name = '{0:s} functions'.format(
+          type_name.replace('_', ' ').capitalize())
+
+      self._WriteIncludeHeaderSection(lines, section_name, [
+          (description, return_type,
+           '{0:s}_{1:s}'.format(type_name, name), arguments)
+          for description, _, return_type, name, arguments in (
+              self._GetTypeFunctions(type_name, sub_type_name))
+          if name != 'initialize'])
+
+    lines.extend([
+        '#if defined( __cplusplus )',
+        '}',
+        '#endif',
+        '',
+        '#endif /* !defined( _{0:s}_H ) */'.format(
+            self._library_name_upper_case),
+        ''])
+
+    self._WriteFile('include/{0:s}.h.in'.format(self._library_name), lines)
+
+    type_names = ['file'] + [
+        type_name for type_name, _ in self._GetTypeNames()]
+
+    lines = [
+        '/*',
+        ' * Type definitions',
+        ' */',
+        '',
+        '#if defined( {0:s}_HAVE_LOCAL_{0:s} )'.format(
+            self._library_name_upper_case),
+        '']
+    lines.extend([
+        'typedef intptr_t {0:s}_{1:s}_t;'.format(self._library_name, type_name)
+        for type_name in type_names])
+    lines.extend(['', '#endif', ''])
+
+    self._WriteFile('include/{0:s}/types.h.in'.format(
+        self._library_name), lines)
+
+    lines = ['/*', ' * Definitions', ' */', '']
+    for enumeration_name, values in (
+        ('ACCESS_FLAGS', [
+            ('ACCESS_FLAG_READ', '0x01'),
+            ('ACCESS_FLAG_WRITE', '0x02')]),
+        ('ITEM_TYPES', [
+            ('ITEM_TYPE_UNKNOWN', '0'),
+            ('ITEM_TYPE_DIRECTORY', '1'),
+            ('ITEM_TYPE_FILE', '2'),
+            ('ITEM_TYPE_ARCHIVE', '3')]),
+        ('FILE_ATTRIBUTE_FLAGS', [
+            ('FILE_ATTRIBUTE_FLAG_READ_ONLY', '0x00000001UL'),
+            ('FILE_ATTRIBUTE_FLAG_HIDDEN', '0x00000002UL')])):
+      lines.extend([
+          'enum {0:s}_{1:s}'.format(
+              self._library_name_upper_case, enumeration_name),
+          '{'])
+      for index, (value_name, value) in enumerate(values):
+        separator = ',' if index + 1 < len(values) else ''
+        lines.append('\t{0:s}_{1:s} = {2:s}{3:s}'.format(
+            self._library_name_upper_case, value_name, value, separator))
+      lines.extend(['};', ''])
+
+    self._WriteFile('include/{0:s}/definitions.h.in'.format(
+        self._library_name), lines)
+
+  def _WriteIncludeHeaderSection(self, lines, section_name, functions):
+    """Writes a section of the include header.
+
+    Args:
+      lines (list[str]): lines of the include header.
+      section_name (str): name of the section.
+      functions (list[tuple[str, str, str, list[str]]]): description, return
+          type, name without library prefix and arguments of every function.
+    """
+    lines.extend([
+        self._SECTION_START, ' * {0:s}'.format(section_name),
+        self._SECTION_END, ''])
+
+    for description, return_type, name, arguments in functions:
+      condition = None
+      if name.endswith('_wide'):
+        condition = '{0:s}_HAVE_WIDE_CHARACTER_TYPE'.format(
+            self._library_name_upper_case)
+      elif name.endswith('_file_io_handle'):
+        condition = '{0:s}_HAVE_BFIO'.format(self._library_name_upper_case)
+
+      if condition:
+        lines.extend(['#if defined( {0:s} )'.format(condition), ''])
+
+      lines.extend(['/* {0:s}'.format(description), ' */'])
+      lines.extend(self._FormatFunctionPrototype(
+          return_type, '{0:s}_{1:s}'.format(self._library_name, name),
+          arguments))
+      lines.append('')
+
+      if condition:
+        lines.extend(['#endif', ''])
+
+  def _WriteLibraryHeaderFile(self, type_name, functions, internal_functions):
+    """Writes a library header file.
+
+    Args:
+      type_name (str): name of the type.
+      functions (list[tuple[str, str, str, str, list[str]]]): functions of
+          the type.
+      internal_functions (list[tuple[str, str, str, str, list[str]]]):
+          internal functions of the type.
+    """
+    type_name_upper_case = type_name.upper()
+
+    lines = [
+        '/*',
+        ' * The {0:s} functions'.format(type_name),
+        ' *',
+        ' * Copyright (C) 2010-2018, Joachim Metz <joachim.metz@gmail.com>',
+        ' */',
+        '',
+        '#if !defined( _{0:s}_INTERNAL_{1:s}_H )'.format(
+            self._library_name_upper_case, type_name_upper_case),
+        '#define _{0:s}_INTERNAL_{1:s}_H'.format(
+            self._library_name_upper_case, type_name_upper_case),
+        '',
+        '#include <common.h>',
+        '#include <types.h>',
+        '']
+
+    for header_name in ('extern', 'libcerror', 'libcthreads', 'types'):
+      lines.append('#include "{0:s}_{1:s}.h"'.format(
+          self._library_name, header_name))
+
+    lines.extend([
+        '',
+        '#if defined( __cplusplus )',
+        'extern "C" {',
+        '#endif',
+        '',
+        'typedef struct {0:s}_internal_{1:s} {0:s}_internal_{1:s}_t;'.format(
+            self._library_name, type_name),
+        '',
+        'struct {0:s}_internal_{1:s}'.format(self._library_name, type_name),
+        '{',
+        '\t/* The size',
+        '\t */',
+        '\tsize64_t size;',
+        '',
+        '#if defined( HAVE_{0:s}_MULTI_THREAD_SUPPORT )'.format(
+            self._library_name_upper_case),
+        '\t/* The read/write lock',
+        '\t */',
+        '\tlibcthreads_read_write_lock_t *read_write_lock;',
+        '#endif',
+        '};',
+        ''])
+
+    for _, _, return_type, name, arguments in internal_functions:
+      lines.extend(self._FormatFunctionPrototype(
+          return_type, '{0:s}_internal_{1:s}_{2:s}'.format(
+              self._library_name, type_name, name),
+          arguments, extern=False))
+      lines.append('')
+
+    for _, _, return_type, name, arguments in functions:
+      is_wide = name.endswith('_wide')
+      if is_wide:
+        lines.extend(['#if defined( HAVE_WIDE_CHARACTER_TYPE )', ''])
+
+      lines.extend(self._FormatFunctionPrototype(
+          return_type, '{0:s}_{1:s}_{2:s}'.format(
+              self._library_name, type_name, name),
+          arguments))
+      lines.append('')
+
+      if is_wide:
+        lines.extend([
+            '#endif /* defined( HAVE_WIDE_CHARACTER_TYPE ) */', ''])
+
+    lines.extend([
+        '#if defined( __cplusplus )',
+        '}',
+        '#endif',
+        '',
+        '#endif /* !defined( _{0:s}_INTERNAL_{1:s}_H ) */'.format(
+            self._library_name_upper_case, type_name_upper_case),
+        ''])
+
+    self._WriteFile('{0:s}/{0:s}_{1:s}.h'.format(
+        self._library_name, type_name), lines)
+
+  def _WriteLibrarySourceFile(self, type_name, functions, internal_functions):
+    """Writes a library source file.
+
+    Args:
+      type_name (str): name of the type.
+      functions (list[tuple[str, str, str, str, list[str]]]): functions of
+          the type.
+      internal_functions (list[tuple[str, str, str, str, list[str]]]):
+          internal functions of the type.
+    """
+    lines = [
+        '/*',
+        ' * The {0:s} functions'.format(type_name),
+        ' */',
+        '',
+        '#include <common.h>',
+        '#include <memory.h>',
+        '#include <types.h>',
+        '',
+        '#include "{0:s}_{1:s}.h"'.format(self._library_name, type_name),
+        '']
+
+    for function_prefix, type_functions in (
+        ('{0:s}_internal_{1:s}'.format(self._library_name, type_name),
+         internal_functions),
+        ('{0:s}_{1:s}'.format(self._library_name, type_name), functions)):
+      for (description, return_value_description, return_type, name,
+           arguments) in type_functions:
+        function_name = '{0:s}_{1:s}'.format(function_prefix, name)
+
+        lines.extend([
+            '/* {0:s}'.format(description),
+            ' * Returns {0:s}'.format(return_value_description),
+            ' */'])
+        lines.extend(self._FormatFunctionPrototype(
+            return_type, function_name, arguments, extern=False))
+        lines.extend([
+            '{',
+            '\tstatic char *function = "{0:s}";'.format(function_name),
+            '',
+            '\treturn( 1 );',
+            '}',
+            ''])
+
+    self._WriteFile('{0:s}/{0:s}_{1:s}.c'.format(
+        self._library_name, type_name), lines)
+
+  def _WriteLibrarySources(self):
+    """Writes the library header and source files and Makefile.am."""
+    source_files = [
+        filename.format(library_name=self._library_name)
+        for filename in self._LIBRARY_SOURCE_FILES]
+
+    types = [('file', self._GetFileFunctions())]
+    for type_name, sub_type_name in self._GetTypeNames():
+      types.append((
+          type_name, self._GetTypeFunctions(type_name, sub_type_name)))
+
+    for type_name, functions in types:
+      internal_functions = [
+          ('Reads the {0:s}'.format(type_name),
+           '1 if successful or -1 on error', 'int', 'read_data', [
+               '{0:s}_internal_{1:s}_t *internal_{1:s}'.format(
+                   self._library_name, type_name),
+               'const uint8_t *data', 'size_t data_size'])]
+
+      self._WriteLibraryHeaderFile(type_name, functions, internal_functions)
+      self._WriteLibrarySourceFile(type_name, functions, internal_functions)
+
+      source_files.extend([
+          '{0:s}_{1:s}.c'.format(self._library_name, type_name),
+          '{0:s}_{1:s}.h'.format(self._library_name, type_name)])
+
+    io_handle_functions = [
+        ('Creates an IO handle', '1 if successful or -1 on error', 'int',
+         'initialize', ['{0:s}_io_handle_t **io_handle'.format(
+             self._library_name)]),
+        ('Frees an IO handle', '1 if successful or -1 on error', 'int',
+         'free', ['{0:s}_io_handle_t **io_handle'.format(
+             self._library_name)]),
+        ('Clears the IO handle', '1 if successful or -1 on error', 'int',
+         'clear', ['{0:s}_io_handle_t *io_handle'.format(
+             self._library_name)])]
+
+    lines = [
+        '/*',
+        ' * The IO handle functions',
+        ' */',
+        '',
+        'typedef struct {0:s}_io_handle {0:s}_io_handle_t;'.format(
+            self._library_name),
+        '',
+        'struct {0:s}_io_handle'.format(self._library_name),
+        '{',
+        '\t/* The size',
+        '\t */',
+        '\tsize64_t size;',
+        '};',
+        '']
+    for _, _, return_type, name, arguments in io_handle_functions:
+      lines.extend(self._FormatFunctionPrototype(
+          return_type, '{0:s}_io_handle_{1:s}'.format(
+              self._library_name, name),
+          arguments, extern=False))
+      lines.append('')
+
+    self._WriteFile('{0:s}/{0:s}_io_handle.h'.format(
+        self._library_name), lines)
+
+    lines = ['/*', ' * The IO handle functions', ' */', '']
+    for (description, return_value_description, return_type, name,
+         arguments) in io_handle_functions:
+      lines.extend([
+          '/* {0:s}'.format(description),
+          ' * Returns {0:s}'.format(return_value_description),
+          ' */'])
+      lines.extend(self._FormatFunctionPrototype(
+          return_type, '{0:s}_io_handle_{1:s}'.format(
+              self._library_name, name),
+          arguments, extern=False))
+      lines.extend(['{', '\treturn( 1 );', '}', ''])
+
+    self._WriteFile('{0:s}/{0:s}_io_handle.c'.format(
+        self._library_name), lines)
+
+    for name in ('error', 'notify', 'support'):
+      self._WriteFile('{0:s}/{0:s}_{1:s}.h'.format(
+          self._library_name, name), [
+              '/*',
+              ' * {0:s}'.format(name),
+              ' */',
+              '',
+              'int {0:s}_{1:s}_dummy('.format(self._library_name, name),
+              '     void );',
+              ''])
+
+    for filename in source_files:
+      path = os.path.join(self._project_directory, self._library_name, filename)
+      if not os.path.exists(path):
+        self._WriteFile('{0:s}/{1:s}'.format(self._library_name, filename), [
+            '/*', ' * {0:s}'.format(filename), ' */', ''])
+
+    source_files = sorted(source_files)
+
+    lines = [
+        'AM_CPPFLAGS = \\',
+        '\t-I$(top_srcdir)/include \\',
+        '\t-I$(top_srcdir)/common \\',
+        '\t@LIBCERROR_CPPFLAGS@ \\',
+        '\t@LIBCTHREADS_CPPFLAGS@ \\',
+        '\t@LIBBFIO_CPPFLAGS@ \\',
+        '\t@ZLIB_CPPFLAGS@ \\',
+        '\t@PTHREAD_CPPFLAGS@ \\',
+        '\t@{0:s}_DLL_EXPORT@'.format(self._library_name_upper_case),
+        '',
+        'lib_LTLIBRARIES = {0:s}.la'.format(self._library_name),
+        '',
+        '{0:s}_la_SOURCES = \\'.format(self._library_name)]
+    lines.extend([
+        '\t{0:s} \\'.format(filename) for filename in source_files[:-1]])
+    lines.extend([
+        '\t{0:s}'.format(source_files[-1]),
+        '',
+        '{0:s}_la_LIBADD = \\'.format(self._library_name),
+        '\t@LIBCERROR_LIBADD@ \\',
+        '\t@LIBCTHREADS_LIBADD@ \\',
+        '\t@LIBBFIO_LIBADD@ \\',
+        '\t@ZLIB_LIBADD@ \\',
+        '\t@PTHREAD_LIBADD@',
+        '',
+        '{0:s}_la_LDFLAGS = -no-undefined -version-info 1:0:0'.format(
+            self._library_name),
+        ''])
+
+    self._WriteFile('{0:s}/Makefile.am'.format(self._library_name), lines)
+
+  def _WriteProjectFiles(self):
+    """Writes the project Makefile.am, configure.ac and placeholder files."""
+    self._WriteFile('Makefile.am', [
+        'ACLOCAL_AMFLAGS = -I m4',
+        '',
+        'SUBDIRS = \\',
+        '\tinclude \\',
+        '\tcommon \\',
+        '\tlibcerror \\',
+        '\tlibcthreads \\',
+        '\tlibbfio \\',
+        '\t{0:s} \\'.format(self._library_name),
+        '\tlibcfile \\',
+        '\tlibcpath \\',
+        '\t{0:s}tools \\'.format(self._library_name_suffix),
+        '\tpy{0:s} \\'.format(self._library_name_suffix),
+        '\tpo \\',
+        '\tmanuals \\',
+        '\ttests \\',
+        '\tmsvscpp',
+        ''])
+
+    self._WriteFile('configure.ac', [
+        'AC_INIT(', ' [{0:s}],'.format(self._library_name), ' [20180101])',
+        ''])
+
+    self._WriteFile('{0:s}.spec.in'.format(self._library_name), [
+        'Name: {0:s}'.format(self._library_name), ''])
+
+    # The man page is only generated when it exists and is outdated.
+    self._WriteFile('manuals/{0:s}.3'.format(self._library_name), [
+        '.Dd January  1, 2018',
+        '.Dt {0:s} 3'.format(self._library_name),
+        '.Os {0:s}'.format(self._library_name),
+        '.Sh NAME',
+        '.Nm {0:s}.h'.format(self._library_name),
+        '.Nd Outdated library description',
+        ''])
+
+    for path in self._PLACEHOLDER_FILES:
+      path = path.format(
+          library_name=self._library_name, suffix=self._library_name_suffix)
+      self._WriteFile(path, [])
+
+    for path in self._DIRECTORIES:
+      path = os.path.join(self._project_directory, *path.split('/'))
+      if not os.path.exists(path):
+        os.makedirs(path)
+
+  def Write(self, projects_directory):
+    """Writes the synthetic project.
+
+    Args:
+      projects_directory (str): path of the projects directory, in which
+          the project directory is created.
+
+    Returns:
+      str: path of the project directory.
+    """
+    self._project_directory = os.path.join(
+        projects_directory, self._library_name)
+
+    self._WriteConfigurationFile()
+    self._WriteIncludeHeaders()
+    self._WriteLibrarySources()
+    self._WriteProjectFiles()
+
+    return self._project_directory
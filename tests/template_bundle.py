@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Tests for the template bundle."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import template_bundle
+
+from tests import test_lib
+
+
+class TemplateBundleTest(test_lib.BaseTestCase):
+  """Template bundle tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    self._source_directory = os.path.join(self._temporary_directory, 'source')
+    os.makedirs(os.path.join(self._source_directory, 'libyal'))
+
+    self._WriteFile(os.path.join('libyal', 'libyal.c'), b'int ${name};\r\n')
+    self._WriteFile(os.path.join('libyal', 'libyal.h'), b'')
+    self._WriteFile('Makefile.am', b'SUBDIRS = ${subdirs}\n')
+
+    self._bundle_path = os.path.join(self._temporary_directory, 'bundle')
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _WriteFile(self, relative_path, data):
+    """Writes a template file.
+
+    Args:
+      relative_path (str): path of the template file relative to the source
+          directory.
+      data (bytes): template file data.
+    """
+    path = os.path.join(self._source_directory, relative_path)
+    with io.open(path, 'wb') as file_object:
+      file_object.write(data)
+
+  def testGetContentHash(self):
+    """Tests the GetContentHash function."""
+    content_hash = template_bundle.GetContentHash(self._source_directory)
+    self.assertEqual(len(content_hash), 64)
+
+    self._WriteFile('Makefile.am', b'SUBDIRS = ${subdirs} \n')
+
+    self.assertNotEqual(
+        template_bundle.GetContentHash(self._source_directory), content_hash)
+
+  def testOpen(self):
+    """Tests the Open function."""
+    content_hash = template_bundle.WriteTemplateBundle(
+        self._bundle_path, self._source_directory)
+    self.assertEqual(
+        content_hash, template_bundle.GetContentHash(self._source_directory))
+
+    bundle = template_bundle.TemplateBundle()
+    self.assertFalse(bundle.IsOpen())
+
+    bundle.Open(self._bundle_path, self._source_directory)
+    try:
+      self.assertTrue(bundle.IsOpen())
+      self.assertEqual(bundle.content_hash, content_hash)
+
+      path = os.path.join(self._source_directory, 'libyal', 'libyal.c')
+      self.assertTrue(bundle.HasFile(path))
+      self.assertEqual(bundle.GetFileData(path), b'int ${name};\r\n')
+
+      path = os.path.join(self._source_directory, 'libyal', 'libyal.h')
+      self.assertEqual(bundle.GetFileData(path), b'')
+
+      path = os.path.join(self._source_directory, 'libyal', 'bogus.c')
+      self.assertFalse(bundle.HasFile(path))
+      self.assertIsNone(bundle.GetFileData(path))
+
+      path = os.path.join(self._temporary_directory, 'Makefile.am')
+      self.assertFalse(bundle.HasFile(path))
+      self.assertIsNone(bundle.GetFileData(path))
+
+      self.assertEqual(
+          bundle.GetDirectoryEntries(self._source_directory), ['Makefile.am'])
+      self.assertEqual(
+          bundle.GetDirectoryEntries(
+              os.path.join(self._source_directory, 'libyal')),
+          ['libyal.c', 'libyal.h'])
+      self.assertEqual(
+          bundle.GetDirectoryEntries(
+              os.path.join(self._source_directory, 'bogus')), [])
+      self.assertIsNone(bundle.GetDirectoryEntries(self._temporary_directory))
+
+    finally:
+      bundle.Close()
+
+    self.assertFalse(bundle.IsOpen())
+
+  def testOpenWithoutSourceDirectory(self):
+    """Tests the Open function without the source directory."""
+    content_hash = template_bundle.WriteTemplateBundle(
+        self._bundle_path, self._source_directory)
+
+    shutil.rmtree(self._source_directory)
+
+    bundle = template_bundle.TemplateBundle()
+    bundle.Open(self._bundle_path, self._source_directory)
+    try:
+      self.assertEqual(bundle.content_hash, content_hash)
+
+      path = os.path.join(self._source_directory, 'libyal', 'libyal.c')
+      self.assertEqual(bundle.GetFileData(path), b'int ${name};\r\n')
+
+      self.assertEqual(
+          bundle.GetDirectoryEntries(
+              os.path.join(self._source_directory, 'libyal')),
+          ['libyal.c', 'libyal.h'])
+
+    finally:
+      bundle.Close()
+
+  def testOpenWithUnsupportedSignature(self):
+    """Tests the Open function with an unsupported signature."""
+    with io.open(self._bundle_path, 'wb') as file_object:
+      file_object.write(b'YALTMPL\x00\x00\x00\x00\x00')
+
+    bundle = template_bundle.TemplateBundle()
+    with self.assertRaises(IOError):
+      bundle.Open(self._bundle_path, self._source_directory)
+
+    self.assertFalse(bundle.IsOpen())
+
+
+if __name__ == '__main__':
+  unittest.main()
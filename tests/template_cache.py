@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Tests for the template cache."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import template_cache
+
+from tests import test_lib
+
+
+class TemplateCacheTest(test_lib.BaseTestCase):
+  """Template cache tests."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def _WriteTemplateFile(self, filename, data):
+    """Writes a template file.
+
+    Args:
+      filename (str): name of the template file.
+      data (bytes): template file data.
+
+    Returns:
+      str: path of the template file.
+    """
+    path = os.path.join(self._temporary_directory, filename)
+    with io.open(path, 'wb') as file_object:
+      file_object.write(data)
+
+    return path
+
+  def testGetTemplate(self):
+    """Tests the GetTemplate function."""
+    test_cache = template_cache.TemplateCache()
+
+    path = self._WriteTemplateFile('test.c', b'int ${name};\r\n')
+
+    template_string = test_cache.GetTemplate(path)
+    self.assertEqual(
+        template_string.substitute({'name': 'value'}), 'int value;\r\n')
+    self.assertEqual(test_cache.hits, 0)
+    self.assertEqual(test_cache.misses, 1)
+
+    cached_template_string = test_cache.GetTemplate(path)
+    self.assertIs(cached_template_string, template_string)
+    self.assertEqual(test_cache.hits, 1)
+    self.assertEqual(test_cache.misses, 1)
+
+    template_string = test_cache.GetTemplate(path, universal_newlines=True)
+    self.assertEqual(
+        template_string.substitute({'name': 'value'}), 'int value;\n')
+    self.assertEqual(test_cache.misses, 2)
+
+    # A change in size invalidates the cached template.
+    self._WriteTemplateFile('test.c', b'long ${name};\n')
+
+    template_string = test_cache.GetTemplate(path)
+    self.assertEqual(
+        template_string.substitute({'name': 'value'}), 'long value;\n')
+    self.assertEqual(test_cache.misses, 3)
+
+  def testGetTemplateEviction(self):
+    """Tests the GetTemplate function with least recently used eviction."""
+    test_cache = template_cache.TemplateCache(maximum_number_of_templates=2)
+
+    path1 = self._WriteTemplateFile('test1.c', b'1')
+    path2 = self._WriteTemplateFile('test2.c', b'2')
+    path3 = self._WriteTemplateFile('test3.c', b'3')
+
+    test_cache.GetTemplate(path1)
+    test_cache.GetTemplate(path2)
+    test_cache.GetTemplate(path1)
+    test_cache.GetTemplate(path3)
+
+    self.assertEqual(len(test_cache), 2)
+    self.assertEqual(test_cache.evictions, 1)
+
+    # The least recently used template is path2.
+    test_cache.GetTemplate(path1)
+    self.assertEqual(test_cache.hits, 2)
+
+    test_cache.GetTemplate(path2)
+    self.assertEqual(test_cache.misses, 4)
+
+  def testGetStatistics(self):
+    """Tests the GetStatistics function."""
+    test_cache = template_cache.TemplateCache()
+
+    path = self._WriteTemplateFile('test.c', b'test')
+    test_cache.GetTemplate(path)
+    test_cache.GetTemplate(path)
+
+    expected_statistics = {
+        'evictions': 0,
+        'hits': 1,
+        'misses': 1,
+        'number_of_templates': 1}
+
+    self.assertEqual(test_cache.GetStatistics(), expected_statistics)
+
+    test_cache.Empty()
+    self.assertEqual(len(test_cache), 0)
+    self.assertEqual(test_cache.hits, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Tests for the template index."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from yaldevtools import template_index
+
+from tests import test_lib
+
+
+class TemplateIndexTest(test_lib.BaseTestCase):
+  """Template index tests."""
+
+  _TEMPLATE_FILENAMES = [
+      'function-body-get_value-with_index.c',
+      'function-body-get_value-with_is_set.c',
+      'function-body-get_value.c',
+      'get_string_value-with_none.c',
+      'get_string_value.c']
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+    for filename in self._TEMPLATE_FILENAMES:
+      path = os.path.join(self._temporary_directory, filename)
+      with io.open(path, 'wb') as file_object:
+        file_object.write(b'')
+
+    os.mkdir(os.path.join(self._temporary_directory, 'directory.c'))
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temporary_directory, True)
+
+  def testGetTemplateFilename(self):
+    """Tests the GetTemplateFilename function."""
+    test_index = template_index.TemplateIndex()
+
+    filename = test_index.GetTemplateFilename(
+        self._temporary_directory, 'get_string_value.c')
+    self.assertEqual(filename, 'get_string_value.c')
+
+    filename = test_index.GetTemplateFilename(
+        self._temporary_directory, 'get_string_value.c', variants=['none'])
+    self.assertEqual(filename, 'get_string_value-with_none.c')
+
+    filename = test_index.GetTemplateFilename(
+        self._temporary_directory, 'get_string_value.c',
+        variants=['type_object'])
+    self.assertIsNone(filename)
+
+    filename = test_index.GetTemplateFilename(
+        self._temporary_directory, 'function-body-get_value-with_index.c')
+    self.assertEqual(filename, 'function-body-get_value-with_index.c')
+
+    filename = test_index.GetTemplateFilename(
+        self._temporary_directory, 'function-body-get_value-with_index.c',
+        variants=['is_set'])
+    self.assertIsNone(filename)
+
+    filename = test_index.GetTemplateFilename(
+        self._temporary_directory, 'directory.c')
+    self.assertIsNone(filename)
+
+    self.assertEqual(test_index.GetLookedUpPaths(), set([
+        os.path.join(self._temporary_directory, 'get_string_value.c'),
+        os.path.join(self._temporary_directory, 'get_string_value-with_none.c'),
+        os.path.join(
+            self._temporary_directory,
+            'function-body-get_value-with_index.c')]))
+
+  def testGetTemplatePaths(self):
+    """Tests the GetTemplatePaths function."""
+    test_index = template_index.TemplateIndex()
+
+    template_paths = test_index.GetTemplatePaths(self._temporary_directory)
+    self.assertEqual(template_paths, [
+        os.path.join(self._temporary_directory, filename)
+        for filename in self._TEMPLATE_FILENAMES])
+
+  def testHasTemplate(self):
+    """Tests the HasTemplate function."""
+    test_index = template_index.TemplateIndex()
+
+    path = os.path.join(self._temporary_directory, 'get_string_value.c')
+    self.assertTrue(test_index.HasTemplate(path))
+
+    path = os.path.join(self._temporary_directory, 'get_guid_value.c')
+    self.assertFalse(test_index.HasTemplate(path))
+
+    path = os.path.join(self._temporary_directory, 'directory.c')
+    self.assertFalse(test_index.HasTemplate(path))
+
+    path = os.path.join(self._temporary_directory, 'bogus', 'test.c')
+    self.assertFalse(test_index.HasTemplate(path))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Compiled template string."""
+
+from __future__ import unicode_literals
+
+import string
+
+
+class CompiledTemplate(string.Template):
+  """Compiled template string.
+
+  The template string is scanned once into a list of literal segments and
+  placeholder slots, such that substitution only requires to look up the
+  mapped values and join them with the literal segments. The placeholder
+  syntax is that of string.Template.
+
+  Attributes:
+    identifiers (list[str]): names of the template variables in order of
+        first occurrence.
+  """
+
+  def __init__(self, template):
+    """Initializes a compiled template string.
+
+    Args:
+      template (str): template string.
+    """
+    super(CompiledTemplate, self).__init__(template)
+    self._invalid_placeholder_offset = None
+    self._segments = []
+    self._slot_identifiers = []
+    self.identifiers = []
+
+    self._Compile()
+
+  def _Compile(self):
+    """Compiles the template string into segments and slots."""
+    identifiers = set()
+    literal_segment = []
+    template_offset = 0
+
+    for match in self.pattern.finditer(self.template):
+      literal_segment.append(self.template[template_offset:match.start()])
+      template_offset = match.end()
+
+      identifier = match.group('named') or match.group('braced')
+      if identifier is not None:
+        self._segments.append(''.join(literal_segment))
+        self._segments.append(None)
+        self._slot_identifiers.append(identifier)
+        literal_segment = []
+
+        if identifier not in identifiers:
+          identifiers.add(identifier)
+          self.identifiers.append(identifier)
+
+      elif match.group('escaped') is not None:
+        literal_segment.append(self.delimiter)
+
+      elif self._invalid_placeholder_offset is None:
+        self._invalid_placeholder_offset = match.start('invalid')
+
+    literal_segment.append(self.template[template_offset:])
+    self._segments.append(''.join(literal_segment))
+
+  def _RaiseInvalidPlaceholder(self):
+    """Raises an error for the first invalid placeholder.
+
+    Raises:
+      ValueError: always.
+    """
+    lines = self.template[:self._invalid_placeholder_offset].splitlines(True)
+    if not lines:
+      column_number = 1
+      line_number = 1
+    else:
+      column_number = (
+          self._invalid_placeholder_offset - len(''.join(lines[:-1])))
+      line_number = len(lines)
+
+    raise ValueError(
+        'Invalid placeholder in string: line {0:d}, col {1:d}'.format(
+            line_number, column_number))
+
+  def GetMissingIdentifiers(self, mapping):
+    """Retrieves the names of the template variables without a mapping.
+
+    Args:
+      mapping (dict[str, object]): template mappings, where the key maps to
+          the name of a template variable.
+
+    Returns:
+      list[str]: names of the template variables that are not in the mapping.
+    """
+    return [
+        identifier for identifier in self.identifiers
+        if identifier not in mapping]
+
+  def substitute(self, *args, **kwargs):  # pylint: disable=arguments-differ
+    """Substitutes the template variables.
+
+    Args:
+      args (list[dict[str, object]]): optional template mappings, where
+          the key maps to the name of a template variable.
+      kwargs (dict[str, object]): template mappings that override those in
+          args.
+
+    Returns:
+      str: template string with the template variables substituted.
+
+    Raises:
+      KeyError: if one or more template variables have no mapping, where
+          the names of all of them are reported.
+      TypeError: if more than one positional argument is passed.
+      ValueError: if the template string contains an invalid placeholder.
+    """
+    if len(args) > 1:
+      raise TypeError('Too many positional arguments')
+
+    mapping = args[0] if args else {}
+    if kwargs:
+      mapping = dict(mapping, **kwargs)
+
+    if self._invalid_placeholder_offset is not None:
+      self._RaiseInvalidPlaceholder()
+
+    try:
+      values = [mapping[identifier] for identifier in self._slot_identifiers]
+    except KeyError:
+      raise KeyError(', '.join(self.GetMissingIdentifiers(mapping)))
+
+    segments = list(self._segments)
+    segments[1::2] = values
+
+    try:
+      return ''.join(segments)
+
+    except TypeError:
+      segments[1::2] = ['%s' % (value, ) for value in values]
+      return ''.join(segments)
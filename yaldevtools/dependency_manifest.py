@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""Dependency manifest of generated source files."""
+
+from __future__ import unicode_literals
+
+import datetime
+import hashlib
+import io
+import json
+import os
+import time
+
+
+class DependencyManifest(object):
+  """Dependency manifest of generated source files.
+
+  The manifest records, per source generator category, every output file
+  with the templates it was derived from, the input files the generator read,
+  the names of the entries in the input directories the generator listed,
+  the configuration values and the source generator code, together with their
+  content hashes. A category is up to date when none of these changed since
+  it was last generated.
+
+  Templates are stored relative to the templates directory and the input and
+  output files relative to the project directory. Since the names of all files
+  in the template directory of a category are recorded, adding, removing or
+  renaming a template causes the category to be regenerated.
+  """
+
+  _FORMAT_VERSION = 2
+
+  # Template variables of which the value depends on the current year.
+  _YEAR_VARIABLES = ('${copyright}', '${python_module_copyright}')
+
+  # Template variables of which the value depends on the current day.
+  _DAY_VARIABLES = ('${library_version}',)
+
+  def __init__(self, path, project_directory, templates_directory):
+    """Initializes a dependency manifest.
+
+    Args:
+      path (str): path of the manifest file.
+      project_directory (str): path of the project directory.
+      templates_directory (str): path of the templates directory.
+    """
+    super(DependencyManifest, self).__init__()
+    self._categories = {}
+    self._file_hashes = {}
+    self._path = path
+    self._project_directory = os.path.abspath(project_directory)
+    self._templates_directory = os.path.abspath(templates_directory)
+
+  def _GetCurrentDay(self):
+    """Retrieves the current day as used by the template mappings.
+
+    Returns:
+      str: current day, formatted as YYYYMMDD.
+    """
+    return time.strftime('%Y%m%d', time.gmtime())
+
+  def _GetCurrentYear(self):
+    """Retrieves the current year as used by the template mappings.
+
+    Returns:
+      str: current year.
+    """
+    return '{0:d}'.format(datetime.date.today().year)
+
+  def _GetDateValues(self, template_paths):
+    """Retrieves the date values the templates depend on.
+
+    Args:
+      template_paths (list[str]): paths of the templates.
+
+    Returns:
+      list[str]: current year and day, where the year or day is None if none
+          of the templates depends on it.
+    """
+    uses_year = False
+    uses_day = False
+    for template_path in template_paths:
+      try:
+        with io.open(template_path, 'r', encoding='utf8') as file_object:
+          template_data = file_object.read()
+      except IOError:
+        continue
+
+      if not uses_year:
+        uses_year = any(
+            variable in template_data for variable in self._YEAR_VARIABLES)
+      if not uses_day:
+        uses_day = any(
+            variable in template_data for variable in self._DAY_VARIABLES)
+
+    return [
+        self._GetCurrentYear() if uses_year else None,
+        self._GetCurrentDay() if uses_day else None]
+
+  def _GetDirectoryListingHash(self, path, recursive=False):
+    """Calculates a hash of the names of the files in a directory.
+
+    Args:
+      path (str): path of the directory.
+      recursive (Optional[bool]): True if the names of files in sub
+          directories should be included.
+
+    Returns:
+      str: hexadecimal SHA-1 of the file names or None if the directory
+          does not exist.
+    """
+    if not os.path.isdir(path):
+      return None
+
+    if recursive:
+      names = []
+      for directory_path, _, filenames in os.walk(path):
+        relative_path = os.path.relpath(directory_path, path)
+        names.extend([
+            os.path.normpath(os.path.join(relative_path, filename))
+            for filename in filenames])
+    else:
+      names = os.listdir(path)
+
+    return self._GetDirectoryNamesHash(path, names)
+
+  def _GetDirectoryNamesHash(self, path, names):
+    """Calculates a hash of the names of the files in a directory.
+
+    Args:
+      path (str): path of the directory.
+      names (list[str]): names of the files in the directory, relative to
+          the directory, or None if the directory does not exist.
+
+    Returns:
+      str: hexadecimal SHA-1 of the file names or None if the directory
+          does not exist.
+    """
+    if names is None:
+      return None
+
+    # Ignore the manifest file itself.
+    manifest_path = os.path.abspath(self._path)
+    names = [
+        name for name in names
+        if os.path.abspath(os.path.join(path, name)) != manifest_path]
+
+    names_data = '\n'.join(sorted(names)).encode('utf8')
+    return hashlib.sha1(names_data).hexdigest()
+
+  def _GetFileHash(self, path):
+    """Calculates the hash of the content of a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      str: hexadecimal SHA-1 of the file content or None if the file does
+          not exist.
+    """
+    if path not in self._file_hashes:
+      file_hash = None
+      if os.path.isfile(path):
+        with io.open(path, 'rb') as file_object:
+          file_hash = hashlib.sha1(file_object.read()).hexdigest()
+
+      self._file_hashes[path] = file_hash
+
+    return self._file_hashes[path]
+
+  def _GetProjectPath(self, path):
+    """Retrieves a path relative to the project directory.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      str: path relative to the project directory.
+    """
+    path = os.path.abspath(path)
+    return os.path.relpath(path, self._project_directory)
+
+  def _GetTemplatePath(self, path):
+    """Retrieves a path relative to the templates directory.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      str: path relative to the templates directory.
+    """
+    path = os.path.abspath(path)
+    return os.path.relpath(path, self._templates_directory)
+
+  def IsUpToDate(
+      self, category, template_directory, code_hash, configuration_hash):
+    """Determines if the generated files of a category are up to date.
+
+    Args:
+      category (str): source generator category.
+      template_directory (str): path of the template directory of the
+          category.
+      code_hash (str): hash of the source generator code.
+      configuration_hash (str): hash of the configuration values.
+
+    Returns:
+      bool: True if none of the dependencies of the category changed since
+          it was last generated.
+    """
+    record = self._categories.get(category, None)
+    if not record:
+      return False
+
+    if (record['code'] != code_hash or
+        record['configuration'] != configuration_hash):
+      return False
+
+    year, day = record['date']
+    if year and year != self._GetCurrentYear():
+      return False
+
+    if day and day != self._GetCurrentDay():
+      return False
+
+    if record['template_directory'] != self._GetDirectoryListingHash(
+        template_directory, recursive=True):
+      return False
+
+    for template_path, template_hash in record['templates']:
+      template_path = os.path.join(self._templates_directory, template_path)
+      if self._GetFileHash(template_path) != template_hash:
+        return False
+
+    for path, file_hash in record['inputs'].items():
+      path = os.path.join(self._project_directory, path)
+      if self._GetFileHash(path) != file_hash:
+        return False
+
+    for path, listing_hash in record['input_directories'].items():
+      path = os.path.join(self._project_directory, path)
+      if self._GetDirectoryListingHash(path) != listing_hash:
+        return False
+
+    for path, (file_hash, _) in record['outputs'].items():
+      path = os.path.join(self._project_directory, path)
+      if self._GetFileHash(path) != file_hash:
+        return False
+
+    for path, listing_hash in record['output_directories'].items():
+      path = os.path.join(self._project_directory, path)
+      if self._GetDirectoryListingHash(path) != listing_hash:
+        return False
+
+    return True
+
+  def ReadFromFile(self):
+    """Reads the manifest from file.
+
+    A missing manifest file or a manifest of an unsupported format results in
+    an empty manifest.
+    """
+    self._categories = {}
+
+    if not os.path.exists(self._path):
+      return
+
+    try:
+      with io.open(self._path, 'r', encoding='utf8') as file_object:
+        manifest = json.load(file_object)
+    except (IOError, ValueError):
+      return
+
+    if manifest.get('format_version', None) == self._FORMAT_VERSION:
+      self._categories = manifest.get('categories', {})
+
+  def SetCategory(
+      self, category, template_directory, code_hash, configuration_hash,
+      input_files, output_templates, input_directories=None):
+    """Sets the dependencies of the generated files of a category.
+
+    The hashes of the files are determined from their current content, hence
+    this should be called after the category was generated. The hashes of
+    the input directories are determined from the names of their entries at
+    the time the source generator listed them, since the directories can be
+    changed by the source generators of other categories.
+
+    Args:
+      category (str): source generator category.
+      template_directory (str): path of the template directory of the
+          category.
+      code_hash (str): hash of the source generator code.
+      configuration_hash (str): hash of the configuration values.
+      input_files (list[str]): paths of the input files read by the source
+          generator.
+      output_templates (dict[str, list[str]]): paths of the templates per
+          path of output file written by the source generator.
+      input_directories (Optional[dict[str, list[str]]]): names of the
+          entries per path of input directory listed by the source generator,
+          where None represents a directory that does not exist.
+    """
+    # The hashes of files written during generation are no longer valid.
+    self._file_hashes = {}
+
+    template_paths = sorted(set([
+        template_path for template_paths in output_templates.values()
+        for template_path in template_paths]))
+    template_indexes = {
+        template_path: index
+        for index, template_path in enumerate(template_paths)}
+
+    outputs = {}
+    output_directories = {}
+    for output_path, output_template_paths in output_templates.items():
+      output_directory = os.path.dirname(output_path) or '.'
+      relative_output_directory = self._GetProjectPath(output_directory)
+      if relative_output_directory not in output_directories:
+        output_directories[relative_output_directory] = (
+            self._GetDirectoryListingHash(output_directory))
+
+      outputs[self._GetProjectPath(output_path)] = [
+          self._GetFileHash(output_path),
+          sorted([
+              template_indexes[template_path]
+              for template_path in output_template_paths])]
+
+    self._categories[category] = {
+        'code': code_hash,
+        'configuration': configuration_hash,
+        'date': self._GetDateValues(template_paths),
+        'input_directories': {
+            self._GetProjectPath(path): self._GetDirectoryNamesHash(
+                path, names)
+            for path, names in (input_directories or {}).items()},
+        'inputs': {
+            self._GetProjectPath(path): self._GetFileHash(path)
+            for path in input_files},
+        'output_directories': output_directories,
+        'outputs': outputs,
+        'template_directory': self._GetDirectoryListingHash(
+            template_directory, recursive=True),
+        'templates': [
+            [self._GetTemplatePath(template_path),
+             self._GetFileHash(template_path)]
+            for template_path in template_paths]}
+
+  def WriteToFile(self):
+    """Writes the manifest to file."""
+    manifest = {
+        'categories': self._categories,
+        'format_version': self._FORMAT_VERSION}
+
+    manifest_data = json.dumps(manifest, separators=(',', ':'), sort_keys=True)
+
+    with io.open(self._path, 'w', encoding='utf8') as file_object:
+      file_object.write('{0:s}\n'.format(manifest_data))
+
+
+def GetCodeHash(directory):
+  """Calculates a hash of the Python code in a directory.
+
+  Args:
+    directory (str): path of the directory.
+
+  Returns:
+    str: hexadecimal SHA-1 of the Python code.
+  """
+  sha1_context = hashlib.sha1()
+  for directory_path, directory_names, filenames in os.walk(directory):
+    directory_names.sort()
+    for filename in sorted(filenames):
+      if not filename.endswith('.py'):
+        continue
+
+      path = os.path.join(directory_path, filename)
+      sha1_context.update(os.path.relpath(path, directory).encode('utf8'))
+      with io.open(path, 'rb') as file_object:
+        sha1_context.update(file_object.read())
+
+  return sha1_context.hexdigest()
+
+
+def GetConfigurationHash(project_configuration):
+  """Calculates a hash of the values of a project configuration.
+
+  Args:
+    project_configuration (ProjectConfiguration): project configuration.
+
+  Returns:
+    str: hexadecimal SHA-1 of the configuration values.
+  """
+  configuration_values = {
+      name: value for name, value in vars(project_configuration).items()
+      if name != '_configuration_file_path' and not name.startswith('_has_')}
+
+  # Values that depend on the presence of directories in the project.
+  for name in (
+      'HasDpkg', 'HasDotNetBindings', 'HasJavaBindings', 'HasPythonModule',
+      'HasRpm', 'HasTests', 'HasTools'):
+    configuration_values[name] = getattr(project_configuration, name)()
+
+  configuration_data = json.dumps(
+      configuration_values, default=vars, sort_keys=True).encode('utf8')
+  return hashlib.sha1(configuration_data).hexdigest()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""File overlay."""
+
+from __future__ import unicode_literals
+
+import io
+import os
+
+
+class FileOverlay(object):
+  """File overlay.
+
+  A file overlay contains the data of files that were generated but not
+  written, such as the output records of a source generator category. The
+  source generators of later categories read these files from the overlay
+  instead of from disk, the same way as if the files were written.
+  """
+
+  def __init__(self):
+    """Initializes a file overlay."""
+    super(FileOverlay, self).__init__()
+    self._files = {}
+
+  def Empty(self):
+    """Empties the file overlay."""
+    self._files = {}
+
+  def Exists(self, path):
+    """Determines if a file exists in the file overlay or on disk.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      bool: True if the file exists.
+    """
+    if os.path.abspath(path) in self._files:
+      return True
+
+    return os.path.exists(path)
+
+  def GetFileData(self, path):
+    """Retrieves the data of a file in the file overlay.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      str: data of the file or None if the file is not in the file overlay.
+    """
+    if not self._files:
+      return None
+
+    return self._files.get(os.path.abspath(path), None)
+
+  def Open(self, path):
+    """Opens a file in the file overlay or on disk for reading.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      file: text file-like object of the file.
+
+    Raises:
+      IOError: if the file cannot be opened.
+      OSError: if the file cannot be opened.
+    """
+    file_data = self.GetFileData(path)
+    if file_data is None:
+      return io.open(path, 'r', encoding='utf8')
+
+    return io.StringIO(file_data, newline=None)
+
+  def SetFileData(self, path, file_data):
+    """Sets the data of a file in the file overlay.
+
+    Args:
+      path (str): path of the file.
+      file_data (str): data of the file.
+    """
+    self._files[os.path.abspath(path)] = file_data
+
+
+FILE_OVERLAY = FileOverlay()
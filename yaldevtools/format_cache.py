@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""Cache of formatted source files."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+
+class FormatCache(object):
+  """Cache of formatted source files.
+
+  The cache maps the absolute path of a source file to the hash of its content
+  and the version of the source formatter, when the source file was known to
+  be formatted. A source file of which the content and the source formatter
+  did not change since does not need to be formatted again.
+
+  The cache is kept in memory and, when a cache path is set, on disk so that
+  it is shared across runs.
+  """
+
+  _FORMAT_VERSION = 1
+
+  def __init__(self, path=None):
+    """Initializes a format cache.
+
+    Args:
+      path (Optional[str]): path of the cache file, where None represents
+          the cache is only kept in memory.
+    """
+    super(FormatCache, self).__init__()
+    self._formatted_files = {}
+    self._path = path
+
+  def GetFileHash(self, path):
+    """Calculates the hash of the content of a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      str: hexadecimal SHA-1 of the content of the file or None if the file
+          cannot be read.
+    """
+    try:
+      with io.open(path, 'rb') as file_object:
+        return hashlib.sha1(file_object.read()).hexdigest()
+
+    except (IOError, OSError):
+      return None
+
+  def IsFormatted(self, path, file_hash):
+    """Determines if a source file is known to be formatted.
+
+    Args:
+      path (str): path of the source file.
+      file_hash (str): hash of the content of the source file.
+
+    Returns:
+      bool: True if the source file, with the content, is known to be
+          formatted by the current version of the source formatter.
+    """
+    if not file_hash:
+      return False
+
+    return self._formatted_files.get(os.path.abspath(path), None) == [
+        file_hash, FORMATTER_CODE_HASH]
+
+  def ReadFromFile(self):
+    """Reads the cache from file.
+
+    A missing cache file or a cache of an unsupported format results in an
+    empty cache.
+    """
+    self._formatted_files = {}
+
+    if not self._path or not os.path.exists(self._path):
+      return
+
+    try:
+      with io.open(self._path, 'r', encoding='utf8') as file_object:
+        cache = json.load(file_object)
+    except (IOError, ValueError):
+      return
+
+    if cache.get('format_version', None) == self._FORMAT_VERSION:
+      self._formatted_files = cache.get('formatted_files', {})
+
+  def SetFormatted(self, path, file_hash):
+    """Sets a source file as formatted.
+
+    Args:
+      path (str): path of the source file.
+      file_hash (str): hash of the formatted content of the source file.
+    """
+    if file_hash:
+      self._formatted_files[os.path.abspath(path)] = [
+          file_hash, FORMATTER_CODE_HASH]
+
+  def WriteToFile(self):
+    """Writes the cache to file.
+
+    The cache is written to a temporary file that is renamed, such that
+    concurrent readers never see a partially written cache file. Failing to
+    write the cache file is not considered an error.
+    """
+    if not self._path:
+      return
+
+    cache = {
+        'format_version': self._FORMAT_VERSION,
+        'formatted_files': self._formatted_files}
+
+    cache_data = json.dumps(cache, separators=(',', ':'), sort_keys=True)
+
+    directory = os.path.dirname(os.path.abspath(self._path))
+
+    try:
+      if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+      file_descriptor, temporary_path = tempfile.mkstemp(
+          dir=directory, prefix='.{0:s}.'.format(os.path.basename(self._path)))
+
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        file_object.write('{0:s}\n'.format(cache_data).encode('utf8'))
+
+      if os.name == 'nt' and os.path.exists(self._path):
+        # On Windows rename does not replace an existing file.
+        os.remove(self._path)
+
+      os.rename(temporary_path, self._path)
+
+    except (IOError, OSError):
+      return
+
+
+def GetDefaultPath():
+  """Retrieves the default path of the cache file.
+
+  Returns:
+    str: default path of the cache file.
+  """
+  cache_directory = os.environ.get('XDG_CACHE_HOME', None)
+  if not cache_directory:
+    cache_directory = os.path.join(os.path.expanduser('~'), '.cache')
+
+  return os.path.join(cache_directory, 'yaldevtools', 'format.json')
+
+
+def _GetFormatterCodeHash():
+  """Calculates a hash of the code of the source formatter.
+
+  Cached source files are formatted again when the source formatter changes.
+
+  Returns:
+    str: hexadecimal SHA-1 of the code.
+  """
+  directory = os.path.dirname(os.path.abspath(__file__))
+
+  sha1_context = hashlib.sha1()
+  for filename in ('source_formatter.py', 'source_formatting.py'):
+    path = os.path.join(directory, filename)
+    try:
+      with io.open(path, 'rb') as file_object:
+        sha1_context.update(file_object.read())
+    except IOError:
+      pass
+
+  return sha1_context.hexdigest()
+
+
+FORMATTER_CODE_HASH = _GetFormatterCodeHash()
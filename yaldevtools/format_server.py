@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Source formatter server.
+
+The server reads JSON-RPC 2.0 requests, one JSON object per line, and writes
+a JSON-RPC 2.0 response, one JSON object per line, for every request that has
+an identifier. This allows editors to format buffers without starting a
+Python interpreter for every buffer.
+
+Supported methods:
+  format: formats a buffer, with the parameters:
+    text (str): text of the buffer, of which the line endings are normalized
+        to "\n".
+    line_ranges (Optional[list[list[int]]]): first and last line number,
+        starting with 1, of the ranges of lines to format, where all lines
+        are formatted by default.
+    edits (Optional[bool]): True to return the edits that format the buffer
+        instead of the formatted text.
+  shutdown: stops the server.
+"""
+
+from __future__ import unicode_literals
+
+import difflib
+import json
+
+from yaldevtools import source_formatter
+
+
+class FormatServer(object):
+  """Source formatter server."""
+
+  _ERROR_INVALID_PARAMS = -32602
+  _ERROR_INVALID_REQUEST = -32600
+  _ERROR_METHOD_NOT_FOUND = -32601
+  _ERROR_PARSE = -32700
+
+  def __init__(self):
+    """Initializes a source formatter server."""
+    super(FormatServer, self).__init__()
+    self._formatter = source_formatter.SourceFormatter()
+    self._is_running = False
+
+  def _CreateErrorResponse(self, identifier, code, message):
+    """Creates an error response.
+
+    Args:
+      identifier (object): identifier of the request.
+      code (int): JSON-RPC error code.
+      message (str): error message.
+
+    Returns:
+      dict[str, object]: error response.
+    """
+    return {
+        'error': {'code': code, 'message': message},
+        'id': identifier,
+        'jsonrpc': '2.0'}
+
+  def _Format(self, params):
+    """Formats a buffer.
+
+    Args:
+      params (dict[str, object]): parameters of the format method.
+
+    Returns:
+      dict[str, object]: formatted text of the buffer or edits that format
+          the buffer.
+
+    Raises:
+      ValueError: if the parameters are not supported.
+    """
+    text = params.get('text', None)
+    if not isinstance(text, type('')):
+      raise ValueError('Missing or unsupported text.')
+
+    line_ranges = params.get('line_ranges', None)
+    if line_ranges is not None:
+      try:
+        line_ranges = [
+            (int(first_line_number), int(last_line_number))
+            for first_line_number, last_line_number in line_ranges]
+      except (TypeError, ValueError):
+        raise ValueError('Unsupported line ranges.')
+
+    # Lines of the formatted text are separated by "\n" regardless of the line
+    # endings of the buffer, the same way as formatted source files.
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    lines = text.split('\n')
+    formatted_lines = self._formatter.FormatSource(
+        lines, line_ranges=line_ranges)
+
+    if not params.get('edits', False):
+      return {'text': '\n'.join(formatted_lines)}
+
+    return {'edits': GetEdits(lines, formatted_lines)}
+
+  def HandleRequest(self, request):
+    """Handles a request.
+
+    Args:
+      request (dict[str, object]): JSON-RPC request.
+
+    Returns:
+      dict[str, object]: JSON-RPC response or None if the request is
+          a notification, which has no identifier.
+    """
+    if not isinstance(request, dict):
+      return self._CreateErrorResponse(
+          None, self._ERROR_INVALID_REQUEST, 'Unsupported request.')
+
+    identifier = request.get('id', None)
+    method = request.get('method', None)
+    params = request.get('params', None) or {}
+
+    if not isinstance(params, dict):
+      response = self._CreateErrorResponse(
+          identifier, self._ERROR_INVALID_PARAMS, 'Unsupported parameters.')
+
+    elif method == 'format':
+      try:
+        result = self._Format(params)
+        response = {'id': identifier, 'jsonrpc': '2.0', 'result': result}
+      except ValueError as exception:
+        response = self._CreateErrorResponse(
+            identifier, self._ERROR_INVALID_PARAMS, '{0!s}'.format(exception))
+
+    elif method == 'shutdown':
+      self._is_running = False
+      response = {'id': identifier, 'jsonrpc': '2.0', 'result': None}
+
+    else:
+      response = self._CreateErrorResponse(
+          identifier, self._ERROR_METHOD_NOT_FOUND,
+          'Unsupported method: {0!s}.'.format(method))
+
+    if identifier is None:
+      return None
+
+    return response
+
+  def Serve(self, input_file, output_file):
+    """Serves requests until shut down or the end of the input.
+
+    Args:
+      input_file (file): text file to read the requests from.
+      output_file (file): text file to write the responses to.
+    """
+    self._is_running = True
+    while self._is_running:
+      line = input_file.readline()
+      if not line:
+        break
+
+      line = line.strip()
+      if not line:
+        continue
+
+      try:
+        request = json.loads(line)
+      except ValueError as exception:
+        response = self._CreateErrorResponse(
+            None, self._ERROR_PARSE, 'Unable to parse request: {0!s}'.format(
+                exception))
+      else:
+        response = self.HandleRequest(request)
+
+      if response is not None:
+        output_file.write('{0:s}\n'.format(json.dumps(
+            response, separators=(',', ':'), sort_keys=True)))
+        output_file.flush()
+
+    self._is_running = False
+
+
+def GetEdits(lines, formatted_lines):
+  """Retrieves the edits that change lines into formatted lines.
+
+  Args:
+    lines (list[str]): lines.
+    formatted_lines (list[str]): formatted lines.
+
+  Returns:
+    list[dict[str, object]]: edits, in order, where every edit replaces the
+        lines from "start" up to, excluding, "end", which are indexes in the
+        lines starting with 0, by "lines". Applying the edits from last to
+        first results in the formatted lines.
+  """
+  sequence_matcher = difflib.SequenceMatcher(
+      None, lines, formatted_lines, autojunk=False)
+
+  edits = []
+  for opcode in sequence_matcher.get_opcodes():
+    tag, start_index, end_index, formatted_start_index, formatted_end_index = (
+        opcode)
+    if tag == 'equal':
+      continue
+
+    edits.append({
+        'end': end_index,
+        'lines': formatted_lines[formatted_start_index:formatted_end_index],
+        'start': start_index})
+
+  return edits
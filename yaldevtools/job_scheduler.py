@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Job scheduler that runs jobs with dependencies in a process pool."""
+
+from __future__ import unicode_literals
+
+import logging
+import multiprocessing
+import sys
+import traceback
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue  # pylint: disable=import-error
+
+
+class LogRecordsCollector(logging.Handler):
+  """Log handler that collects log records.
+
+  Attributes:
+    log_records (list[tuple[int, str]]): log level and message of every log
+        record that was handled.
+  """
+
+  def __init__(self):
+    """Initializes a log records collector."""
+    super(LogRecordsCollector, self).__init__()
+    self.log_records = []
+
+  def emit(self, record):
+    """Collects a log record.
+
+    Args:
+      record (logging.LogRecord): log record.
+    """
+    self.log_records.append((record.levelno, record.getMessage()))
+
+
+def _RunJob(job_function, job_arguments):
+  """Runs a job in a worker process.
+
+  The log records of the job are collected instead of written, such that
+  the parent process can write them in job order.
+
+  Args:
+    job_function (function): function of the job.
+    job_arguments (list[object]): arguments of the job function.
+
+  Returns:
+    tuple[object, list[tuple[int, str]], str]: result of the job function,
+        log records of the job and error or None if the job was successful.
+  """
+  root_logger = logging.getLogger()
+  root_handlers = list(root_logger.handlers)
+
+  log_records_collector = LogRecordsCollector()
+  for handler in root_handlers:
+    root_logger.removeHandler(handler)
+  root_logger.addHandler(log_records_collector)
+
+  result = None
+  error = None
+  try:
+    result = job_function(*job_arguments)
+  except Exception:  # pylint: disable=broad-except
+    error = traceback.format_exc()
+  finally:
+    root_logger.removeHandler(log_records_collector)
+    for handler in root_handlers:
+      root_logger.addHandler(handler)
+
+  return result, log_records_collector.log_records, error
+
+
+class Job(object):
+  """Job.
+
+  Attributes:
+    arguments (list[object]): arguments of the job function.
+    dependencies (list[str]): names of the jobs that must be completed before
+        this job can run.
+    function (function): function of the job.
+    name (str): name of the job.
+  """
+
+  def __init__(self, name, function, arguments, dependencies):
+    """Initializes a job.
+
+    Args:
+      name (str): name of the job.
+      function (function): function of the job.
+      arguments (list[object]): arguments of the job function.
+      dependencies (list[str]): names of the jobs that must be completed
+          before this job can run.
+    """
+    super(Job, self).__init__()
+    self.arguments = arguments
+    self.dependencies = dependencies
+    self.function = function
+    self.name = name
+
+
+class JobScheduler(object):
+  """Job scheduler.
+
+  Jobs are run in a process pool as soon as the jobs they depend on are
+  completed. The log records of the jobs are written in the order the jobs
+  were added, regardless of the order in which the jobs complete.
+  """
+
+  def __init__(self, number_of_jobs=1):
+    """Initializes a job scheduler.
+
+    Args:
+      number_of_jobs (Optional[int]): maximum number of jobs to run in
+          parallel, where 1 represents running the jobs in the current
+          process.
+    """
+    super(JobScheduler, self).__init__()
+    self._jobs = []
+    self._number_of_jobs = number_of_jobs
+
+  def _GetDependencies(self, job, job_names):
+    """Retrieves the dependencies of a job on the jobs that were added.
+
+    Args:
+      job (Job): job.
+      job_names (list[str]): names of the jobs that were added, in order.
+
+    Returns:
+      list[str]: names of the jobs that must be completed before the job can
+          run.
+
+    Raises:
+      ValueError: if the job depends on a job that was added after it.
+    """
+    job_index = job_names.index(job.name)
+
+    dependencies = []
+    for dependency in job.dependencies:
+      if dependency not in job_names:
+        continue
+
+      if job_names.index(dependency) > job_index:
+        raise ValueError(
+            'Job: {0:s} depends on job: {1:s} that was added after it.'.format(
+                job.name, dependency))
+
+      dependencies.append(dependency)
+
+    return dependencies
+
+  def _RunJobsInProcessPool(self):
+    """Runs the jobs in a process pool.
+
+    Returns:
+      dict[str, object]: results of the jobs per name.
+
+    Raises:
+      RuntimeError: if a job failed.
+    """
+    job_names = [job.name for job in self._jobs]
+    dependencies_per_name = {
+        job.name: self._GetDependencies(job, job_names) for job in self._jobs}
+
+    completed_jobs_queue = queue.Queue()
+    job_results = {}
+    job_errors = {}
+    log_records_per_name = {}
+    next_log_index = 0
+
+    pending_jobs = list(self._jobs)
+    number_of_running_jobs = 0
+
+    process_pool = multiprocessing.Pool(processes=self._number_of_jobs)
+    try:
+      while pending_jobs or number_of_running_jobs:
+        if not job_errors:
+          for job in list(pending_jobs):
+            dependencies = dependencies_per_name[job.name]
+            if any(name not in job_results for name in dependencies):
+              continue
+
+            pending_jobs.remove(job)
+            number_of_running_jobs += 1
+
+            keyword_arguments = {
+                'callback': lambda value, name=job.name: (
+                    completed_jobs_queue.put((name, value)))}
+
+            # A job of which the arguments or result cannot be transferred
+            # between processes never completes, hence it is reported as
+            # an error. Note that Python 2 does not support an error callback.
+            if sys.version_info[0] >= 3:
+              keyword_arguments['error_callback'] = (
+                  lambda exception, name=job.name: completed_jobs_queue.put(
+                      (name, (None, [], '{0!s}'.format(exception)))))
+
+            process_pool.apply_async(
+                _RunJob, (job.function, job.arguments), **keyword_arguments)
+
+        elif not number_of_running_jobs:
+          break
+
+        job_name, (result, log_records, error) = completed_jobs_queue.get()
+        number_of_running_jobs -= 1
+
+        log_records_per_name[job_name] = log_records
+        if error:
+          job_errors[job_name] = error
+        else:
+          job_results[job_name] = result
+
+        # Write the log records of the completed jobs in the order the jobs
+        # were added.
+        while (next_log_index < len(job_names) and
+               job_names[next_log_index] in log_records_per_name):
+          name = job_names[next_log_index]
+          for level, message in log_records_per_name.pop(name):
+            logging.log(level, message)
+          next_log_index += 1
+
+    finally:
+      process_pool.close()
+      process_pool.join()
+
+    # Write the remaining log records when jobs were not run due to an error.
+    for name in job_names[next_log_index:]:
+      for level, message in log_records_per_name.pop(name, []):
+        logging.log(level, message)
+
+    if job_errors:
+      job_name = sorted(job_errors.keys(), key=job_names.index)[0]
+      raise RuntimeError('Job: {0:s} failed with error:\n{1:s}'.format(
+          job_name, job_errors[job_name]))
+
+    return job_results
+
+  def AddJob(self, name, function, arguments, dependencies=None):
+    """Adds a job.
+
+    A process pool requires the function and arguments of a job to be
+    picklable.
+
+    Args:
+      name (str): name of the job.
+      function (function): function of the job.
+      arguments (list[object]): arguments of the job function.
+      dependencies (Optional[list[str]]): names of the jobs that must be
+          completed before this job can run. Dependencies on jobs that are
+          not added are ignored.
+
+    Raises:
+      KeyError: if a job with the same name was already added.
+    """
+    if name in [job.name for job in self._jobs]:
+      raise KeyError('Job: {0:s} already added.'.format(name))
+
+    job = Job(name, function, arguments, dependencies or [])
+    self._jobs.append(job)
+
+  def Run(self):
+    """Runs the jobs.
+
+    Returns:
+      dict[str, object]: results of the jobs per name.
+
+    Raises:
+      RuntimeError: if a job run in the process pool failed.
+      ValueError: if a job depends on a job that was added after it.
+    """
+    if self._number_of_jobs > 1 and len(self._jobs) > 1:
+      return self._RunJobsInProcessPool()
+
+    job_names = [job.name for job in self._jobs]
+
+    job_results = {}
+    for job in self._jobs:
+      self._GetDependencies(job, job_names)
+      job_results[job.name] = job.function(*job.arguments)
+
+    return job_results
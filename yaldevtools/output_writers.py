@@ -4,20 +4,240 @@
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import abc
+import collections
+import hashlib
 import io
+import os
+import stat
+import tempfile
 
+from yaldevtools import file_overlay
 
-class FileWriter(object):
-  """File output writer."""
 
-  def __init__(self, output_directory):
+class OutputRecord(object):
+  """Output record, which is a file generated in memory.
+
+  Attributes:
+    data (str): data of the file.
+    mode (int): file mode bits of the file, such as the executable bit.
+    path (str): path of the file.
+  """
+
+  def __init__(self, path, data, mode):
+    """Initializes an output record.
+
+    Args:
+      path (str): path of the file.
+      data (str): data of the file.
+      mode (int): file mode bits of the file.
+    """
+    super(OutputRecord, self).__init__()
+    self.data = data
+    self.mode = mode
+    self.path = path
+
+  @property
+  def executable(self):
+    """bool: True if the executable bit of the file is set."""
+    return bool(self.mode & stat.S_IEXEC)
+
+
+class OutputWriter(object):
+  """Output writer interface."""
+
+  def Close(self):
+    """Closes the output writer.
+
+    Data of which writing was deferred by the output writer is written.
+    """
+    return
+
+  def SetExecutable(self, file_path):
+    """Sets the executable bit of a written file.
+
+    Args:
+      file_path (str): path of the file.
+    """
+    return
+
+  @abc.abstractmethod
+  def WriteFile(self, file_path, file_data, access_mode='w'):
+    """Writes the data to file.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): to write.
+      access_mode (Optional[str]): output file access mode.
+    """
+
+
+class FileWriter(OutputWriter):
+  """File output writer.
+
+  When changes are tracked, the size and hash of the original data of a file
+  are determined before the file is first written. The size and hash of the
+  data written are determined in memory, such that files do not have to be
+  read back to determine if they were changed.
+  """
+
+  _READ_BUFFER_SIZE = 64 * 1024
+
+  def __init__(self, output_directory, track_changes=False):
     """Initializes a file output writer.
 
     Args:
       output_directory (str): path of the output directory.
+      track_changes (Optional[bool]): True if the writer should track which
+          files were changed, which requires the original data of the files
+          to be read.
     """
     super(FileWriter, self).__init__()
+    self._file_paths = []
+    self._original_file_states = {}
     self._output_directory = output_directory
+    self._track_changes = track_changes
+    self._written_file_states = {}
+
+  def _AddFilePath(self, file_path):
+    """Adds the path of a file that is written by the writer.
+
+    Args:
+      file_path (str): path of the file to write.
+    """
+    if file_path not in self._original_file_states:
+      self._file_paths.append(file_path)
+
+      original_file_state = None
+      if self._track_changes:
+        original_file_state = self._GetFileState(file_path)
+
+      self._original_file_states[file_path] = original_file_state
+
+  def _EncodeFileData(self, file_data):
+    """Encodes data the same way as writing a file in text mode does.
+
+    Args:
+      file_data (str): data.
+
+    Returns:
+      bytes: encoded data.
+    """
+    if os.linesep != '\n':
+      file_data = file_data.replace('\n', os.linesep)
+
+    return file_data.encode('utf8')
+
+  def _GetFileState(self, file_path):
+    """Determines the size and hash of the data of a file.
+
+    Args:
+      file_path (str): path of the file.
+
+    Returns:
+      tuple[int, hashlib.sha1]: size and SHA-1 context of the data of the file
+          or None if the file does not exist.
+    """
+    if not os.path.isfile(file_path):
+      return None
+
+    file_size = 0
+    sha1_context = hashlib.sha1()
+    with io.open(file_path, 'rb') as file_object:
+      data = file_object.read(self._READ_BUFFER_SIZE)
+      while data:
+        file_size += len(data)
+        sha1_context.update(data)
+        data = file_object.read(self._READ_BUFFER_SIZE)
+
+    return file_size, sha1_context
+
+  def _IsChanged(self, file_path):
+    """Determines if a file was changed by the writer.
+
+    Args:
+      file_path (str): path of the file.
+
+    Returns:
+      bool: True if the data written differs from the original data of the
+          file.
+    """
+    original_file_state = self._original_file_states[file_path]
+    written_file_state = self._written_file_states.get(
+        file_path, original_file_state)
+
+    return not self._IsSameFileState(original_file_state, written_file_state)
+
+  def _IsSameFileState(self, file_state, other_file_state):
+    """Determines if the size and hash of the data of files are the same.
+
+    Args:
+      file_state (tuple[int, hashlib.sha1]): size and SHA-1 context of the
+          data of a file or None if the file does not exist.
+      other_file_state (tuple[int, hashlib.sha1]): size and SHA-1 context of
+          the data of another file or None if the file does not exist.
+
+    Returns:
+      bool: True if the size and hash of the data are the same.
+    """
+    if file_state is None or other_file_state is None:
+      return file_state is other_file_state
+
+    return (file_state[0] == other_file_state[0] and
+            file_state[1].digest() == other_file_state[1].digest())
+
+  def GetChangedFiles(self):
+    """Retrieves the files that were changed or created by the writer.
+
+    Returns:
+      list[str]: paths of the changed and created files, in order of their
+          first write, or None if changes are not tracked.
+    """
+    if not self._track_changes:
+      return None
+
+    return [
+        file_path for file_path in self._file_paths
+        if self._IsChanged(file_path)]
+
+  def GetStatistics(self):
+    """Retrieves statistics of the files written by the writer.
+
+    Returns:
+      dict[str, int]: number of changed, new and unchanged files or None if
+          changes are not tracked.
+    """
+    if not self._track_changes:
+      return None
+
+    statistics = {'changed': 0, 'new': 0, 'unchanged': 0}
+    for file_path in self._file_paths:
+      if self._original_file_states[file_path] is None:
+        statistics['new'] += 1
+      elif self._IsChanged(file_path):
+        statistics['changed'] += 1
+      else:
+        statistics['unchanged'] += 1
+
+    return statistics
+
+  def GetWrittenFiles(self):
+    """Retrieves the files that were written by the writer.
+
+    Returns:
+      list[str]: paths of the written files, in order of their first write.
+    """
+    return list(self._file_paths)
+
+  def SetExecutable(self, file_path):
+    """Sets the executable bit of a written file.
+
+    Args:
+      file_path (str): path of the file.
+    """
+    stat_info = os.stat(file_path)
+    if not stat_info.st_mode & stat.S_IEXEC:
+      os.chmod(file_path, stat_info.st_mode | stat.S_IEXEC)
 
   def WriteFile(self, file_path, file_data, access_mode='w'):
     """Writes the data to file.
@@ -27,11 +247,273 @@ class FileWriter(object):
       file_data (bytes): to write.
       access_mode (Optional[str]): output file access mode.
     """
+    self._AddFilePath(file_path)
+
+    if self._track_changes:
+      if access_mode == 'w':
+        file_size, sha1_context = 0, hashlib.sha1()
+      else:
+        file_state = self._written_file_states.get(
+            file_path, self._original_file_states[file_path])
+        if file_state is None:
+          file_size, sha1_context = 0, hashlib.sha1()
+        else:
+          file_size, sha1_context = file_state[0], file_state[1].copy()
+
+      encoded_file_data = self._EncodeFileData(file_data)
+      sha1_context.update(encoded_file_data)
+
+      self._written_file_states[file_path] = (
+          file_size + len(encoded_file_data), sha1_context)
+
     with io.open(file_path, access_mode, encoding='utf8') as file_object:
       file_object.write(file_data)
 
 
-class StdoutWriter(object):
+class ChangedFileWriter(FileWriter):
+  """File output writer that only replaces files of which the data changed.
+
+  The data written to a file is kept in memory until another file is written
+  or the writer is closed. The data is then compared with that of the existing
+  file, first by size and then by hash, and the file is only replaced, using
+  a temporary file that is renamed, when the data differs. This preserves the
+  modification time of files of which the data did not change.
+
+  Changes are always tracked, since the original data of the files is read
+  to compare it with the data written.
+  """
+
+  def __init__(self, output_directory):
+    """Initializes a file output writer.
+
+    Args:
+      output_directory (str): path of the output directory.
+    """
+    super(ChangedFileWriter, self).__init__(
+        output_directory, track_changes=True)
+    self._pending_file_data = []
+    self._pending_file_path = None
+
+  def _ReplaceFile(self, file_path, file_data):
+    """Replaces a file by writing its data to a temporary file and renaming it.
+
+    Args:
+      file_path (str): path of the file.
+      file_data (bytes): data of the file.
+    """
+    directory = os.path.dirname(file_path) or '.'
+    file_descriptor, temporary_file_path = tempfile.mkstemp(
+        dir=directory, prefix='.{0:s}.'.format(os.path.basename(file_path)))
+
+    try:
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        file_object.write(file_data)
+
+      if os.path.exists(file_path):
+        file_mode = os.stat(file_path).st_mode
+      else:
+        umask = os.umask(0)
+        os.umask(umask)
+        file_mode = 0o666 & ~umask
+
+      os.chmod(temporary_file_path, file_mode & 0o7777)
+
+      if os.name == 'nt' and os.path.exists(file_path):
+        # On Windows rename does not replace an existing file.
+        os.remove(file_path)
+
+      os.rename(temporary_file_path, file_path)
+
+    except (IOError, OSError):
+      if os.path.exists(temporary_file_path):
+        os.remove(temporary_file_path)
+      raise
+
+  def _WritePendingFile(self):
+    """Writes the data of the pending file if it changed."""
+    if not self._pending_file_path:
+      return
+
+    file_data = self._EncodeFileData(''.join(self._pending_file_data))
+    file_state = (len(file_data), hashlib.sha1(file_data))
+
+    # The file contains the data last written by the writer or, if it was
+    # not written before, the original data.
+    existing_file_state = self._written_file_states.get(
+        self._pending_file_path,
+        self._original_file_states[self._pending_file_path])
+
+    if not self._IsSameFileState(existing_file_state, file_state):
+      self._ReplaceFile(self._pending_file_path, file_data)
+
+    self._written_file_states[self._pending_file_path] = file_state
+
+    self._pending_file_data = []
+    self._pending_file_path = None
+
+  def Close(self):
+    """Closes the output writer.
+
+    The data of the pending file is written.
+    """
+    self._WritePendingFile()
+
+  def GetChangedFiles(self):
+    """Retrieves the files that were changed or created by the writer.
+
+    Returns:
+      list[str]: paths of the changed and created files, in order of their
+          first write.
+    """
+    self._WritePendingFile()
+    return super(ChangedFileWriter, self).GetChangedFiles()
+
+  def GetStatistics(self):
+    """Retrieves statistics of the files written by the writer.
+
+    Returns:
+      dict[str, int]: number of changed, new and unchanged files.
+    """
+    self._WritePendingFile()
+    return super(ChangedFileWriter, self).GetStatistics()
+
+  def SetExecutable(self, file_path):
+    """Sets the executable bit of a written file.
+
+    Args:
+      file_path (str): path of the file.
+    """
+    if file_path == self._pending_file_path:
+      self._WritePendingFile()
+
+    super(ChangedFileWriter, self).SetExecutable(file_path)
+
+  def WriteFile(self, file_path, file_data, access_mode='w'):
+    """Writes the data to file.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): to write.
+      access_mode (Optional[str]): output file access mode.
+    """
+    if file_path != self._pending_file_path:
+      self._WritePendingFile()
+
+      self._AddFilePath(file_path)
+      self._pending_file_path = file_path
+
+      if access_mode == 'a' and os.path.exists(file_path):
+        with io.open(file_path, 'r', encoding='utf8') as file_object:
+          self._pending_file_data.append(file_object.read())
+
+    if access_mode == 'w':
+      self._pending_file_data = []
+
+    self._pending_file_data.append(file_data)
+
+
+class RecordWriter(OutputWriter):
+  """Output writer that keeps the written files in memory as output records.
+
+  No files are written. The file mode bits of a record are those of the
+  existing file, or the default file mode bits for a new file, and the data
+  of an existing file is read when data is appended to it, the same way as
+  the file output writers do.
+  """
+
+  def __init__(self):
+    """Initializes a record output writer."""
+    super(RecordWriter, self).__init__()
+    self._executable_file_paths = set()
+    self._file_data = collections.OrderedDict()
+
+  def _GetFileMode(self, file_path):
+    """Retrieves the file mode bits of a file.
+
+    Args:
+      file_path (str): path of the file.
+
+    Returns:
+      int: file mode bits of the existing file or the default file mode bits
+          if the file does not exist.
+    """
+    if os.path.exists(file_path):
+      file_mode = os.stat(file_path).st_mode & 0o7777
+    else:
+      umask = os.umask(0)
+      os.umask(umask)
+      file_mode = 0o666 & ~umask
+
+    if file_path in self._executable_file_paths:
+      file_mode |= stat.S_IEXEC
+
+    return file_mode
+
+  def _ReadExistingFileData(self, file_path):
+    """Reads the data of an existing file.
+
+    Args:
+      file_path (str): path of the file.
+
+    Returns:
+      list[str]: data of the file or an empty list if the file does not
+          exist.
+    """
+    if not file_overlay.FILE_OVERLAY.Exists(file_path):
+      return []
+
+    with file_overlay.FILE_OVERLAY.Open(file_path) as file_object:
+      return [file_object.read()]
+
+  def GetRecords(self):
+    """Retrieves the output records of the written files.
+
+    Returns:
+      list[OutputRecord]: output records, in order of the first write of
+          the files.
+    """
+    return [
+        OutputRecord(
+            file_path, ''.join(file_data), self._GetFileMode(file_path))
+        for file_path, file_data in self._file_data.items()]
+
+  def GetWrittenFiles(self):
+    """Retrieves the files that were written by the writer.
+
+    Returns:
+      list[str]: paths of the written files, in order of their first write.
+    """
+    return list(self._file_data.keys())
+
+  def SetExecutable(self, file_path):
+    """Sets the executable bit of a written file.
+
+    Args:
+      file_path (str): path of the file.
+    """
+    if file_path not in self._file_data:
+      self._file_data[file_path] = self._ReadExistingFileData(file_path)
+
+    self._executable_file_paths.add(file_path)
+
+  def WriteFile(self, file_path, file_data, access_mode='w'):
+    """Writes the data to file.
+
+    Args:
+      file_path (str): path of the file to write.
+      file_data (bytes): to write.
+      access_mode (Optional[str]): output file access mode.
+    """
+    if access_mode == 'w':
+      self._file_data[file_path] = []
+
+    elif file_path not in self._file_data:
+      self._file_data[file_path] = self._ReadExistingFileData(file_path)
+
+    self._file_data[file_path].append(file_data)
+
+
+class StdoutWriter(OutputWriter):
   """Stdout output writer."""
 
   def __init__(self):
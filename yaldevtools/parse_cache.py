@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""Cache of parsed source files."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import os
+import pickle
+import re
+import tempfile
+import time
+
+from yaldevtools import file_overlay
+
+
+class ParseCache(object):
+  """Cache of parsed source files.
+
+  The cache maps a key, derived from the content of the parsed files, the
+  parser and its arguments, to the values of the parsed attributes. Values are
+  stored serialized, such that every lookup returns a separate copy that can
+  be modified by the caller.
+
+  The cache is kept in memory and, when a cache directory is set, on disk so
+  that it is shared across runs. The names of the cache files start with the
+  format version and the hash of the parser code. When the cache directory
+  is set, cache files of another format version or parser code and cache
+  files that were not used for the maximum age are removed, such that the
+  cache directory does not grow indefinitely.
+
+  Attributes:
+    hits (int): number of lookups that were served from the cache.
+    misses (int): number of lookups that were not served from the cache.
+  """
+
+  _FORMAT_VERSION = 1
+
+  # Expression of the names of cache files, of any format version or parser
+  # code including cache files without a prefix written by earlier versions,
+  # and of temporary files, such that other files in the cache directory are
+  # never removed.
+  _CACHE_FILENAME_RE = re.compile(
+      r'^(([0-9]+-[0-9a-f]{40}-)?[0-9a-f]{40}\.pickle|\.[0-9a-f]{40}\..+)$')
+
+  # Maximum age, in seconds, of a cache file that is not used.
+  _MAXIMUM_AGE = 30 * 24 * 60 * 60
+
+  _PICKLE_PROTOCOL = 2
+
+  def __init__(self, directory=None):
+    """Initializes a parse cache.
+
+    Args:
+      directory (Optional[str]): path of the cache directory, where None
+          represents the cache is only kept in memory.
+    """
+    super(ParseCache, self).__init__()
+    self._directory = directory
+    self._values = {}
+    self.hits = 0
+    self.misses = 0
+
+    if directory:
+      self._RemoveObsoleteFiles()
+
+  def _GetCacheFilenamePrefix(self):
+    """Retrieves the prefix of the names of the cache files.
+
+    Returns:
+      str: prefix of the names of the cache files, which contains the format
+          version and the hash of the parser code.
+    """
+    return '{0:d}-{1:s}-'.format(self._FORMAT_VERSION, PARSER_CODE_HASH)
+
+  def _GetCachePath(self, key):
+    """Retrieves the path of the cache file of a key.
+
+    Args:
+      key (str): cache key.
+
+    Returns:
+      str: path of the cache file.
+    """
+    return os.path.join(self._directory, '{0:s}{1:s}.pickle'.format(
+        self._GetCacheFilenamePrefix(), key))
+
+  def _GetFileHash(self, path):
+    """Calculates the hash of the content of a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      str: hexadecimal SHA-1 of the content of the file or None if the file
+          does not exist.
+    """
+    file_data = file_overlay.FILE_OVERLAY.GetFileData(path)
+    if file_data is not None:
+      return hashlib.sha1(file_data.encode('utf8')).hexdigest()
+
+    try:
+      with io.open(path, 'rb') as file_object:
+        return hashlib.sha1(file_object.read()).hexdigest()
+
+    except (IOError, OSError):
+      return None
+
+  def _ReadValuesFromFile(self, key):
+    """Reads serialized values from the cache directory.
+
+    Args:
+      key (str): cache key.
+
+    Returns:
+      bytes: serialized values or None if not available.
+    """
+    if not self._directory:
+      return None
+
+    cache_path = self._GetCachePath(key)
+    try:
+      with io.open(cache_path, 'rb') as file_object:
+        serialized_values = file_object.read()
+
+      # Update the modification time so that a used cache file is not removed
+      # as obsolete.
+      os.utime(cache_path, None)
+
+    except (IOError, OSError):
+      return None
+
+    return serialized_values
+
+  def _RemoveObsoleteFiles(self):
+    """Removes obsolete files from the cache directory.
+
+    Cache files of another format version or parser code, which are no
+    longer looked up, and cache and temporary files that were not used for
+    the maximum age are removed. Other files are kept. Failing to remove
+    a file is not considered an error.
+    """
+    try:
+      filenames = os.listdir(self._directory)
+    except (IOError, OSError):
+      return
+
+    filename_prefix = self._GetCacheFilenamePrefix()
+    minimum_modification_time = time.time() - self._MAXIMUM_AGE
+
+    for filename in filenames:
+      if not self._CACHE_FILENAME_RE.match(filename):
+        continue
+
+      path = os.path.join(self._directory, filename)
+      try:
+        # Temporary files, which could be written concurrently, are only
+        # removed when older than the maximum age as well.
+        if ((filename.startswith(filename_prefix) or
+             filename.startswith('.')) and
+            os.stat(path).st_mtime >= minimum_modification_time):
+          continue
+
+        os.remove(path)
+
+      except (IOError, OSError):
+        continue
+
+  def _WriteValuesToFile(self, key, serialized_values):
+    """Writes serialized values to the cache directory.
+
+    The values are written to a temporary file that is renamed, such that
+    concurrent readers never see a partially written cache file. Failing to
+    write the cache file is not considered an error.
+
+    Args:
+      key (str): cache key.
+      serialized_values (bytes): serialized values.
+    """
+    if not self._directory:
+      return
+
+    try:
+      if not os.path.isdir(self._directory):
+        os.makedirs(self._directory)
+
+      file_descriptor, temporary_path = tempfile.mkstemp(
+          dir=self._directory, prefix='.{0:s}.'.format(key))
+
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        file_object.write(serialized_values)
+
+      cache_path = self._GetCachePath(key)
+      if os.name == 'nt' and os.path.exists(cache_path):
+        # On Windows rename does not replace an existing file.
+        os.remove(cache_path)
+
+      os.rename(temporary_path, cache_path)
+
+    except (IOError, OSError):
+      return
+
+  def Empty(self):
+    """Empties the in memory cache and resets the counters."""
+    self._values = {}
+    self.hits = 0
+    self.misses = 0
+
+  def GetKey(self, parser_name, parser_arguments, paths):
+    """Retrieves the cache key of parsing specific files.
+
+    Args:
+      parser_name (str): name of the parser.
+      parser_arguments (list[str]): arguments that affect the result of the
+          parser.
+      paths (list[str]): paths of the files the parser reads or falls back
+          to, where a file that does not exist is part of the key as well.
+
+    Returns:
+      str: cache key.
+    """
+    key_values = [
+        '{0:d}'.format(self._FORMAT_VERSION), PARSER_CODE_HASH, parser_name]
+    key_values.extend(parser_arguments)
+    key_values.extend([self._GetFileHash(path) or '' for path in paths])
+
+    key_data = '\n'.join(key_values).encode('utf8')
+    return hashlib.sha1(key_data).hexdigest()
+
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      dict[str, int]: cache statistics per name.
+    """
+    return {
+        'hits': self.hits,
+        'misses': self.misses,
+        'number_of_values': len(self._values)}
+
+  def GetValues(self, key):
+    """Retrieves the values of the parsed attributes.
+
+    Args:
+      key (str): cache key.
+
+    Returns:
+      dict[str, object]: values of the parsed attributes per name or None if
+          not cached.
+    """
+    serialized_values = self._values.get(key, None)
+    if serialized_values is None:
+      serialized_values = self._ReadValuesFromFile(key)
+
+    values = None
+    if serialized_values is not None:
+      try:
+        values = pickle.loads(serialized_values)
+      except Exception:  # pylint: disable=broad-except
+        # A corrupt or incompatible cache file is handled as a cache miss.
+        values = None
+
+    if values is None:
+      self.misses += 1
+      return None
+
+    self._values[key] = serialized_values
+    self.hits += 1
+
+    return values
+
+  def SetDirectory(self, directory):
+    """Sets the cache directory.
+
+    Args:
+      directory (str): path of the cache directory, where None represents
+          the cache is only kept in memory.
+    """
+    self._directory = directory
+
+    if directory:
+      self._RemoveObsoleteFiles()
+
+  def SetValues(self, key, values):
+    """Sets the values of the parsed attributes.
+
+    Args:
+      key (str): cache key.
+      values (dict[str, object]): values of the parsed attributes per name.
+    """
+    serialized_values = pickle.dumps(values, protocol=self._PICKLE_PROTOCOL)
+
+    self._values[key] = serialized_values
+    self._WriteValuesToFile(key, serialized_values)
+
+
+def GetDefaultDirectory():
+  """Retrieves the default cache directory.
+
+  Returns:
+    str: path of the default cache directory.
+  """
+  cache_directory = os.environ.get('XDG_CACHE_HOME', None)
+  if not cache_directory:
+    cache_directory = os.path.join(os.path.expanduser('~'), '.cache')
+
+  return os.path.join(cache_directory, 'yaldevtools', 'parse')
+
+
+def _GetParserCodeHash():
+  """Calculates a hash of the code of the parsers and parsed objects.
+
+  Cached values are no longer used when the code that produced them changes.
+
+  Returns:
+    str: hexadecimal SHA-1 of the code.
+  """
+  directory = os.path.dirname(os.path.abspath(__file__))
+
+  sha1_context = hashlib.sha1()
+  for filename in (
+      'parse_cache.py', 'source_code.py', 'source_file.py',
+      'source_parser.py'):
+    path = os.path.join(directory, filename)
+    try:
+      with io.open(path, 'rb') as file_object:
+        sha1_context.update(file_object.read())
+    except IOError:
+      pass
+
+  return sha1_context.hexdigest()
+
+
+PARSER_CODE_HASH = _GetParserCodeHash()
+
+PARSE_CACHE = ParseCache()
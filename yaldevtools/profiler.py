@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+"""Generation profiler."""
+
+from __future__ import unicode_literals
+
+import cProfile
+import functools
+import inspect
+import io
+import json
+import time
+
+try:
+  import builtins
+except ImportError:
+  import __builtin__ as builtins  # pylint: disable=import-error
+
+from yaldevtools import parse_cache
+from yaldevtools import template_cache
+
+
+def AddArguments(argument_parser):
+  """Adds the profiling command line arguments.
+
+  Args:
+    argument_parser (argparse.ArgumentParser): argument parser.
+  """
+  argument_parser.add_argument(
+      '--profile', dest='profile_path', action='store', metavar='PATH',
+      default=None, help=(
+          'path of a JSON file to write a profiling report to, that contains '
+          'the wall time per generator, generate method and template file, '
+          'the number of files opened, the bytes read and written and the '
+          'cache hit rates.'))
+
+  argument_parser.add_argument(
+      '--profile-cprofile', dest='cprofile_path', action='store',
+      metavar='PATH', default=None, help=(
+          'path of a file to write cProfile statistics to, which can be '
+          'read with the pstats module.'))
+
+
+def CreateProfiler(options):
+  """Creates a generation profiler if profiling was requested.
+
+  Args:
+    options (argparse.Namespace): command line arguments, as added by
+        AddArguments.
+
+  Returns:
+    GenerationProfiler: generation profiler or None if profiling was not
+        requested.
+  """
+  if not options.profile_path and not options.cprofile_path:
+    return None
+
+  return GenerationProfiler(
+      report_path=options.profile_path, cprofile_path=options.cprofile_path)
+
+
+class _ProfiledFile(object):
+  """File-like object that counts the bytes read and written."""
+
+  def __init__(self, file_object, file_statistics):
+    """Initializes a profiled file-like object.
+
+    Args:
+      file_object (file): file-like object.
+      file_statistics (dict[str, int]): file statistics to update.
+    """
+    super(_ProfiledFile, self).__init__()
+    self._file_object = file_object
+    self._file_statistics = file_statistics
+
+  def __enter__(self):
+    """Enters a with statement."""
+    self._file_object.__enter__()
+    return self
+
+  def __exit__(self, exception_type, value, traceback):
+    """Exits a with statement."""
+    return self._file_object.__exit__(exception_type, value, traceback)
+
+  def __getattr__(self, name):
+    """Retrieves an attribute of the file-like object."""
+    return getattr(self._file_object, name)
+
+  def __iter__(self):
+    """Iterates over the lines of the file-like object."""
+    for line in self._file_object:
+      self._file_statistics['bytes_read'] += self._GetDataSize(line)
+      yield line
+
+  def _GetDataSize(self, data):
+    """Retrieves the size of data read or written.
+
+    Args:
+      data (bytes|str): data read or written, where text is measured in
+          the encoding of the file-like object.
+
+    Returns:
+      int: size of the data in bytes.
+    """
+    if isinstance(data, bytes):
+      return len(data)
+
+    encoding = getattr(self._file_object, 'encoding', None) or 'utf8'
+    return len(data.encode(encoding, 'replace'))
+
+  def read(self, *args):
+    """Reads data."""
+    data = self._file_object.read(*args)
+    self._file_statistics['bytes_read'] += self._GetDataSize(data)
+    return data
+
+  def readline(self, *args):
+    """Reads a line."""
+    line = self._file_object.readline(*args)
+    self._file_statistics['bytes_read'] += self._GetDataSize(line)
+    return line
+
+  def readlines(self, *args):
+    """Reads lines."""
+    lines = self._file_object.readlines(*args)
+    self._file_statistics['bytes_read'] += sum([
+        self._GetDataSize(line) for line in lines])
+    return lines
+
+  def write(self, data):
+    """Writes data."""
+    self._file_statistics['bytes_written'] += self._GetDataSize(data)
+    return self._file_object.write(data)
+
+  def writelines(self, lines):
+    """Writes lines."""
+    lines = list(lines)
+    self._file_statistics['bytes_written'] += sum([
+        self._GetDataSize(line) for line in lines])
+    return self._file_object.writelines(lines)
+
+
+class GenerationProfiler(object):
+  """Generation profiler.
+
+  The profiler measures the wall time spent per generator, per generate
+  method and per template file, by instrumenting the methods of generator
+  classes, and the number of files opened and the bytes read from and
+  written to them, by instrumenting io.open and open. The time of a method
+  includes the time of the methods it calls, where the self time excludes
+  the time of the instrumented methods it calls.
+
+  Only the current process is profiled, source generators run in a process
+  pool are not.
+
+  Attributes:
+    wall_time (float): wall time in seconds between starting and stopping
+        the profiler or None if not stopped.
+  """
+
+  # Categories of the timings.
+  _CATEGORY_GENERATORS = 'generators'
+  _CATEGORY_METHODS = 'methods'
+  _CATEGORY_TEMPLATES = 'templates'
+
+  def __init__(self, report_path=None, cprofile_path=None):
+    """Initializes a generation profiler.
+
+    Args:
+      report_path (Optional[str]): path of the JSON file to write the
+          profiling report to when profiling is stopped.
+      cprofile_path (Optional[str]): path of the file to write the cProfile
+          statistics to when profiling is stopped, where None represents
+          the functions called are not profiled with cProfile.
+    """
+    super(GenerationProfiler, self).__init__()
+    self._cache_statistics = None
+    self._call_stack = []
+    self._cprofile = None
+    self._cprofile_path = cprofile_path
+    self._file_statistics = {'bytes_read': 0, 'bytes_written': 0, 'opens': 0}
+    self._instrumented_methods = []
+    self._original_builtins_open = None
+    self._original_io_open = None
+    self._report_path = report_path
+    self._start_time = None
+    self._timings = {
+        self._CATEGORY_GENERATORS: {},
+        self._CATEGORY_METHODS: {},
+        self._CATEGORY_TEMPLATES: {}}
+    self.wall_time = None
+
+  def _AddTiming(self, category, name, total_time, self_time):
+    """Adds a timing.
+
+    Args:
+      category (str): category of the timing.
+      name (str): name of the timed generator, method or template file.
+      total_time (float): time in seconds, including that of the instrumented
+          methods called.
+      self_time (float): time in seconds, excluding that of the instrumented
+          methods called.
+    """
+    timing = self._timings[category].get(name, None)
+    if not timing:
+      timing = {'calls': 0, 'self_time': 0.0, 'total_time': 0.0}
+      self._timings[category][name] = timing
+
+    timing['calls'] += 1
+    timing['self_time'] += self_time
+    timing['total_time'] += total_time
+
+  def _CreateMethodWrapper(self, method, category, template_argument):
+    """Creates a wrapper that times a method.
+
+    Args:
+      method (function): method.
+      category (str): category of the timing.
+      template_argument (bool): True if the first argument of the method is
+          the path of a template file that should be timed as well.
+
+    Returns:
+      function: wrapper of the method.
+    """
+    method_name = method.__name__
+
+    @functools.wraps(method)
+    def _ProfiledMethod(instance, *args, **kwargs):
+      """Times a method."""
+      start_time = time.time()
+      self._call_stack.append(0.0)
+      try:
+        return method(instance, *args, **kwargs)
+
+      finally:
+        total_time = time.time() - start_time
+        self_time = total_time - self._call_stack.pop()
+        if self._call_stack:
+          self._call_stack[-1] += total_time
+
+        class_name = type(instance).__name__
+        if category == self._CATEGORY_GENERATORS:
+          name = class_name
+        else:
+          name = '{0:s}.{1:s}'.format(class_name, method_name)
+
+        self._AddTiming(category, name, total_time, self_time)
+
+        if template_argument:
+          template_filename = kwargs.get('template_filename', None)
+          if template_filename is None and args:
+            template_filename = args[0]
+
+          if template_filename is not None:
+            self._AddTiming(
+                self._CATEGORY_TEMPLATES, template_filename, total_time,
+                self_time)
+
+    _ProfiledMethod.profiled_method = method
+    return _ProfiledMethod
+
+  def _CreateOpenWrapper(self, open_function):
+    """Creates a wrapper that counts the files opened by an open function.
+
+    Args:
+      open_function (function): open function, such as io.open.
+
+    Returns:
+      function: wrapper of the open function.
+    """
+    @functools.wraps(open_function)
+    def _ProfiledOpen(*args, **kwargs):
+      """Opens a file."""
+      file_object = open_function(*args, **kwargs)
+      self._file_statistics['opens'] += 1
+      return _ProfiledFile(file_object, self._file_statistics)
+
+    return _ProfiledOpen
+
+  def _GetCacheStatistics(self):
+    """Retrieves the statistics of the parse and template caches.
+
+    Returns:
+      dict[str, dict[str, int]]: cache statistics per cache.
+    """
+    parse_cache_statistics = parse_cache.PARSE_CACHE.GetStatistics()
+    template_cache_statistics = template_cache.TEMPLATE_CACHE.GetStatistics()
+
+    return {
+        'parse_cache': {
+            key: parse_cache_statistics[key] for key in ('hits', 'misses')},
+        'template_cache': {
+            key: template_cache_statistics[key]
+            for key in ('evictions', 'hits', 'misses')}}
+
+  def GetReport(self):
+    """Retrieves the profiling report.
+
+    Returns:
+      dict[str, object]: profiling report, that contains the wall time, the
+          timings per generator, per method and per template file, the file
+          statistics and the cache statistics, including the hit rate, per
+          cache.
+    """
+    cache_statistics = {}
+    if self._cache_statistics:
+      current_cache_statistics = self._GetCacheStatistics()
+      for cache_name, statistics in current_cache_statistics.items():
+        statistics = {
+            key: value - self._cache_statistics[cache_name][key]
+            for key, value in statistics.items()}
+
+        number_of_lookups = statistics['hits'] + statistics['misses']
+        statistics['hit_rate'] = None
+        if number_of_lookups:
+          statistics['hit_rate'] = float(statistics['hits']) / number_of_lookups
+
+        cache_statistics[cache_name] = statistics
+
+    report = {
+        'caches': cache_statistics,
+        'files': dict(self._file_statistics),
+        'wall_time': self.wall_time}
+
+    for category, timings in self._timings.items():
+      report[category] = {
+          name: dict(timing) for name, timing in timings.items()}
+
+    return report
+
+  def InstrumentClass(
+      self, generator_class, generate_method_names=None,
+      method_prefixes=None, template_method_names=None):
+    """Instruments the methods of a generator class and its base classes.
+
+    Args:
+      generator_class (type): generator class.
+      generate_method_names (Optional[list[str]]): names of the methods that
+          run the generator, where None represents "Generate".
+      method_prefixes (Optional[list[str]]): prefixes of the names of the
+          methods to time, where None represents "_Generate".
+      template_method_names (Optional[list[str]]): names of the methods of
+          which the first argument is the path of a template file, where None
+          represents "_GenerateSection".
+    """
+    if generate_method_names is None:
+      generate_method_names = ['Generate']
+    if method_prefixes is None:
+      method_prefixes = ['_Generate']
+    if template_method_names is None:
+      template_method_names = ['_GenerateSection']
+
+    method_prefixes = tuple(method_prefixes)
+
+    for class_object in inspect.getmro(generator_class):
+      if class_object is object:
+        continue
+
+      for name, value in list(class_object.__dict__.items()):
+        if not inspect.isfunction(value) or hasattr(value, 'profiled_method'):
+          continue
+
+        if name in generate_method_names:
+          category = self._CATEGORY_GENERATORS
+        elif name.startswith(method_prefixes):
+          category = self._CATEGORY_METHODS
+        else:
+          continue
+
+        method_wrapper = self._CreateMethodWrapper(
+            value, category, name in template_method_names)
+        setattr(class_object, name, method_wrapper)
+
+        self._instrumented_methods.append((class_object, name, value))
+
+  def Start(self):
+    """Starts profiling."""
+    self._cache_statistics = self._GetCacheStatistics()
+
+    self._original_builtins_open = builtins.open
+    self._original_io_open = io.open
+
+    builtins.open = self._CreateOpenWrapper(self._original_builtins_open)
+    io.open = self._CreateOpenWrapper(self._original_io_open)
+
+    if self._cprofile_path:
+      self._cprofile = cProfile.Profile()
+      self._cprofile.enable()
+
+    self._start_time = time.time()
+
+  def Stop(self):
+    """Stops profiling.
+
+    The instrumented methods and open functions are restored and the
+    profiling report and cProfile statistics are written, if their paths
+    were specified.
+    """
+    self.wall_time = time.time() - self._start_time
+
+    if self._cprofile:
+      self._cprofile.disable()
+
+    builtins.open = self._original_builtins_open
+    io.open = self._original_io_open
+
+    for class_object, name, method in reversed(self._instrumented_methods):
+      setattr(class_object, name, method)
+
+    self._instrumented_methods = []
+
+    if self._report_path:
+      self.WriteReport(self._report_path)
+
+    if self._cprofile_path:
+      self.WriteCProfileStatistics(self._cprofile_path)
+
+  def WriteCProfileStatistics(self, path):
+    """Writes the cProfile statistics to a file.
+
+    The statistics can be read with the pstats module.
+
+    Args:
+      path (str): path of the cProfile statistics file.
+    """
+    if self._cprofile:
+      self._cprofile.dump_stats(path)
+
+  def WriteReport(self, path):
+    """Writes the profiling report to a JSON file.
+
+    Args:
+      path (str): path of the report file.
+    """
+    report = json.dumps(self.GetReport(), indent=2, sort_keys=True)
+
+    with io.open(path, 'w', encoding='utf8') as file_object:
+      file_object.write('{0:s}\n'.format(report))
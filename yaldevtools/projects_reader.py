@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Reader for the projects definition file."""
+
+from __future__ import unicode_literals
+
+import json
+
+try:
+  import ConfigParser as configparser
+except ImportError:
+  import configparser  # pylint: disable=import-error
+
+
+class Project(object):
+  """Project definition.
+
+  Attributes:
+    appveyor_identifier (str): AppVeyor identifier.
+    category (str): category.
+    coverity_badge (int): Coverity badge identifier.
+    description (str): description.
+    display_name (str): display name.
+    documentation_only (bool): True if the project only contains documentation.
+    group (int): group.
+    name (str): name.
+  """
+
+  def __init__(self, name):
+    """Initializes a project.
+
+    Args:
+      name (str): name.
+    """
+    super(Project, self).__init__()
+    self.appveyor_identifier = None
+    self.category = None
+    self.coverity_badge = None
+    self.description = None
+    self.display_name = name
+    self.documentation_only = False
+    self.group = None
+    self.name = name
+
+
+class ProjectsReader(object):
+  """Project definition reader."""
+
+  def __init__(self):
+    """Initializes a projects definition reader."""
+    super(ProjectsReader, self).__init__()
+    # TODO: replace by:
+    # self._config_parser = configparser. ConfigParser(interpolation=None)
+    self._config_parser = configparser.RawConfigParser()
+
+  def _GetConfigValue(self, section_name, value_name):
+    """Retrieves a value from the config parser.
+
+    Args:
+      section_name (str): name of the section that contains the value.
+      value_name (str): name of the value.
+
+    Returns:
+      object: value or None if the value is not available.
+    """
+    try:
+      value = self._config_parser.get(section_name, value_name)
+    except configparser.NoOptionError:
+      value = None
+
+    if value:
+      return json.loads(value)
+
+    return None
+
+  def ReadFromFile(self, filename):
+    """Reads the projects from file.
+
+    Args:
+      filename (str): path of the projects file.
+
+    Returns:
+      list[Project]: project.
+    """
+    self._config_parser.read([filename])
+
+    projects = []
+    for project_name in self._config_parser.sections():
+      project = Project(project_name)
+
+      project.appveyor_identifier = self._GetConfigValue(
+          project_name, 'appveyor_identifier')
+
+      project.category = self._GetConfigValue(project_name, 'category')
+
+      project.coverity_badge = self._GetConfigValue(
+          project_name, 'coverity_badge')
+
+      project.description = self._GetConfigValue(project_name, 'description')
+
+      project.display_name = self._GetConfigValue(
+          project_name, 'display_name')
+
+      project.documentation_only = self._GetConfigValue(
+          project_name, 'documentation_only')
+
+      project.group = self._GetConfigValue(project_name, 'group')
+
+      projects.append(project)
+
+    return projects
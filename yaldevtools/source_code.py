@@ -16,6 +16,8 @@ class EnumDeclaration(object):
     constants (dict[str, str]): constant values per name.
   """
 
+  __slots__ = ('constants', 'name')
+
   def __init__(self, name):
     """Initializes an enumeration type declaration.
 
@@ -30,6 +32,8 @@ class EnumDeclaration(object):
 class FunctionArgument(object):
   """Function argument."""
 
+  __slots__ = ('_strings', )
+
   def __init__(self, argument_string):
     """Initializes a function argument.
 
@@ -86,6 +90,11 @@ class FunctionPrototype(object):
     value_description (str): description of the value.
   """
 
+  __slots__ = (
+      '_parsed_value', '_value_name', '_value_type', 'arguments', 'have_bfio',
+      'have_debug_output', 'have_extern', 'have_wide_character_type', 'name',
+      'return_type', 'return_values', 'value_description')
+
   def __init__(self, name, return_type):
     """Initializes a function prototype.
 
@@ -203,17 +212,21 @@ class FunctionPrototype(object):
 class PythonTypeObjectFunctionPrototype(object):
   """Python type object function prototype.
 
+  The type function, value name and descriptions are derived from the other
+  attributes on first use and cached. Assigning arguments, data_type,
+  function_type, return_values or value_description invalidates the cached
+  values, hence arguments should be replaced rather than changed in place.
+
   Attributes:
-    arguments (list[str]): arguments.
-    data_type (str): data type.
-    function_type (str): function type.
     object_type (str): object type.
-    return_values (set[str]): return values or None if the function does not
-        return values.
-    value_description (str): description of the value.
     value_type (str): value type.
   """
 
+  __slots__ = (
+      '_arguments', '_cached_values', '_data_type', '_function_type', '_name',
+      '_python_module_name', '_return_values', '_type_function', '_type_name',
+      '_value_description', 'object_type', 'value_type')
+
   def __init__(self, python_module_name, type_name, type_function):
     """Initializes a Python type object function prototype.
 
@@ -223,164 +236,117 @@ class PythonTypeObjectFunctionPrototype(object):
       type_function (str): type function.
     """
     super(PythonTypeObjectFunctionPrototype, self).__init__()
+    self._arguments = []
+    self._cached_values = {}
+    self._data_type = definitions.DATA_TYPE_NONE
+    self._function_type = None
     self._name = None
     self._python_module_name = python_module_name
+    self._return_values = None
     self._type_function = type_function
     self._type_name = type_name
-    self._value_name = None
-    self.arguments = []
-    self.data_type = definitions.DATA_TYPE_NONE
-    self.function_type = None
+    self._value_description = None
     self.object_type = None
-    self.return_values = None
-    self.value_description = None
     self.value_type = None
 
   @property
-  def name(self):
-    """str: name."""
-    if self._name is None:
-      self._name = '{0:s}_{1:s}_{2:s}'.format(
-          self._python_module_name, self._type_name, self.type_function)
-
-    return self._name
-
-  @property
-  def type_function(self):
-    """str: type function."""
-    # TODO: make overrides more generic.
-    if self._type_function == 'set_parent_file':
-      return 'set_parent'
-
-    if (self._type_function.startswith('copy_') and
-        not self._type_function.startswith('copy_from_')):
-      return 'get_{0:s}'.format(self._type_function[5:])
-
-    if (self._type_function.startswith('get_utf8_') or
-        self._type_function.startswith('set_utf8_')):
-      return ''.join([self._type_function[:4], self._type_function[9:]])
-
-    if self._type_function.startswith('get_data_as_'):
-      _, _, type_function_suffix = self._type_function.partition('_data_as_')
-
-      if type_function_suffix in (
-          '16bit_integer', '32bit_integer', '64bit_integer'):
-        return 'get_data_as_integer'
-
-      elif type_function_suffix in ('filetime', 'floatingtime'):
-        return 'get_data_as_datetime'
+  def arguments(self):
+    """list[str]: arguments."""
+    return self._arguments
 
-      elif type_function_suffix == 'utf8_string':
-        return 'get_data_as_string'
-
-      else:
-        return self._type_function
-
-    if self._type_function.startswith('get_'):
-      type_function_prefix, _, type_function_suffix = (
-          self._type_function.partition('_by_'))
+  @arguments.setter
+  def arguments(self, arguments):
+    """Sets the arguments.
 
-      if type_function_suffix in ('entry', 'index'):
-        return type_function_prefix
-
-      if type_function_suffix in ('utf8_name', 'utf8_path'):
-        return ''.join([self._type_function[:-10], self._type_function[-5:]])
-
-      if self._type_function.endswith('_utf8_string'):
-        return ''.join([self._type_function[:-12], self._type_function[-7:]])
-
-      if self._type_function.endswith('_utf8_string_size'):
-        return ''.join([self._type_function[:-17], self._type_function[-12:]])
-
-    return self._type_function
+    Args:
+      arguments (list[str]): arguments.
+    """
+    self._arguments = arguments
+    self._cached_values = {}
 
   @property
-  def value_name(self):
-    """str: value name."""
-    if self._value_name is None:
-      # TODO: make overrides more generic.
-      if self.function_type == definitions.FUNCTION_TYPE_COPY:
-        if self._type_function.startswith('copy_'):
-          self._value_name = self._type_function[5:]
+  def data_type(self):
+    """str: data type."""
+    return self._data_type
 
-      elif self.function_type == definitions.FUNCTION_TYPE_COPY_FROM:
-        if self._type_function.startswith('copy_from_'):
-          self._value_name = self._type_function[10:]
+  @data_type.setter
+  def data_type(self, data_type):
+    """Sets the data type.
 
-      elif self.function_type == definitions.FUNCTION_TYPE_COPY_TO:
-        if self._type_function.startswith('get_'):
-          self._value_name = self._type_function[4:]
-
-      elif self.function_type in (
-          definitions.FUNCTION_TYPE_GET,
-          definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
-          definitions.FUNCTION_TYPE_GET_BY_INDEX,
-          definitions.FUNCTION_TYPE_GET_BY_NAME,
-          definitions.FUNCTION_TYPE_GET_BY_PATH):
-        type_function_prefix, _, _ = self._type_function.partition('_by_')
-
-        if type_function_prefix.startswith('get_'):
-          type_function_prefix = type_function_prefix[4:]
+    Args:
+      data_type (str): data type.
+    """
+    self._data_type = data_type
+    self._cached_values = {}
 
-        if type_function_prefix.startswith('utf8_'):
-          type_function_prefix = type_function_prefix[5:]
+  @property
+  def function_type(self):
+    """str: function type."""
+    return self._function_type
 
-        self._value_name = type_function_prefix
+  @function_type.setter
+  def function_type(self, function_type):
+    """Sets the function type.
 
-      elif self.function_type == definitions.FUNCTION_TYPE_IS:
-        if self._type_function.startswith('is_'):
-          self._value_name = self._type_function[3:]
+    Args:
+      function_type (str): function type.
+    """
+    self._function_type = function_type
+    self._cached_values = {}
 
-      elif self.function_type == definitions.FUNCTION_TYPE_SET:
-        if self._type_function.startswith('set_utf8_'):
-          self._value_name = self._type_function[9:]
+  @property
+  def name(self):
+    """str: name."""
+    if self._name is None:
+      self._name = '{0:s}_{1:s}_{2:s}'.format(
+          self._python_module_name, self._type_name, self.type_function)
 
-        elif self._type_function.startswith('set_'):
-          self._value_name = self._type_function[4:]
+    return self._name
 
-    return self._value_name
+  @property
+  def return_values(self):
+    """set[str]: return values or None if the function does not return
+        values."""
+    return self._return_values
 
-  def DataTypeIsDatetime(self):
-    """Determines if the data type is a datetime type.
+  @return_values.setter
+  def return_values(self, return_values):
+    """Sets the return values.
 
-    Returns:
-      bool: True if the data type is a datetime type.
+    Args:
+      return_values (set[str]): return values or None if the function does
+          not return values.
     """
-    return self.data_type in (
-        definitions.DATA_TYPE_FAT_DATE_TIME,
-        definitions.DATA_TYPE_FILETIME,
-        definitions.DATA_TYPE_FLOATINGTIME,
-        definitions.DATA_TYPE_POSIX_TIME)
+    self._return_values = return_values
+    self._cached_values = {}
 
-  def DataTypeIsFloat(self):
-    """Determines if the data type is a floating-point type.
+  @property
+  def type_function(self):
+    """str: type function."""
+    return self._GetCachedValue('type_function', self._DetermineTypeFunction)
 
-    Returns:
-      bool: True if the data type is a floating-point type.
-    """
-    return self.data_type in (
-        definitions.DATA_TYPE_FLOAT, 
-        definitions.DATA_TYPE_DOUBLE)
+  @property
+  def value_description(self):
+    """str: description of the value."""
+    return self._value_description
 
-  def DataTypeIsInteger(self):
-    """Determines if the data type is an integer type.
+  @value_description.setter
+  def value_description(self, value_description):
+    """Sets the description of the value.
 
-    Returns:
-      bool: True if the data type is an integer type.
+    Args:
+      value_description (str): description of the value.
     """
-    return self.data_type in (
-        definitions.DATA_TYPE_INT,
-        definitions.DATA_TYPE_INT32,
-        definitions.DATA_TYPE_OFF64,
-        definitions.DATA_TYPE_SIZE32,
-        definitions.DATA_TYPE_SIZE64,
-        definitions.DATA_TYPE_UINT8,
-        definitions.DATA_TYPE_UINT16,
-        definitions.DATA_TYPE_UINT32,
-        definitions.DATA_TYPE_UINT64)
+    self._value_description = value_description
+    self._cached_values = {}
 
-  def GetAttributeDescription(self):
-    """Retrieves the fuction as attribute description.
+  @property
+  def value_name(self):
+    """str: value name."""
+    return self._GetCachedValue('value_name', self._DetermineValueName)
+
+  def _DetermineAttributeDescription(self):
+    """Determines the fuction as attribute description.
 
     Returns:
       str: function as attribute description.
@@ -428,8 +394,8 @@ class PythonTypeObjectFunctionPrototype(object):
 
     return description
 
-  def GetDataTypeDescription(self):
-    """Retrieves the data type description.
+  def _DetermineDataTypeDescription(self):
+    """Determines the data type description.
 
     Returns:
       str: data type description.
@@ -473,8 +439,8 @@ class PythonTypeObjectFunctionPrototype(object):
 
     return data_type_description
 
-  def GetDescription(self):
-    """Retrieves the description.
+  def _DetermineDescription(self):
+    """Determines the description.
 
     Returns:
       list[str]: lines of the description.
@@ -603,7 +569,108 @@ class PythonTypeObjectFunctionPrototype(object):
 
     return description
 
-  def GetValueNameAndPrefix(self):
+  def _DetermineTypeFunction(self):
+    """Determines the type function.
+
+    Returns:
+      str: type function.
+    """
+    # TODO: make overrides more generic.
+    if self._type_function == 'set_parent_file':
+      return 'set_parent'
+
+    if (self._type_function.startswith('copy_') and
+        not self._type_function.startswith('copy_from_')):
+      return 'get_{0:s}'.format(self._type_function[5:])
+
+    if (self._type_function.startswith('get_utf8_') or
+        self._type_function.startswith('set_utf8_')):
+      return ''.join([self._type_function[:4], self._type_function[9:]])
+
+    if self._type_function.startswith('get_data_as_'):
+      _, _, type_function_suffix = self._type_function.partition('_data_as_')
+
+      if type_function_suffix in (
+          '16bit_integer', '32bit_integer', '64bit_integer'):
+        return 'get_data_as_integer'
+
+      elif type_function_suffix in ('filetime', 'floatingtime'):
+        return 'get_data_as_datetime'
+
+      elif type_function_suffix == 'utf8_string':
+        return 'get_data_as_string'
+
+      else:
+        return self._type_function
+
+    if self._type_function.startswith('get_'):
+      type_function_prefix, _, type_function_suffix = (
+          self._type_function.partition('_by_'))
+
+      if type_function_suffix in ('entry', 'index'):
+        return type_function_prefix
+
+      if type_function_suffix in ('utf8_name', 'utf8_path'):
+        return ''.join([self._type_function[:-10], self._type_function[-5:]])
+
+      if self._type_function.endswith('_utf8_string'):
+        return ''.join([self._type_function[:-12], self._type_function[-7:]])
+
+      if self._type_function.endswith('_utf8_string_size'):
+        return ''.join([self._type_function[:-17], self._type_function[-12:]])
+
+    return self._type_function
+
+  def _DetermineValueName(self):
+    """Determines the value name.
+
+    Returns:
+      str: value name or None if not available.
+    """
+    value_name = None
+    # TODO: make overrides more generic.
+    if self.function_type == definitions.FUNCTION_TYPE_COPY:
+      if self._type_function.startswith('copy_'):
+        value_name = self._type_function[5:]
+
+    elif self.function_type == definitions.FUNCTION_TYPE_COPY_FROM:
+      if self._type_function.startswith('copy_from_'):
+        value_name = self._type_function[10:]
+
+    elif self.function_type == definitions.FUNCTION_TYPE_COPY_TO:
+      if self._type_function.startswith('get_'):
+        value_name = self._type_function[4:]
+
+    elif self.function_type in (
+        definitions.FUNCTION_TYPE_GET,
+        definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
+        definitions.FUNCTION_TYPE_GET_BY_INDEX,
+        definitions.FUNCTION_TYPE_GET_BY_NAME,
+        definitions.FUNCTION_TYPE_GET_BY_PATH):
+      type_function_prefix, _, _ = self._type_function.partition('_by_')
+
+      if type_function_prefix.startswith('get_'):
+        type_function_prefix = type_function_prefix[4:]
+
+      if type_function_prefix.startswith('utf8_'):
+        type_function_prefix = type_function_prefix[5:]
+
+      value_name = type_function_prefix
+
+    elif self.function_type == definitions.FUNCTION_TYPE_IS:
+      if self._type_function.startswith('is_'):
+        value_name = self._type_function[3:]
+
+    elif self.function_type == definitions.FUNCTION_TYPE_SET:
+      if self._type_function.startswith('set_utf8_'):
+        value_name = self._type_function[9:]
+
+      elif self._type_function.startswith('set_'):
+        value_name = self._type_function[4:]
+
+    return value_name
+
+  def _DetermineValueNameAndPrefix(self):
     """Determines the value name and its prefix.
 
     Returns:
@@ -615,3 +682,97 @@ class PythonTypeObjectFunctionPrototype(object):
         return value_name, value_name_prefix
 
     return self.value_name, None
+
+  def _GetCachedValue(self, key, determine_function):
+    """Retrieves a cached derived value.
+
+    Args:
+      key (str): key of the derived value.
+      determine_function (function): function that determines the derived
+          value when it is not cached.
+
+    Returns:
+      object: derived value.
+    """
+    try:
+      return self._cached_values[key]
+    except KeyError:
+      value = determine_function()
+      self._cached_values[key] = value
+      return value
+
+  def DataTypeIsDatetime(self):
+    """Determines if the data type is a datetime type.
+
+    Returns:
+      bool: True if the data type is a datetime type.
+    """
+    return self.data_type in (
+        definitions.DATA_TYPE_FAT_DATE_TIME,
+        definitions.DATA_TYPE_FILETIME,
+        definitions.DATA_TYPE_FLOATINGTIME,
+        definitions.DATA_TYPE_POSIX_TIME)
+
+  def DataTypeIsFloat(self):
+    """Determines if the data type is a floating-point type.
+
+    Returns:
+      bool: True if the data type is a floating-point type.
+    """
+    return self.data_type in (
+        definitions.DATA_TYPE_FLOAT, 
+        definitions.DATA_TYPE_DOUBLE)
+
+  def DataTypeIsInteger(self):
+    """Determines if the data type is an integer type.
+
+    Returns:
+      bool: True if the data type is an integer type.
+    """
+    return self.data_type in (
+        definitions.DATA_TYPE_INT,
+        definitions.DATA_TYPE_INT32,
+        definitions.DATA_TYPE_OFF64,
+        definitions.DATA_TYPE_SIZE32,
+        definitions.DATA_TYPE_SIZE64,
+        definitions.DATA_TYPE_UINT8,
+        definitions.DATA_TYPE_UINT16,
+        definitions.DATA_TYPE_UINT32,
+        definitions.DATA_TYPE_UINT64)
+
+  def GetAttributeDescription(self):
+    """Retrieves the fuction as attribute description.
+
+    Returns:
+      str: function as attribute description.
+    """
+    return self._GetCachedValue(
+        'attribute_description', self._DetermineAttributeDescription)
+
+  def GetDataTypeDescription(self):
+    """Retrieves the data type description.
+
+    Returns:
+      str: data type description.
+    """
+    return self._GetCachedValue(
+        'data_type_description', self._DetermineDataTypeDescription)
+
+  def GetDescription(self):
+    """Retrieves the description.
+
+    Returns:
+      list[str]: lines of the description.
+    """
+    description = self._GetCachedValue(
+        'description', self._DetermineDescription)
+    return list(description)
+
+  def GetValueNameAndPrefix(self):
+    """Determines the value name and its prefix.
+
+    Returns:
+      tuple[str, str]: value name and prefix.
+    """
+    return self._GetCachedValue(
+        'value_name_and_prefix', self._DetermineValueNameAndPrefix)
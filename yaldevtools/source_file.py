@@ -4,10 +4,11 @@
 from __future__ import unicode_literals
 
 import collections
-import io
 import os
 
-from yaldevtools import source_code
+from yaldevtools import file_overlay
+from yaldevtools import parse_cache
+from yaldevtools import source_parser
 
 
 class DefinitionsIncludeHeaderFile(object):
@@ -34,40 +35,13 @@ class DefinitionsIncludeHeaderFile(object):
     Args:
       project_configuration (ProjectConfiguration): project configuration.
     """
-    self.enum_declarations = []
+    parser = source_parser.DeclarationParser(
+        project_configuration.library_name)
 
-    enum_prefix = 'enum '.format(project_configuration.library_name.upper())
-    enum_prefix_length = len(enum_prefix)
+    with file_overlay.FILE_OVERLAY.Open(self._path) as file_object:
+      parser.Parse(file_object)
 
-    in_enum = False
-    enum_declaration = None
-
-    with io.open(self._path, 'r', encoding='utf8') as file_object:
-      for line in file_object.readlines():
-        line = line.strip()
-
-        if in_enum:
-          if line.startswith('};'):
-            in_enum = False
-
-            self.enum_declarations.append(enum_declaration)
-            enum_declaration = None
-
-          elif not line.startswith('{'):
-            definition, _, value = line.partition('=')
-
-            definition = definition.strip()
-            definition = definition.rstrip(',')
-
-            value = value.strip()
-            value = value.rstrip(',')
-
-            enum_declaration.constants[definition] = value
-
-        if line.startswith(enum_prefix):
-          in_enum = True
-          enum_declaration = source_code.EnumDeclaration(
-              line[enum_prefix_length:])
+    self.enum_declarations = parser.enum_declarations
 
 
 class LibraryHeaderFile(object):
@@ -84,6 +58,11 @@ class LibraryHeaderFile(object):
     types (list[str]): type names.
   """
 
+  # Attributes that are set by parsing and stored in the parse cache.
+  _PARSED_ATTRIBUTES = (
+      '_library_name', 'functions_per_name', 'has_read_write_lock',
+      'have_internal_functions', 'types')
+
   def __init__(self, path):
     """Initializes a library header file.
 
@@ -111,169 +90,171 @@ class LibraryHeaderFile(object):
     self._library_name = project_configuration.library_name
 
     self.functions_per_name = collections.OrderedDict()
-    self.types = []
 
-    define_extern = '{0:s}_EXTERN'.format(self._library_name.upper())
+    function_descriptions = {}
+    if source_file_object:
+      function_descriptions = self._ReadFunctionDescriptions(
+          source_file_object)
 
-    define_have_debug_output = '#if defined( HAVE_DEBUG_OUTPUT )'
+    parser = source_parser.DeclarationParser(self._library_name)
+    parser.Parse(header_file_object)
 
-    define_have_wide_character_type = (
-        '#if defined( HAVE_WIDE_CHARACTER_TYPE )')
+    for function_declaration in parser.function_declarations:
+      function_prototype = function_declaration.function_prototype
 
-    function_argument = None
-    function_prototype = None
-    have_extern = False
-    have_debug_output = False
-    have_wide_character_type = False
-    in_function_prototype = False
+      return_values, value_description = function_descriptions.get(
+          function_declaration.function_line, (None, None))
 
-    for line in header_file_object.readlines():
-      line = line.strip()
+      function_prototype.have_debug_output = (
+          'HAVE_DEBUG_OUTPUT' in function_declaration.conditions)
+      function_prototype.have_wide_character_type = (
+          'HAVE_WIDE_CHARACTER_TYPE' in function_declaration.conditions)
+      function_prototype.return_values = return_values
+      function_prototype.value_description = value_description
 
-      if in_function_prototype:
-        # Check if we have a callback function argument.
-        if line.endswith('('):
-          argument_string = '{0:s} '.format(line)
-          function_argument = source_code.FunctionArgument(argument_string)
+      if not function_prototype.have_extern:
+        self.have_internal_functions = True
 
-        else:
-          if line.endswith(' );'):
-            argument_string = line[:-3]
+      self.functions_per_name[function_prototype.name] = function_prototype
 
-          else:
-            # Get the part of the line before the ','.
-            argument_string, _, _ = line.partition(',')
+    if parser.has_read_write_lock:
+      self.has_read_write_lock = True
 
-          if not function_argument:
-            function_prototype.AddArgumentString(argument_string)
+    self.types = sorted(parser.struct_types)
 
-          else:
-            function_argument.AddArgumentString(argument_string)
+  def _ReadFiles(self, project_configuration):
+    """Reads the header and source files.
 
-        if function_argument and line.endswith(' ),'):
-          function_prototype.AddArgument(function_argument)
-          function_argument = None
-
-        elif line.endswith(' );'):
-          self.functions_per_name[function_prototype.name] = (
-              function_prototype)
-
-          function_prototype = None
-          in_function_prototype = False
-          have_extern = False
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
 
-      elif line.endswith('('):
-        function_line = line
+    Raises:
+      IOError: if the header file is missing.
+    """
+    header_file_path = self.path
+    if not file_overlay.FILE_OVERLAY.Exists(header_file_path):
+      # Fallback to .h.in file if available.
+      header_file_path = '{0:s}.in'.format(self.path)
 
-        # Get the part of the line before the library name.
-        data_type, _, _ = line.partition(self._library_name)
+    if not file_overlay.FILE_OVERLAY.Exists(header_file_path):
+      raise IOError('Missing include header file: {0:s}'.format(self.path))
 
-        # Get the part of the line after the data type.
-        line = line[len(data_type):]
-        data_type = data_type.strip()
+    source_file_path = '{0:s}.c'.format(self.path[:-2])
+    with file_overlay.FILE_OVERLAY.Open(
+        header_file_path) as header_file_object:
+      if file_overlay.FILE_OVERLAY.Exists(source_file_path):
+        source_file_object = file_overlay.FILE_OVERLAY.Open(source_file_path)
+      else:
+        source_file_object = None
 
-        # Get the part of the remainder of the line before the '('.
-        name, _, _ = line.partition('(')
+      try:
+        self._ReadFileObject(
+            project_configuration, header_file_object, source_file_object)
 
-        return_values = None
-        value_description = None
+      finally:
         if source_file_object:
-          source_line = source_file_object.readline()
-
-          while source_line:
-            if source_line.startswith('/* Reads '):
-              value_description = source_line.strip()
-              value_description = value_description[9:]
-
-              if value_description.endswith(' at the current offset into a buffer'):
-                value_description = value_description[:-36]
-
-              elif value_description.endswith(' at a specific offset'):
-                value_description = value_description[:-21]
-
-            elif source_line.startswith('/* Retrieves '):
-              value_description = source_line.strip()
-              value_description = value_description[13:]
-
-              if value_description.startswith('a '):
-                value_description = value_description[2:]
-              elif value_description.startswith('an '):
-                value_description = value_description[3:]
-              elif value_description.startswith('the '):
-                value_description = value_description[4:]
-
-              if value_description.startswith('specific '):
-                value_description = value_description[9:]
-
-              if value_description.startswith('UTF-8 '):
-                value_description = value_description[6:]
-              elif value_description.startswith('UTF-16 '):
-                value_description = value_description[7:]
-
-              if value_description.startswith('string value of '):
-                value_description = value_description[16:]
-
-              if value_description.startswith('a '):
-                value_description = value_description[2:]
-              elif value_description.startswith('an '):
-                value_description = value_description[3:]
-              elif value_description.startswith('the '):
-                value_description = value_description[4:]
-
-            elif source_line.startswith('/* Seeks a certain offset within the '):
-               value_description = source_line.strip()
-               value_description = value_description[37:]
-
-            elif source_line.startswith(' * Returns '):
-              return_values = set()
-              if ' -1 ' in source_line:
-                return_values.add('-1')
-              if ' 0 ' in source_line:
-                return_values.add('0')
-              if ' 1 ' in source_line:
-                return_values.add('1')
-              if ' NULL ' in source_line:
-                return_values.add('NULL')
-
-            elif function_line == source_line.strip():
-              break
-
-            source_line = source_file_object.readline()
-
-        function_prototype = source_code.FunctionPrototype(name, data_type)
-        function_prototype.have_extern = have_extern
-        function_prototype.have_debug_output = have_debug_output
-        function_prototype.have_wide_character_type = (
-            have_wide_character_type)
-        function_prototype.return_values = return_values
-        function_prototype.value_description = value_description
-
-        if not have_extern:
-          self.have_internal_functions = True
-
-        in_function_prototype = True
-
-      elif line.startswith(define_extern):
-        have_extern = True
-
-      elif line.startswith(define_have_debug_output):
-        have_debug_output = True
+          source_file_object.close()
 
-      elif line.startswith(define_have_wide_character_type):
-        have_wide_character_type = True
+  def _ReadFunctionDescriptions(self, source_file_object):
+    """Reads the function descriptions from a source file-like object.
 
-      elif line.startswith('#endif'):
-        have_debug_output = False
-        have_wide_character_type = False
+    The source file is read in a single pass. The value description and
+    return values are taken from the comments that precede a function
+    definition.
 
-      elif line.startswith('typedef struct '):
-        type_name = line.split(' ')[2]
-        self.types.append(type_name)
+    Args:
+      source_file_object (file): source file-like object.
 
-      elif line == 'libcthreads_read_write_lock_t *read_write_lock;':
-        self.has_read_write_lock = True
+    Returns:
+      dict[str, tuple[set[str], str]]: return values and value description
+          per first line of a function definition, such as
+          "int libyal_file_open(". The return values or value description
+          are None if not available.
+    """
+    function_descriptions = {}
+
+    return_values = None
+    value_description = None
+
+    for source_line in source_file_object.readlines():
+      if source_line.startswith('/* Reads '):
+        value_description = source_line.strip()
+        value_description = value_description[9:]
+
+        if value_description.endswith(' at the current offset into a buffer'):
+          value_description = value_description[:-36]
+
+        elif value_description.endswith(' at a specific offset'):
+          value_description = value_description[:-21]
+
+      elif source_line.startswith('/* Retrieves '):
+        value_description = source_line.strip()
+        value_description = value_description[13:]
+
+        if value_description.startswith('a '):
+          value_description = value_description[2:]
+        elif value_description.startswith('an '):
+          value_description = value_description[3:]
+        elif value_description.startswith('the '):
+          value_description = value_description[4:]
+
+        if value_description.startswith('specific '):
+          value_description = value_description[9:]
+
+        if value_description.startswith('UTF-8 '):
+          value_description = value_description[6:]
+        elif value_description.startswith('UTF-16 '):
+          value_description = value_description[7:]
+
+        if value_description.startswith('string value of '):
+          value_description = value_description[16:]
+
+        if value_description.startswith('a '):
+          value_description = value_description[2:]
+        elif value_description.startswith('an '):
+          value_description = value_description[3:]
+        elif value_description.startswith('the '):
+          value_description = value_description[4:]
+
+      elif source_line.startswith('/* Seeks a certain offset within the '):
+        value_description = source_line.strip()
+        value_description = value_description[37:]
+
+      elif source_line.startswith(' * Returns '):
+        return_values = set()
+        if ' -1 ' in source_line:
+          return_values.add('-1')
+        if ' 0 ' in source_line:
+          return_values.add('0')
+        if ' 1 ' in source_line:
+          return_values.add('1')
+        if ' NULL ' in source_line:
+          return_values.add('NULL')
+
+      elif source_line[:1].isalpha() or source_line[:1] == '_':
+        function_line = source_line.strip()
+        if function_line.endswith('('):
+          # A function is defined only once, except for variants that depend
+          # on preprocessor conditions, of which the first is used.
+          if function_line not in function_descriptions:
+            function_descriptions[function_line] = (
+                return_values, value_description)
+
+          return_values = None
+          value_description = None
+
+    return function_descriptions
+
+  def GetInputFiles(self):
+    """Retrieves the paths of the files the header file is read from.
 
-    self.types = sorted(self.types)
+    Returns:
+      list[str]: paths of the header file, its .h.in fallback and the
+          corresponding source file.
+    """
+    return [
+        self.path, '{0:s}.in'.format(self.path),
+        '{0:s}.c'.format(self.path[:-2])]
 
   def GetTypeFunction(self, type_name, type_function):
     """Retrieves the function prototype of a specific type function.
@@ -297,31 +278,26 @@ class LibraryHeaderFile(object):
   def Read(self, project_configuration):
     """Reads a header file.
 
+    The parsed header file is retrieved from the parse cache when the header
+    and source files did not change.
+
     Args:
       project_configuration (ProjectConfiguration): project configuration.
     """
-    header_file_path = self.path
-    if not os.path.exists(header_file_path):
-      # Fallback to .h.in file if available.
-      header_file_path = '{0:s}.in'.format(self.path)
+    cache_key = parse_cache.PARSE_CACHE.GetKey(
+        'LibraryHeaderFile', [project_configuration.library_name],
+        self.GetInputFiles())
 
-    if not os.path.exists(header_file_path):
-      raise IOError('Missing include header file: {0:s}'.format(self.path))
+    values = parse_cache.PARSE_CACHE.GetValues(cache_key)
+    if values is not None:
+      for name, value in values.items():
+        setattr(self, name, value)
+      return
 
-    source_file_path = '{0:s}.c'.format(self.path[:-2])
-    with io.open(header_file_path, 'r', encoding='utf8') as header_file_object:
-      if os.path.exists(source_file_path):
-        source_file_object = io.open(source_file_path, 'r', encoding='utf8')
-      else:
-        source_file_object = None
+    self._ReadFiles(project_configuration)
 
-      try:
-        self._ReadFileObject(
-            project_configuration, header_file_object, source_file_object)
-
-      finally:
-        if source_file_object:
-          source_file_object.close()
+    values = {name: getattr(self, name) for name in self._PARSED_ATTRIBUTES}
+    parse_cache.PARSE_CACHE.SetValues(cache_key, values)
 
 
 class LibraryIncludeHeaderFile(object):
@@ -339,6 +315,11 @@ class LibraryIncludeHeaderFile(object):
     section_names (list[str]): section names.
   """
 
+  # Attributes that are set by parsing and stored in the parse cache.
+  _PARSED_ATTRIBUTES = (
+      '_library_name', 'functions_per_name', 'functions_per_section',
+      'have_bfio', 'have_wide_character_type', 'section_names')
+
   _SIGNATURE_TYPES = ('container', 'file', 'handle', 'store', 'volume')
 
   def __init__(self, path):
@@ -433,6 +414,60 @@ class LibraryIncludeHeaderFile(object):
       else:
         self._api_types_with_input_group[group_name] = section_name
 
+  def _ReadFile(self, project_configuration):
+    """Reads the include header file.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+    """
+    self._library_name = project_configuration.library_name
+
+    self.functions_per_name = collections.OrderedDict()
+    self.functions_per_section = {}
+    self.have_bfio = False
+    self.have_wide_character_type = False
+    self.section_names = []
+
+    define_have_bfio = '{0:s}_HAVE_BFIO'.format(self._library_name.upper())
+
+    define_have_wide_character_type = '{0:s}_HAVE_WIDE_CHARACTER_TYPE'.format(
+        self._library_name.upper())
+
+    parser = source_parser.DeclarationParser(self._library_name)
+
+    with file_overlay.FILE_OVERLAY.Open(self._path) as file_object:
+      parser.Parse(file_object)
+
+    self.section_names = parser.section_names
+    for section_name in self.section_names:
+      self.functions_per_section[section_name] = []
+
+    for function_declaration in parser.function_declarations:
+      function_prototype = function_declaration.function_prototype
+      if not function_prototype.have_extern:
+        continue
+
+      conditions = function_declaration.conditions
+
+      function_prototype.have_bfio = define_have_bfio in conditions
+      function_prototype.have_debug_output = 'HAVE_DEBUG_OUTPUT' in conditions
+      function_prototype.have_wide_character_type = (
+          define_have_wide_character_type in conditions)
+
+      if function_prototype.have_bfio:
+        self.have_bfio = True
+      if function_prototype.have_wide_character_type:
+        self.have_wide_character_type = True
+
+      if function_declaration.is_deprecated:
+        continue
+
+      # TODO: handle section_name is None
+      self.functions_per_name[function_prototype.name] = function_prototype
+
+      self.functions_per_section[function_declaration.section_name].append(
+          function_prototype)
+
   def GetAPIFunctionTestGroups(self):
     """Determines the API function test groups.
 
@@ -502,6 +537,22 @@ class LibraryIncludeHeaderFile(object):
       list[FunctionPrototype]: function prototypes of the functions in
           the group.
     """
+    section_name = self.GetFunctionGroupSectionName(group_name)
+    if not section_name:
+      return []
+
+    return self.functions_per_section.get(section_name, [])
+
+  def GetFunctionGroupSectionName(self, group_name):
+    """Retrieves the section name of a function group.
+
+    Args:
+      group_name (str): group name.
+
+    Returns:
+      str: name of the section that contains the functions of the group or
+          None if not available, such as for a pseudo type group.
+    """
     section_name = self._api_functions_group.get(group_name, None)
     if not section_name:
       section_name = self._api_functions_with_input_group.get(group_name, None)
@@ -509,10 +560,8 @@ class LibraryIncludeHeaderFile(object):
       section_name = self._api_types_group.get(group_name, None)
     if not section_name:
       section_name = self._api_types_with_input_group.get(group_name, None)
-    if not section_name:
-      return []
 
-    return self.functions_per_section.get(section_name, [])
+    return section_name
 
   def HasErrorArgument(self, group_name):
     """Determines if a function group has functions with an error argument.
@@ -567,140 +616,64 @@ class LibraryIncludeHeaderFile(object):
   def Read(self, project_configuration):
     """Reads the include header file.
 
+    The parsed include header file is retrieved from the parse cache when
+    the include header file did not change.
+
     Args:
       project_configuration (ProjectConfiguration): project configuration.
     """
-    self._library_name = project_configuration.library_name
-
-    self.functions_per_name = collections.OrderedDict()
-    self.functions_per_section = {}
-    self.have_bfio = False
-    self.have_wide_character_type = False
-    self.section_names = []
-
-    define_deprecated = '{0:s}_DEPRECATED'.format(self._library_name.upper())
+    cache_key = parse_cache.PARSE_CACHE.GetKey(
+        'LibraryIncludeHeaderFile', [project_configuration.library_name],
+        [self._path])
 
-    define_extern = '{0:s}_EXTERN'.format(self._library_name.upper())
+    values = parse_cache.PARSE_CACHE.GetValues(cache_key)
+    if values is not None:
+      self.SetParsedValues(values)
+      return
 
-    define_have_bfio = '#if defined( {0:s}_HAVE_BFIO )'.format(
-        self._library_name.upper())
-
-    define_have_debug_output = '#if defined( HAVE_DEBUG_OUTPUT )'
-
-    define_have_wide_character_type = (
-        '#if defined( {0:s}_HAVE_WIDE_CHARACTER_TYPE )').format(
-            self._library_name.upper())
-
-    function_argument = None
-    function_prototype = None
-    have_bfio = False
-    have_extern = False
-    have_debug_output = False
-    have_wide_character_type = False
-    in_define_deprecated = False
-    in_section = False
-    section_name = None
-
-    with io.open(self._path, 'r', encoding='utf8') as file_object:
-      for line in file_object.readlines():
-        line = line.strip()
+    self._ReadFile(project_configuration)
 
-        if have_extern:
-          if function_prototype:
-            # Check if we have a callback function argument.
-            if line.endswith('('):
-              argument_string = '{0:s} '.format(line)
-              function_argument = source_code.FunctionArgument(argument_string)
+    values = {name: getattr(self, name) for name in self._PARSED_ATTRIBUTES}
+    parse_cache.PARSE_CACHE.SetValues(cache_key, values)
 
-            else:
-              if line.endswith(' );'):
-                argument_string = line[:-3]
-
-              else:
-                # Get the part of the line before the ','.
-                argument_string, _, _ = line.partition(',')
+  def SetFunctionGroups(self, function_groups, check_signature_type):
+    """Sets the function groups instead of analyzing the include header file.
 
-              if not function_argument:
-                function_prototype.AddArgumentString(argument_string)
-
-              else:
-                function_argument.AddArgumentString(argument_string)
-
-            if function_argument and line.endswith(' ),'):
-              function_prototype.AddArgument(function_argument)
-              function_argument = None
-
-            elif line.endswith(' );'):
-              if not in_define_deprecated:
-                # TODO: handle section_name is None
-                self.functions_per_name[function_prototype.name] = (
-                    function_prototype)
-
-                self.functions_per_section[section_name].append(
-                    function_prototype)
-
-              function_prototype = None
-              in_define_deprecated = False
-              have_extern = False
-
-          elif line.endswith(';'):
-            # The line contains a variable definition.
-            have_extern = False
-
-          else:
-            # Get the part of the line before the library name.
-            data_type, _, _ = line.partition(self._library_name)
-
-            # Get the part of the line after the data type.
-            line = line[len(data_type):]
-            data_type = data_type.strip()
-
-            # Get the part of the remainder of the line before the '('.
-            name, _, _ = line.partition('(')
-
-            function_prototype = source_code.FunctionPrototype(name, data_type)
-            function_prototype.have_bfio = have_bfio
-            function_prototype.have_extern = have_extern
-            function_prototype.have_debug_output = have_debug_output
-            function_prototype.have_wide_character_type = (
-                have_wide_character_type)
-
-            if have_bfio:
-              self.have_bfio = True
-            if have_wide_character_type:
-              self.have_wide_character_type = True
-
-        elif in_section:
-          if line.startswith('* '):
-            section_name = line[2:]
-            self.section_names.append(section_name)
-            self.functions_per_section[section_name] = []
-            in_section = False
-
-        elif line == (
-            '/* -------------------------------------------------------------'
-            '------------'):
-          in_section = True
-
-        elif line.startswith(define_deprecated):
-          in_define_deprecated = True
-
-        elif line.startswith(define_have_bfio):
-          have_bfio = True
-
-        elif line.startswith(define_extern):
-          have_extern = True
-
-        elif line.startswith(define_have_debug_output):
-          have_debug_output = True
-
-        elif line.startswith(define_have_wide_character_type):
-          have_wide_character_type = True
+    Args:
+      function_groups (list[tuple[str, str, str]]): type, name and section
+          name of the function groups, in order, where the type is one of
+          "functions", "functions_with_input", "types", "types_with_input" or
+          "pseudo_types".
+      check_signature_type (str): check signature function type or None if
+          no check signature function was found.
+    """
+    groups_per_type = {
+        'functions': collections.OrderedDict(),
+        'functions_with_input': collections.OrderedDict(),
+        'pseudo_types': collections.OrderedDict(),
+        'types': collections.OrderedDict(),
+        'types_with_input': collections.OrderedDict()}
+
+    for group_type, group_name, section_name in function_groups:
+      groups_per_type[group_type][group_name] = section_name
+
+    self._api_functions_group = groups_per_type['functions']
+    self._api_functions_with_input_group = groups_per_type[
+        'functions_with_input']
+    self._api_pseudo_types_group = groups_per_type['pseudo_types']
+    self._api_types_group = groups_per_type['types']
+    self._api_types_with_input_group = groups_per_type['types_with_input']
+    self._check_signature_type = check_signature_type
+
+  def SetParsedValues(self, values):
+    """Sets the parsed values instead of reading the include header file.
 
-        elif line.startswith('#endif'):
-          have_bfio = False
-          have_debug_output = False
-          have_wide_character_type = False
+    Args:
+      values (dict[str, object]): values of the parsed attributes per name,
+          such as stored in the parse cache.
+    """
+    for name, value in values.items():
+      setattr(self, name, value)
 
 
 class LibraryMakefileAMFile(object):
@@ -742,7 +715,7 @@ class LibraryMakefileAMFile(object):
 
     in_section = None
 
-    with io.open(self._path, 'r', encoding='utf8') as file_object:
+    with file_overlay.FILE_OVERLAY.Open(self._path) as file_object:
       for line in file_object.readlines():
         line = line.strip()
 
@@ -810,7 +783,7 @@ class MainMakefileAMFile(object):
     in_subdirs = False
     in_library_dependencies = True
 
-    with io.open(self._path, 'r', encoding='utf8') as file_object:
+    with file_overlay.FILE_OVERLAY.Open(self._path) as file_object:
       for line in file_object.readlines():
         line = line.strip()
 
@@ -910,10 +883,10 @@ class TestSourceFile(object):
     Args:
       project_configuration (ProjectConfiguration): project configuration.
     """
-    if not os.path.exists(self.path):
+    if not file_overlay.FILE_OVERLAY.Exists(self.path):
       raise IOError('Missing test source file: {0:s}'.format(self.path))
 
-    with io.open(self.path, 'r', encoding='utf8') as source_file_object:
+    with file_overlay.FILE_OVERLAY.Open(self.path) as source_file_object:
       self._ReadFileObject(project_configuration, source_file_object)
 
 
@@ -943,13 +916,9 @@ class TypesIncludeHeaderFile(object):
     """
     self._library_name = project_configuration.library_name
 
-    self.types = []
+    parser = source_parser.DeclarationParser(self._library_name)
 
-    typedef_prefix = 'typedef intptr_t {0:s}_'.format(self._library_name)
-    typedef_prefix_length = len(typedef_prefix)
+    with file_overlay.FILE_OVERLAY.Open(self._path) as file_object:
+      parser.Parse(file_object)
 
-    with io.open(self._path, 'r', encoding='utf8') as file_object:
-      for line in file_object.readlines():
-        line = line.strip()
-        if line.startswith(typedef_prefix) and line.endswith('_t;'):
-          self.types.append(line[typedef_prefix_length:-3])
+    self.types = parser.intptr_types
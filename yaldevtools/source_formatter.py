@@ -20,6 +20,9 @@ class LineModifier(object):
 class Variable(object):
   """C variable."""
 
+  __slots__ = (
+      'is_pointer', 'modifiers', 'name', 'type', 'type_sort_ranking')
+
   _TYPE_SORT_RANKING = [
       'FILE',
       'size64_t',
@@ -158,7 +161,202 @@ class Variable(object):
 
 
 class SourceFormatter(object):
-  """Libyal C source formatter."""
+  """Libyal C source formatter.
+
+  Lines of C source are formatted in a single pass. Every variable
+  declaration is parsed once, into a precomputed sort key and the position
+  of its equal sign, which is used for both the sorting and the vertical
+  alignment of the declarations.
+  """
+
+  _TYPE_SORT_RANKINGS = {
+      variable_type: index + 1
+      for index, variable_type in enumerate(Variable._TYPE_SORT_RANKING)}
+
+  def _AlignEqualSigns(self, declarations, alignment_offset):
+    """Vertically aligns the equal signs of parsed declarations.
+
+    Args:
+      declarations (list[tuple[object, str, tuple[str, str, int]]]): sort
+          key, line and equal sign of parsed declarations.
+      alignment_offset (int): aligment offset.
+
+    Returns:
+      list[str]: lines of the declarations with aligned equal signs.
+    """
+    aligned_lines = []
+    for _, line, equal_sign in declarations:
+      if equal_sign:
+        prefix, suffix, formatted_prefix_length = equal_sign
+        line = '{0:s}{1:s}={2:s}'.format(
+            prefix, ' ' * (alignment_offset - formatted_prefix_length),
+            suffix)
+
+      aligned_lines.append(line)
+
+    return aligned_lines
+
+  def _FormatDeclarationLines(self, lines):
+    """Formats the lines of the variable declarations of a function.
+
+    The declarations are sorted and aligned per block, where blocks are
+    separated by empty, preprocessor and comment lines.
+
+    Args:
+      lines (list[str]): lines of the variable declarations.
+
+    Returns:
+      list[str]: formatted lines of the variable declarations.
+    """
+    equal_signs = [self._GetEqualSign(line) for line in lines]
+    alignment_offset = self._GetAlignmentOffset(equal_signs)
+
+    formatted_lines = []
+    declarations = []
+    for line, equal_sign in zip(lines, equal_signs):
+      stripped_line = line.strip()
+      if stripped_line and stripped_line[0] not in '#*' and not (
+          stripped_line.startswith('/*')):
+        declarations.append((self._GetSortKey(line), line, equal_sign))
+        continue
+
+      if declarations:
+        declarations.sort(key=lambda declaration: declaration[0])
+        formatted_lines.extend(self._AlignEqualSigns(
+            declarations, alignment_offset))
+        declarations = []
+
+      formatted_lines.append(line)
+
+    if declarations:
+      declarations.sort(key=lambda declaration: declaration[0])
+      formatted_lines.extend(self._AlignEqualSigns(
+          declarations, alignment_offset))
+
+    return formatted_lines
+
+  def _FormatLineRanges(self, lines, line_ranges):
+    """Formats the functions and other lines that overlap with line ranges.
+
+    Args:
+      lines (list[str]): lines of C source.
+      line_ranges (list[tuple[int, int]]): first and last line number,
+          starting with 1, of the ranges of lines to format.
+
+    Returns:
+      list[str]: lines of C source of which the blocks that overlap with
+          the line ranges are formatted.
+    """
+    formatted_lines = []
+    for start_index, end_index in self._GetBlocks(lines):
+      block_lines = lines[start_index:end_index]
+      if any(
+          first_line_number <= end_index and last_line_number > start_index
+          for first_line_number, last_line_number in line_ranges):
+        block_lines = self.FormatSource(block_lines)
+
+      formatted_lines.extend(block_lines)
+
+    return formatted_lines
+
+  def _GetAlignmentOffset(self, equal_signs):
+    """Determines the alignment offset to vertically align equal signs.
+
+    Args:
+      equal_signs (list[tuple[str, str, int]]): equal signs of parsed lines,
+          where None represents a line without an equal sign.
+
+    Returns:
+      int: aligment offset or None if no equal sign was found.
+    """
+    formatted_prefix_lengths = [
+        equal_sign[2] for equal_sign in equal_signs if equal_sign]
+    if not formatted_prefix_lengths:
+      return None
+
+    return max(formatted_prefix_lengths) + 1
+
+  def _GetBlocks(self, lines):
+    """Retrieves the blocks of lines that are formatted independently.
+
+    A block is either the body of a function, from its opening to its closing
+    brace, or a line outside a function.
+
+    Args:
+      lines (list[str]): lines of C source.
+
+    Returns:
+      list[tuple[int, int]]: start and end index, excluding the end, of every
+          block of lines, in order.
+    """
+    blocks = []
+    function_start_index = None
+    for index, line in enumerate(lines):
+      if function_start_index is None:
+        if line == '{':
+          function_start_index = index
+        else:
+          blocks.append((index, index + 1))
+
+      elif line == '}':
+        blocks.append((function_start_index, index + 1))
+        function_start_index = None
+
+    if function_start_index is not None:
+      blocks.append((function_start_index, len(lines)))
+
+    return blocks
+
+  def _GetEqualSign(self, line):
+    """Parses the equal sign of a C variable declaration.
+
+    Args:
+      line (str): C variable declaration.
+
+    Returns:
+      tuple[str, str, int]: declaration before the equal sign, without
+          trailing whitespace, declaration after the equal sign and length
+          of the declaration before the equal sign with tabs expanded, or None
+          if the declaration has no equal sign to align.
+    """
+    if '=' not in line or line.strip().endswith(' = {'):
+      return None
+
+    prefix, _, suffix = line.rpartition('=')
+    prefix = prefix.rstrip()
+
+    return prefix, suffix, len(prefix) + 7 * prefix.count('\t')
+
+  def _GetSortKey(self, line):
+    """Retrieves the sort key of a C variable declaration.
+
+    Declarations are sorted the same way as the Variable class compares them:
+    pointers first, then by type sort ranking, then by type without the
+    trailing "_t" and finally by name.
+
+    Args:
+      line (str): C variable declaration.
+
+    Returns:
+      tuple[bool, int, str, str]: sort key.
+    """
+    prefix, _, _ = line.partition('=')
+    prefix, _, name = prefix.strip().rpartition(' ')
+    _, _, variable_type = prefix.rpartition(' ')
+
+    is_pointer = name.startswith('*')
+    if is_pointer:
+      _, _, name = name.rpartition('*')
+
+    variable_type_sort_ranking = self._TYPE_SORT_RANKINGS.get(variable_type, 0)
+
+    # Note that the type without "_t" is determined the same way as
+    # Variable.Compare does, which results in an empty string for types
+    # without "_t".
+    type_without_suffix, _, _ = variable_type.rpartition('_t')
+
+    return (
+        not is_pointer, variable_type_sort_ranking, type_without_suffix, name)
 
   def FormatLineIndentation(self, line, indentation_level):
     """Formats the identation for a line of C source.
@@ -171,49 +369,49 @@ class SourceFormatter(object):
       str: line of C source with formatted indentation.
     """
     index = 0
-    line_length = len(line)
-
     for _ in range(0, indentation_level):
-      maximum_end_index = min(index + 8, line_length)
-
-      end_index = index
-      while end_index < maximum_end_index:
-        if line[end_index] != ' ':
-          break
-        end_index += 1
+      indentation = line[index:index + 8]
+      stripped_indentation = indentation.lstrip(' ')
+      end_index = index + len(indentation) - len(stripped_indentation)
 
       # Merge less than 8 spaces and a tab.
-      if end_index < maximum_end_index:
-        if line[end_index] != '\t':
+      if stripped_indentation:
+        if stripped_indentation[0] != '\t':
           break
 
+        has_spaces = end_index > index
         end_index += 1
 
-      indentation = set(line[index:end_index])
-      if indentation == set([' ']) or indentation == set([' ', '\t']):
+      else:
+        has_spaces = bool(indentation)
+
+      if has_spaces:
         line = '{0:s}\t{1:s}'.format(line[:index], line[end_index:])
-        line_length = len(line)
 
       index += 1
 
-    while index < line_length:
-      if line[index] == '\t':
-        line = '{0:s}        {1:s}'.format(line[:index], line[index + 1:])
-        line_length = len(line)
-
-      index += 1
+    if '\t' in line[index:]:
+      line = '{0:s}{1:s}'.format(line[:index], line[index:].replace(
+          '\t', '        '))
 
     return line
 
-  def FormatSource(self, lines):
+  def FormatSource(self, lines, line_ranges=None):
     """Formats lines of C source.
 
     Args:
       lines (list[str]): lines of C source.
+      line_ranges (Optional[list[tuple[int, int]]]): first and last line
+          number, starting with 1, of the ranges of lines to format, where
+          None represents all lines. Only the functions and the lines outside
+          functions that overlap with the line ranges are formatted.
 
     Returns:
       list[str]: formatted lines of C source.
     """
+    if line_ranges is not None:
+      return self._FormatLineRanges(lines, line_ranges)
+
     in_variables_declaration_block = False
     in_function = False
     in_switch_case = False
@@ -247,35 +445,25 @@ class SourceFormatter(object):
         elif stripped_line == '}':
           indentation_level -= 1
 
-      # TODO: refactor to separate function
       if declaration_lines:
-        alignment_offset = self.VerticalAlignEqualSignsDetermineOffset(
-            declaration_lines)
-
-        block_of_declaration_lines = []
-        for declaration_line in declaration_lines:
-          stripped_declaration_line = declaration_line.strip()
-          if stripped_declaration_line and not (
-                  stripped_declaration_line.startswith('#') or
-                  stripped_declaration_line.startswith('/*') or
-                  stripped_declaration_line.startswith('*') or
-                  stripped_declaration_line.startswith('*/')):
-            block_of_declaration_lines.append(declaration_line)
-            continue
-
-          if block_of_declaration_lines:
-            block_of_declaration_lines.sort(key=lambda line: Variable(line))
-            block_of_declaration_lines = self.VerticalAlignEqualSigns(
-                block_of_declaration_lines, alignment_offset)
-
-            formatted_lines.extend(block_of_declaration_lines)
-            block_of_declaration_lines = []
+        formatted_lines.extend(self._FormatDeclarationLines(
+            declaration_lines))
+        declaration_lines = []
 
-          formatted_lines.append(declaration_line)
+      if not indentation_level:
+        # Without indentation only tabs are expanded.
+        if '\t' in line:
+          line = line.replace('\t', '        ')
 
-        declaration_lines = []
+      else:
+        # Lines that are indented with tabs only and that have no tabs to
+        # expand, which are most lines, do not need to be formatted.
+        number_of_tabs = len(line) - len(line.lstrip('\t'))
+        if (number_of_tabs > indentation_level or
+            line.count('\t') != number_of_tabs or
+            line[number_of_tabs:number_of_tabs + 1] == ' '):
+          line = self.FormatLineIndentation(line, indentation_level)
 
-      line = self.FormatLineIndentation(line, indentation_level)
       formatted_lines.append(line)
 
       if in_function:
@@ -301,56 +489,55 @@ class SourceFormatter(object):
 
     return formatted_lines
 
-  # TODO: remove this once _SortVariableDeclarations has been fixed.
-  def FormatSourceOld(self, lines):
-    """Formats lines of C source.
+  def SortVariableDeclarations(self, lines):
+    """Sorts and aligns variable declarations.
+
+    The declarations are sorted per block, where blocks are separated by
+    empty, preprocessor and comment lines. The lines of initialized arrays
+    and structures are not sorted.
 
     Args:
-      lines (list[str]): lines of C source.
+      lines (list[str]): lines of C variable declarations.
 
     Returns:
-      list[str]: formatted lines of C source.
+      list[str]: sorted and aligned lines of C variable declarations.
     """
-    alignment_offset = self.VerticalAlignEqualSignsDetermineOffset(lines)
+    equal_signs = [self._GetEqualSign(line) for line in lines]
+    alignment_offset = self._GetAlignmentOffset(equal_signs)
 
     in_declaration_block = False
     formatted_lines = []
-    declaration_lines = []
-    for line in lines:
-      striped_line = line.strip()
+    declarations = []
+    for line, equal_sign in zip(lines, equal_signs):
+      stripped_line = line.strip()
       if in_declaration_block:
-        if striped_line.endswith('};'):
+        if stripped_line.endswith('};'):
           in_declaration_block = False
         formatted_lines.append(line)
         continue
 
-      if striped_line.endswith(' = {'):
+      if stripped_line.endswith(' = {'):
         in_declaration_block = True
         formatted_lines.append(line)
         continue
 
-      if (striped_line and
-          not striped_line.startswith('#') and
-          not striped_line.startswith('/*') and
-          not striped_line.startswith('*/')):
-        declaration_lines.append(line)
+      if (stripped_line and
+          not stripped_line.startswith('#') and
+          not stripped_line.startswith('/*') and
+          not stripped_line.startswith('*/')):
+        declarations.append((self._GetSortKey(line), line, equal_sign))
         continue
 
-      declaration_lines.sort(key=lambda line: Variable(line))
-      declaration_lines = self.VerticalAlignEqualSigns(
-          declaration_lines, alignment_offset)
-
-      formatted_lines.extend(declaration_lines)
+      declarations.sort(key=lambda declaration: declaration[0])
+      formatted_lines.extend(self._AlignEqualSigns(
+          declarations, alignment_offset))
       formatted_lines.append(line)
-      declaration_lines = []
-
-    if declaration_lines:
-      declaration_lines.sort(key=lambda line: Variable(line))
-      declaration_lines = self.VerticalAlignEqualSigns(
-          declaration_lines, alignment_offset)
+      declarations = []
 
-      formatted_lines.extend(declaration_lines)
-      declaration_lines = []
+    if declarations:
+      declarations.sort(key=lambda declaration: declaration[0])
+      formatted_lines.extend(self._AlignEqualSigns(
+          declarations, alignment_offset))
 
     return formatted_lines
 
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Functions to format the source files of libyal projects."""
+
+from __future__ import unicode_literals
+
+import glob
+import io
+import logging
+import os
+import re
+
+from yaldevtools import source_formatter
+
+
+# Expression of the header of a hunk of a unified diff, of which the groups
+# are the first line number and the number of lines in the new file.
+_HUNK_HEADER_RE = re.compile(r'^@@ -[0-9,]+ \+([0-9]+)(?:,([0-9]+))? @@')
+
+# The extensions of the source files that are formatted when a directory
+# is formatted.
+SOURCE_FILE_EXTENSIONS = frozenset(['.c', '.h'])
+
+
+def _HasGlob(path):
+  """Determines if a path contains glob characters.
+
+  Args:
+    path (str): path.
+
+  Returns:
+    bool: True if the path contains glob characters.
+  """
+  return any(character in path for character in '*?[')
+
+
+def FindSourceFiles(paths):
+  """Finds source files.
+
+  Args:
+    paths (list[str]): paths of source files, directories, which are searched
+        recursively for source files, excluding hidden directories, and glob
+        patterns of source files or directories.
+
+  Returns:
+    list[str]: sorted paths of the source files, without duplicates.
+  """
+  source_files = set()
+  for path in paths:
+    if _HasGlob(path):
+      matching_paths = glob.glob(path)
+    else:
+      matching_paths = [path]
+
+    for matching_path in matching_paths:
+      if not os.path.isdir(matching_path):
+        source_files.add(matching_path)
+        continue
+
+      for directory, directory_names, filenames in os.walk(matching_path):
+        directory_names[:] = sorted([
+            directory_name for directory_name in directory_names
+            if not directory_name.startswith('.')])
+
+        for filename in filenames:
+          _, extension = os.path.splitext(filename)
+          if extension in SOURCE_FILE_EXTENSIONS:
+            source_files.add(os.path.join(directory, filename))
+
+  return sorted(source_files)
+
+
+def FormatSourceFile(path, check=False, line_ranges=None):
+  """Formats a source file.
+
+  The source file is only written when the formatted data differs.
+
+  Args:
+    path (str): path of the source file.
+    check (Optional[bool]): True if the source file should only be checked
+        and not be written.
+    line_ranges (Optional[list[tuple[int, int]]]): first and last line
+        number, starting with 1, of the ranges of lines to format, where None
+        represents all lines.
+
+  Returns:
+    bool: True if the source file was changed or, when checking, would be
+        changed.
+  """
+  with io.open(path, 'r', encoding='utf8', newline='') as file_object:
+    file_data = file_object.read()
+
+  # Convert end of line characters the same way as reading a file in text
+  # mode does.
+  file_content = file_data.replace('\r\n', '\n').replace('\r', '\n')
+
+  formatter = source_formatter.SourceFormatter()
+  formatted_lines = formatter.FormatSource(
+      file_content.split('\n'), line_ranges=line_ranges)
+  formatted_file_content = '\n'.join(formatted_lines)
+
+  formatted_file_data = formatted_file_content
+  if os.linesep != '\n':
+    formatted_file_data = formatted_file_data.replace('\n', os.linesep)
+
+  if formatted_file_data == file_data:
+    return False
+
+  if check:
+    return True
+
+  with io.open(path, 'w', encoding='utf8') as file_object:
+    file_object.write(formatted_file_content)
+
+  return True
+
+
+def FormatSourceFiles(paths, check=False, line_ranges_per_path=None):
+  """Formats source files.
+
+  Source files that cannot be read or decoded are skipped.
+
+  Args:
+    paths (list[str]): paths of the source files.
+    check (Optional[bool]): True if the source files should only be checked
+        and not be written.
+    line_ranges_per_path (Optional[dict[str, list[tuple[int, int]]]]): first
+        and last line number, starting with 1, of the ranges of lines to
+        format per path of a source file, where None represents all lines of
+        all source files.
+
+  Returns:
+    tuple[list[str], list[str]]: paths of the source files that were changed
+        or, when checking, would be changed and paths of the source files
+        that could not be formatted.
+  """
+  changed_files = []
+  failed_files = []
+  for path in paths:
+    try:
+      line_ranges = None
+      if line_ranges_per_path is not None:
+        line_ranges = line_ranges_per_path.get(os.path.normpath(path), [])
+
+      if FormatSourceFile(path, check=check, line_ranges=line_ranges):
+        changed_files.append(path)
+
+    except (IOError, OSError, UnicodeDecodeError) as exception:
+      logging.warning('Unable to format: {0:s} with error: {1!s}'.format(
+          path, exception))
+      failed_files.append(path)
+
+  return changed_files, failed_files
+
+
+def GetChangedLineRanges(diff_lines):
+  """Retrieves the changed line ranges from a unified diff.
+
+  The diff is expected to be created without context lines, such as by
+  "git diff -U0". Deleted lines are represented by a range of the lines
+  before and after them.
+
+  Args:
+    diff_lines (list[str]): lines of the unified diff.
+
+  Returns:
+    dict[str, list[tuple[int, int]]]: first and last line number, starting
+        with 1, of the ranges of changed lines per normalized path of a
+        changed file.
+  """
+  line_ranges_per_path = {}
+  line_ranges = None
+  for line in diff_lines:
+    if line.startswith('+++ '):
+      path = line[4:].rstrip('\r\n').split('\t')[0]
+      if path == '/dev/null':
+        line_ranges = None
+        continue
+
+      if path.startswith('b/'):
+        path = path[2:]
+
+      line_ranges = line_ranges_per_path.setdefault(
+          os.path.normpath(path), [])
+      continue
+
+    if line_ranges is None:
+      continue
+
+    match = _HUNK_HEADER_RE.match(line)
+    if not match:
+      continue
+
+    first_line_number = int(match.group(1), 10)
+    number_of_lines = int(match.group(2) or '1', 10)
+
+    if number_of_lines:
+      line_ranges.append((
+          first_line_number, first_line_number + number_of_lines - 1))
+    else:
+      line_ranges.append((max(first_line_number, 1), first_line_number + 1))
+
+  return line_ranges_per_path
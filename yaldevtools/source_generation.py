@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+"""Functions to generate the source files of libyal projects."""
+
+from __future__ import unicode_literals
+
+import logging
+import os
+import time
+
+from yaldevtools import configuration
+from yaldevtools import file_overlay
+from yaldevtools import output_writers
+from yaldevtools import parse_cache
+from yaldevtools import template_bundle
+from yaldevtools import template_cache
+from yaldevtools import template_index
+
+
+# The source generators per category, as the name of the module in
+# yaldevtools.source_generators and the name of the source generator class,
+# with the categories that read files written by the category and therefore
+# must be run after it. The module of a source generator is only imported
+# when the source generator is retrieved.
+SOURCE_GENERATORS = [
+    ('common', 'common', 'CommonSourceFileGenerator', []),
+    ('config', 'config', 'ConfigurationFileGenerator', []),
+    ('documents', 'documents', 'DocumentFileGenerator', []),
+    ('include', 'include', 'IncludeSourceFileGenerator', []),
+    ('libyal', 'library', 'LibrarySourceFileGenerator', ['include']),
+    ('pyyal', 'python_module', 'PythonModuleSourceFileGenerator', [
+        'include', 'libyal']),
+    ('scripts', 'scripts', 'ScriptFileGenerator', []),
+    ('tests', 'tests', 'TestSourceFileGenerator', ['include', 'libyal']),
+    ('yaltools', 'tools', 'ToolSourceFileGenerator', []),
+]
+
+# TODO: generate manuals/Makefile.am
+
+MANUALS_GENERATORS = [
+    ('libyal.3', 'manpage', 'LibraryManPageGenerator', []),
+]
+
+
+def _ImportSourceGeneratorClass(module_name, class_name):
+  """Imports a source generator class.
+
+  Args:
+    module_name (str): name of the module in yaldevtools.source_generators.
+    class_name (str): name of the source generator class.
+
+  Returns:
+    type: source generator class.
+  """
+  # Note that __import__ is used instead of importlib.import_module so that
+  # the import is reported by "python -X importtime".
+  module_object = __import__(
+      'yaldevtools.source_generators.{0:s}'.format(module_name),
+      fromlist=[class_name])
+  return getattr(module_object, class_name)
+
+
+def _GetCacheStatistics():
+  """Retrieves the statistics of the parse and template caches.
+
+  Returns:
+    dict[str, dict[str, int]]: cache statistics per cache.
+  """
+  return {
+      'parse_cache': parse_cache.PARSE_CACHE.GetStatistics(),
+      'template_cache': template_cache.TEMPLATE_CACHE.GetStatistics()}
+
+
+def _GetCacheStatisticsDelta(cache_statistics):
+  """Retrieves the cache statistics since earlier statistics.
+
+  Args:
+    cache_statistics (dict[str, dict[str, int]]): earlier cache statistics
+        per cache.
+
+  Returns:
+    dict[str, dict[str, int]]: parse cache hits and misses and template
+        cache evictions, hits and misses since the earlier statistics.
+  """
+  current_cache_statistics = _GetCacheStatistics()
+  return {
+      'parse_cache': {
+          key: (current_cache_statistics['parse_cache'][key] -
+                cache_statistics['parse_cache'][key])
+          for key in ('hits', 'misses')},
+      'template_cache': {
+          key: (current_cache_statistics['template_cache'][key] -
+                cache_statistics['template_cache'][key])
+          for key in ('evictions', 'hits', 'misses')}}
+
+
+def GetSourceGeneratorNames():
+  """Retrieves the names of the source generator categories.
+
+  No source generator modules are imported.
+
+  Returns:
+    list[str]: names of the source generator categories, in order of
+        generation.
+  """
+  return [
+      source_category for source_category, _, _, _ in (
+          SOURCE_GENERATORS + MANUALS_GENERATORS)]
+
+
+def GetSourceGenerators(libyal_directory, generators=None):
+  """Retrieves the source generators.
+
+  Only the modules of the retrieved source generators are imported.
+
+  Args:
+    libyal_directory (str): path of the libyal directory.
+    generators (Optional[list[str]]): names of the source generator categories
+        to retrieve, where None represents all.
+
+  Returns:
+    list[tuple[str, type, str, list[str]]]: source generator category,
+        source generator class, template directory and names of the categories
+        the source generator depends on, in order of generation.
+  """
+  sources_directory = os.path.join(libyal_directory, 'data', 'source')
+  manuals_directory = os.path.join(sources_directory, 'manuals')
+
+  source_generators = []
+  for source_generator_definitions, generators_directory in (
+      (SOURCE_GENERATORS, sources_directory),
+      (MANUALS_GENERATORS, manuals_directory)):
+    for source_category, module_name, class_name, dependencies in (
+        source_generator_definitions):
+      if generators and source_category not in generators:
+        continue
+
+      source_generator_class = _ImportSourceGeneratorClass(
+          module_name, class_name)
+
+      template_directory = os.path.join(generators_directory, source_category)
+      source_generators.append((
+          source_category, source_generator_class, template_directory,
+          dependencies))
+
+  return source_generators
+
+
+def _CreateOutputWriter(output_directory, only_changed, track_changes=False):
+  """Creates an output writer.
+
+  Args:
+    output_directory (str): path of the output directory or None to write
+        to stdout.
+    only_changed (bool): True if only files of which the data changed should
+        be written.
+    track_changes (Optional[bool]): True if the output writer should track
+        which files were changed. Note that changes are always tracked when
+        only files of which the data changed are written.
+
+  Returns:
+    OutputWriter: output writer.
+  """
+  if not output_directory:
+    return output_writers.StdoutWriter()
+
+  if only_changed:
+    return output_writers.ChangedFileWriter(output_directory)
+
+  return output_writers.FileWriter(
+      output_directory, track_changes=track_changes)
+
+
+def GenerateProjectSources(
+    project_name, project_directory, configuration_file, projects_directory,
+    libyal_directory, generators, experimental, only_changed=False):
+  """Generates the source files of a project.
+
+  The source files are generated relative to the project directory, which
+  becomes the current working directory during generation.
+
+  Args:
+    project_name (str): name of the project.
+    project_directory (str): path of the project directory.
+    configuration_file (str): path of the project configuration file.
+    projects_directory (str): path of the projects directory.
+    libyal_directory (str): path of the libyal directory.
+    generators (list[str]): names of the source generator categories to run,
+        where None represents all.
+    experimental (bool): True if experimental functionality is enabled.
+    only_changed (Optional[bool]): True if only files of which the data
+        changed should be written.
+
+  Returns:
+    dict[str, object]: summary of the generation, that contains the name of
+        the project, the duration of the generation in seconds, the paths of
+        the changed files, the output file statistics, the parse and
+        template cache statistics and the paths of the templates that were
+        rendered and that were looked up.
+  """
+  logging.info('Generating source files of: {0:s}'.format(project_name))
+
+  start_time = time.time()
+  cache_statistics = _GetCacheStatistics()
+
+  project_configuration = configuration.ProjectConfiguration()
+  project_configuration.ReadFromFile(configuration_file)
+
+  output_writer = _CreateOutputWriter(
+      project_directory, only_changed, track_changes=True)
+
+  rendered_templates = set()
+
+  working_directory = os.getcwd()
+  os.chdir(project_directory)
+
+  try:
+    for _, source_generator_class, template_directory, _ in (
+        GetSourceGenerators(libyal_directory, generators=generators)):
+      source_generator_object = source_generator_class(
+          projects_directory, template_directory, experimental=experimental)
+      source_generator_object.Generate(project_configuration, output_writer)
+
+      _, _, output_templates = source_generator_object.GetDependencies()
+      for template_paths in output_templates.values():
+        rendered_templates.update(template_paths)
+
+      # Source generators of later categories can read the files written.
+      output_writer.Close()
+
+    changed_files = output_writer.GetChangedFiles()
+    output_files = output_writer.GetStatistics()
+
+  finally:
+    os.chdir(working_directory)
+
+  summary = {
+      'changed_files': changed_files,
+      'duration': time.time() - start_time,
+      'looked_up_templates': template_index.TEMPLATE_INDEX.GetLookedUpPaths(),
+      'name': project_name,
+      'output_files': output_files,
+      'rendered_templates': rendered_templates}
+  summary.update(_GetCacheStatisticsDelta(cache_statistics))
+
+  return summary
+
+
+def GenerateProjectRecords(
+    project_directory, configuration_file, projects_directory,
+    libyal_directory, generators, experimental):
+  """Generates the source files of a project as output records.
+
+  No files are written. The source files are generated relative to the
+  project directory, which is the current working directory while a source
+  generator is run, and the output records of a source generator category
+  are yielded after the category was generated.
+
+  Source generator categories that depend on another category, such as
+  libyal on include, read the files of that category from the file overlay,
+  which contains the output records of the categories generated before,
+  hence the same files are generated as by GenerateProjectSources.
+
+  Args:
+    project_directory (str): path of the project directory.
+    configuration_file (str): path of the project configuration file.
+    projects_directory (str): path of the projects directory.
+    libyal_directory (str): path of the libyal directory.
+    generators (list[str]): names of the source generator categories to run,
+        where None represents all.
+    experimental (bool): True if experimental functionality is enabled.
+
+  Yields:
+    OutputRecord: output record of a generated source file, with a path
+        relative to the project directory.
+  """
+  project_configuration = configuration.ProjectConfiguration()
+  project_configuration.ReadFromFile(configuration_file)
+
+  project_directory = os.path.abspath(project_directory)
+
+  file_overlay.FILE_OVERLAY.Empty()
+
+  try:
+    for _, source_generator_class, template_directory, _ in (
+        GetSourceGenerators(libyal_directory, generators=generators)):
+      source_generator_object = source_generator_class(
+          projects_directory, template_directory, experimental=experimental)
+
+      working_directory = os.getcwd()
+      os.chdir(project_directory)
+
+      try:
+        output_records = list(source_generator_object.GenerateRecords(
+            project_configuration))
+      finally:
+        os.chdir(working_directory)
+
+      for output_record in output_records:
+        # Some source generators write files by their absolute path.
+        if os.path.isabs(output_record.path):
+          output_record.path = os.path.relpath(
+              output_record.path, project_directory)
+
+        # Source generators of later categories can read the files generated.
+        file_overlay.FILE_OVERLAY.SetFileData(
+            os.path.join(project_directory, output_record.path),
+            output_record.data)
+
+      for output_record in output_records:
+        yield output_record
+
+  finally:
+    file_overlay.FILE_OVERLAY.Empty()
+
+
+def OpenTemplateBundle(libyal_directory, path):
+  """Opens a template bundle of the templates in data/source.
+
+  The template bundle is built with scripts/template-bundle.py and is used
+  instead of the templates in data/source. Since the template bundle is not
+  checked against the templates, for example to not stat every template on
+  a slow file system, it is only used when explicitly requested. Whether
+  a template bundle contains the current templates can be checked with
+  the --verify option of scripts/template-bundle.py.
+
+  Args:
+    libyal_directory (str): path of the libyal directory.
+    path (str): path of the template bundle.
+
+  Returns:
+    bool: True if the template bundle was opened.
+  """
+  sources_directory = os.path.join(libyal_directory, 'data', 'source')
+  try:
+    template_bundle.TEMPLATE_BUNDLE.Open(path, sources_directory)
+  except (IOError, OSError) as exception:
+    logging.warning((
+        'Unable to open template bundle: {0:s} with error: {1!s}, using '
+        'templates in: {2:s} instead.').format(
+            path, exception, sources_directory))
+    return False
+
+  logging.info('Using template bundle: {0:s}'.format(path))
+  return True
+
+
+def GenerateSourceCategory(
+    source_generator_class, projects_directory, template_directory,
+    project_configuration, output_directory, experimental,
+    only_changed=False):
+  """Generates the source files of a category.
+
+  Args:
+    source_generator_class (type): source generator class.
+    projects_directory (str): path of the projects directory.
+    template_directory (str): path of the template directory.
+    project_configuration (ProjectConfiguration): project configuration.
+    output_directory (str): path of the output directory or None to write
+        to stdout.
+    experimental (bool): True if experimental functionality is enabled.
+    only_changed (Optional[bool]): True if only files of which the data
+        changed should be written.
+
+  Returns:
+    dict[str, object]: result of the generation, that contains the paths of
+        the input files read by the source generator, the names of the
+        entries per path of input directory listed by the source generator,
+        the paths of the templates per path of output file, the output file
+        statistics, which are None when writing to stdout or when changes are
+        not tracked because all files are written, and the parse and template
+        cache statistics.
+  """
+  cache_statistics = _GetCacheStatistics()
+
+  source_generator_object = source_generator_class(
+      projects_directory, template_directory, experimental=experimental)
+
+  output_writer = _CreateOutputWriter(output_directory, only_changed)
+
+  source_generator_object.Generate(project_configuration, output_writer)
+  output_writer.Close()
+
+  input_files, input_directories, output_templates = (
+      source_generator_object.GetDependencies())
+
+  output_templates = {
+      output_path: sorted(template_paths)
+      for output_path, template_paths in output_templates.items()}
+
+  output_files = None
+  if output_directory:
+    output_files = output_writer.GetStatistics()
+
+    # Files can be written without a template, for example when an existing
+    # file is only reformatted.
+    for output_path in output_writer.GetWrittenFiles():
+      output_templates.setdefault(output_path, [])
+
+  result = {
+      'input_directories': input_directories,
+      'input_files': sorted(input_files),
+      'output_files': output_files,
+      'output_templates': output_templates}
+  result.update(_GetCacheStatisticsDelta(cache_statistics))
+
+  return result
+
+
+def WriteRecords(output_records, output_writer):
+  """Writes output records.
+
+  The paths of the output records are relative to the current working
+  directory.
+
+  Args:
+    output_records (iterable[OutputRecord]): output records.
+    output_writer (OutputWriter): output writer.
+
+  Returns:
+    int: number of output records written.
+  """
+  number_of_records = 0
+  for output_record in output_records:
+    output_writer.WriteFile(
+        output_record.path, output_record.data, access_mode='w')
+    if output_record.executable:
+      output_writer.SetExecutable(output_record.path)
+
+    number_of_records += 1
+
+  output_writer.Close()
+
+  return number_of_records
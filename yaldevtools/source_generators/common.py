@@ -25,11 +25,10 @@ class CommonSourceFileGenerator(interface.SourceFileGenerator):
         project_configuration, authors_separator=self._AUTHORS_SEPARATOR)
     template_mappings['authors'] = self._AUTHORS
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       output_filename = os.path.join('common', directory_entry)
 
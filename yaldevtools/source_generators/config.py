@@ -3,10 +3,9 @@
 
 from __future__ import unicode_literals
 
-import glob
+import fnmatch
 import logging
 import os
-import stat
 
 from yaldevtools.source_generators import interface
 
@@ -734,10 +733,8 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
 
     template_directory = os.path.join(self._template_directory, 'dpkg')
 
-    for directory_entry in os.listdir(template_directory):
+    for directory_entry in self._ListTemplateDirectory(template_directory):
       template_filename = os.path.join(template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       if (directory_entry.startswith('control') or
           directory_entry.startswith('rules')):
@@ -804,10 +801,8 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         self._template_directory, 'dpkg', 'source')
     output_directory = os.path.join(output_directory, 'source')
 
-    for directory_entry in os.listdir(template_directory):
+    for directory_entry in self._ListTemplateDirectory(template_directory):
       template_filename = os.path.join(template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       output_filename = os.path.join(output_directory, directory_entry)
       self._GenerateSection(
@@ -877,13 +872,17 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
 
     source_glob = '{0:s}_test_*.c'.format(
         project_configuration.library_name_suffix)
-    source_glob = os.path.join('tests', source_glob)
 
     tests_files = ['/tests/tmp*']
     if os.path.exists(os.path.join('tests', 'input')):
       tests_files.append('/tests/input')
 
-    for source_file_path in sorted(glob.glob(source_glob)):
+    source_file_paths = [
+        os.path.join('tests', directory_entry)
+        for directory_entry in self._ListInputDirectory('tests')
+        if fnmatch.fnmatch(directory_entry, source_glob)]
+
+    for source_file_path in source_file_paths:
       if (source_file_path.endswith('_functions.c') or
           source_file_path.endswith('_getopt.c') or
           source_file_path.endswith('_i18n.c') or
@@ -1113,8 +1112,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
     del template_mappings['dpkg_build_dependencies']
 
     # Set x-bit for .sh script.
-    stat_info = os.stat(output_filename)
-    os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+    output_writer.SetExecutable(output_filename)
 
   def _GenerateTravisInstallSh(self, template_mappings, output_writer):
     """Generates the .travis/install.sh script file.
@@ -1138,8 +1136,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         template_filenames, template_mappings, output_writer, output_filename)
 
     # Set x-bit for .sh script.
-    stat_info = os.stat(output_filename)
-    os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+    output_writer.SetExecutable(output_filename)
 
   def _GenerateTravisRunTestsSh(
       self, project_configuration, template_mappings, output_writer):
@@ -1174,8 +1171,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
     del template_mappings['shared_object_version']
 
     # Set x-bit for .sh script.
-    stat_info = os.stat(output_filename)
-    os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+    output_writer.SetExecutable(output_filename)
 
   def _GenerateTravisScriptDockerSh(
       self, project_configuration, template_mappings, output_writer):
@@ -1209,8 +1205,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
     del template_mappings['dpkg_build_dependencies']
 
     # Set x-bit for .sh script.
-    stat_info = os.stat(output_filename)
-    os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+    output_writer.SetExecutable(output_filename)
 
   def _GenerateTravisScriptSh(
       self, project_configuration, template_mappings, output_writer):
@@ -1239,8 +1234,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         template_filenames, template_mappings, output_writer, output_filename)
 
     # Set x-bit for .sh script.
-    stat_info = os.stat(output_filename)
-    os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+    output_writer.SetExecutable(output_filename)
 
   def _GenerateTravisYML(
       self, project_configuration, template_mappings, include_header_file,
@@ -1536,11 +1530,10 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
 
     template_mappings['pc_libs_private'] = ' '.join(pc_libs_private)
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       if directory_entry == 'libyal.nuspec':
         output_filename = '{0:s}.nuspec'.format(
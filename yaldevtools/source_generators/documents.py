@@ -27,11 +27,10 @@ class DocumentFileGenerator(interface.SourceFileGenerator):
     template_mappings['project_description'] = project_configuration.project_description
     template_mappings['project_status'] = project_configuration.project_status
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       self._GenerateSection(
           template_filename, template_mappings, output_writer, directory_entry)
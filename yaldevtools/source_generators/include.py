@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import io
 import logging
 import os
 
@@ -184,25 +185,31 @@ class IncludeSourceFileGenerator(interface.SourceFileGenerator):
     output_directory = os.path.join(
         'include', project_configuration.library_name)
     template_directory = os.path.join(self._template_directory, 'libyal')
-    for directory_entry in os.listdir(template_directory):
+    for directory_entry in self._ListTemplateDirectory(template_directory):
       template_filename = os.path.join(template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       output_filename = os.path.join(output_directory, directory_entry)
-      if (directory_entry not in ('definitions.h.in', 'extern.h') and
-          not os.path.exists(output_filename)):
+      if not os.path.exists(output_filename):
         continue
 
+      self._StartOutputBuffer(output_filename)
+
       # Do not overwrite defintions.h.in when it exist.
-      if (directory_entry != 'definitions.h.in' and
-          os.path.exists(output_filename)):
+      if directory_entry == 'definitions.h.in':
+        with io.open(output_filename, 'r', encoding='utf8') as file_object:
+          output_data = file_object.read()
+
+        self._WriteOutputData(output_writer, output_filename, output_data)
+
+      else:
         self._GenerateSection(
             template_filename, template_mappings, output_writer, output_filename)
 
       if directory_entry in ('codepage.h', 'definitions.h.in', 'error.h'):
         self._VerticalAlignTabs(output_filename)
 
+      self._FlushOutputBuffer(output_writer, output_filename)
+
     output_filename = os.path.join(output_directory, 'features.h.in')
     self._GenerateFeaturesHeader(
         project_configuration, template_mappings, include_header_file,
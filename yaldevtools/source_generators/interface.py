@@ -8,11 +8,15 @@ import datetime
 import io
 import logging
 import os
-import string
 import time
 
+from yaldevtools import file_overlay
+from yaldevtools import output_writers
 from yaldevtools import source_file
 from yaldevtools import source_formatter
+from yaldevtools import symbol_database
+from yaldevtools import template_cache
+from yaldevtools import template_index
 
 
 class SourceFileGenerator(object):
@@ -37,7 +41,12 @@ class SourceFileGenerator(object):
     self._library_makefile_am_file = None
     self._library_makefile_am_path = None
     self._library_path = None
+    self._input_directories = {}
+    self._input_files = set()
     self._library_type_header_files = {}
+    self._output_buffers = {}
+    self._output_line_modifiers = {}
+    self._output_templates = {}
     self._projects_directory = projects_directory
     self._python_module_path = None
     self._template_directory = template_directory
@@ -46,6 +55,28 @@ class SourceFileGenerator(object):
     self._types_include_header_file = None
     self._types_include_header_path = None
 
+  def _AddLineModifier(self, output_filename, line_modifier, *arguments):
+    """Adds a line modifier to the output buffer of an output file.
+
+    The line modifiers are applied in order, when the output buffer is
+    flushed.
+
+    Args:
+      output_filename (str): path of the output file.
+      line_modifier (function): function that takes the lines of the output
+          file, followed by the arguments, and returns the modified lines.
+      arguments (list[object]): arguments of the line modifier.
+
+    Raises:
+      RuntimeError: if no output buffer was started for the output file.
+    """
+    if output_filename not in self._output_buffers:
+      raise RuntimeError('Missing output buffer for: {0:s}'.format(
+          output_filename))
+
+    self._output_line_modifiers[output_filename].append(
+        (line_modifier, arguments))
+
   def _CorrectDescriptionSpelling(self, name, output_filename):
     """Corrects the spelling of a type or value decription.
 
@@ -56,17 +87,46 @@ class SourceFileGenerator(object):
     if not name or name[0] not in ('a', 'e', 'i', 'o', ''):
       return
 
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(
+        output_filename, self._CorrectDescriptionSpellingInLines, name)
+
+  def _CorrectDescriptionSpellingInLines(self, lines, name):
+    """Corrects the spelling of a type or value decription in lines.
 
+    Args:
+      lines (list[str]): lines.
+      name (str): type or value name.
+
+    Returns:
+      list[str]: modified lines.
+    """
     name = name.replace('_', ' ')
     description = ' a {0:s}'.format(name)
     corrected_description = ' an {0:s}'.format(name)
 
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        line = line.replace(description, corrected_description)
-        file_object.write(line)
+    return [line.replace(description, corrected_description) for line in lines]
+
+  def _FlushOutputBuffer(self, output_writer, output_filename):
+    """Flushes the output buffer of an output file.
+
+    The line modifiers of the output buffer are applied and the resulting
+    data is written to the output writer with a single write.
+
+    Args:
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+    """
+    output_data = ''.join(self._output_buffers.pop(output_filename))
+    line_modifiers = self._output_line_modifiers.pop(output_filename)
+
+    if line_modifiers:
+      lines = self._SplitLines(output_data)
+      for line_modifier, arguments in line_modifiers:
+        lines = line_modifier(lines, *arguments)
+
+      output_data = ''.join(lines)
+
+    output_writer.WriteFile(output_filename, output_data, access_mode='w')
 
   def _GenerateSection(
       self, template_filename, template_mappings, output_writer,
@@ -81,17 +141,20 @@ class SourceFileGenerator(object):
       output_filename (str): name of the output file.
       access_mode (Optional[str]): output file access mode.
     """
+    self._output_templates.setdefault(output_filename, set()).add(
+        template_filename)
+
     template_string = self._ReadTemplateFile(template_filename)
     try:
       output_data = template_string.substitute(template_mappings)
     except (KeyError, ValueError) as exception:
       logging.error(
-          'Unable to format template: {0:s} with error: {1:s}'.format(
+          'Unable to format template: {0:s} with error: {1!s}'.format(
               template_filename, exception))
       return
 
-    output_writer.WriteFile(
-        output_filename, output_data, access_mode=access_mode)
+    self._WriteOutputData(
+        output_writer, output_filename, output_data, access_mode=access_mode)
 
   def _GenerateSections(
       self, template_filenames, template_mappings, output_writer,
@@ -112,6 +175,33 @@ class SourceFileGenerator(object):
           access_mode=access_mode)
       access_mode = 'a'
 
+  def _GetAPITestGroups(self, include_header_file):
+    """Retrieves the API test groups.
+
+    The API test groups of a library include header file retrieved from
+    the symbol database are not analyzed again.
+
+    Args:
+      include_header_file (LibraryIncludeHeaderFile): library include header
+          file.
+
+    Returns:
+      tuple[list[str], list[str], list[str], list[str], list[str]]: names of
+          the API function groups without and with test data, API type groups
+          without and with test data and API pseudo type groups.
+    """
+    api_functions, api_functions_with_input = (
+        include_header_file.GetAPIFunctionTestGroups())
+
+    api_types, api_types_with_input = (
+        include_header_file.GetAPITypeTestGroups())
+
+    api_pseudo_types = include_header_file.GetAPIPseudoTypeTestGroups()
+
+    return (
+        list(api_functions), list(api_functions_with_input), api_types,
+        api_types_with_input, api_pseudo_types)
+
   def _GetDefinitionsIncludeHeaderFile(self, project_configuration):
     """Retrieves the definitions include header file.
 
@@ -126,8 +216,10 @@ class SourceFileGenerator(object):
       self._definitions_include_header_path = os.path.join(
           self._projects_directory, project_configuration.library_name,
           'include', project_configuration.library_name, 'definitions.h.in')
+      self._input_files.add(self._definitions_include_header_path)
 
-      if os.path.exists(self._definitions_include_header_path):
+      if file_overlay.FILE_OVERLAY.Exists(
+          self._definitions_include_header_path):
         self._definitions_include_header_file = (
             source_file.DefinitionsIncludeHeaderFile(
                 self._definitions_include_header_path))
@@ -151,12 +243,25 @@ class SourceFileGenerator(object):
       self._library_include_header_path = os.path.join(
           self._projects_directory, project_configuration.library_name,
           'include', self._library_include_header_path)
+      self._input_files.add(self._library_include_header_path)
+
+      if file_overlay.FILE_OVERLAY.Exists(self._library_include_header_path):
+        database = symbol_database.SYMBOL_DATABASE
+        if database.IsEnabled():
+          # The symbol database only analyzes the library include header file
+          # again if the project changed.
+          database.UpdateProject(
+              project_configuration.library_name, self._projects_directory)
+          self._library_include_header_file = (
+              database.GetLibraryIncludeHeaderFile(
+                  project_configuration.library_name,
+                  self._library_include_header_path))
 
-      if os.path.exists(self._library_include_header_path):
-        self._library_include_header_file = (
-            source_file.LibraryIncludeHeaderFile(
-                self._library_include_header_path))
-        self._library_include_header_file.Read(project_configuration)
+        else:
+          self._library_include_header_file = (
+              source_file.LibraryIncludeHeaderFile(
+                  self._library_include_header_path))
+          self._library_include_header_file.Read(project_configuration)
 
     return self._library_include_header_file
 
@@ -174,8 +279,9 @@ class SourceFileGenerator(object):
       self._library_makefile_am_path = os.path.join(
           self._projects_directory, project_configuration.library_name,
           project_configuration.library_name, 'Makefile.am')
+      self._input_files.add(self._library_makefile_am_path)
 
-      if os.path.exists(self._library_makefile_am_path):
+      if file_overlay.FILE_OVERLAY.Exists(self._library_makefile_am_path):
         self._library_makefile_am_file = source_file.LibraryMakefileAMFile(
             self._library_makefile_am_path)
         self._library_makefile_am_file.Read(project_configuration)
@@ -196,12 +302,29 @@ class SourceFileGenerator(object):
     makefile_am_path = os.path.join(
         self._projects_directory, project_configuration.library_name,
         'Makefile.am')
+    self._input_files.add(makefile_am_path)
 
     makefile_am_file = source_file.MainMakefileAMFile(makefile_am_path)
     makefile_am_file.Read(project_configuration)
 
     return makefile_am_file
 
+  def _GetTemplateFilename(
+      self, template_directory, template_name, variants=None):
+    """Retrieves the name of a template file or one of its variants.
+
+    Args:
+      template_directory (str): path of the template directory.
+      template_name (str): name of the template file.
+      variants (Optional[list[str]]): names of the variants, such as
+          "is_set" for the template file with the "-with_is_set" suffix.
+
+    Returns:
+      str: name of the template file or None if not available.
+    """
+    return template_index.TEMPLATE_INDEX.GetTemplateFilename(
+        template_directory, template_name, variants=variants)
+
   def _GetTemplateMappings(self, project_configuration, authors_separator=', '):
     """Retrieves the template mappings.
 
@@ -296,6 +419,7 @@ class SourceFileGenerator(object):
           project_configuration.library_name, type_name)
       header_file_path = os.path.join(self._library_path, header_file_path)
       header_file = source_file.LibraryHeaderFile(header_file_path)
+      self._input_files.update(header_file.GetInputFiles())
 
       # TODO: handle types in non-matching header files.
       try:
@@ -323,8 +447,9 @@ class SourceFileGenerator(object):
       self._types_include_header_path = os.path.join(
           self._projects_directory, project_configuration.library_name,
           'include', project_configuration.library_name, 'types.h.in')
+      self._input_files.add(self._types_include_header_path)
 
-      if os.path.exists(self._types_include_header_path):
+      if file_overlay.FILE_OVERLAY.Exists(self._types_include_header_path):
         self._types_include_header_file = source_file.TypesIncludeHeaderFile(
             self._types_include_header_path)
         self._types_include_header_file.Read(project_configuration)
@@ -348,6 +473,17 @@ class SourceFileGenerator(object):
 
     return False
 
+  def _HasTemplate(self, path):
+    """Determines if a template file exists.
+
+    Args:
+      path (str): path of the template file.
+
+    Returns:
+      bool: True if the template file exists.
+    """
+    return template_index.TEMPLATE_INDEX.HasTemplate(path)
+
   def _HasTests(self, project_configuration):
     """Determines if the project has tests.
 
@@ -366,6 +502,37 @@ class SourceFileGenerator(object):
 
     return self._has_tests
 
+  def _ListInputDirectory(self, path):
+    """Lists the names of the entries in an input directory.
+
+    The names are recorded as a dependency of the generated files, such that
+    adding or removing an entry causes the files to be generated again.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: sorted names of the entries in the directory or an empty list
+          if the directory does not exist.
+    """
+    names = None
+    if os.path.isdir(path):
+      names = sorted(os.listdir(path))
+
+    self._input_directories[path] = names
+    return names or []
+
+  def _ListTemplateDirectory(self, template_directory):
+    """Lists the template files in a template directory.
+
+    Args:
+      template_directory (str): path of the template directory.
+
+    Returns:
+      list[str]: names of the template files in the template directory.
+    """
+    return template_index.TEMPLATE_INDEX.GetFilenames(template_directory)
+
   def _ReadTemplateFile(self, filename):
     """Reads a template string from file.
 
@@ -375,14 +542,7 @@ class SourceFileGenerator(object):
     Returns:
       string.Template: template string.
     """
-    # Read with binary mode to make sure end of line characters are
-    # not converted.
-    with io.open(filename, 'rb') as file_object:
-      file_data = file_object.read()
-
-    file_data = file_data.decode('utf8')
-
-    return string.Template(file_data)
+    return template_cache.TEMPLATE_CACHE.GetTemplate(filename)
 
   def _SetSequenceTypeNameInTemplateMappings(
       self, template_mappings, type_name):
@@ -503,9 +663,20 @@ class SourceFileGenerator(object):
       project_configuration (ProjectConfiguration): project configuration.
       output_filename (str): path of the output file.
     """
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(
+        output_filename, self._SortIncludeHeadersInLines,
+        project_configuration)
 
+  def _SortIncludeHeadersInLines(self, lines, project_configuration):
+    """Sorts the include headers within lines of a source file.
+
+    Args:
+      lines (list[str]): lines of the source file.
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Returns:
+      list[str]: modified lines.
+    """
     library_include_header_start = '#include "{0:s}_'.format(
         project_configuration.library_name)
 
@@ -521,24 +692,26 @@ class SourceFileGenerator(object):
     include_headers = []
     in_include_headers = False
 
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        if (line.startswith(library_include_header_start) or
-            line.startswith(python_module_include_header_start) or
-            line.startswith(test_include_header_start) or
-            line.startswith(tools_include_header_start) or
-            line.startswith('#include "info_') or
-            line.startswith('#include "mount_')):
-          include_headers.append(line)
-          in_include_headers = True
-
-        elif in_include_headers:
-          file_object.writelines(sorted(include_headers))
-          file_object.write(line)
-          in_include_headers = False
+    modified_lines = []
+    for line in lines:
+      if (line.startswith(library_include_header_start) or
+          line.startswith(python_module_include_header_start) or
+          line.startswith(test_include_header_start) or
+          line.startswith(tools_include_header_start) or
+          line.startswith('#include "info_') or
+          line.startswith('#include "mount_')):
+        include_headers.append(line)
+        in_include_headers = True
+
+      elif in_include_headers:
+        modified_lines.extend(sorted(include_headers))
+        modified_lines.append(line)
+        in_include_headers = False
 
-        else:
-          file_object.write(line)
+      else:
+        modified_lines.append(line)
+
+    return modified_lines
 
   def _SortVariableDeclarations(self, output_filename):
     """Sorts the variable declarations within a source file.
@@ -546,38 +719,87 @@ class SourceFileGenerator(object):
     Args:
       output_filename (str): path of the output file.
     """
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(
+        output_filename, self._SortVariableDeclarationsInLines)
+
+  def _SortVariableDeclarationsInLines(self, lines):
+    """Sorts the variable declarations within lines of a source file.
 
+    Args:
+      lines (list[str]): lines of the source file.
+
+    Returns:
+      list[str]: modified lines.
+    """
     formatter = source_formatter.SourceFormatter()
     variable_declarations = None
     in_variable_declarations = False
 
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        stripped_line = line.rstrip()
-        if stripped_line == '{':
-          file_object.write(line)
-          variable_declarations = []
-          in_variable_declarations = True
+    modified_lines = []
+    for line in lines:
+      stripped_line = line.rstrip()
+      if stripped_line == '{':
+        modified_lines.append(line)
+        variable_declarations = []
+        in_variable_declarations = True
 
-        elif in_variable_declarations:
-          if ('(' not in stripped_line or
-              stripped_line.startswith('#if defined(')):
-            variable_declarations.append(line)
+      elif in_variable_declarations:
+        if ('(' not in stripped_line or
+            stripped_line.startswith('#if defined(')):
+          variable_declarations.append(line)
 
-          else:
-            # TODO: remove the need for FormatSourceOld.
-            sorted_lines = formatter.FormatSourceOld(variable_declarations)
+        else:
+          sorted_lines = formatter.SortVariableDeclarations(
+              variable_declarations)
 
-            file_object.writelines(sorted_lines)
-            file_object.write(line)
-            in_variable_declarations = False
+          modified_lines.extend(sorted_lines)
+          modified_lines.append(line)
+          in_variable_declarations = False
 
-        else:
-          file_object.write(line)
+      else:
+        modified_lines.append(line)
+
+    return modified_lines
+
+  def _SplitLines(self, data):
+    """Splits data into lines.
+
+    End of line characters are converted to "\\n" the same way as reading
+    a file in text mode does.
+
+    Args:
+      data (str): data.
+
+    Returns:
+      list[str]: lines, including the end of line characters.
+    """
+    data = data.replace('\r\n', '\n').replace('\r', '\n')
+
+    lines = data.split('\n')
+    if lines[-1]:
+      last_line = lines.pop()
+    else:
+      last_line = None
+      lines.pop()
+
+    lines = ['{0:s}\n'.format(line) for line in lines]
+    if last_line:
+      lines.append(last_line)
+
+    return lines
+
+  def _StartOutputBuffer(self, output_filename):
+    """Starts an output buffer for an output file.
+
+    Generated sections of the output file are stored in the output buffer,
+    instead of being written to the output writer, until the output buffer
+    is flushed.
 
-    lines = formatter.FormatSource(lines)
+    Args:
+      output_filename (str): path of the output file.
+    """
+    self._output_buffers[output_filename] = []
+    self._output_line_modifiers[output_filename] = []
 
   def _VerticalAlignAssignmentStatements(self, output_filename):
     """Vertically aligns assignment statements.
@@ -585,45 +807,56 @@ class SourceFileGenerator(object):
     Args:
       output_filename (str): path of the output file.
     """
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(
+        output_filename, self._VerticalAlignAssignmentStatementsInLines)
 
+  def _VerticalAlignAssignmentStatementsInLines(self, lines):
+    """Vertically aligns assignment statements within lines.
+
+    Args:
+      lines (list[str]): lines.
+
+    Returns:
+      list[str]: modified lines.
+    """
     assigment_statements = []
     in_assigment_statements_block = False
 
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        if ' = ' in line:
-          if not in_assigment_statements_block:
-            in_assigment_statements_block = True
+    modified_lines = []
+    for line in lines:
+      if ' = ' in line:
+        if not in_assigment_statements_block:
+          in_assigment_statements_block = True
 
-          assigment_statements.append(line)
-          continue
+        assigment_statements.append(line)
+        continue
 
-        if in_assigment_statements_block:
-          if len(assigment_statements) == 1:
-            file_object.write(assigment_statements[0])
+      if in_assigment_statements_block:
+        if len(assigment_statements) == 1:
+          modified_lines.append(assigment_statements[0])
 
-          else:
-            alignment_offset = 0
-            for assigment_statement in assigment_statements:
-              prefix, _, _ = assigment_statement.rpartition('=')
-              prefix = prefix.rstrip()
-              alignment_offset = max(alignment_offset, len(prefix) + 1)
+        else:
+          alignment_offset = 0
+          for assigment_statement in assigment_statements:
+            prefix, _, _ = assigment_statement.rpartition('=')
+            prefix = prefix.rstrip()
+            alignment_offset = max(alignment_offset, len(prefix) + 1)
+
+          for assigment_statement in assigment_statements:
+            prefix, _, suffix = assigment_statement.rpartition('=')
+            prefix = prefix.rstrip()
+            alignment_length = alignment_offset - len(prefix)
 
-            for assigment_statement in assigment_statements:
-              prefix, _, suffix = assigment_statement.rpartition('=')
-              prefix = prefix.rstrip()
-              alignment_length = alignment_offset - len(prefix)
+            assigment_statement_line = '{0:s}{1:s}={2:s}'.format(
+                prefix, ' ' * alignment_length, suffix)
+            modified_lines.append(assigment_statement_line)
 
-              assigment_statement_line = '{0:s}{1:s}={2:s}'.format(
-                  prefix, ' ' * alignment_length, suffix)
-              file_object.write(assigment_statement_line)
+        in_assigment_statements_block = False
+        assigment_statements = []
 
-          in_assigment_statements_block = False
-          assigment_statements = []
+      modified_lines.append(line)
 
-        file_object.write(line)
+    return modified_lines
 
   def _VerticalAlignFunctionArguments(self, output_filename):
     """Vertically aligns function arguments.
@@ -634,43 +867,55 @@ class SourceFileGenerator(object):
     Args:
       output_filename (str): path of the output file.
     """
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(
+        output_filename, self._VerticalAlignFunctionArgumentsInLines)
 
+  def _VerticalAlignFunctionArgumentsInLines(self, lines):
+    """Vertically aligns function arguments within lines.
+
+    Args:
+      lines (list[str]): lines.
+
+    Returns:
+      list[str]: modified lines.
+    """
     alignment_number_of_spaces = 0
     alignment_number_of_tabs = 0
     in_function_call = False
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        if not line.startswith('\t'):
-          file_object.write(line)
-          continue
 
-        stripped_line = line.rstrip()
+    modified_lines = []
+    for line in lines:
+      if not line.startswith('\t'):
+        modified_lines.append(line)
+        continue
+
+      stripped_line = line.rstrip()
+
+      if in_function_call:
+        if stripped_line.endswith(')') or stripped_line.endswith(');'):
+          in_function_call = False
 
-        if in_function_call:
-          if stripped_line.endswith(')') or stripped_line.endswith(');'):
-            in_function_call = False
+        stripped_line = line.lstrip()
+        line = '{0:s}{1:s}{2:s}'.format(
+            '\t' * alignment_number_of_tabs,
+            ' ' * alignment_number_of_spaces,
+            stripped_line)
 
-          stripped_line = line.lstrip()
-          line = '{0:s}{1:s}{2:s}'.format(
-              '\t' * alignment_number_of_tabs,
-              ' ' * alignment_number_of_spaces,
-              stripped_line)
+      elif stripped_line.endswith('('):
+        in_function_call = True
+        stripped_line = line.lstrip()
 
-        elif stripped_line.endswith('('):
-          in_function_call = True
-          stripped_line = line.lstrip()
+        alignment_number_of_spaces = stripped_line.rfind(' ')
+        if alignment_number_of_spaces == -1:
+          alignment_number_of_spaces = 1
+        else:
+          alignment_number_of_spaces += 2
 
-          alignment_number_of_spaces = stripped_line.rfind(' ')
-          if alignment_number_of_spaces == -1:
-            alignment_number_of_spaces = 1
-          else:
-            alignment_number_of_spaces += 2
+        alignment_number_of_tabs = len(line) - len(stripped_line)
 
-          alignment_number_of_tabs = len(line) - len(stripped_line)
+      modified_lines.append(line)
 
-        file_object.write(line)
+    return modified_lines
 
   def _VerticalAlignTabs(self, output_filename):
     """Vertically aligns tabs.
@@ -678,9 +923,17 @@ class SourceFileGenerator(object):
     Args:
       output_filename (str): path of the output file.
     """
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(output_filename, self._VerticalAlignTabsInLines)
 
+  def _VerticalAlignTabsInLines(self, lines):
+    """Vertically aligns tabs within lines.
+
+    Args:
+      lines (list[str]): lines.
+
+    Returns:
+      list[str]: modified lines.
+    """
     alignment_offset = 0
     for line in lines:
       if '\t' not in line.lstrip('\t'):
@@ -699,23 +952,80 @@ class SourceFileGenerator(object):
       else:
         alignment_offset = max(alignment_offset, equal_sign_offset)
 
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        if '\t' in line.lstrip('\t'):
-          prefix, _, suffix = line.rpartition('\t')
-          prefix = prefix.rstrip('\t')
-          formatted_prefix = prefix.replace('\t', ' ' * 8)
+    modified_lines = []
+    for line in lines:
+      if '\t' in line.lstrip('\t'):
+        prefix, _, suffix = line.rpartition('\t')
+        prefix = prefix.rstrip('\t')
+        formatted_prefix = prefix.replace('\t', ' ' * 8)
+
+        alignment_size = alignment_offset - len(formatted_prefix)
+        alignment_size, remainder = divmod(alignment_size, 8)
+        if remainder > 0:
+          alignment_size += 1
 
-          alignment_size = alignment_offset - len(formatted_prefix)
-          alignment_size, remainder = divmod(alignment_size, 8)
-          if remainder > 0:
-            alignment_size += 1
+        alignment = '\t' * alignment_size
 
-          alignment = '\t' * alignment_size
+        line = '{0:s}{1:s}{2:s}'.format(prefix, alignment, suffix)
 
-          line = '{0:s}{1:s}{2:s}'.format(prefix, alignment, suffix)
+      modified_lines.append(line)
 
-        file_object.write(line)
+    return modified_lines
+
+  def _WriteOutputData(
+      self, output_writer, output_filename, output_data, access_mode='w'):
+    """Writes output data.
+
+    Args:
+      output_writer (OutputWriter): output writer.
+      output_filename (str): path of the output file.
+      output_data (str): output data.
+      access_mode (Optional[str]): output file access mode.
+    """
+    output_buffer = self._output_buffers.get(output_filename, None)
+    if output_buffer is None:
+      output_writer.WriteFile(
+          output_filename, output_data, access_mode=access_mode)
+
+    else:
+      if access_mode == 'w':
+        del output_buffer[:]
+
+      output_buffer.append(output_data)
+
+  def GenerateRecords(self, project_configuration):
+    """Generates the source files as output records.
+
+    The source files are generated in memory instead of being written. Files
+    in the current working directory, such as existing source files, are
+    still read.
+
+    Args:
+      project_configuration (ProjectConfiguration): project configuration.
+
+    Yields:
+      OutputRecord: output record of a generated source file, in order of
+          the first write of the source files.
+    """
+    output_writer = output_writers.RecordWriter()
+    self.Generate(project_configuration, output_writer)
+    output_writer.Close()
+
+    for output_record in output_writer.GetRecords():
+      yield output_record
+
+  def GetDependencies(self):
+    """Retrieves the dependencies of the generated files.
+
+    Returns:
+      tuple[set[str], dict[str, list[str]], dict[str, set[str]]]: paths of
+          the input files read by the generator, names of the entries per
+          path of input directory listed by the generator, where None
+          represents a directory that does not exist, and paths of the
+          templates per path of output file.
+    """
+    return (
+        self._input_files, self._input_directories, self._output_templates)
 
   @abc.abstractmethod
   def Generate(self, project_configuration, output_writer):
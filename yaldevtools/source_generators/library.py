@@ -72,6 +72,8 @@ class LibrarySourceFileGenerator(interface.SourceFileGenerator):
           if line == internal_types_start_line:
             in_internal_types = True
 
+    self._StartOutputBuffer(output_filename)
+
     template_filename = os.path.join(template_directory, 'header.h')
 
     self._GenerateSection(
@@ -79,7 +81,8 @@ class LibrarySourceFileGenerator(interface.SourceFileGenerator):
 
     if internal_types:
       output_data = '\n'.join(internal_types)
-      output_writer.WriteFile(output_filename, output_data, access_mode='a')
+      self._WriteOutputData(
+          output_writer, output_filename, output_data, access_mode='a')
 
     template_filename = os.path.join(template_directory, 'footer.h')
 
@@ -89,6 +92,8 @@ class LibrarySourceFileGenerator(interface.SourceFileGenerator):
 
     self._VerticalAlignTabs(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def Generate(self, project_configuration, output_writer):
     """Generates library source files.
 
@@ -154,7 +159,8 @@ class LibrarySourceFileGenerator(interface.SourceFileGenerator):
     self._GenerateTypesHeader(
         project_configuration, template_mappings, output_writer)
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       if not directory_entry.startswith('libyal'):
         continue
 
@@ -189,8 +195,6 @@ class LibrarySourceFileGenerator(interface.SourceFileGenerator):
 
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       output_filename = '{0:s}{1:s}'.format(
           project_configuration.library_name, directory_entry[6:])
@@ -210,8 +214,12 @@ class LibrarySourceFileGenerator(interface.SourceFileGenerator):
       else:
         template_mappings['authors'] = authors_template_mapping
 
+      self._StartOutputBuffer(output_filename)
+
       self._GenerateSection(
           template_filename, template_mappings, output_writer, output_filename)
 
       if directory_entry == 'libyal_codepage.h':
         self._VerticalAlignTabs(output_filename)
+
+      self._FlushOutputBuffer(output_writer, output_filename)
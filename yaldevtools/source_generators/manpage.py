@@ -7,7 +7,6 @@ import difflib
 import io
 import logging
 import os
-import shutil
 import time
 
 from yaldevtools.source_generators import interface
@@ -30,8 +29,12 @@ class LibraryManPageGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
-    backup_filename = '{0:s}.{1:d}'.format(output_filename, os.getpid())
-    shutil.copyfile(output_filename, backup_filename)
+    original_lines = None
+    if os.path.exists(output_filename):
+      with io.open(output_filename, 'r', encoding='utf8') as file_object:
+        original_lines = file_object.readlines()
+
+    self._StartOutputBuffer(output_filename)
 
     template_mappings['date'] = time.strftime(
         '%B %d, %Y', time.gmtime()).replace(' 0', '  ')
@@ -161,20 +164,32 @@ class LibraryManPageGenerator(interface.SourceFileGenerator):
         template_filename, template_mappings, output_writer, output_filename,
         access_mode='a')
 
-    backup_file = io.open(backup_filename, 'r', encoding='utf8')
-    backup_lines = backup_file.readlines()
+    if original_lines is not None:
+      self._AddLineModifier(
+          output_filename, self._RestoreUnchangedManPageInLines,
+          original_lines)
+
+    self._FlushOutputBuffer(output_writer, output_filename)
+
+  def _RestoreUnchangedManPageInLines(self, lines, original_lines):
+    """Restores the original man page when only its date changed.
 
-    output_file = io.open(output_filename, 'r', encoding='utf8')
-    output_lines = output_file.readlines()
+    Args:
+      lines (list[str]): lines of the generated man page.
+      original_lines (list[str]): lines of the original man page.
 
-    diff_lines = list(difflib.ndiff(backup_lines[1:], output_lines[1:]))
+    Returns:
+      list[str]: original lines if there are no changes besides the date,
+          otherwise the generated lines.
+    """
+    diff_lines = list(difflib.ndiff(original_lines[1:], lines[1:]))
     diff_lines = [line for line in diff_lines if line.startswith('-')]
 
     # Check if there are changes besides the date.
     if diff_lines:
-      os.remove(backup_filename)
-    else:
-      shutil.move(backup_filename, output_filename)
+      return lines
+
+    return original_lines
 
   def Generate(self, project_configuration, output_writer):
     """Generates a library man page file (libyal.3).
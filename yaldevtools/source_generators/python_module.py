@@ -16,12 +16,14 @@ from yaldevtools.source_generators import interface
 class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
   """Python module source files generator."""
 
-  def _CopyFunctionToOutputFile(self, lines, search_string, output_filename):
+  def _CopyFunctionToOutputFile(
+      self, lines, search_string, output_writer, output_filename):
     """Copies a function to the output file.
 
     Args:
       lines (list[bytes]): lines of the input file to copy from.
       search_string (bytes): string to search the input for.
+      output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
 
     Returns:
@@ -37,16 +39,13 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     if function_index is None:
       return False
 
-    with io.open(output_filename, 'a', encoding='utf8') as file_object:
-      line = lines[function_index]
-      while not line.startswith('}'):
-        file_object.write(line)
-
-        function_index += 1
-        line = lines[function_index]
+    function_end_index = function_index
+    while not lines[function_end_index].startswith('}'):
+      function_end_index += 1
 
-      file_object.write(line)
-      file_object.write(lines[function_index + 1])
+    output_data = ''.join(lines[function_index:function_end_index + 2])
+    self._WriteOutputData(
+        output_writer, output_filename, output_data, access_mode='a')
 
     return True
 
@@ -68,6 +67,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'pyyal_definitions')
 
@@ -80,10 +81,11 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     self._GenerateSection(
         template_filename, template_mappings, output_writer, output_filename)
 
-    # TODO: change to a generic line modifiers approach.
     self._CorrectDescriptionSpelling(definitions_name, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateDefinitionsSourceFile(
       self, project_configuration, template_mappings, definitions_name,
       enum_declaration, output_writer):
@@ -102,6 +104,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'pyyal_definitions')
 
@@ -146,12 +150,13 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
         template_filename, template_mappings, output_writer, output_filename,
         access_mode='a')
 
-    # TODO: change to a generic line modifiers approach.
     self._CorrectDescriptionSpelling(definitions_name, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
     self._SortVariableDeclarations(output_filename)
     self._VerticalAlignFunctionArguments(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateModuleHeaderFile(
       self, project_configuration, template_mappings, include_header_file,
       output_writer):
@@ -226,6 +231,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     if signature_type:
       signature_desription = (
           project_configuration.project_data_format or 'TODO')
@@ -320,6 +327,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateSequenceTypeHeaderFile(
       self, project_configuration, template_mappings, type_name, output_writer):
     """Generates a Python sequence type object header file.
@@ -338,6 +347,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'pyyal_sequence_type')
 
@@ -349,11 +360,12 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     self._GenerateSection(
         template_filename, template_mappings, output_writer, output_filename)
 
-    # TODO: change to a generic line modifiers approach.
     self._CorrectDescriptionSpelling(sequence_type_name, output_filename)
     self._CorrectDescriptionSpelling(type_name, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateSequenceTypeSourceFile(
       self, project_configuration, template_mappings, type_name, output_writer,
       type_is_object=False):
@@ -374,6 +386,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'pyyal_sequence_type')
 
@@ -401,7 +415,6 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     self._GenerateSection(
         template_filename, template_mappings, output_writer, output_filename)
 
-    # TODO: change to a generic line modifiers approach.
     self._CorrectDescriptionSpelling(type_name, output_filename)
     self._CorrectDescriptionSpelling(sequence_type_name, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
@@ -410,6 +423,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     self._VerticalAlignFunctionArguments(output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateTypeHeaderFile(
       self, project_configuration, template_mappings, type_name,
       python_function_prototypes, output_writer, has_pseudo_sub_types=False,
@@ -433,6 +448,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     open_support = 'open' in python_function_prototypes
     without_initialize_and_with_free = (
         'initialize' not in python_function_prototypes and
@@ -501,7 +518,7 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
 
       template_filename = '{0:s}.h'.format(type_function)
       template_filename = os.path.join(template_directory, template_filename)
-      if not os.path.exists(template_filename):
+      if not self._HasTemplate(template_filename):
         template_filename = None
         if python_function_prototype.function_type == (
             definitions.FUNCTION_TYPE_GET):
@@ -533,7 +550,7 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
         if template_filename:
           template_filename = os.path.join(template_directory, template_filename)
 
-      if not template_filename or not os.path.exists(template_filename):
+      if not template_filename or not self._HasTemplate(template_filename):
         logging.warning((
             'Unable to generate Python type object header for: {0:s}.{1:s} '
             'missing template: {1:s}').format(
@@ -554,10 +571,11 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
         template_filename, template_mappings, output_writer, output_filename,
         access_mode='a')
 
-    # TODO: change to a generic line modifiers approach.
     self._CorrectDescriptionSpelling(type_name, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateTypeSourceFile(
       self, project_configuration, template_mappings, type_name,
       python_function_prototypes, output_writer, has_pseudo_sub_types=False,
@@ -581,6 +599,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     output_filename = os.path.join(
         project_configuration.python_module_name, output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     lines = []
     if os.path.exists(output_filename):
       with io.open(output_filename, 'r', encoding='utf8') as file_object:
@@ -776,7 +796,7 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
 
       template_filename = '{0:s}.c'.format(type_function)
       template_filename = os.path.join(template_directory, template_filename)
-      if not os.path.exists(template_filename):
+      if not self._HasTemplate(template_filename):
         template_filename = None
 
         # TODO: make more generic.
@@ -830,19 +850,18 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
                     python_function_prototype.data_type)
 
               else:
+                template_variants = []
                 if (python_function_prototype.return_values and
                     'None' in python_function_prototype.return_values):
-                  template_filename = 'get_{0:s}{1:s}_value-with_none.c'.format(
-                      value_name_prefix, python_function_prototype.data_type)
+                  template_variants.append('none')
 
                 elif has_pseudo_sub_types:
-                  template_filename = (
-                      'get_{0:s}{1:s}_value-with_type_object.c').format(
-                          value_name_prefix, python_function_prototype.data_type)
+                  template_variants.append('type_object')
 
-                else:
-                  template_filename = 'get_{0:s}{1:s}_value.c'.format(
-                      value_name_prefix, python_function_prototype.data_type)
+                template_filename = self._GetTemplateFilename(
+                    template_directory, 'get_{0:s}{1:s}_value.c'.format(
+                        value_name_prefix, python_function_prototype.data_type),
+                    variants=template_variants)
 
           elif python_function_prototype.function_type == (
               definitions.FUNCTION_TYPE_GET_BY_INDEX):
@@ -892,7 +911,7 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
         if template_filename:
           template_filename = os.path.join(template_directory, template_filename)
 
-      if not template_filename or not os.path.exists(template_filename):
+      if not template_filename or not self._HasTemplate(template_filename):
         logging.warning((
             'Unable to generate Python type object source code for: '
             '{0:s}.{1:s} missing template: {1:s}').format(
@@ -918,7 +937,7 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
                 value_name)
 
         result = self._CopyFunctionToOutputFile(
-            lines, search_string, output_filename)
+            lines, search_string, output_writer, output_filename)
 
         if not result:
           additional_template_filename = 'get_value_type_object.c'
@@ -940,14 +959,13 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
                 type_function)
 
         result = self._CopyFunctionToOutputFile(
-            lines, search_string, output_filename)
+            lines, search_string, output_writer, output_filename)
 
       if not result:
         self._GenerateSection(
             template_filename, template_mappings, output_writer, output_filename,
             access_mode='a')
 
-    # TODO: change to a generic line modifiers approach.
     self._CorrectDescriptionSpelling(type_name, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
     # TODO: combine vertical align functions.
@@ -955,6 +973,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     self._VerticalAlignFunctionArguments(output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateTypeSourceFileTypeObjectMethods(
       self, project_configuration, template_mappings, type_name,
       python_function_prototypes, output_writer, output_filename):
@@ -1834,14 +1854,13 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
     else:
       template_mappings['guid_byte_order'] = 'LITTLE'
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       if not directory_entry.startswith('pyyal_'):
         continue
 
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       force_create = False
 
@@ -1859,12 +1878,16 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
       if not force_create and not os.path.exists(output_filename):
         continue
 
+      self._StartOutputBuffer(output_filename)
+
       self._GenerateSection(
           template_filename, template_mappings, output_writer, output_filename)
 
       if directory_entry == 'pyyal_file_object_io_handle.c':
         self._SortVariableDeclarations(output_filename)
 
+      self._FlushOutputBuffer(output_writer, output_filename)
+
     del template_mappings['guid_byte_order']
 
     library_include_header_file = self._GetLibraryIncludeHeaderFile(
@@ -1878,11 +1901,8 @@ class PythonModuleSourceFileGenerator(interface.SourceFileGenerator):
           'source and header files.').format(
               self._library_include_header_path))
     else:
-      api_types, api_types_with_input = (
-          library_include_header_file.GetAPITypeTestGroups())
-
-      api_pseudo_types = (
-          library_include_header_file.GetAPIPseudoTypeTestGroups())
+      _, _, api_types, api_types_with_input, api_pseudo_types = (
+          self._GetAPITestGroups(library_include_header_file))
 
       api_types.extend(api_types_with_input)
       python_module_types.extend(api_types)
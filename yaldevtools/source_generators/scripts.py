@@ -4,7 +4,6 @@
 from __future__ import unicode_literals
 
 import os
-import stat
 
 from yaldevtools.source_generators import interface
 
@@ -89,8 +88,7 @@ class ScriptFileGenerator(interface.SourceFileGenerator):
     del template_mappings['coverage_configure_options']
 
     # Set the x-bit for the shell script (.sh).
-    stat_info = os.stat(output_filename)
-    os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+    output_writer.SetExecutable(output_filename)
 
   def Generate(self, project_configuration, output_writer):
     """Generates script files.
@@ -107,6 +105,7 @@ class ScriptFileGenerator(interface.SourceFileGenerator):
     mount_tool_filename = '{0:s}.c'.format(mount_tool_name)
     mount_tool_filename = os.path.join(
         project_configuration.tools_directory, mount_tool_filename)
+    self._input_files.add(mount_tool_filename)
 
     template_mappings = self._GetTemplateMappings(project_configuration)
     template_mappings['local_libs'] = ' '.join(
@@ -116,11 +115,10 @@ class ScriptFileGenerator(interface.SourceFileGenerator):
     self._GenerateRunTestsSh(
         project_configuration, template_mappings, output_writer)
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       output_filename = directory_entry
 
@@ -137,5 +135,4 @@ class ScriptFileGenerator(interface.SourceFileGenerator):
 
       if output_filename.endswith('.sh'):
         # Set the x-bit for a shell script (.sh).
-        stat_info = os.stat(output_filename)
-        os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+        output_writer.SetExecutable(output_filename)
@@ -3,10 +3,8 @@
 
 from __future__ import unicode_literals
 
-import io
 import logging
 import os
-import stat
 
 from yaldevtools import source_file
 from yaldevtools.source_generators import interface
@@ -72,6 +70,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         project_configuration.library_name_suffix)
     output_filename = os.path.join('tests', output_filename)
 
+    self._StartOutputBuffer(output_filename)
+
     # TODO: add check for has codepage function for libsigscan and include
     # libcerror.
     if signature_type:
@@ -214,6 +214,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
     self._SortIncludeHeaders(project_configuration, output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateExistingFunction(
       self, test_function_name, test_source_file, output_writer,
       output_filename, access_mode='w'):
@@ -238,8 +240,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
       return False
 
     output_data = '\n'.join(existing_test_function)
-    output_writer.WriteFile(
-        output_filename, output_data, access_mode=access_mode)
+    self._WriteOutputData(
+        output_writer, output_filename, output_data, access_mode=access_mode)
     return True
 
   def _GenerateTestFunctions(
@@ -406,6 +408,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         self._template_directory, 'Makefile.am')
     output_filename = os.path.join('tests', 'Makefile.am')
 
+    self._StartOutputBuffer(output_filename)
+
     test_scripts = []
     if (api_functions or api_functions_with_input or api_types or
         api_types_with_input or api_pseudo_types):
@@ -565,6 +569,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortSources(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GeneratePythonModuleSupportTests(
       self, project_configuration, template_mappings, include_header_file,
       output_writer):
@@ -1161,37 +1167,35 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
 
     body_template_name = None
     if function_template:
+      template_variants = []
       if clone_function:
-        body_template_name = 'function-body-{0:s}-with_clone_function.c'.format(
-            function_template)
+        template_variants.append('clone_function')
       elif free_function:
-        body_template_name = 'function-body-{0:s}-with_free_function.c'.format(
-            function_template)
+        template_variants.append('free_function')
       elif with_codepage:
-        body_template_name = 'function-body-{0:s}-with_codepage.c'.format(
-            function_template)
+        template_variants.append('codepage')
       elif with_io_handle:
-        body_template_name = 'function-body-{0:s}-with_io_handle.c'.format(
-            function_template)
+        template_variants.append('io_handle')
       elif with_is_set:
-        body_template_name = 'function-body-{0:s}-with_is_set.c'.format(
-            function_template)
-      else:
-        body_template_name = 'function-body-{0:s}.c'.format(function_template)
+        template_variants.append('is_set')
+
+      body_template_name = self._GetTemplateFilename(
+          template_directory, 'function-body-{0:s}.c'.format(function_template),
+          variants=template_variants)
 
     body_template_filename = None
     if body_template_name:
       body_template_filename = os.path.join(
           template_directory, body_template_name)
 
-    if not body_template_filename or not os.path.exists(body_template_filename):
+    if not body_template_filename:
       template_filename = None
       if function_template:
         template_filename = '{0:s}.c'.format(function_template)
         template_filename = os.path.join(template_directory, template_filename)
 
       # Generate the test function based on a single template.
-      if template_filename and os.path.exists(template_filename):
+      if template_filename and self._HasTemplate(template_filename):
         self._GenerateTypeTestDefineInternalEnd(
             template_mappings, last_have_extern, have_extern, output_writer,
             output_filename)
@@ -1503,7 +1507,7 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
     if template_filename:
       template_filename = os.path.join(template_directory, template_filename)
 
-    if not template_filename or not os.path.exists(template_filename):
+    if not template_filename or not self._HasTemplate(template_filename):
       if self._GenerateExistingFunction(
           test_function_name, test_source_file, output_writer,
           output_filename, access_mode='a'):
@@ -1859,6 +1863,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
             test_source_file.path))
         return False
 
+    self._StartOutputBuffer(output_filename)
+
     type_size_name = self._GetTypeSizeName(project_configuration, type_name)
 
     template_directory = os.path.join(self._template_directory, 'yal_test_type')
@@ -2015,29 +2021,30 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
 
     # Generate test data.
     test_data_directory = os.path.join('tests', 'data')
-    if os.path.exists(test_data_directory):
-      for directory_entry in sorted(os.listdir(test_data_directory)):
-        test_type_name, _, test_data_suffix = directory_entry.partition('.')
-        if test_type_name != type_name:
-          continue
+    for directory_entry in self._ListInputDirectory(test_data_directory):
+      test_type_name, _, test_data_suffix = directory_entry.partition('.')
+      if test_type_name != type_name:
+        continue
 
-        test_data_suffix, _, test_data_index = test_data_suffix.rpartition('.')
-        if test_data_suffix:
-          test_data_suffix = '_{0:s}'.format(test_data_suffix)
+      test_data_suffix, _, test_data_index = test_data_suffix.rpartition('.')
+      if test_data_suffix:
+        test_data_suffix = '_{0:s}'.format(test_data_suffix)
 
-        test_data_file = os.path.join(test_data_directory, directory_entry)
-        with open(test_data_file, 'rb') as file_object:
-          test_data = file_object.read()
+      test_data_file = os.path.join(test_data_directory, directory_entry)
+      self._input_files.add(test_data_file)
 
-        template_mappings['test_data'] = self._FormatTestData(test_data)
-        template_mappings['test_data_size'] = len(test_data)
-        template_mappings['test_data_index'] = test_data_index
-        template_mappings['test_data_suffix'] = test_data_suffix
+      with open(test_data_file, 'rb') as file_object:
+        test_data = file_object.read()
 
-        template_filename = os.path.join(template_directory, 'test_data.c')
-        self._GenerateSection(
-            template_filename, template_mappings, output_writer, output_filename,
-            access_mode='a')
+      template_mappings['test_data'] = self._FormatTestData(test_data)
+      template_mappings['test_data_size'] = len(test_data)
+      template_mappings['test_data_index'] = test_data_index
+      template_mappings['test_data_suffix'] = test_data_suffix
+
+      template_filename = os.path.join(template_directory, 'test_data.c')
+      self._GenerateSection(
+          template_filename, template_mappings, output_writer, output_filename,
+          access_mode='a')
 
     # Generate a clone, compare and/or free test function if necessary.
     clone_function = None
@@ -2196,6 +2203,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
     self._SortIncludeHeaders(project_configuration, output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
     return True
 
   def _GenerateTypeTestsMainFunction(
@@ -2679,6 +2688,7 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
 
       header_file_path = os.path.join(library_path, source_file_path)
       header_file = source_file.LibraryHeaderFile(header_file_path)
+      self._input_files.update(header_file.GetInputFiles())
       header_file.Read(project_configuration)
 
       if not header_file.types:
@@ -2921,37 +2931,47 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
     Args:
       output_filename (str): path of the output file.
     """
-    with io.open(output_filename, 'r', encoding='utf8') as file_object:
-      lines = file_object.readlines()
+    self._AddLineModifier(output_filename, self._SortSourcesInLines)
+
+  def _SortSourcesInLines(self, lines):
+    """Sorts the sources within lines.
+
+    Args:
+      lines (list[str]): lines.
 
+    Returns:
+      list[str]: modified lines.
+    """
     sources = None
     in_sources = False
 
-    with io.open(output_filename, 'w', encoding='utf8') as file_object:
-      for line in lines:
-        stripped_line = line.strip()
-        if stripped_line.endswith('_SOURCES = \\'):
-          file_object.write(line)
-          sources = []
-          in_sources = True
+    modified_lines = []
+    for line in lines:
+      stripped_line = line.strip()
+      if stripped_line.endswith('_SOURCES = \\'):
+        modified_lines.append(line)
+        sources = []
+        in_sources = True
 
-        elif in_sources:
-          if stripped_line:
-            if stripped_line.endswith(' \\'):
-              stripped_line = stripped_line[:-2]
-            sources.append(stripped_line)
+      elif in_sources:
+        if stripped_line:
+          if stripped_line.endswith(' \\'):
+            stripped_line = stripped_line[:-2]
+          sources.append(stripped_line)
 
-          else:
-            sorted_lines = ' \\\n'.join(
-                ['\t{0:s}'.format(filename) for filename in sorted(sources)])
+        else:
+          sorted_lines = ' \\\n'.join(
+              ['\t{0:s}'.format(filename) for filename in sorted(sources)])
 
-            file_object.writelines(sorted_lines)
-            file_object.write('\n')
-            file_object.write(line)
-            in_sources = False
+          modified_lines.append(sorted_lines)
+          modified_lines.append('\n')
+          modified_lines.append(line)
+          in_sources = False
 
-        else:
-          file_object.write(line)
+      else:
+        modified_lines.append(line)
+
+    return modified_lines
 
   def _ReadTestDataFile(self, type_name, sequence_number=1):
     """Reads a test data file.
@@ -2965,6 +2985,7 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
     """
     test_data_filename = '{0:s}.{1:d}'.format(type_name, sequence_number)
     test_data_file = os.path.join('tests', 'data', test_data_filename)
+    self._input_files.add(test_data_file)
 
     if not os.path.exists(test_data_file):
       return bytes()
@@ -3011,13 +3032,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
               self._library_makefile_am_path))
       return
 
-    api_functions, api_functions_with_input = (
-        include_header_file.GetAPIFunctionTestGroups())
-
-    api_types, api_types_with_input = (
-        include_header_file.GetAPITypeTestGroups())
-
-    api_pseudo_types = include_header_file.GetAPIPseudoTypeTestGroups()
+    (api_functions, api_functions_with_input, api_types, api_types_with_input,
+     api_pseudo_types) = self._GetAPITestGroups(include_header_file)
 
     types, internal_functions = self._GetLibraryTypes(
         project_configuration, makefile_am_file)
@@ -3074,7 +3090,8 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         api_types, api_types_with_input, api_pseudo_types, internal_functions,
         internal_types, test_python_functions, test_python_functions_with_input)
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       # Ignore yal_test_library.h in favor of yal_test_libyal.h
       if directory_entry == library_header:
         continue
@@ -3086,8 +3103,6 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
 
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       is_script = (
           directory_entry.endswith('.ps1') or directory_entry.endswith('.sh'))
@@ -3138,16 +3153,19 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
       if not force_create and not os.path.exists(output_filename):
         continue
 
+      self._StartOutputBuffer(output_filename)
+
       self._GenerateSection(
           template_filename, template_mappings, output_writer, output_filename)
 
       if output_filename.endswith('.c'):
         self._SortIncludeHeaders(project_configuration, output_filename)
 
-      elif output_filename.endswith('.sh'):
+      self._FlushOutputBuffer(output_writer, output_filename)
+
+      if output_filename.endswith('.sh'):
         # Set x-bit for a shell script (.sh).
-        stat_info = os.stat(output_filename)
-        os.chmod(output_filename, stat_info.st_mode | stat.S_IEXEC)
+        output_writer.SetExecutable(output_filename)
 
     with_offset = False
 
@@ -200,6 +200,7 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     info_tool_filename = os.path.join(
         project_configuration.tools_directory, info_tool_filename)
 
+    self._input_files.add(info_tool_filename)
     if os.path.exists(info_tool_filename):
       output_filename = os.path.join(
           project_configuration.tools_directory, 'info_handle.h')
@@ -230,6 +231,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'yalinfo')
 
     info_tool_options = self._GetInfoToolOptions(
@@ -270,6 +273,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     self._SortIncludeHeaders(project_configuration, output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateInfoToolSourceMainFunction(
       self, project_configuration, template_mappings, info_tool_name,
       info_tool_options, output_writer, output_filename):
@@ -438,6 +443,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'mount_dokan')
 
     template_filename = os.path.join(template_directory, 'mount_dokan.h')
@@ -446,6 +453,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountDokanSourceFile(
       self, project_configuration, template_mappings, mount_tool_name,
       output_writer, output_filename):
@@ -459,6 +468,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'mount_dokan')
 
     template_mappings['mount_tool_name'] = mount_tool_name
@@ -471,6 +482,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountFileEntryHeaderFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -483,6 +496,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'mount_file_entry')
 
@@ -507,6 +522,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
         project_configuration.mount_tool_file_entry_type, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountFileEntrySourceFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -519,6 +536,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'mount_file_entry')
 
@@ -689,6 +708,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     self._SortIncludeHeaders(project_configuration, output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountFileSystemHeaderFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -701,6 +722,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'mount_file_system')
 
@@ -786,6 +809,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
         project_configuration.mount_tool_file_entry_type, output_filename)
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountFileSystemSourceFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -798,6 +823,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(
         self._template_directory, 'mount_file_system')
 
@@ -883,6 +910,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     self._SortVariableDeclarations(output_filename)
     self._VerticalAlignFunctionArguments(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountFuseHeaderFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -895,6 +924,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'mount_fuse')
 
     template_filename = os.path.join(template_directory, 'mount_fuse.h')
@@ -903,6 +934,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountFuseSourceFile(
       self, project_configuration, template_mappings, mount_tool_name,
       output_writer, output_filename):
@@ -916,6 +949,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'mount_fuse')
 
     template_mappings['mount_tool_name'] = mount_tool_name
@@ -928,6 +963,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountHandleHeaderFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -940,6 +977,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'mount_handle')
 
     template_names = ['header.h', 'includes-start.h']
@@ -1074,6 +1113,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
 
     self._SortIncludeHeaders(project_configuration, output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountHandleSourceFile(
       self, project_configuration, template_mappings, output_writer,
       output_filename):
@@ -1086,6 +1127,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'mount_handle')
 
     template_names = ['header.c', 'includes-start.c']
@@ -1373,6 +1416,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     self._SortVariableDeclarations(output_filename)
     self._VerticalAlignFunctionArguments(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountTool(
       self, project_configuration, template_mappings, output_writer):
     """Generates a mount tool.
@@ -1390,6 +1435,7 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     mount_tool_filename = os.path.join(
         project_configuration.tools_directory, mount_tool_filename)
 
+    self._input_files.add(mount_tool_filename)
     if os.path.exists(mount_tool_filename):
       output_filename = os.path.join(
           project_configuration.tools_directory, 'mount_file_entry.h')
@@ -1468,6 +1514,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
       output_writer (OutputWriter): output writer.
       output_filename (str): path of the output file.
     """
+    self._StartOutputBuffer(output_filename)
+
     template_directory = os.path.join(self._template_directory, 'yalmount')
 
     template_names = ['header.c', 'includes-start.c']
@@ -1528,6 +1576,8 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
     self._SortIncludeHeaders(project_configuration, output_filename)
     self._SortVariableDeclarations(output_filename)
 
+    self._FlushOutputBuffer(output_writer, output_filename)
+
   def _GenerateMountToolSourceMainFunction(
       self, project_configuration, template_mappings, mount_tool_name,
       mount_tool_options, output_writer, output_filename):
@@ -1887,15 +1937,14 @@ class ToolSourceFileGenerator(interface.SourceFileGenerator):
 
     # TODO: add support for ouput.[ch]
 
-    for directory_entry in os.listdir(self._template_directory):
+    for directory_entry in self._ListTemplateDirectory(
+        self._template_directory):
       # Ignore yaltools_library.h in favor of yaltools_libyal.h
       if directory_entry == library_header:
         continue
 
       template_filename = os.path.join(
           self._template_directory, directory_entry)
-      if not os.path.isfile(template_filename):
-        continue
 
       if directory_entry == 'yaltools_libyal.h':
         output_filename = '{0:s}tools_{1:s}.h'.format(
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""Parser for the declarations in C source and header files."""
+
+from __future__ import unicode_literals
+
+from yaldevtools import source_code
+
+
+TOKEN_TYPE_BLANK = 1
+TOKEN_TYPE_COMMENT = 2
+TOKEN_TYPE_DEPRECATED = 3
+TOKEN_TYPE_ENDIF = 4
+TOKEN_TYPE_ENUM = 5
+TOKEN_TYPE_EXTERN = 6
+TOKEN_TYPE_IF_DEFINED = 7
+TOKEN_TYPE_OPEN_PARENTHESIS = 8
+TOKEN_TYPE_OTHER = 9
+TOKEN_TYPE_PREPROCESSOR = 10
+TOKEN_TYPE_SECTION_SEPARATOR = 11
+TOKEN_TYPE_STATEMENT = 12
+TOKEN_TYPE_TYPEDEF = 13
+
+
+class FunctionDeclaration(object):
+  """Function declaration.
+
+  Attributes:
+    conditions (set[str]): names of the preprocessor definitions the
+        declaration is conditional on, such as "HAVE_DEBUG_OUTPUT".
+    function_line (str): first line of the declaration, such as
+        "int libyal_file_open(".
+    function_prototype (FunctionPrototype): function prototype.
+    is_deprecated (bool): True if the function is marked as deprecated.
+    section_name (str): name of the section that contains the declaration
+        or None if not in a section.
+  """
+
+  __slots__ = (
+      'conditions', 'function_line', 'function_prototype', 'is_deprecated',
+      'section_name')
+
+  def __init__(self, function_line, function_prototype):
+    """Initializes a function declaration.
+
+    Args:
+      function_line (str): first line of the declaration.
+      function_prototype (FunctionPrototype): function prototype.
+    """
+    super(FunctionDeclaration, self).__init__()
+    self.conditions = set()
+    self.function_line = function_line
+    self.function_prototype = function_prototype
+    self.is_deprecated = False
+    self.section_name = None
+
+
+class Tokenizer(object):
+  """Tokenizer of the lines of a C source or header file.
+
+  Every line is stripped and classified only once, where the classification
+  is determined by the first and last character of the line before any
+  prefix is compared.
+  """
+
+  _SECTION_SEPARATOR = (
+      '/* -------------------------------------------------------------'
+      '------------')
+
+  def __init__(self, library_name):
+    """Initializes a tokenizer.
+
+    Args:
+      library_name (str): name of the library, such as "libyal".
+    """
+    super(Tokenizer, self).__init__()
+    self._define_deprecated = '{0:s}_DEPRECATED'.format(library_name.upper())
+    self._define_extern = '{0:s}_EXTERN'.format(library_name.upper())
+
+  def Tokenize(self, file_object):
+    """Tokenizes a file-like object.
+
+    Args:
+      file_object (file): file-like object.
+
+    Yields:
+      tuple[int, str]: token type and stripped line.
+    """
+    for line in file_object:
+      line = line.strip()
+      if not line:
+        yield TOKEN_TYPE_BLANK, line
+        continue
+
+      last_character = line[-1]
+      if last_character == '(':
+        yield TOKEN_TYPE_OPEN_PARENTHESIS, line
+        continue
+
+      first_character = line[0]
+      if first_character == '#':
+        if line.startswith('#if defined( '):
+          token_type = TOKEN_TYPE_IF_DEFINED
+        elif line.startswith('#endif'):
+          token_type = TOKEN_TYPE_ENDIF
+        else:
+          token_type = TOKEN_TYPE_PREPROCESSOR
+
+      elif first_character in ('*', '/'):
+        if line == self._SECTION_SEPARATOR:
+          token_type = TOKEN_TYPE_SECTION_SEPARATOR
+        else:
+          token_type = TOKEN_TYPE_COMMENT
+
+      elif line.startswith(self._define_deprecated):
+        token_type = TOKEN_TYPE_DEPRECATED
+
+      elif line.startswith(self._define_extern):
+        token_type = TOKEN_TYPE_EXTERN
+
+      elif line.startswith('typedef '):
+        token_type = TOKEN_TYPE_TYPEDEF
+
+      elif line.startswith('enum '):
+        token_type = TOKEN_TYPE_ENUM
+
+      elif last_character == ';':
+        token_type = TOKEN_TYPE_STATEMENT
+
+      else:
+        token_type = TOKEN_TYPE_OTHER
+
+      yield token_type, line
+
+
+class DeclarationParser(object):
+  """Parser for the declarations in a C source or header file.
+
+  The parser supports the subset of C used by the libyal header files, such
+  as preprocessor conditions, extern and deprecated markers, function
+  prototypes with callback function arguments, type definitions and
+  enumeration types.
+
+  Attributes:
+    enum_declarations (list[EnumDeclaration]): enumeration type declarations.
+    function_declarations (list[FunctionDeclaration]): function declarations.
+    has_read_write_lock (bool): True if a thread read/write lock is declared.
+    intptr_types (list[str]): names of the types defined as intptr_t, without
+        the library name prefix and "_t" suffix.
+    section_names (list[str]): section names.
+    struct_types (list[str]): names of the types defined as struct.
+  """
+
+  _READ_WRITE_LOCK_DECLARATION = (
+      'libcthreads_read_write_lock_t *read_write_lock;')
+
+  def __init__(self, library_name):
+    """Initializes a declaration parser.
+
+    Args:
+      library_name (str): name of the library, such as "libyal".
+    """
+    super(DeclarationParser, self).__init__()
+    self._intptr_typedef_prefix = 'typedef intptr_t {0:s}_'.format(
+        library_name)
+    self._library_name = library_name
+    self._tokenizer = Tokenizer(library_name)
+
+    self.enum_declarations = []
+    self.function_declarations = []
+    self.has_read_write_lock = False
+    self.intptr_types = []
+    self.section_names = []
+    self.struct_types = []
+
+  def _ParseArgument(self, line, function_prototype, function_argument):
+    """Parses a line of the arguments of a function prototype.
+
+    Args:
+      line (str): stripped line.
+      function_prototype (FunctionPrototype): function prototype.
+      function_argument (FunctionArgument): callback function argument that
+          is being parsed or None if not available.
+
+    Returns:
+      FunctionArgument: callback function argument that is being parsed or
+          None if not available.
+    """
+    # Check if we have a callback function argument.
+    if line.endswith('('):
+      argument_string = '{0:s} '.format(line)
+      return source_code.FunctionArgument(argument_string)
+
+    if line.endswith(' );'):
+      argument_string = line[:-3]
+
+    else:
+      # Get the part of the line before the ','.
+      argument_string, _, _ = line.partition(',')
+
+    if not function_argument:
+      function_prototype.AddArgumentString(argument_string)
+
+    else:
+      function_argument.AddArgumentString(argument_string)
+
+      if line.endswith(' ),'):
+        function_prototype.AddArgument(function_argument)
+        function_argument = None
+
+    return function_argument
+
+  def _ParseEnumConstant(self, line, enum_declaration):
+    """Parses a line of the constants of an enumeration type.
+
+    Args:
+      line (str): stripped line.
+      enum_declaration (EnumDeclaration): enumeration type declaration.
+    """
+    definition, _, value = line.partition('=')
+
+    definition = definition.strip()
+    definition = definition.rstrip(',')
+
+    value = value.strip()
+    value = value.rstrip(',')
+
+    enum_declaration.constants[definition] = value
+
+  def _ParseFunctionLine(self, line):
+    """Parses the first line of a function prototype.
+
+    Args:
+      line (str): stripped line, such as "int libyal_file_open(".
+
+    Returns:
+      FunctionPrototype: function prototype.
+    """
+    # Get the part of the line before the library name.
+    data_type, _, _ = line.partition(self._library_name)
+
+    # Get the part of the line after the data type.
+    line = line[len(data_type):]
+    data_type = data_type.strip()
+
+    # Get the part of the remainder of the line before the '('.
+    name, _, _ = line.partition('(')
+
+    return source_code.FunctionPrototype(name, data_type)
+
+  def Parse(self, file_object):
+    """Parses a file-like object in a single pass.
+
+    Args:
+      file_object (file): file-like object.
+    """
+    self.enum_declarations = []
+    self.function_declarations = []
+    self.has_read_write_lock = False
+    self.intptr_types = []
+    self.section_names = []
+    self.struct_types = []
+
+    conditions = set()
+    enum_declaration = None
+    function_argument = None
+    function_declaration = None
+    have_extern = False
+    in_define_deprecated = False
+    in_section = False
+    section_name = None
+
+    for token_type, line in self._tokenizer.Tokenize(file_object):
+      if function_declaration:
+        function_prototype = function_declaration.function_prototype
+
+        function_argument = self._ParseArgument(
+            line, function_prototype, function_argument)
+
+        if line.endswith(' );'):
+          self.function_declarations.append(function_declaration)
+
+          function_argument = None
+          function_declaration = None
+          have_extern = False
+          in_define_deprecated = False
+
+        continue
+
+      if enum_declaration:
+        if line.startswith('};'):
+          self.enum_declarations.append(enum_declaration)
+          enum_declaration = None
+
+        elif not line.startswith('{'):
+          self._ParseEnumConstant(line, enum_declaration)
+
+      if in_section:
+        if line.startswith('* '):
+          section_name = line[2:]
+          self.section_names.append(section_name)
+          in_section = False
+
+      elif token_type == TOKEN_TYPE_OPEN_PARENTHESIS:
+        function_prototype = self._ParseFunctionLine(line)
+        function_prototype.have_extern = have_extern
+
+        function_declaration = FunctionDeclaration(line, function_prototype)
+        function_declaration.conditions = set(conditions)
+        function_declaration.is_deprecated = in_define_deprecated
+        function_declaration.section_name = section_name
+
+      elif token_type == TOKEN_TYPE_IF_DEFINED:
+        # Get the name of the first definition, such as "HAVE_DEBUG_OUTPUT"
+        # from "#if defined( HAVE_DEBUG_OUTPUT )".
+        definition, separator, _ = line[13:].partition(' )')
+        if separator:
+          conditions.add(definition)
+
+      elif token_type == TOKEN_TYPE_ENDIF:
+        conditions = set()
+
+      elif token_type == TOKEN_TYPE_EXTERN:
+        have_extern = True
+
+      elif token_type == TOKEN_TYPE_DEPRECATED:
+        in_define_deprecated = True
+
+      elif token_type == TOKEN_TYPE_SECTION_SEPARATOR:
+        in_section = True
+
+      elif token_type == TOKEN_TYPE_STATEMENT:
+        # The line contains a variable definition.
+        have_extern = False
+
+        if line == self._READ_WRITE_LOCK_DECLARATION:
+          self.has_read_write_lock = True
+
+      elif token_type == TOKEN_TYPE_TYPEDEF:
+        if line.startswith('typedef struct '):
+          self.struct_types.append(line.split(' ')[2])
+
+        elif (line.startswith(self._intptr_typedef_prefix) and
+              line.endswith('_t;')):
+          self.intptr_types.append(
+              line[len(self._intptr_typedef_prefix):-3])
+
+      elif token_type == TOKEN_TYPE_ENUM:
+        enum_declaration = source_code.EnumDeclaration(line[5:])
@@ -0,0 +1,706 @@
+# -*- coding: utf-8 -*-
+"""Database of the symbols of libyal projects."""
+
+from __future__ import unicode_literals
+
+import collections
+import glob
+import os
+import sqlite3
+
+from yaldevtools import configuration
+from yaldevtools import file_overlay
+from yaldevtools import parse_cache
+from yaldevtools import source_code
+from yaldevtools import source_file
+
+
+class SymbolDatabase(object):
+  """SQLite database of the symbols of libyal projects.
+
+  The database contains the functions, arguments, sections, API groups and
+  enumeration types of the public and internal API of the indexed projects.
+  A project is only indexed again when its header or source files changed,
+  such that the results of analyzing the headers can be shared between runs
+  and projects. The library include header file of a project can be restored
+  from the database, without parsing it.
+
+  The database is opened on first use, in the process that uses it.
+  """
+
+  # The API group types in the order returned by GetAPITestGroups.
+  API_GROUP_TYPES = (
+      'functions', 'functions_with_input', 'types', 'types_with_input',
+      'pseudo_types')
+
+  _FORMAT_VERSION = 2
+
+  _TABLE_DEFINITIONS = [
+      ('projects', (
+          'project_identifier INTEGER PRIMARY KEY, name TEXT UNIQUE, '
+          'key TEXT, check_signature_type TEXT, have_bfio INTEGER, '
+          'have_wide_character_type INTEGER')),
+      ('api_groups', (
+          'project_identifier INTEGER, group_type TEXT, '
+          'sequence_number INTEGER, name TEXT, section_name TEXT')),
+      ('sections', (
+          'project_identifier INTEGER, sequence_number INTEGER, name TEXT')),
+      ('functions', (
+          'function_identifier INTEGER PRIMARY KEY, '
+          'project_identifier INTEGER, name TEXT, return_type TEXT, '
+          'group_name TEXT, section_name TEXT, header_name TEXT, '
+          'have_bfio INTEGER, have_debug_output INTEGER, '
+          'have_extern INTEGER, have_wide_character_type INTEGER, '
+          'return_values TEXT, value_description TEXT')),
+      ('arguments', (
+          'function_identifier INTEGER, sequence_number INTEGER, '
+          'argument TEXT')),
+      ('enums', (
+          'enum_identifier INTEGER PRIMARY KEY, project_identifier INTEGER, '
+          'name TEXT')),
+      ('enum_constants', (
+          'enum_identifier INTEGER, sequence_number INTEGER, name TEXT, '
+          'value TEXT'))]
+
+  _INDEX_DEFINITIONS = [
+      ('api_groups_project', 'api_groups (project_identifier)'),
+      ('arguments_function', 'arguments (function_identifier)'),
+      ('enum_constants_enum', 'enum_constants (enum_identifier)'),
+      ('enums_project', 'enums (project_identifier)'),
+      ('functions_name', 'functions (name)'),
+      ('functions_project', 'functions (project_identifier)'),
+      ('sections_project', 'sections (project_identifier)')]
+
+  def __init__(self, path=None):
+    """Initializes a symbol database.
+
+    Args:
+      path (Optional[str]): path of the database file, where None represents
+          the symbol database is disabled.
+    """
+    super(SymbolDatabase, self).__init__()
+    self._connection = None
+    self._path = path
+    self._process_identifier = None
+
+  def _CreateFunctionPrototype(self, row):
+    """Creates a function prototype from the values of a function.
+
+    Args:
+      row (tuple[object, ...]): name, return type, have bfio, have debug
+          output, have extern, have wide character type, return values and
+          value description of the function.
+
+    Returns:
+      FunctionPrototype: function prototype, without arguments.
+    """
+    function_prototype = source_code.FunctionPrototype(row[0], row[1])
+    function_prototype.have_bfio = bool(row[2])
+    function_prototype.have_debug_output = bool(row[3])
+    function_prototype.have_extern = bool(row[4])
+    function_prototype.have_wide_character_type = bool(row[5])
+    function_prototype.value_description = row[7]
+
+    if row[6] is not None:
+      function_prototype.return_values = set(
+          value for value in row[6].split(',') if value)
+
+    return function_prototype
+
+  def _CreateTables(self, connection):
+    """Creates the tables if the database is new or of a different format.
+
+    Args:
+      connection (sqlite3.Connection): database connection.
+    """
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+      cursor = connection.execute('PRAGMA user_version')
+      format_version = cursor.fetchone()[0]
+
+      if format_version != self._FORMAT_VERSION:
+        for table_name, _ in self._TABLE_DEFINITIONS:
+          connection.execute('DROP TABLE IF EXISTS {0:s}'.format(table_name))
+
+        for table_name, column_definitions in self._TABLE_DEFINITIONS:
+          connection.execute('CREATE TABLE {0:s} ({1:s})'.format(
+              table_name, column_definitions))
+
+        for index_name, index_definition in self._INDEX_DEFINITIONS:
+          connection.execute('CREATE INDEX {0:s} ON {1:s}'.format(
+              index_name, index_definition))
+
+        connection.execute('PRAGMA user_version = {0:d}'.format(
+            self._FORMAT_VERSION))
+
+      connection.execute('COMMIT')
+
+    except Exception:
+      connection.execute('ROLLBACK')
+      raise
+
+  def _GetConnection(self):
+    """Retrieves the database connection.
+
+    Returns:
+      sqlite3.Connection: database connection.
+    """
+    if self._connection and self._process_identifier != os.getpid():
+      # A connection cannot be used by a forked process.
+      self._connection = None
+
+    if not self._connection:
+      directory = os.path.dirname(self._path)
+      if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+      # Transactions are started explicitly.
+      connection = sqlite3.connect(
+          self._path, isolation_level=None, timeout=60.0)
+      self._CreateTables(connection)
+
+      self._connection = connection
+      self._process_identifier = os.getpid()
+
+    return self._connection
+
+  def _GetProjectFiles(self, library_name, projects_directory):
+    """Retrieves the paths of the header files of a project.
+
+    Args:
+      library_name (str): name of the library.
+      projects_directory (str): path of the projects directory.
+
+    Returns:
+      tuple[str, str, list[str]]: paths of the library include header file,
+          the definitions include header file and the library header files.
+    """
+    project_directory = os.path.join(projects_directory, library_name)
+
+    include_header_path = os.path.join(
+        project_directory, 'include', '{0:s}.h.in'.format(library_name))
+    definitions_include_header_path = os.path.join(
+        project_directory, 'include', library_name, 'definitions.h.in')
+
+    header_file_path_prefix = os.path.join(
+        project_directory, library_name, '{0:s}_'.format(library_name))
+
+    library_header_paths = set(glob.glob(
+        '{0:s}*.h'.format(header_file_path_prefix)))
+    for header_file_path in glob.glob(
+        '{0:s}*.h.in'.format(header_file_path_prefix)):
+      library_header_paths.add(header_file_path[:-3])
+
+    return (
+        include_header_path, definitions_include_header_path,
+        sorted(library_header_paths))
+
+  def _GetProjectIdentifier(self, connection, project_name):
+    """Retrieves the identifier of a project.
+
+    Args:
+      connection (sqlite3.Connection): database connection.
+      project_name (str): name of the project.
+
+    Returns:
+      int: identifier of the project or None if not indexed.
+    """
+    cursor = connection.execute(
+        'SELECT project_identifier FROM projects WHERE name = ?',
+        (project_name, ))
+    row = cursor.fetchone()
+    if not row:
+      return None
+
+    return row[0]
+
+  def _IndexProject(
+      self, connection, project_configuration, key, include_header_path,
+      definitions_include_header_path, library_header_paths):
+    """Indexes a project.
+
+    Args:
+      connection (sqlite3.Connection): database connection.
+      project_configuration (ProjectConfiguration): project configuration.
+      key (str): key of the indexed files.
+      include_header_path (str): path of the library include header file.
+      definitions_include_header_path (str): path of the definitions include
+          header file.
+      library_header_paths (list[str]): paths of the library header files.
+    """
+    library_name = project_configuration.library_name
+
+    include_header_file = source_file.LibraryIncludeHeaderFile(
+        include_header_path)
+    include_header_file.Read(project_configuration)
+
+    project_identifier = self._GetProjectIdentifier(connection, library_name)
+    if project_identifier is not None:
+      self._RemoveProject(connection, project_identifier)
+
+    cursor = connection.execute((
+        'INSERT INTO projects (name, key, check_signature_type, have_bfio, '
+        'have_wide_character_type) VALUES (?, ?, ?, ?, ?)'), (
+            library_name, key, include_header_file.GetCheckSignatureType(),
+            include_header_file.have_bfio,
+            include_header_file.have_wide_character_type))
+    project_identifier = cursor.lastrowid
+
+    for sequence_number, section_name in enumerate(
+        include_header_file.section_names):
+      connection.execute((
+          'INSERT INTO sections (project_identifier, sequence_number, name) '
+          'VALUES (?, ?, ?)'), (
+              project_identifier, sequence_number, section_name))
+
+    api_functions, api_functions_with_input = (
+        include_header_file.GetAPIFunctionTestGroups())
+    api_types, api_types_with_input = (
+        include_header_file.GetAPITypeTestGroups())
+    api_pseudo_types = include_header_file.GetAPIPseudoTypeTestGroups()
+
+    group_names = {}
+    for group_type, names in zip(self.API_GROUP_TYPES, (
+        api_functions, api_functions_with_input, api_types,
+        api_types_with_input, api_pseudo_types)):
+      for sequence_number, name in enumerate(names):
+        connection.execute((
+            'INSERT INTO api_groups (project_identifier, group_type, '
+            'sequence_number, name, section_name) VALUES (?, ?, ?, ?, ?)'), (
+                project_identifier, group_type, sequence_number, name,
+                include_header_file.GetFunctionGroupSectionName(name)))
+
+        for function_prototype in include_header_file.GetFunctionGroup(name):
+          group_names[function_prototype.name] = name
+
+    section_names = {}
+    for section_name, functions in (
+        include_header_file.functions_per_section.items()):
+      for function_prototype in functions:
+        section_names[function_prototype.name] = section_name
+
+    header_name = os.path.basename(include_header_path)[:-3]
+    for function_prototype in include_header_file.functions_per_name.values():
+      self._InsertFunction(
+          connection, project_identifier, function_prototype,
+          group_names.get(function_prototype.name, None),
+          section_names.get(function_prototype.name, None), header_name)
+
+    type_name_prefix_length = len(library_name) + 1
+    for header_file_path in library_header_paths:
+      header_file = source_file.LibraryHeaderFile(header_file_path)
+      header_file.Read(project_configuration)
+
+      header_name = os.path.basename(header_file_path)
+      type_name = header_name[type_name_prefix_length:-2]
+
+      for function_prototype in header_file.functions_per_name.values():
+        # Public functions are indexed from the library include header.
+        if function_prototype.name in include_header_file.functions_per_name:
+          continue
+
+        self._InsertFunction(
+            connection, project_identifier, function_prototype, type_name,
+            None, header_name)
+
+    if file_overlay.FILE_OVERLAY.Exists(definitions_include_header_path):
+      definitions_header_file = source_file.DefinitionsIncludeHeaderFile(
+          definitions_include_header_path)
+      definitions_header_file.Read(project_configuration)
+
+      for enum_declaration in definitions_header_file.enum_declarations:
+        cursor = connection.execute(
+            'INSERT INTO enums (project_identifier, name) VALUES (?, ?)',
+            (project_identifier, enum_declaration.name))
+        enum_identifier = cursor.lastrowid
+
+        for sequence_number, (name, value) in enumerate(
+            enum_declaration.constants.items()):
+          connection.execute((
+              'INSERT INTO enum_constants (enum_identifier, sequence_number, '
+              'name, value) VALUES (?, ?, ?, ?)'), (
+                  enum_identifier, sequence_number, name, value))
+
+  def _InsertFunction(
+      self, connection, project_identifier, function_prototype, group_name,
+      section_name, header_name):
+    """Inserts a function.
+
+    Args:
+      connection (sqlite3.Connection): database connection.
+      project_identifier (int): identifier of the project.
+      function_prototype (FunctionPrototype): function prototype.
+      group_name (str): name of the function group, such as the type name,
+          or None if not part of a group.
+      section_name (str): name of the section in the library include header
+          or None if not available.
+      header_name (str): name of the header file that declares the function.
+    """
+    return_values = None
+    if function_prototype.return_values is not None:
+      return_values = ','.join(sorted(function_prototype.return_values))
+
+    cursor = connection.execute((
+        'INSERT INTO functions (project_identifier, name, return_type, '
+        'group_name, section_name, header_name, have_bfio, have_debug_output, '
+        'have_extern, have_wide_character_type, return_values, '
+        'value_description) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'), (
+            project_identifier, function_prototype.name,
+            function_prototype.return_type, group_name, section_name,
+            header_name, function_prototype.have_bfio,
+            function_prototype.have_debug_output,
+            function_prototype.have_extern,
+            function_prototype.have_wide_character_type, return_values,
+            function_prototype.value_description))
+    function_identifier = cursor.lastrowid
+
+    for sequence_number, function_argument in enumerate(
+        function_prototype.arguments):
+      connection.execute((
+          'INSERT INTO arguments (function_identifier, sequence_number, '
+          'argument) VALUES (?, ?, ?)'), (
+              function_identifier, sequence_number,
+              function_argument.CopyToString()))
+
+  def _RemoveProject(self, connection, project_identifier):
+    """Removes a project.
+
+    Args:
+      connection (sqlite3.Connection): database connection.
+      project_identifier (int): identifier of the project.
+    """
+    connection.execute((
+        'DELETE FROM arguments WHERE function_identifier IN ('
+        'SELECT function_identifier FROM functions '
+        'WHERE project_identifier = ?)'), (project_identifier, ))
+    connection.execute((
+        'DELETE FROM enum_constants WHERE enum_identifier IN ('
+        'SELECT enum_identifier FROM enums WHERE project_identifier = ?)'),
+                       (project_identifier, ))
+
+    for table_name in (
+        'api_groups', 'enums', 'functions', 'projects', 'sections'):
+      connection.execute(
+          'DELETE FROM {0:s} WHERE project_identifier = ?'.format(table_name),
+          (project_identifier, ))
+
+  def Close(self):
+    """Closes the database."""
+    if self._connection and self._process_identifier == os.getpid():
+      self._connection.close()
+
+    self._connection = None
+    self._process_identifier = None
+
+  def GetAPITestGroups(self, project_name):
+    """Retrieves the API test groups of a project.
+
+    Args:
+      project_name (str): name of the project.
+
+    Returns:
+      tuple[list[str], list[str], list[str], list[str], list[str]]: names of
+          the API function groups without and with test data, API type groups
+          without and with test data and API pseudo type groups.
+    """
+    names_per_group_type = {
+        group_type: [] for group_type in self.API_GROUP_TYPES}
+
+    cursor = self._GetConnection().execute((
+        'SELECT api_groups.group_type, api_groups.name FROM api_groups '
+        'JOIN projects USING (project_identifier) WHERE projects.name = ? '
+        'ORDER BY api_groups.sequence_number'), (project_name, ))
+
+    for group_type, name in cursor:
+      names_per_group_type[group_type].append(name)
+
+    return tuple(
+        names_per_group_type[group_type]
+        for group_type in self.API_GROUP_TYPES)
+
+  def GetCheckSignatureType(self, project_name):
+    """Retrieves the check signature function type of a project.
+
+    Args:
+      project_name (str): name of the project.
+
+    Returns:
+      str: check signature function type or None if the project has no check
+          signature function.
+    """
+    cursor = self._GetConnection().execute(
+        'SELECT check_signature_type FROM projects WHERE name = ?',
+        (project_name, ))
+    row = cursor.fetchone()
+    if not row:
+      return None
+
+    return row[0]
+
+  def GetEnumDeclarations(self, project_name=None, name_pattern=None):
+    """Retrieves enumeration type declarations.
+
+    Args:
+      project_name (Optional[str]): name of the project, where None
+          represents all projects.
+      name_pattern (Optional[str]): glob pattern of the names of the
+          enumeration types, such as "*_ACCESS_FLAGS", where None represents
+          all enumeration types.
+
+    Returns:
+      list[tuple[str, EnumDeclaration]]: name of the project and enumeration
+          type declaration, ordered by project name.
+    """
+    connection = self._GetConnection()
+
+    enum_declarations = []
+    cursor = connection.execute((
+        'SELECT enums.enum_identifier, projects.name, enums.name FROM enums '
+        'JOIN projects USING (project_identifier) '
+        'WHERE (? IS NULL OR projects.name = ?) '
+        'AND (? IS NULL OR enums.name GLOB ?) '
+        'ORDER BY projects.name, enums.enum_identifier'), (
+            project_name, project_name, name_pattern, name_pattern))
+
+    for enum_identifier, enum_project_name, name in cursor.fetchall():
+      enum_declaration = source_code.EnumDeclaration(name)
+
+      constants_cursor = connection.execute((
+          'SELECT name, value FROM enum_constants WHERE enum_identifier = ? '
+          'ORDER BY sequence_number'), (enum_identifier, ))
+      for constant_name, value in constants_cursor:
+        enum_declaration.constants[constant_name] = value
+
+      enum_declarations.append((enum_project_name, enum_declaration))
+
+    return enum_declarations
+
+  def GetFunctionPrototypes(self, project_name=None, name_pattern=None):
+    """Retrieves function prototypes.
+
+    Args:
+      project_name (Optional[str]): name of the project, where None
+          represents all projects.
+      name_pattern (Optional[str]): glob pattern of the function names, such
+          as "*_get_*_by_index", where None represents all functions.
+
+    Returns:
+      list[tuple[str, FunctionPrototype]]: name of the project and function
+          prototype, ordered by project and function name.
+    """
+    connection = self._GetConnection()
+
+    function_prototypes = []
+    cursor = connection.execute((
+        'SELECT functions.function_identifier, projects.name, functions.name, '
+        'functions.return_type, functions.have_bfio, '
+        'functions.have_debug_output, functions.have_extern, '
+        'functions.have_wide_character_type, functions.return_values, '
+        'functions.value_description FROM functions '
+        'JOIN projects USING (project_identifier) '
+        'WHERE (? IS NULL OR projects.name = ?) '
+        'AND (? IS NULL OR functions.name GLOB ?) '
+        'ORDER BY projects.name, functions.name'), (
+            project_name, project_name, name_pattern, name_pattern))
+
+    for row in cursor.fetchall():
+      function_identifier, function_project_name = row[:2]
+
+      function_prototype = self._CreateFunctionPrototype(row[2:])
+
+      arguments_cursor = connection.execute((
+          'SELECT argument FROM arguments WHERE function_identifier = ? '
+          'ORDER BY sequence_number'), (function_identifier, ))
+      for argument, in arguments_cursor:
+        function_prototype.AddArgumentString(argument)
+
+      function_prototypes.append((function_project_name, function_prototype))
+
+    return function_prototypes
+
+  def GetLibraryIncludeHeaderFile(self, project_name, path):
+    """Retrieves the library include header file of a project.
+
+    The library include header file is restored from the indexed sections,
+    public functions and API groups, without reading and analyzing it.
+
+    Args:
+      project_name (str): name of the project.
+      path (str): path of the library include header file.
+
+    Returns:
+      LibraryIncludeHeaderFile: library include header file or None if the
+          project is not indexed.
+    """
+    connection = self._GetConnection()
+
+    cursor = connection.execute((
+        'SELECT project_identifier, check_signature_type, have_bfio, '
+        'have_wide_character_type FROM projects WHERE name = ?'),
+                                (project_name, ))
+    row = cursor.fetchone()
+    if not row:
+      return None
+
+    (project_identifier, check_signature_type, have_bfio,
+     have_wide_character_type) = row
+
+    cursor = connection.execute((
+        'SELECT name FROM sections WHERE project_identifier = ? '
+        'ORDER BY sequence_number'), (project_identifier, ))
+    section_names = [name for name, in cursor]
+
+    # Public functions are indexed from the library include header in order
+    # of declaration.
+    header_name = '{0:s}.h'.format(project_name)
+
+    arguments_per_function = {}
+    cursor = connection.execute((
+        'SELECT arguments.function_identifier, arguments.argument '
+        'FROM arguments JOIN functions USING (function_identifier) '
+        'WHERE functions.project_identifier = ? AND functions.header_name = ? '
+        'ORDER BY arguments.function_identifier, arguments.sequence_number'),
+                                (project_identifier, header_name))
+    for function_identifier, argument in cursor:
+      arguments_per_function.setdefault(function_identifier, []).append(
+          argument)
+
+    functions_per_name = collections.OrderedDict()
+    functions_per_section = {
+        section_name: [] for section_name in section_names}
+
+    cursor = connection.execute((
+        'SELECT function_identifier, section_name, name, return_type, '
+        'have_bfio, have_debug_output, have_extern, '
+        'have_wide_character_type, return_values, value_description '
+        'FROM functions WHERE project_identifier = ? AND header_name = ? '
+        'ORDER BY function_identifier'), (project_identifier, header_name))
+
+    for row in cursor:
+      function_identifier, section_name = row[:2]
+
+      function_prototype = self._CreateFunctionPrototype(row[2:])
+      for argument in arguments_per_function.get(function_identifier, []):
+        function_prototype.AddArgumentString(argument)
+
+      functions_per_name[function_prototype.name] = function_prototype
+      functions_per_section[section_name].append(function_prototype)
+
+    cursor = connection.execute((
+        'SELECT group_type, name, section_name FROM api_groups '
+        'WHERE project_identifier = ? ORDER BY sequence_number'),
+                                (project_identifier, ))
+    function_groups = cursor.fetchall()
+
+    include_header_file = source_file.LibraryIncludeHeaderFile(path)
+    include_header_file.SetParsedValues({
+        '_library_name': project_name,
+        'functions_per_name': functions_per_name,
+        'functions_per_section': functions_per_section,
+        'have_bfio': bool(have_bfio),
+        'have_wide_character_type': bool(have_wide_character_type),
+        'section_names': section_names})
+    include_header_file.SetFunctionGroups(
+        function_groups, check_signature_type)
+
+    return include_header_file
+
+  def GetProjectNames(self):
+    """Retrieves the names of the indexed projects.
+
+    Returns:
+      list[str]: names of the indexed projects.
+    """
+    cursor = self._GetConnection().execute(
+        'SELECT name FROM projects ORDER BY name')
+    return [name for name, in cursor]
+
+  def IsEnabled(self):
+    """Determines if the symbol database is enabled.
+
+    Returns:
+      bool: True if a path of the database file is set.
+    """
+    return bool(self._path)
+
+  def SetPath(self, path):
+    """Sets the path of the database file.
+
+    Args:
+      path (str): path of the database file, where None represents the
+          symbol database is disabled.
+    """
+    self.Close()
+    self._path = path
+
+  def UpdateProject(self, library_name, projects_directory):
+    """Indexes a project if it was not indexed or its files changed.
+
+    Args:
+      library_name (str): name of the library, such as "libyal".
+      projects_directory (str): path of the projects directory.
+
+    Returns:
+      bool: True if the project was indexed, False if the project was up to
+          date or has no library include header file.
+    """
+    (include_header_path, definitions_include_header_path,
+     library_header_paths) = self._GetProjectFiles(
+         library_name, projects_directory)
+
+    if not file_overlay.FILE_OVERLAY.Exists(include_header_path):
+      return False
+
+    paths = [include_header_path, definitions_include_header_path]
+    for header_file_path in library_header_paths:
+      header_file = source_file.LibraryHeaderFile(header_file_path)
+      paths.extend(header_file.GetInputFiles())
+
+    # The relative paths are part of the key, such that added and removed
+    # header files are detected.
+    parser_arguments = [library_name]
+    parser_arguments.extend([
+        os.path.relpath(path, projects_directory) for path in paths])
+
+    key = parse_cache.PARSE_CACHE.GetKey(
+        'SymbolDatabase', parser_arguments, paths)
+
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.library_name = library_name
+
+    connection = self._GetConnection()
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+      cursor = connection.execute(
+          'SELECT key FROM projects WHERE name = ?', (library_name, ))
+      row = cursor.fetchone()
+
+      is_up_to_date = bool(row and row[0] == key)
+      if not is_up_to_date:
+        self._IndexProject(
+            connection, project_configuration, key, include_header_path,
+            definitions_include_header_path, library_header_paths)
+
+      connection.execute('COMMIT')
+
+    except Exception:
+      connection.execute('ROLLBACK')
+      raise
+
+    return not is_up_to_date
+
+
+def GetDefaultPath():
+  """Retrieves the default path of the symbol database file.
+
+  Returns:
+    str: default path of the symbol database file.
+  """
+  cache_directory = os.environ.get('XDG_CACHE_HOME', None)
+  if not cache_directory:
+    cache_directory = os.path.join(os.path.expanduser('~'), '.cache')
+
+  return os.path.join(cache_directory, 'yaldevtools', 'symbols.db')
+
+
+SYMBOL_DATABASE = SymbolDatabase()
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""Template bundle."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import struct
+
+
+def _GetRelativePaths(source_directory):
+  """Retrieves the paths of the template files in a directory tree.
+
+  Args:
+    source_directory (str): path of the directory.
+
+  Returns:
+    list[str]: paths of the template files relative to the directory, with
+        "/" as path segment separator, sorted alphabetically.
+  """
+  relative_paths = []
+  for directory, _, filenames in os.walk(source_directory):
+    relative_directory = os.path.relpath(directory, source_directory)
+    for filename in filenames:
+      relative_path = os.path.normpath(
+          os.path.join(relative_directory, filename))
+      relative_paths.append(relative_path.replace(os.sep, '/'))
+
+  return sorted(relative_paths)
+
+
+def _UpdateContentHash(hash_context, relative_path, file_data):
+  """Updates the content hash with a template file.
+
+  Args:
+    hash_context (hashlib._Hash): hash context.
+    relative_path (str): relative path of the template file.
+    file_data (bytes): data of the template file.
+  """
+  hash_context.update(relative_path.encode('utf8'))
+  hash_context.update(struct.pack('<BQ', 0, len(file_data)))
+  hash_context.update(file_data)
+
+
+def GetContentHash(source_directory):
+  """Calculates the content hash of the template files in a directory tree.
+
+  Args:
+    source_directory (str): path of the directory.
+
+  Returns:
+    str: hexadecimal SHA-256 of the paths and data of the template files.
+  """
+  hash_context = hashlib.sha256()
+  for relative_path in _GetRelativePaths(source_directory):
+    path = os.path.join(source_directory, *relative_path.split('/'))
+    with io.open(path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    _UpdateContentHash(hash_context, relative_path, file_data)
+
+  return hash_context.hexdigest()
+
+
+def GetDefaultPath(libyal_directory):
+  """Retrieves the default path of the template bundle.
+
+  Args:
+    libyal_directory (str): path of the libyal directory.
+
+  Returns:
+    str: path of the template bundle of data/source.
+  """
+  return os.path.join(libyal_directory, 'data', 'source.bundle')
+
+
+def WriteTemplateBundle(path, source_directory):
+  """Packs the template files of a directory tree into a template bundle.
+
+  Args:
+    path (str): path of the template bundle.
+    source_directory (str): path of the directory.
+
+  Returns:
+    str: content hash of the template files.
+  """
+  hash_context = hashlib.sha256()
+  data_offset = 0
+  files = []
+  files_data = []
+
+  for relative_path in _GetRelativePaths(source_directory):
+    file_path = os.path.join(source_directory, *relative_path.split('/'))
+    with io.open(file_path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    _UpdateContentHash(hash_context, relative_path, file_data)
+
+    files.append([relative_path, data_offset, len(file_data)])
+    files_data.append(file_data)
+    data_offset += len(file_data)
+
+  content_hash = hash_context.hexdigest()
+
+  index_data = json.dumps(
+      {'content_hash': content_hash, 'files': files}, sort_keys=True)
+  index_data = index_data.encode('utf8')
+
+  # Write to a temporary file first so that a concurrent reader never maps
+  # a partially written template bundle.
+  temporary_path = '{0:s}.{1:d}.tmp'.format(path, os.getpid())
+  with io.open(temporary_path, 'wb') as file_object:
+    file_object.write(TemplateBundle.HEADER.pack(
+        TemplateBundle.FILE_SIGNATURE, len(index_data)))
+    file_object.write(index_data)
+    for file_data in files_data:
+      file_object.write(file_data)
+
+  if os.path.exists(path):
+    os.remove(path)
+  os.rename(temporary_path, path)
+
+  return content_hash
+
+
+class TemplateBundle(object):
+  """Template bundle.
+
+  A template bundle contains the template files of a directory tree, such as
+  data/source, in a single file that is memory mapped. The bundle consists
+  of a header, an index with the offset and size of the data of every
+  template file and the content hash of the template files, followed by the
+  data of the template files.
+
+  Attributes:
+    content_hash (str): hexadecimal SHA-256 of the paths and data of the
+        template files or None if not open.
+  """
+
+  FILE_SIGNATURE = b'YALTMPL\x01'
+
+  # The header consists of the file signature and the size of the index.
+  HEADER = struct.Struct('<8sI')
+
+  def __init__(self):
+    """Initializes a template bundle."""
+    super(TemplateBundle, self).__init__()
+    self._data_offset = None
+    self._directories = {}
+    self._file_object = None
+    self._files = {}
+    self._memory_map = None
+    self._source_directory = None
+    self.content_hash = None
+
+  def _GetRelativePath(self, path):
+    """Retrieves the path relative to the source directory.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      str: path relative to the source directory, with "/" as path segment
+          separator, or None if the bundle is not open or the path is not
+          in the source directory.
+    """
+    if not self._source_directory:
+      return None
+
+    path = os.path.abspath(path)
+    if path == self._source_directory:
+      return ''
+
+    if not path.startswith(self._source_directory + os.sep):
+      return None
+
+    relative_path = path[len(self._source_directory) + 1:]
+    return relative_path.replace(os.sep, '/')
+
+  def Close(self):
+    """Closes the template bundle."""
+    if self._memory_map:
+      self._memory_map.close()
+    if self._file_object:
+      self._file_object.close()
+
+    self._data_offset = None
+    self._directories = {}
+    self._file_object = None
+    self._files = {}
+    self._memory_map = None
+    self._source_directory = None
+    self.content_hash = None
+
+  def GetDirectoryEntries(self, path):
+    """Retrieves the names of the template files in a directory.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: names of the template files in the directory, sorted
+          alphabetically, or None if the directory is not in the source
+          directory of the template bundle.
+    """
+    relative_path = self._GetRelativePath(path)
+    if relative_path is None:
+      return None
+
+    return list(self._directories.get(relative_path, []))
+
+  def GetFileData(self, path):
+    """Retrieves the data of a template file.
+
+    Args:
+      path (str): path of the template file.
+
+    Returns:
+      bytes: data of the template file or None if the template file is not
+          in the template bundle.
+    """
+    relative_path = self._GetRelativePath(path)
+    if relative_path is None:
+      return None
+
+    file_range = self._files.get(relative_path, None)
+    if not file_range:
+      return None
+
+    data_offset, data_size = file_range
+    data_offset += self._data_offset
+    return self._memory_map[data_offset:data_offset + data_size]
+
+  def HasFile(self, path):
+    """Determines if a template file is in the template bundle.
+
+    Args:
+      path (str): path of the template file.
+
+    Returns:
+      bool: True if the template file is in the template bundle.
+    """
+    relative_path = self._GetRelativePath(path)
+    return relative_path in self._files
+
+  def IsOpen(self):
+    """Determines if the template bundle is open.
+
+    Returns:
+      bool: True if the template bundle is open.
+    """
+    return self._memory_map is not None
+
+  def Open(self, path, source_directory):
+    """Opens a template bundle.
+
+    Args:
+      path (str): path of the template bundle.
+      source_directory (str): path of the directory of which the template
+          bundle contains the template files.
+
+    Raises:
+      IOError: if the template bundle cannot be read.
+      OSError: if the template bundle cannot be read.
+    """
+    if self._memory_map:
+      self.Close()
+
+    file_object = io.open(path, 'rb')
+    try:
+      memory_map = mmap.mmap(
+          file_object.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, mmap.error) as exception:
+      file_object.close()
+      raise IOError(
+          'Unable to map template bundle: {0:s} with error: {1!s}'.format(
+              path, exception))
+
+    try:
+      if len(memory_map) < self.HEADER.size:
+        raise IOError('Template bundle: {0:s} too small.'.format(path))
+
+      signature, index_size = self.HEADER.unpack(
+          memory_map[:self.HEADER.size])
+      if signature != self.FILE_SIGNATURE:
+        raise IOError('Unsupported template bundle signature: {0:s}.'.format(
+            path))
+
+      index_end_offset = self.HEADER.size + index_size
+      try:
+        index = json.loads(
+            memory_map[self.HEADER.size:index_end_offset].decode('utf8'))
+      except ValueError as exception:
+        raise IOError(
+            'Unable to read template bundle index: {0:s} with error: '
+            '{1!s}'.format(path, exception))
+
+    except IOError:
+      memory_map.close()
+      file_object.close()
+      raise
+
+    directories = {}
+    files = {}
+    for relative_path, data_offset, data_size in index['files']:
+      files[relative_path] = (data_offset, data_size)
+
+      relative_directory, _, filename = relative_path.rpartition('/')
+      directories.setdefault(relative_directory, []).append(filename)
+
+    self._data_offset = index_end_offset
+    self._directories = directories
+    self._file_object = file_object
+    self._files = files
+    self._memory_map = memory_map
+    self._source_directory = os.path.abspath(source_directory)
+    self.content_hash = index['content_hash']
+
+    logging.debug('Opened template bundle: {0:s} ({1:s})'.format(
+        path, self.content_hash))
+
+
+TEMPLATE_BUNDLE = TemplateBundle()
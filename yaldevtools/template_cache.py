@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Template cache."""
+
+from __future__ import unicode_literals
+
+import collections
+import io
+import os
+
+from yaldevtools import compiled_template
+from yaldevtools import template_bundle
+
+
+class TemplateCache(object):
+  """Template cache.
+
+  The cache maps the path of a template file to its compiled template. A cached
+  template is only used as long as the modification time and size of the
+  template file, or the content hash of the template bundle that contains it,
+  are unchanged. The least recently used templates are evicted when the
+  maximum number of templates is exceeded.
+
+  Attributes:
+    evictions (int): number of templates evicted from the cache.
+    hits (int): number of template lookups that were served from the cache.
+    misses (int): number of template lookups that required the template file
+        to be read.
+  """
+
+  _MAXIMUM_NUMBER_OF_TEMPLATES = 2048
+
+  def __init__(self, maximum_number_of_templates=None):
+    """Initializes a template cache.
+
+    Args:
+      maximum_number_of_templates (Optional[int]): maximum number of templates
+          to cache, where None represents the default.
+    """
+    super(TemplateCache, self).__init__()
+    self._maximum_number_of_templates = (
+        maximum_number_of_templates or self._MAXIMUM_NUMBER_OF_TEMPLATES)
+    self._templates = collections.OrderedDict()
+    self.evictions = 0
+    self.hits = 0
+    self.misses = 0
+
+  def __len__(self):
+    """Retrieves the number of cached templates.
+
+    Returns:
+      int: number of cached templates.
+    """
+    return len(self._templates)
+
+  def _ReadTemplateFile(self, path, universal_newlines):
+    """Reads a template string from file.
+
+    Args:
+      path (str): path of the file containing the template string.
+      universal_newlines (bool): True if end of line characters should be
+          converted to "\\n".
+
+    Returns:
+      str: template string.
+    """
+    file_data = template_bundle.TEMPLATE_BUNDLE.GetFileData(path)
+    if file_data is None:
+      # Read with binary mode to make sure end of line characters are
+      # not converted.
+      with io.open(path, 'rb') as file_object:
+        file_data = file_object.read()
+
+    file_data = file_data.decode('utf8')
+
+    if universal_newlines:
+      file_data = file_data.replace('\r\n', '\n')
+      file_data = file_data.replace('\r', '\n')
+
+    return file_data
+
+  def Empty(self):
+    """Empties the cache and resets the counters."""
+    self._templates = collections.OrderedDict()
+    self.evictions = 0
+    self.hits = 0
+    self.misses = 0
+
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      dict[str, int]: cache statistics per name.
+    """
+    return {
+        'evictions': self.evictions,
+        'hits': self.hits,
+        'misses': self.misses,
+        'number_of_templates': len(self._templates)}
+
+  def GetTemplate(self, path, universal_newlines=False):
+    """Retrieves a template.
+
+    Args:
+      path (str): path of the file containing the template string.
+      universal_newlines (Optional[bool]): True if end of line characters
+          should be converted to "\\n".
+
+    Returns:
+      CompiledTemplate: compiled template string.
+
+    Raises:
+      IOError: if the template file cannot be read.
+      OSError: if the template file cannot be read.
+    """
+    # Templates in the template bundle do not change while it is open.
+    if template_bundle.TEMPLATE_BUNDLE.HasFile(path):
+      file_identifier = template_bundle.TEMPLATE_BUNDLE.content_hash
+    else:
+      stat_object = os.stat(path)
+      file_identifier = (stat_object.st_mtime, stat_object.st_size)
+
+    lookup_key = (path, universal_newlines)
+    cached_value = self._templates.pop(lookup_key, None)
+    if cached_value and cached_value[0] == file_identifier:
+      self.hits += 1
+
+    else:
+      self.misses += 1
+
+      file_data = self._ReadTemplateFile(path, universal_newlines)
+      cached_value = (
+          file_identifier, compiled_template.CompiledTemplate(file_data))
+
+      while len(self._templates) >= self._maximum_number_of_templates:
+        self._templates.popitem(last=False)
+        self.evictions += 1
+
+    # Reinserting the value marks it as the most recently used.
+    self._templates[lookup_key] = cached_value
+
+    return cached_value[1]
+
+
+TEMPLATE_CACHE = TemplateCache()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Template index."""
+
+from __future__ import unicode_literals
+
+import os
+
+from yaldevtools import template_bundle
+
+
+class TemplateIndex(object):
+  """Template index.
+
+  The index lists the template files of a directory once, after which
+  determining if a template file exists, or which variant of a template is
+  available, is a dictionary lookup instead of a file system query. The
+  template files of a directory are listed from the template bundle when
+  it contains the directory.
+
+  A template variant is a template file of which the name contains one or
+  more "-with_" segments, such as "get_string_value-with_none.c", and is
+  indexed by the base name, such as "get_string_value.c", and the names of
+  the variants, such as "none".
+  """
+
+  _VARIANT_PREFIX = 'with_'
+
+  def __init__(self):
+    """Initializes a template index."""
+    super(TemplateIndex, self).__init__()
+    self._filenames_per_directory = {}
+    self._filenames_sets_per_directory = {}
+    self._looked_up_paths = set()
+    self._variants_per_directory = {}
+
+  def _GetTemplateKey(self, template_name, variants=None):
+    """Retrieves the index key of a template.
+
+    Args:
+      template_name (str): name of the template file, such as
+          "get_string_value-with_none.c".
+      variants (Optional[list[str]]): names of additional variants, such as
+          "none".
+
+    Returns:
+      tuple[str, frozenset[str]]: base name, such as "get_string_value.c",
+          and names of the variants of the template.
+    """
+    name, extension = os.path.splitext(template_name)
+
+    name_segments = []
+    template_variants = set(variants or [])
+    for name_segment in name.split('-'):
+      if name_segment.startswith(self._VARIANT_PREFIX):
+        template_variants.add(name_segment[len(self._VARIANT_PREFIX):])
+      else:
+        name_segments.append(name_segment)
+
+    base_name = '{0:s}{1:s}'.format('-'.join(name_segments), extension)
+    return base_name, frozenset(template_variants)
+
+  def _IndexDirectory(self, path):
+    """Indexes the template files of a directory.
+
+    Args:
+      path (str): path of the directory.
+    """
+    filenames = []
+    variants = {}
+
+    directory_entries = template_bundle.TEMPLATE_BUNDLE.GetDirectoryEntries(
+        path)
+    if directory_entries is not None:
+      filenames = directory_entries
+
+    else:
+      try:
+        directory_entries = os.listdir(path)
+      except OSError:
+        directory_entries = []
+
+      for filename in directory_entries:
+        if os.path.isfile(os.path.join(path, filename)):
+          filenames.append(filename)
+
+    for filename in filenames:
+      template_key = self._GetTemplateKey(filename)
+      # Prefer the template file of which the name is sorted first, if
+      # multiple template files map to the same base name and variants.
+      if template_key not in variants or filename < variants[template_key]:
+        variants[template_key] = filename
+
+    self._filenames_per_directory[path] = filenames
+    self._filenames_sets_per_directory[path] = frozenset(filenames)
+    self._variants_per_directory[path] = variants
+
+  def GetFilenames(self, path):
+    """Retrieves the names of the template files in a directory.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: names of the template files in the directory.
+    """
+    if path not in self._filenames_per_directory:
+      self._IndexDirectory(path)
+
+    return list(self._filenames_per_directory[path])
+
+  def GetLookedUpPaths(self):
+    """Retrieves the paths of the template files that were looked up.
+
+    Returns:
+      set[str]: paths of the template files that were looked up and exist.
+    """
+    return set(self._looked_up_paths)
+
+  def GetTemplateFilename(self, path, template_name, variants=None):
+    """Retrieves the name of a template file or one of its variants.
+
+    Args:
+      path (str): path of the directory that contains the template file.
+      template_name (str): name of the template file, such as
+          "get_string_value.c".
+      variants (Optional[list[str]]): names of the variants, such as "none".
+
+    Returns:
+      str: name of the template file, such as "get_string_value-with_none.c",
+          or None if not available.
+    """
+    if path not in self._variants_per_directory:
+      self._IndexDirectory(path)
+
+    template_key = self._GetTemplateKey(template_name, variants=variants)
+    filename = self._variants_per_directory[path].get(template_key, None)
+    if filename:
+      self._looked_up_paths.add(os.path.join(path, filename))
+
+    return filename
+
+  def GetTemplatePaths(self, path):
+    """Retrieves the paths of all the template files in a directory tree.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: paths of the template files, sorted alphabetically.
+    """
+    template_paths = []
+    for directory, _, filenames in os.walk(path):
+      for filename in filenames:
+        template_paths.append(os.path.join(directory, filename))
+
+    return sorted(template_paths)
+
+  def HasTemplate(self, path):
+    """Determines if a template file exists.
+
+    Args:
+      path (str): path of the template file.
+
+    Returns:
+      bool: True if the template file exists.
+    """
+    directory, filename = os.path.split(path)
+    if directory not in self._filenames_sets_per_directory:
+      self._IndexDirectory(directory)
+
+    if filename not in self._filenames_sets_per_directory[directory]:
+      return False
+
+    self._looked_up_paths.add(path)
+    return True
+
+
+TEMPLATE_INDEX = TemplateIndex()
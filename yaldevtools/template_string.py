@@ -3,8 +3,7 @@
 
 from __future__ import unicode_literals
 
-import io
-import string
+from yaldevtools import template_cache
 
 
 class TemplateStringGenerator(object):
@@ -19,10 +18,8 @@ class TemplateStringGenerator(object):
     Returns:
       string.Template: template string.
     """
-    with io.open(filename, 'r', encoding='utf8') as file_object:
-      file_data = file_object.read()
-
-    return string.Template(file_data)
+    return template_cache.TEMPLATE_CACHE.GetTemplate(
+        filename, universal_newlines=True)
 
   def Generate(self, template_filename, template_mappings):
     """Generates output based on the template string.